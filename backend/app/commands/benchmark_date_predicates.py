@@ -0,0 +1,180 @@
+"""날짜 조건 / 날짜 인덱스 전후 비교 벤치마크 커맨드
+
+사용법:
+    python -m app.commands.benchmark_date_predicates --days 365 --devices 10 --detections-per-day 200 --iterations 20
+
+- 합성 사용자 1명에 디바이스별 N일치 탐지를 넣고 하루치 조회(건수 + 최근 시각)의 지연(p50 / p95 / max, ms)을 비교
+  - func_date: func.date(detected_at) == 날짜 (기존 조건, 컬럼을 함수로 감싸 detected_at 범위 조회 불가)
+  - no_index: 반열린 구간 조건 + 날짜 인덱스 제외(IGNORE INDEX) - 인덱스 추가 전 상태
+  - half_open: query_filters.on_date (현재 조건 + migrations/002·005 인덱스)
+- 범위: 사용자 전체(user_seq) / 디바이스 1대(device_seq), 조회 일자는 합성 기간 중 임의 선택
+- 조건별 실행 계획(key / rows)도 함께 출력
+- 합성 데이터는 하나의 트랜잭션에서만 사용하고 마지막에 롤백 (외래키 검사는 해당 세션에서만 끔)
+"""
+import argparse
+import asyncio
+import logging
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, Dict, List
+
+from sqlalchemy import select, func, insert, text
+
+from app.core.danger_levels import DANGER_LEVELS, severity_of
+from app.core.database import async_session, engine
+from app.models.detection_result import DetectionResult
+from app.repositories.query_filters import on_date
+
+logger = logging.getLogger("benchmark_date_predicates")
+
+# 합성 사용자 / 디바이스 / 상품 번호 (실제 데이터와 겹치지 않는 값)
+SYNTHETIC_USER_SEQ = 2_000_000_000
+SYNTHETIC_DEVICE_SEQ = 2_000_000_000
+SYNTHETIC_MODEL_PRODUCT_SEQ = 2_000_000_000
+
+# 입력 배치 크기
+SEED_BATCH_SIZE = 5000
+
+# 범위별 날짜 인덱스 (no_index 단계에서 제외)
+DATE_INDEXES = {
+    'user': 'idx_detection_results_user_feed, idx_detection_results_user_level_detected, idx_detection_results_detected',
+    'device': 'idx_detection_results_device_detected, idx_detection_results_detected'
+}
+
+
+async def _measure(call: Callable[[date], Awaitable[object]], days: List[date], iterations: int) -> Dict[str, float]:
+    """호출 지연 측정 (첫 호출은 버퍼 풀 예열용으로 제외)"""
+    await call(random.choice(days))
+
+    elapsed_ms: List[float] = []
+    for _ in range(iterations):
+        target_date = random.choice(days)
+        started_at = time.perf_counter()
+        await call(target_date)
+        elapsed_ms.append((time.perf_counter() - started_at) * 1000)
+
+    elapsed_ms.sort()
+    return {
+        'p50': elapsed_ms[len(elapsed_ms) // 2],
+        'p95': elapsed_ms[min(len(elapsed_ms) - 1, int(len(elapsed_ms) * 0.95))],
+        'max': elapsed_ms[-1]
+    }
+
+
+def _build_query(scope: str, predicate: str, target_date: date):
+    """하루치 건수 + 최근 시각 조회 (scope: user / device, predicate: func_date / no_index / half_open)"""
+    if scope == 'user':
+        scope_condition = DetectionResult.user_seq == SYNTHETIC_USER_SEQ
+    else:
+        scope_condition = DetectionResult.device_seq == SYNTHETIC_DEVICE_SEQ
+
+    if predicate == 'func_date':
+        date_condition = func.date(DetectionResult.detected_at) == target_date
+    else:
+        date_condition = on_date(DetectionResult.detected_at, target_date)
+
+    query = select(
+        func.count(DetectionResult.detection_seq),
+        func.max(DetectionResult.detected_at)
+    ).where(scope_condition, date_condition)
+
+    if predicate == 'no_index':
+        query = query.with_hint(DetectionResult, f"IGNORE INDEX ({DATE_INDEXES[scope]})", 'mysql')
+    return query
+
+
+async def _explain(session, scope: str, predicate: str, target_date: date) -> str:
+    """실행 계획 요약 (key / rows)"""
+    compiled_query = str(
+        _build_query(scope, predicate, target_date)
+        .compile(engine.sync_engine, compile_kwargs={"literal_binds": True})
+    )
+    result = await session.execute(text(f"EXPLAIN {compiled_query}"))
+    row = result.mappings().first()
+    return f"key={row.get('key')}, rows={row.get('rows')}"
+
+
+async def _seed(session, day_count: int, device_count: int, detections_per_day: int) -> List[date]:
+    """합성 탐지 입력 (커밋하지 않음) - 반환값: 합성 기간 일자 목록"""
+    await session.execute(text("SET SESSION foreign_key_checks = 0"))
+
+    today = date.today()
+    days = [today - timedelta(days=offset) for offset in range(1, day_count + 1)]
+    device_seqs = [SYNTHETIC_DEVICE_SEQ + index for index in range(device_count)]
+
+    detection_rows = []
+    total_rows = 0
+    for target_date in days:
+        start_of_day = datetime.combine(target_date, datetime.min.time())
+        for device_seq in device_seqs:
+            for _ in range(detections_per_day):
+                danger_level = random.choice(DANGER_LEVELS)
+                detection_rows.append({
+                    'device_seq': device_seq,
+                    'user_seq': SYNTHETIC_USER_SEQ,
+                    'model_product_seq': SYNTHETIC_MODEL_PRODUCT_SEQ,
+                    'detection_class': 'safety',
+                    'detection_label': 'benchmark',
+                    'confidence': 90,
+                    'bbox_x': 0, 'bbox_y': 0, 'bbox_width': 10, 'bbox_height': 10,
+                    'danger_level': danger_level,
+                    'severity': severity_of(danger_level),
+                    'detected_at': start_of_day + timedelta(seconds=random.randrange(86400))
+                })
+            if len(detection_rows) >= SEED_BATCH_SIZE:
+                await session.execute(insert(DetectionResult), detection_rows)
+                total_rows += len(detection_rows)
+                detection_rows = []
+
+    if detection_rows:
+        await session.execute(insert(DetectionResult), detection_rows)
+        total_rows += len(detection_rows)
+    await session.flush()
+
+    logger.info(f"합성 데이터: {day_count}일, 디바이스 {device_count}, 디바이스별 일 {detections_per_day}건, 총 {total_rows}건")
+    return days
+
+
+async def benchmark_date_predicates(day_count: int, device_count: int, detections_per_day: int, iterations: int) -> None:
+    """합성 데이터로 날짜 조건 / 인덱스 전후 지연 비교 (종료 시 롤백)"""
+    async with async_session() as session:
+        try:
+            days = await _seed(session, day_count, device_count, detections_per_day)
+
+            logger.info(f"{'scope':>8} {'predicate':>10} {'p50(ms)':>10} {'p95(ms)':>10} {'max(ms)':>10}  plan")
+            for scope in ('user', 'device'):
+                for predicate in ('func_date', 'no_index', 'half_open'):
+                    async def call(target_date: date, scope=scope, predicate=predicate):
+                        return (await session.execute(_build_query(scope, predicate, target_date))).one()
+
+                    measurement = await _measure(call, days, iterations)
+                    plan = await _explain(session, scope, predicate, days[0])
+                    logger.info(f"{scope:>8} {predicate:>10} {measurement['p50']:>10.2f} "
+                                f"{measurement['p95']:>10.2f} {measurement['max']:>10.2f}  {plan}")
+        finally:
+            await session.rollback()
+
+
+async def _main(args: argparse.Namespace) -> int:
+    try:
+        await benchmark_date_predicates(args.days, args.devices, args.detections_per_day, args.iterations)
+        return 0
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="날짜 조건 / 날짜 인덱스 전후 비교 벤치마크 (합성 데이터, 롤백)")
+    parser.add_argument("--days", type=int, default=365, help="합성 기간 일수 (기본: 365)")
+    parser.add_argument("--devices", type=int, default=10, help="디바이스 수 (기본: 10)")
+    parser.add_argument("--detections-per-day", type=int, default=200, help="디바이스별 하루 탐지 건수 (기본: 200)")
+    parser.add_argument("--iterations", type=int, default=20, help="조건별 반복 횟수 (기본: 20)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    raise SystemExit(asyncio.run(_main(args)))
+
+
+if __name__ == "__main__":
+    main()
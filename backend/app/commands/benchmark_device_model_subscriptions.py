@@ -0,0 +1,220 @@
+"""디바이스별 구독 상품 조회 벤치마크 커맨드
+
+사용법:
+    python -m app.commands.benchmark_device_model_subscriptions --devices 100 --products 20 --labels 50 --iterations 20
+
+- 합성 사용자 1명에 디바이스 / 활성 구독 / 상품별 탐지 매핑 / 오늘 탐지를 넣고 두 조회 방식의 지연(p50 / p95 / max, ms)을 비교
+  - legacy: 디바이스 x 구독 x 매핑 x 오늘 탐지 조인 후 GROUP_CONCAT(DISTINCT) / COUNT(DISTINCT) (기존 쿼리 형태)
+  - current: DashboardRepository.get_device_model_subscriptions (독립 조회 3개 + 메모리 병합)
+- 조인 방식의 중간 결과 행 수(COUNT(*))도 함께 출력
+- 합성 데이터는 하나의 트랜잭션에서만 사용하고 마지막에 롤백 (외래키 검사는 해당 세션에서만 끔)
+"""
+import argparse
+import asyncio
+import logging
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Awaitable, Callable, Dict, List
+
+from sqlalchemy import select, func, and_, distinct, insert, text
+
+from app.core.danger_levels import DANGER_LEVELS, severity_of
+from app.core.database import async_session, engine
+from app.models.detection_mapping import ModelDetectionMapping
+from app.models.detection_result import DetectionResult
+from app.models.device import Device
+from app.models.model_product import ModelProduct
+from app.models.subscription import ModelProductSubscription
+from app.repositories.dashboard_repository import DashboardRepository
+from app.repositories.query_filters import on_date
+
+logger = logging.getLogger("benchmark_device_model_subscriptions")
+
+# 합성 사용자 번호 (실제 사용자와 겹치지 않는 값)
+SYNTHETIC_USER_SEQ = 2_000_000_000
+
+
+async def _measure(call: Callable[[], Awaitable[object]], iterations: int) -> Dict[str, float]:
+    """호출 지연 측정 (첫 호출은 캐시 예열용으로 제외)"""
+    await call()
+
+    elapsed_ms: List[float] = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        await call()
+        elapsed_ms.append((time.perf_counter() - started_at) * 1000)
+
+    elapsed_ms.sort()
+    return {
+        'p50': elapsed_ms[len(elapsed_ms) // 2],
+        'p95': elapsed_ms[min(len(elapsed_ms) - 1, int(len(elapsed_ms) * 0.95))],
+        'max': elapsed_ms[-1]
+    }
+
+
+def _legacy_join(today: date):
+    """기존 쿼리의 조인 (디바이스 x 구독 x 매핑 x 오늘 탐지)"""
+    return Device.__table__.join(
+        ModelProductSubscription.__table__,
+        ModelProductSubscription.user_seq == Device.user_seq
+    ).join(
+        ModelProduct.__table__, ModelProductSubscription.model_product_seq == ModelProduct.model_product_seq
+    ).outerjoin(
+        ModelDetectionMapping.__table__,
+        ModelProductSubscription.model_product_seq == ModelDetectionMapping.model_product_seq
+    ).outerjoin(
+        DetectionResult.__table__,
+        and_(
+            DetectionResult.device_seq == Device.device_seq,
+            DetectionResult.model_product_seq == ModelDetectionMapping.model_product_seq,
+            DetectionResult.detection_label == ModelDetectionMapping.detection_label,
+            on_date(DetectionResult.detected_at, today)
+        )
+    )
+
+
+def _legacy_conditions(user_seq: int):
+    return and_(Device.user_seq == user_seq, ModelProductSubscription.subscription_status == 'A')
+
+
+async def _run_legacy_query(session, user_seq: int, today: date) -> list:
+    """기존 쿼리 형태 실행 (상품명은 tbl_model_product 컬럼 사용)"""
+    result = await session.execute(
+        select(
+            Device.device_seq,
+            Device.device_label,
+            Device.device_type,
+            func.group_concat(ModelProduct.product_name_depatecated.distinct()).label('activated_models'),
+            func.count(distinct(DetectionResult.detection_seq)).label('today_detection_count'),
+            func.max(DetectionResult.detected_at).label('last_detection_time')
+        ).select_from(
+            _legacy_join(today)
+        ).where(
+            _legacy_conditions(user_seq)
+        ).group_by(
+            Device.device_seq, Device.device_label, Device.device_type
+        ).order_by(
+            Device.device_label
+        )
+    )
+    return result.fetchall()
+
+
+async def _seed(session, user_seq: int, device_count: int, product_count: int, label_count: int,
+                detections_per_device: int) -> None:
+    """합성 데이터 입력 (커밋하지 않음)"""
+    await session.execute(text("SET SESSION foreign_key_checks = 0"))
+
+    now = datetime.now()
+    products = [
+        ModelProduct(model_seq=0, product_name_depatecated=f"benchmark product {index}")
+        for index in range(product_count)
+    ]
+    devices = [
+        Device(user_seq=user_seq, device_label=f"benchmark device {index:03d}", device_type='A')
+        for index in range(device_count)
+    ]
+    session.add_all(products + devices)
+    await session.flush()
+
+    product_seqs = [product.model_product_seq for product in products]
+    session.add_all(
+        ModelProductSubscription(
+            user_seq=user_seq, model_product_seq=product_seq, subscription_status='A', subscribed_dt=now
+        )
+        for product_seq in product_seqs
+    )
+
+    labels = [f"label_{index:02d}" for index in range(label_count)]
+    mapping_rows = []
+    for product_seq in product_seqs:
+        for index, label in enumerate(labels):
+            mapping_rows.append({
+                'model_product_seq': product_seq,
+                'detection_label': label,
+                'danger_level': DANGER_LEVELS[index % len(DANGER_LEVELS)]
+            })
+    await session.execute(insert(ModelDetectionMapping), mapping_rows)
+
+    # 오늘 탐지 (자정 이후 ~ 현재 사이에 고르게 분포)
+    start_of_day = datetime.combine(now.date(), datetime.min.time())
+    seconds_today = max(1, int((now - start_of_day).total_seconds()))
+    detection_rows = []
+    for device in devices:
+        for _ in range(detections_per_device):
+            label_index = random.randrange(label_count)
+            danger_level = DANGER_LEVELS[label_index % len(DANGER_LEVELS)]
+            detection_rows.append({
+                'device_seq': device.device_seq,
+                'user_seq': user_seq,
+                'model_product_seq': random.choice(product_seqs),
+                'detection_class': 'safety',
+                'detection_label': labels[label_index],
+                'confidence': 90,
+                'bbox_x': 0, 'bbox_y': 0, 'bbox_width': 10, 'bbox_height': 10,
+                'danger_level': danger_level,
+                'severity': severity_of(danger_level),
+                'detected_at': start_of_day + timedelta(seconds=random.randrange(seconds_today))
+            })
+    await session.execute(insert(DetectionResult), detection_rows)  # 집계는 트리거가 갱신
+    await session.flush()
+
+    logger.info(f"합성 데이터: 디바이스 {device_count}, 구독 {product_count}, 매핑 {len(mapping_rows)}, "
+                f"오늘 탐지 {len(detection_rows)}건")
+
+
+async def benchmark_device_model_subscriptions(device_count: int, product_count: int, label_count: int,
+                                               detections_per_device: int, iterations: int) -> None:
+    """합성 데이터로 기존 조인 / 현재 조회 지연 비교 (종료 시 롤백)"""
+    async with async_session() as session:
+        try:
+            user_seq = SYNTHETIC_USER_SEQ
+            today = date.today()
+            await _seed(session, user_seq, device_count, product_count, label_count, detections_per_device)
+
+            intermediate_rows = await session.scalar(
+                select(func.count()).select_from(_legacy_join(today)).where(_legacy_conditions(user_seq))
+            )
+            logger.info(f"기존 조인 중간 결과 행 수: {intermediate_rows}")
+
+            dashboard_repository = DashboardRepository(session)
+            measurements = {
+                'legacy': await _measure(lambda: _run_legacy_query(session, user_seq, today), iterations),
+                'current': await _measure(
+                    lambda: dashboard_repository.get_device_model_subscriptions(user_seq), iterations
+                )
+            }
+
+            logger.info(f"{'query':>10} {'p50(ms)':>10} {'p95(ms)':>10} {'max(ms)':>10}")
+            for name, measurement in measurements.items():
+                logger.info(f"{name:>10} {measurement['p50']:>10.2f} {measurement['p95']:>10.2f} {measurement['max']:>10.2f}")
+        finally:
+            await session.rollback()
+
+
+async def _main(args: argparse.Namespace) -> int:
+    try:
+        await benchmark_device_model_subscriptions(
+            args.devices, args.products, args.labels, args.detections_per_device, args.iterations
+        )
+        return 0
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="디바이스별 구독 상품 조회 벤치마크 (합성 데이터, 롤백)")
+    parser.add_argument("--devices", type=int, default=100, help="디바이스 수 (기본: 100)")
+    parser.add_argument("--products", type=int, default=20, help="활성 구독 상품 수 (기본: 20)")
+    parser.add_argument("--labels", type=int, default=50, help="상품별 탐지 라벨 매핑 수 (기본: 50)")
+    parser.add_argument("--detections-per-device", type=int, default=50, help="디바이스별 오늘 탐지 건수 (기본: 50)")
+    parser.add_argument("--iterations", type=int, default=20, help="반복 횟수 (기본: 20)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    raise SystemExit(asyncio.run(_main(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""로그인 폭주 중 다른 엔드포인트 지연 벤치마크 커맨드
+
+사용법:
+    python -m app.commands.benchmark_login_storm --concurrency 50 --duration 10
+
+- 로그인 1건의 CPU 작업(SHA-256 + bcrypt 검증)을 concurrency 개 작업이 연속으로 실행하는 동안
+  앱의 다른 엔드포인트(기본: /health)를 주기적으로 호출해 지연(p50 / p95 / p99 / max, ms) 측정
+- 단계
+  - baseline: 로그인 없이 측정
+  - inline: core.auth.verify_password 를 이벤트 루프에서 직접 실행 (기존 방식)
+  - pool: password_hasher 스레드 풀에서 실행 (대기열 초과 시 거절 건수도 출력)
+- 앱은 같은 프로세스에서 ASGI 로 호출 (워커 1개 = 이벤트 루프 1개와 같은 조건), DB / 웹 API 는 사용하지 않음
+"""
+import argparse
+import asyncio
+import logging
+import time
+from typing import Dict, List
+
+import httpx
+
+from app.core.auth import hash_password, verify_password
+from app.core.password_hasher import password_hasher, PasswordHasherBusy
+from app.main import app
+
+logger = logging.getLogger("benchmark_login_storm")
+
+BENCHMARK_PASSWORD = "benchmark-password"
+
+
+def _summarize(elapsed_ms: List[float]) -> Dict[str, float]:
+    elapsed_ms = sorted(elapsed_ms)
+    if not elapsed_ms:
+        return {'count': 0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+
+    def percentile(ratio: float) -> float:
+        return elapsed_ms[min(len(elapsed_ms) - 1, int(len(elapsed_ms) * ratio))]
+
+    return {
+        'count': len(elapsed_ms),
+        'p50': percentile(0.5),
+        'p95': percentile(0.95),
+        'p99': percentile(0.99),
+        'max': elapsed_ms[-1]
+    }
+
+
+async def _probe(client: httpx.AsyncClient, path: str, stop_at: float, interval: float) -> List[float]:
+    """다른 엔드포인트를 주기적으로 호출하며 지연(ms) 기록"""
+    elapsed_ms: List[float] = []
+    while time.monotonic() < stop_at:
+        started_at = time.perf_counter()
+        await client.get(path)
+        elapsed_ms.append((time.perf_counter() - started_at) * 1000)
+        await asyncio.sleep(interval)
+    return elapsed_ms
+
+
+async def _storm_worker(mode: str, hashed_password: str, stop_at: float, counters: Dict[str, int]) -> None:
+    """로그인 비밀번호 검증을 연속 실행"""
+    while time.monotonic() < stop_at:
+        if mode == 'inline':
+            verify_password(BENCHMARK_PASSWORD, hashed_password)
+            counters['verified'] += 1
+            await asyncio.sleep(0)  # 다음 검증 전에 다른 작업에 차례를 넘김 (요청 간 전환과 같은 조건)
+            continue
+        try:
+            await password_hasher.verify(BENCHMARK_PASSWORD, hashed_password)
+            counters['verified'] += 1
+        except PasswordHasherBusy:
+            counters['rejected'] += 1
+            await asyncio.sleep(0.01)  # 거절된 클라이언트의 재시도 간격
+
+
+async def _run_phase(client: httpx.AsyncClient, mode: str, hashed_password: str, concurrency: int,
+                     duration: float, probe_path: str, probe_interval: float) -> Dict[str, float]:
+    counters = {'verified': 0, 'rejected': 0}
+    stop_at = time.monotonic() + duration
+    workers = []
+    if mode != 'baseline':
+        workers = [asyncio.create_task(_storm_worker(mode, hashed_password, stop_at, counters))
+                   for _ in range(concurrency)]
+    summary = _summarize(await _probe(client, probe_path, stop_at, probe_interval))
+    await asyncio.gather(*workers)
+    return {**summary, 'verified': counters['verified'], 'rejected': counters['rejected']}
+
+
+async def benchmark_login_storm(concurrency: int, duration: float, probe_path: str, probe_interval: float) -> None:
+    """baseline / inline / pool 단계별 지연 비교"""
+    hashed_password = hash_password(BENCHMARK_PASSWORD)
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+            results = {}
+            for mode in ('baseline', 'inline', 'pool'):
+                results[mode] = await _run_phase(
+                    client, mode, hashed_password, concurrency, duration, probe_path, probe_interval
+                )
+    finally:
+        password_hasher.close()
+
+    logger.info(f"엔드포인트: {probe_path}, 동시 로그인 {concurrency}건, 단계별 {duration}초, "
+                f"해싱 스레드 {password_hasher.workers}개 / 대기 상한 {password_hasher.max_pending}")
+    logger.info(f"{'phase':>10} {'count':>7} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'max(ms)':>9} "
+                f"{'verified':>9} {'rejected':>9}")
+    for mode, result in results.items():
+        logger.info(f"{mode:>10} {result['count']:>7} {result['p50']:>9.2f} {result['p95']:>9.2f} "
+                    f"{result['p99']:>9.2f} {result['max']:>9.2f} {result['verified']:>9} {result['rejected']:>9}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로그인 폭주 중 다른 엔드포인트 지연 벤치마크 (bcrypt inline / 스레드 풀)")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 로그인 수 (기본: 50)")
+    parser.add_argument("--duration", type=float, default=10.0, help="단계별 측정 시간(초) (기본: 10)")
+    parser.add_argument("--probe-path", default="/health", help="측정할 엔드포인트 경로 (기본: /health)")
+    parser.add_argument("--probe-interval", type=float, default=0.02, help="엔드포인트 호출 간격(초) (기본: 0.02)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(benchmark_login_storm(args.concurrency, args.duration, args.probe_path, args.probe_interval))
+
+
+if __name__ == "__main__":
+    main()
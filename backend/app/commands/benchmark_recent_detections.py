@@ -0,0 +1,111 @@
+"""최근 탐지 목록 조회 벤치마크 커맨드
+
+사용법:
+    python -m app.commands.benchmark_recent_detections --user-seqs 1 2 3 --limit 10 --iterations 50
+
+- 사용자별 전체 탐지 건수와 함께 최근 목록 조회 지연(p50 / p95 / max, ms)을 출력
+- 탐지 건수가 수천 ~ 수백만 건인 사용자를 함께 지정하면 건수와 무관하게 지연이 일정한지 확인 가능
+- 단계별 측정: 1단계(상위 N개 번호), 2단계 포함 전체(get_recent_general_detection_list / get_recent_detections_with_full_info)
+- --explain 지정 시 1단계 쿼리 실행 계획 출력 (key=idx_detection_results_user_feed, Extra: Using index 확인)
+"""
+import argparse
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List
+
+from sqlalchemy import select, func, text
+
+from app.core.database import async_session, engine
+from app.models.detection_result import DetectionResult
+from app.repositories.dashboard_repository import DashboardRepository
+from app.repositories.detection_repository import DetectionRepository
+from app.repositories.recent_detection_query import RecentDetectionQuery
+
+logger = logging.getLogger("benchmark_recent_detections")
+
+
+async def _measure(call: Callable[[], Awaitable[object]], iterations: int) -> Dict[str, float]:
+    """호출 지연 측정 (첫 호출은 캐시 예열용으로 제외)"""
+    await call()
+
+    elapsed_ms: List[float] = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        await call()
+        elapsed_ms.append((time.perf_counter() - started_at) * 1000)
+
+    elapsed_ms.sort()
+    return {
+        'p50': elapsed_ms[len(elapsed_ms) // 2],
+        'p95': elapsed_ms[min(len(elapsed_ms) - 1, int(len(elapsed_ms) * 0.95))],
+        'max': elapsed_ms[-1]
+    }
+
+
+async def _explain_phase_one(session, user_seq: int, limit: int) -> None:
+    """1단계 쿼리 실행 계획 출력"""
+    phase_one_query = str(
+        select(DetectionResult.detection_seq)
+        .where(DetectionResult.user_seq == user_seq, DetectionResult.danger_level.isnot(None))
+        .order_by(DetectionResult.detected_at.desc(), DetectionResult.detection_seq.desc())
+        .limit(limit)
+        .compile(engine.sync_engine, compile_kwargs={"literal_binds": True})
+    )
+    result = await session.execute(text(f"EXPLAIN {phase_one_query}"))
+    for row in result.mappings():
+        logger.info(f"  EXPLAIN [user_seq={user_seq}]: key={row.get('key')}, rows={row.get('rows')}, extra={row.get('Extra')}")
+
+
+async def benchmark_recent_detections(user_seqs: List[int], limit: int, iterations: int, explain: bool) -> None:
+    """사용자별 최근 목록 조회 지연 측정"""
+    async with async_session() as session:
+        recent_query = RecentDetectionQuery(session)
+        dashboard_repository = DashboardRepository(session)
+        detection_repository = DetectionRepository(session)
+
+        logger.info(f"{'user_seq':>10} {'rows':>12} {'phase':>12} {'p50(ms)':>10} {'p95(ms)':>10} {'max(ms)':>10}")
+        for user_seq in user_seqs:
+            total_rows = await session.scalar(
+                select(func.count(DetectionResult.detection_seq)).where(DetectionResult.user_seq == user_seq)
+            )
+
+            measurements = {
+                'ids': await _measure(lambda: recent_query.get_recent_detection_seqs(user_seq, limit), iterations),
+                'general': await _measure(
+                    lambda: dashboard_repository.get_recent_general_detection_list(user_seq, limit), iterations
+                ),
+                'full_info': await _measure(
+                    lambda: detection_repository.get_recent_detections_with_full_info(user_seq, 'en-US', limit), iterations
+                )
+            }
+            for phase, measurement in measurements.items():
+                logger.info(f"{user_seq:>10} {total_rows:>12} {phase:>12} "
+                            f"{measurement['p50']:>10.2f} {measurement['p95']:>10.2f} {measurement['max']:>10.2f}")
+
+            if explain:
+                await _explain_phase_one(session, user_seq, limit)
+
+
+async def _main(args: argparse.Namespace) -> int:
+    try:
+        await benchmark_recent_detections(args.user_seqs, args.limit, args.iterations, args.explain)
+        return 0
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="최근 탐지 목록 조회 벤치마크")
+    parser.add_argument("--user-seqs", type=int, nargs="+", required=True, help="측정할 사용자 번호 (탐지 건수가 다른 사용자 여러 명)")
+    parser.add_argument("--limit", type=int, default=10, help="목록 크기 (기본: 10)")
+    parser.add_argument("--iterations", type=int, default=50, help="사용자별 반복 횟수 (기본: 50)")
+    parser.add_argument("--explain", action="store_true", help="1단계 쿼리 실행 계획 출력")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    raise SystemExit(asyncio.run(_main(args)))
+
+
+if __name__ == "__main__":
+    main()
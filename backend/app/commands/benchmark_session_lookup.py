@@ -0,0 +1,172 @@
+"""세션 토큰 조회 벤치마크 커맨드
+
+사용법:
+    python -m app.commands.benchmark_session_lookup --sessions 100000 --iterations 200
+
+- 합성 세션 N건(SPRING_SESSION + 속성 2건 + tbl_session_token)을 넣고 두 조회 방식의 지연(p50 / p95 / max, ms)을 비교
+  - legacy: SPRING_SESSION_ATTRIBUTES.ATTRIBUTE_BYTES = JSON 문자열 조인 (기존 쿼리 형태, 속성 스캔)
+  - indexed: tbl_session_token 기본키(토큰 해시) 조회 + SPRING_SESSION 기본키 조인 (현재 _verify_session_token)
+- 조회 토큰은 합성 세션 중 임의 선택 (매 반복 다른 토큰)
+- 합성 데이터는 하나의 트랜잭션에서만 사용하고 마지막에 롤백
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import secrets
+import time
+import uuid
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List
+
+from sqlalchemy import select, and_, insert
+
+from app.core.database import async_session, engine
+from app.models.session_token import SessionToken
+from app.models.user import SpringSession, SpringSessionAttributes
+
+logger = logging.getLogger("benchmark_session_lookup")
+
+# 합성 세션 사용자 번호 (실제 사용자와 겹치지 않는 값)
+SYNTHETIC_USER_SEQ = 2_000_000_000
+
+# 입력 배치 크기
+SEED_BATCH_SIZE = 5000
+
+
+async def _measure(call: Callable[[str], Awaitable[object]], tokens: List[str], iterations: int) -> Dict[str, float]:
+    """호출 지연 측정 (첫 호출은 예열용으로 제외)"""
+    await call(random.choice(tokens))
+
+    elapsed_ms: List[float] = []
+    for _ in range(iterations):
+        token = random.choice(tokens)
+        started_at = time.perf_counter()
+        row = await call(token)
+        elapsed_ms.append((time.perf_counter() - started_at) * 1000)
+        if row is None:
+            raise RuntimeError(f"합성 세션 조회 실패: {token[:16]}...")
+
+    elapsed_ms.sort()
+    return {
+        'p50': elapsed_ms[len(elapsed_ms) // 2],
+        'p95': elapsed_ms[min(len(elapsed_ms) - 1, int(len(elapsed_ms) * 0.95))],
+        'max': elapsed_ms[-1]
+    }
+
+
+async def _legacy_lookup(session, session_token: str):
+    """기존 쿼리 형태 (속성 TEXT 비교)"""
+    result = await session.execute(
+        select(SpringSession.PRIMARY_ID, SpringSession.EXPIRY_TIME, SpringSession.PRINCIPAL_NAME)
+        .select_from(
+            SpringSession.__table__.join(
+                SpringSessionAttributes.__table__,
+                SpringSession.PRIMARY_ID == SpringSessionAttributes.SESSION_PRIMARY_ID
+            )
+        )
+        .where(
+            and_(
+                SpringSessionAttributes.ATTRIBUTE_NAME == "session_token",
+                SpringSessionAttributes.ATTRIBUTE_BYTES == json.dumps(session_token)
+            )
+        )
+    )
+    return result.fetchone()
+
+
+async def _indexed_lookup(session, session_token: str):
+    """토큰 해시 기본키 조회 (_verify_session_token 과 같은 쿼리)"""
+    result = await session.execute(
+        select(SpringSession.PRIMARY_ID, SpringSession.EXPIRY_TIME, SpringSession.PRINCIPAL_NAME)
+        .select_from(SessionToken)
+        .join(SpringSession, SpringSession.PRIMARY_ID == SessionToken.session_primary_id)
+        .where(SessionToken.token_hash == SessionToken.hash_token(session_token))
+    )
+    return result.fetchone()
+
+
+async def _seed(session, session_count: int) -> List[str]:
+    """합성 세션 입력 (커밋하지 않음) - 반환값: 세션 토큰 목록"""
+    now_ms = int(datetime.now().timestamp() * 1000)
+    expires_ms = now_ms + 60 * 60 * 1000
+    tokens: List[str] = []
+
+    for offset in range(0, session_count, SEED_BATCH_SIZE):
+        session_rows, attribute_rows, token_rows = [], [], []
+        for _ in range(min(SEED_BATCH_SIZE, session_count - offset)):
+            primary_id = str(uuid.uuid4())
+            session_token = secrets.token_hex(32)
+            tokens.append(session_token)
+            session_rows.append({
+                'PRIMARY_ID': primary_id,
+                'SESSION_ID': secrets.token_hex(16),
+                'CREATION_TIME': now_ms,
+                'LAST_ACCESS_TIME': now_ms,
+                'MAX_INACTIVE_INTERVAL': 3600,
+                'EXPIRY_TIME': expires_ms,
+                'PRINCIPAL_NAME': str(SYNTHETIC_USER_SEQ)
+            })
+            attribute_rows.append({
+                'SESSION_PRIMARY_ID': primary_id, 'ATTRIBUTE_NAME': 'user_seq',
+                'ATTRIBUTE_BYTES': json.dumps(SYNTHETIC_USER_SEQ)
+            })
+            attribute_rows.append({
+                'SESSION_PRIMARY_ID': primary_id, 'ATTRIBUTE_NAME': 'session_token',
+                'ATTRIBUTE_BYTES': json.dumps(session_token)
+            })
+            token_rows.append({
+                'token_hash': SessionToken.hash_token(session_token),
+                'session_primary_id': primary_id,
+                'user_seq': SYNTHETIC_USER_SEQ,
+                'expiry_time': expires_ms
+            })
+
+        await session.execute(insert(SpringSession), session_rows)
+        await session.execute(insert(SpringSessionAttributes), attribute_rows)
+        await session.execute(insert(SessionToken).prefix_with("IGNORE"), token_rows)  # 속성 트리거가 먼저 넣은 키는 무시
+        logger.info(f"합성 세션 입력: {len(tokens)}/{session_count}")
+
+    await session.flush()
+    return tokens
+
+
+async def benchmark_session_lookup(session_count: int, iterations: int) -> None:
+    """합성 세션으로 기존 / 인덱스 조회 지연 비교 (종료 시 롤백)"""
+    async with async_session() as session:
+        try:
+            tokens = await _seed(session, session_count)
+            measurements = {
+                'legacy': await _measure(lambda token: _legacy_lookup(session, token), tokens, iterations),
+                'indexed': await _measure(lambda token: _indexed_lookup(session, token), tokens, iterations)
+            }
+
+            logger.info(f"합성 세션 {session_count}건, 조회 {iterations}회")
+            logger.info(f"{'query':>10} {'p50(ms)':>10} {'p95(ms)':>10} {'max(ms)':>10}")
+            for name, measurement in measurements.items():
+                logger.info(f"{name:>10} {measurement['p50']:>10.2f} {measurement['p95']:>10.2f} {measurement['max']:>10.2f}")
+        finally:
+            await session.rollback()
+
+
+async def _main(args: argparse.Namespace) -> int:
+    try:
+        await benchmark_session_lookup(args.sessions, args.iterations)
+        return 0
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="세션 토큰 조회 벤치마크 (합성 세션, 롤백)")
+    parser.add_argument("--sessions", type=int, default=100000, help="합성 세션 수 (기본: 100000)")
+    parser.add_argument("--iterations", type=int, default=200, help="조회 반복 횟수 (기본: 200)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    raise SystemExit(asyncio.run(_main(args)))
+
+
+if __name__ == "__main__":
+    main()
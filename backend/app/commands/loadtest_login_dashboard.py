@@ -0,0 +1,187 @@
+"""로그인 진행 중 대시보드 지연 부하 테스트 커맨드
+
+사용법:
+    python -m app.commands.loadtest_login_dashboard --logins 50 --login-delay 2 --duration 10
+
+- 로컬 stub 웹 API(응답을 login-delay 초 늦게 보내는 HTTP 서버)를 띄우고 web_api_base_url 을 stub 으로 지정
+- 앱은 같은 프로세스에서 ASGI 로 호출 (워커 1개 = 이벤트 루프 1개와 같은 조건)
+- 1단계(baseline): 로그인 없이 대시보드 엔드포인트 지연 측정
+- 2단계(logins): 동시 로그인 N건을 계속 보내는 동안 같은 엔드포인트 지연 측정
+  - 웹 API 호출이 이벤트 루프를 막으면 2단계 지연이 login-delay 수준으로 늘어남
+- 로그인 사용자명은 존재하지 않는 임의 값 (stub 은 항상 로그인 실패 응답 -> 비밀번호 틀림 횟수 갱신 없음)
+- 기본 대시보드 엔드포인트는 /dashboard/health (DB 조회 없음), --probe-path 로 변경 가능
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Dict, List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.database import engine
+from app.core.web_api_client import web_api_client
+from app.main import app
+
+logger = logging.getLogger("loadtest_login_dashboard")
+
+# stub 웹 API 로그인 응답 (항상 실패)
+STUB_LOGIN_RESPONSE = json.dumps({"success": False, "message": "INVALID_CREDENTIALS"}).encode()
+
+
+class StubWebApi:
+    """응답을 지연시키는 최소 HTTP/1.1 서버 (keep-alive 지원, 요청 본문은 무시)"""
+
+    def __init__(self, delay_seconds: float):
+        self.delay_seconds = delay_seconds
+        self.requests = 0
+        self.connections = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, host="127.0.0.1", port=0)
+
+    async def close(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                content_length = 0
+                keep_alive = True
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    name = name.strip().lower()
+                    if name == "content-length":
+                        content_length = int(value.strip())
+                    elif name == "connection" and value.strip().lower() == "close":
+                        keep_alive = False
+                if content_length:
+                    await reader.readexactly(content_length)
+
+                self.requests += 1
+                await asyncio.sleep(self.delay_seconds)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(STUB_LOGIN_RESPONSE)).encode() + b"\r\n"
+                    b"Connection: " + (b"keep-alive" if keep_alive else b"close") + b"\r\n\r\n"
+                    + STUB_LOGIN_RESPONSE
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def _summarize(elapsed_ms: List[float]) -> Dict[str, float]:
+    elapsed_ms = sorted(elapsed_ms)
+    if not elapsed_ms:
+        return {'count': 0, 'p50': 0.0, 'p95': 0.0, 'max': 0.0}
+    return {
+        'count': len(elapsed_ms),
+        'p50': elapsed_ms[len(elapsed_ms) // 2],
+        'p95': elapsed_ms[min(len(elapsed_ms) - 1, int(len(elapsed_ms) * 0.95))],
+        'max': elapsed_ms[-1]
+    }
+
+
+async def _probe(client: httpx.AsyncClient, path: str, stop_at: float, interval: float) -> List[float]:
+    """대시보드 엔드포인트를 주기적으로 호출하며 지연(ms) 기록"""
+    elapsed_ms: List[float] = []
+    while time.monotonic() < stop_at:
+        started_at = time.perf_counter()
+        await client.get(path)
+        elapsed_ms.append((time.perf_counter() - started_at) * 1000)
+        await asyncio.sleep(interval)
+    return elapsed_ms
+
+
+async def _login_loop(client: httpx.AsyncClient, path: str, stop_at: float, elapsed_ms: List[float]) -> None:
+    """로그인을 연속으로 호출 (존재하지 않는 임의 사용자명)"""
+    while time.monotonic() < stop_at:
+        started_at = time.perf_counter()
+        await client.post(path, json={"username": f"loadtest-{uuid.uuid4().hex}", "password": "loadtest"})
+        elapsed_ms.append((time.perf_counter() - started_at) * 1000)
+
+
+async def loadtest_login_dashboard(logins: int, login_delay: float, duration: float,
+                                   probe_path: str, probe_interval: float) -> None:
+    """baseline / 로그인 진행 중 대시보드 지연 비교"""
+    stub = StubWebApi(login_delay)
+    await stub.start()
+    settings.web_api_base_url = stub.base_url
+    logger.info(f"stub 웹 API: {stub.base_url} (응답 지연 {login_delay}초)")
+
+    login_path = f"{settings.api_prefix}/auth/login"
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=None) as client:
+            baseline = _summarize(await _probe(client, probe_path, time.monotonic() + duration, probe_interval))
+
+            login_ms: List[float] = []
+            stop_at = time.monotonic() + duration
+            login_tasks = [asyncio.create_task(_login_loop(client, login_path, stop_at, login_ms))
+                           for _ in range(logins)]
+            await asyncio.sleep(min(login_delay, duration) / 2)  # 로그인이 웹 API 응답을 기다리는 상태에서 측정 시작
+            under_login = _summarize(await _probe(client, probe_path, stop_at, probe_interval))
+            await asyncio.gather(*login_tasks)
+
+        logins_summary = _summarize(login_ms)
+        logger.info(f"대시보드 엔드포인트: {probe_path}, 동시 로그인 {logins}건")
+        logger.info(f"{'phase':>10} {'count':>8} {'p50(ms)':>10} {'p95(ms)':>10} {'max(ms)':>10}")
+        for name, summary in (('baseline', baseline), ('logins', under_login), ('login', logins_summary)):
+            logger.info(f"{name:>10} {summary['count']:>8} {summary['p50']:>10.2f} "
+                        f"{summary['p95']:>10.2f} {summary['max']:>10.2f}")
+        logger.info(f"stub 웹 API 요청 {stub.requests}건 / TCP 연결 {stub.connections}개 (keep-alive 재사용)")
+    finally:
+        await web_api_client.close()
+        await stub.close()
+
+
+async def _main(args: argparse.Namespace) -> int:
+    try:
+        await loadtest_login_dashboard(
+            args.logins, args.login_delay, args.duration,
+            args.probe_path or f"{settings.api_prefix}/dashboard/health", args.probe_interval
+        )
+        return 0
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로그인 진행 중 대시보드 지연 부하 테스트 (로컬 stub 웹 API)")
+    parser.add_argument("--logins", type=int, default=50, help="동시 로그인 수 (기본: 50)")
+    parser.add_argument("--login-delay", type=float, default=2.0, help="stub 웹 API 응답 지연(초) (기본: 2)")
+    parser.add_argument("--duration", type=float, default=10.0, help="단계별 측정 시간(초) (기본: 10)")
+    parser.add_argument("--probe-path", default=None, help="측정할 대시보드 경로 (기본: {api_prefix}/dashboard/health)")
+    parser.add_argument("--probe-interval", type=float, default=0.05, help="대시보드 호출 간격(초) (기본: 0.05)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    raise SystemExit(asyncio.run(_main(args)))
+
+
+if __name__ == "__main__":
+    main()
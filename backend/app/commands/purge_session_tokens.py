@@ -0,0 +1,72 @@
+"""만료 / 삭제된 세션의 토큰 조회 키 정리 커맨드
+
+사용법:
+    python -m app.commands.purge_session_tokens --batch-size 5000
+
+- tbl_session_token 중 SPRING_SESSION 행이 없거나(웹 서버 세션 정리 등) 만료된 세션의 키를 삭제
+- batch-size 건씩 나눠 삭제 (배치마다 커밋 -> 긴 잠금 방지)
+"""
+import argparse
+import asyncio
+import logging
+from datetime import datetime
+
+from sqlalchemy import select, delete, or_
+
+from app.core.database import async_session, engine
+from app.models.session_token import SessionToken
+from app.models.user import SpringSession
+
+logger = logging.getLogger("purge_session_tokens")
+
+
+async def purge_session_tokens(batch_size: int) -> int:
+    """정리 대상 키 삭제 - 반환값: 삭제 건수"""
+    now_ms = int(datetime.now().timestamp() * 1000)
+    purged = 0
+    while True:
+        async with async_session() as session:
+            try:
+                result = await session.execute(
+                    select(SessionToken.token_hash)
+                    .outerjoin(SpringSession, SpringSession.PRIMARY_ID == SessionToken.session_primary_id)
+                    .where(or_(SpringSession.PRIMARY_ID.is_(None), SpringSession.EXPIRY_TIME < now_ms))
+                    .limit(batch_size)
+                )
+                token_hashes = [row.token_hash for row in result]
+                if not token_hashes:
+                    return purged
+
+                await session.execute(delete(SessionToken).where(SessionToken.token_hash.in_(token_hashes)))
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+        purged += len(token_hashes)
+        logger.info(f"세션 토큰 키 정리: {purged}건")
+
+
+async def _main(args: argparse.Namespace) -> int:
+    try:
+        purged = await purge_session_tokens(args.batch_size)
+        logger.info(f"세션 토큰 키 정리 완료: {purged}건")
+        return 0
+    except Exception as e:
+        logger.error(f"세션 토큰 키 정리 실패: {str(e)}")
+        return 1
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="만료 / 삭제된 세션의 토큰 조회 키 정리")
+    parser.add_argument("--batch-size", type=int, default=5000, help="배치당 삭제 건수 (기본: 5000)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    raise SystemExit(asyncio.run(_main(args)))
+
+
+if __name__ == "__main__":
+    main()
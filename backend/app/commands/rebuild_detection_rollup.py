@@ -0,0 +1,106 @@
+"""시간대별 / 일자별 탐지 집계 재생성 / 백필 커맨드
+
+사용법:
+    python -m app.commands.rebuild_detection_rollup --start-date 2025-01-01 --end-date 2025-01-31 --workers 4
+
+- 평소 집계는 tbl_detection_results 트리거가 갱신 (migrations/010) -> 트리거 적용 전 기간 백필 / 집계 복구용
+- 일자 단위로 작업을 나누고, 일자마다 별도 세션/트랜잭션에서 재집계
+- --workers 개수만큼 일자를 병렬 처리 (DB 커넥션도 최대 workers 개 사용)
+- 재생성한 일자는 지난 날짜 대시보드 캐시(같은 캐시 파일을 쓰는 서버)에서 해당 사용자 항목 무효화
+"""
+import argparse
+import asyncio
+import logging
+from datetime import date, datetime, timedelta
+from typing import List
+
+from app.core.dashboard_history_cache import dashboard_history_cache, invalidate_history_cache_for_date
+from app.core.database import async_session, engine
+from app.repositories.detection_repository import DetectionRepository
+from app.repositories.detection_rollup_repository import DetectionRollupRepository
+
+logger = logging.getLogger("rebuild_detection_rollup")
+
+
+def _parse_date(value: str) -> date:
+    """YYYY-MM-DD 문자열을 date로 변환"""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"올바른 날짜 형식이 아닙니다. (YYYY-MM-DD): {value}")
+
+
+def _build_day_list(start_date: date, end_date: date) -> List[date]:
+    """시작일 ~ 종료일(포함) 일자 목록"""
+    return [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+
+
+async def _rebuild_single_day(target_date: date, worker_limiter: asyncio.Semaphore) -> int:
+    """하루치 집계를 별도 세션에서 재생성"""
+    async with worker_limiter:
+        async with async_session() as session:
+            try:
+                bucket_count = await DetectionRollupRepository(session).rebuild_day(target_date)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+            await invalidate_history_cache_for_date(
+                await DetectionRepository(session).get_user_seqs_on_date(target_date), target_date
+            )
+            return bucket_count
+
+
+async def rebuild_detection_rollup(start_date: date, end_date: date, workers: int) -> bool:
+    """기간 내 일자별 집계를 병렬로 재생성
+    - 반환값: 모든 일자 성공 여부
+    """
+    target_days = _build_day_list(start_date, end_date)
+    worker_limiter = asyncio.Semaphore(max(1, workers))
+
+    logger.info(f"집계 재생성 시작 [{start_date} ~ {end_date}, {len(target_days)}일, workers={workers}]")
+
+    results = await asyncio.gather(
+        *(_rebuild_single_day(target_date, worker_limiter) for target_date in target_days),
+        return_exceptions=True
+    )
+
+    failed_days = []
+    total_buckets = 0
+    for target_date, result in zip(target_days, results):
+        if isinstance(result, BaseException):
+            logger.error(f"집계 재생성 실패 [date={target_date}]: {str(result)}")
+            failed_days.append(target_date)
+        else:
+            total_buckets += result
+
+    logger.info(f"집계 재생성 완료: {total_buckets}개 버킷, 실패 {len(failed_days)}일")
+    return not failed_days
+
+
+async def _main(args: argparse.Namespace) -> int:
+    try:
+        success = await rebuild_detection_rollup(args.start_date, args.end_date, args.workers)
+        return 0 if success else 1
+    finally:
+        dashboard_history_cache.close()
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="시간대별 / 일자별 탐지 집계 재생성 / 백필")
+    parser.add_argument("--start-date", type=_parse_date, required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end-date", type=_parse_date, default=date.today(), help="종료일 (YYYY-MM-DD, 기본: 오늘)")
+    parser.add_argument("--workers", type=int, default=4, help="병렬 처리 일자 수 (기본: 4)")
+    args = parser.parse_args()
+
+    if args.start_date > args.end_date:
+        parser.error("시작일이 종료일보다 늦을 수 없습니다.")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    raise SystemExit(asyncio.run(_main(args)))
+
+
+if __name__ == "__main__":
+    main()
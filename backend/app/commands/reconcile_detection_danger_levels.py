@@ -0,0 +1,102 @@
+"""탐지 위험도 재계산 커맨드 (매핑 변경 후 실행)
+
+사용법:
+    python -m app.commands.reconcile_detection_danger_levels --start-date 2025-01-01 --end-date 2025-01-31 --workers 4
+
+- tbl_detection_results.danger_level / severity 를 현재 tbl_model_detection_mappings 기준으로 다시 계산
+- 일자 단위로 작업을 나누고, 일자마다 별도 세션/트랜잭션에서 처리 (값이 바뀐 행만 갱신)
+- 위험도가 바뀐 행의 집계 버킷은 행 UPDATE 트리거가 같은 트랜잭션에서 옮김 (재집계 불필요, migrations/010)
+- 위험도가 바뀐 일자는 지난 날짜 대시보드 캐시(같은 캐시 파일을 쓰는 서버)에서 해당 사용자 항목 무효화
+  (다른 서버의 캐시는 일자 워터마크 검증으로 반영)
+- 실행 중인 서버의 탐지 권한 인덱스는 매핑 TTL(entitlement_mapping_ttl_seconds) 경과 후 갱신됨
+"""
+import argparse
+import asyncio
+import logging
+from datetime import date
+
+from app.commands.rebuild_detection_rollup import _parse_date, _build_day_list
+from app.core.dashboard_history_cache import dashboard_history_cache, invalidate_history_cache_for_date
+from app.core.database import async_session, engine
+from app.repositories.detection_repository import DetectionRepository
+
+logger = logging.getLogger("reconcile_detection_danger_levels")
+
+
+async def _reconcile_single_day(target_date: date, worker_limiter: asyncio.Semaphore) -> int:
+    """하루치 위험도 재계산 (집계 버킷은 트리거가 함께 갱신)
+    - 반환값: 변경된 탐지 행 수
+    """
+    async with worker_limiter:
+        async with async_session() as session:
+            try:
+                detection_repository = DetectionRepository(session)
+                changed_count = await detection_repository.reconcile_danger_levels(target_date)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+            if changed_count:
+                await invalidate_history_cache_for_date(
+                    await detection_repository.get_user_seqs_on_date(target_date), target_date
+                )
+            return changed_count
+
+
+async def reconcile_detection_danger_levels(start_date: date, end_date: date, workers: int) -> bool:
+    """기간 내 일자별 위험도를 병렬로 재계산
+    - 반환값: 모든 일자 성공 여부
+    """
+    target_days = _build_day_list(start_date, end_date)
+    worker_limiter = asyncio.Semaphore(max(1, workers))
+
+    logger.info(f"위험도 재계산 시작 [{start_date} ~ {end_date}, {len(target_days)}일, workers={workers}]")
+
+    results = await asyncio.gather(
+        *(_reconcile_single_day(target_date, worker_limiter) for target_date in target_days),
+        return_exceptions=True
+    )
+
+    failed_days = []
+    total_changed = 0
+    changed_days = 0
+    for target_date, result in zip(target_days, results):
+        if isinstance(result, BaseException):
+            logger.error(f"위험도 재계산 실패 [date={target_date}]: {str(result)}")
+            failed_days.append(target_date)
+            continue
+
+        total_changed += result
+        if result:
+            changed_days += 1
+
+    logger.info(f"위험도 재계산 완료: {total_changed}건 변경, 변경 일자 {changed_days}일, 실패 {len(failed_days)}일")
+    return not failed_days
+
+
+async def _main(args: argparse.Namespace) -> int:
+    try:
+        success = await reconcile_detection_danger_levels(args.start_date, args.end_date, args.workers)
+        return 0 if success else 1
+    finally:
+        dashboard_history_cache.close()
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="탐지 위험도(danger_level / severity) 재계산")
+    parser.add_argument("--start-date", type=_parse_date, required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end-date", type=_parse_date, default=date.today(), help="종료일 (YYYY-MM-DD, 기본: 오늘)")
+    parser.add_argument("--workers", type=int, default=4, help="병렬 처리 일자 수 (기본: 4)")
+    args = parser.parse_args()
+
+    if args.start_date > args.end_date:
+        parser.error("시작일이 종료일보다 늦을 수 없습니다.")
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    raise SystemExit(asyncio.run(_main(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""프로세스 내 메모리 캐시
+- TTL(만료 시간) + 최대 개수 기반 LRU 제거
+- 히트/미스/제거 카운터 제공 (캐시 크기 산정용)
+- 이벤트 루프 단일 스레드에서만 사용 (락 없음)
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLLRUCache:
+    """TTL + LRU 메모리 캐시"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        """
+        - max_entries: 최대 보관 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+        - ttl_seconds: 기본 만료 시간(초)
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+        # 통계 카운터
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Optional[Any]]:
+        """캐시 조회 - (히트 여부, 값) 반환"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """캐시 저장 - ttl_seconds 미지정 시 기본 TTL 적용"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> bool:
+        """항목 삭제 - 삭제 여부 반환"""
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (히트율 포함)"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+
+
+class GenerationMap:
+    """키별 세대 번호 (항목 단위 무효화용) - TTL + LRU 로 크기 제한
+    - 무효화 시 전역 카운터의 다음 값을 키의 세대로 저장 (세대 값은 키별로 단조 증가)
+    - 제거된 키는 다음 조회 시 현재 전역 카운터 값을 새 세대로 저장
+      (제거 전 세대는 모두 그 값 이하이고, 같다면 그 뒤로 무효화가 없었으므로 이전 세대 결과도 유효)
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._generations = TTLLRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._counter = 0
+
+    def get(self, key: Hashable) -> int:
+        """현재 세대 번호"""
+        cache_hit, generation = self._generations.get(key)
+        if not cache_hit:
+            generation = self._counter
+            self._generations.set(key, generation)
+        return generation
+
+    def bump(self, key: Hashable) -> int:
+        """세대 번호 증가 (키의 이전 세대 결과 무효화) - 새 세대 번호 반환"""
+        self._counter += 1
+        self._generations.set(key, self._counter)
+        return self._counter
+
+    def clear(self) -> None:
+        """전체 삭제 (카운터는 유지 -> 이전 세대 번호를 다시 쓰지 않음)"""
+        self._generations.clear()
+
+    def __len__(self) -> int:
+        return len(self._generations)
@@ -0,0 +1,199 @@
+"""다국어 카탈로그 캐시 (프로세스 내)
+- 상품명: tbl_model_product_lang.product_name  -> model_product_seq 기준
+- AI 안내 템플릿: tbl_guidance_model_product(_lang).ai_detection_guide -> (model_product_seq, 탐지 라벨) 기준
+- 언어별로 처음 요청될 때 1회 조회 (lazy), 최대 언어 수 / TTL 로 메모리 제한
+- 조회 시 요청 언어 -> en-US 순서로 대체 (fallback)
+- 카탈로그 테이블에 없는 언어는 en-US 로 바로 대체 (요청 값마다 캐시 항목 / 적재 락이 생기지 않도록)
+- 변경 감지: check 주기마다 카탈로그 테이블 워터마크를 조회해 달라졌으면 전체 재적재
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLLRUCache
+from app.core.config import settings
+from app.models.model_product import ModelProductLang
+from app.models.guidance_model import GuidanceModel, GuidanceModelLang
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LANGUAGE = 'en-US'
+
+
+class LanguageCatalog:
+    """언어 1개의 카탈로그 텍스트 (읽기 전용)
+    - product_names: model_product_seq -> 상품명
+    - label_guides: (model_product_seq, target_detection_label) -> 안내 템플릿
+    - product_guides: model_product_seq -> 안내 템플릿 (라벨 일치 항목이 없을 때 사용)
+    """
+
+    def __init__(self, language: str, product_names: Dict[int, str],
+                 label_guides: Dict[Tuple[int, str], str], product_guides: Dict[int, str]):
+        self.language = language
+        self.product_names = product_names
+        self.label_guides = label_guides
+        self.product_guides = product_guides
+
+
+class CatalogView:
+    """요청 언어 + 대체 언어 카탈로그 묶음"""
+
+    def __init__(self, catalogs: List[LanguageCatalog]):
+        self.catalogs = catalogs
+
+    def product_name(self, model_product_seq: int) -> Optional[str]:
+        """상품명 (요청 언어 -> en-US, 없으면 None)"""
+        for catalog in self.catalogs:
+            product_name = catalog.product_names.get(model_product_seq)
+            if product_name:
+                return product_name
+        return None
+
+    def detection_guide(self, model_product_seq: int, detection_label: str) -> Optional[str]:
+        """AI 안내 템플릿 (라벨 일치 -> 상품 대표, 언어는 요청 언어 -> en-US, 없으면 None)"""
+        for catalog in self.catalogs:
+            guide = catalog.label_guides.get((model_product_seq, detection_label))
+            if guide:
+                return guide
+        for catalog in self.catalogs:
+            guide = catalog.product_guides.get(model_product_seq)
+            if guide:
+                return guide
+        return None
+
+
+class CatalogCache:
+    """언어별 카탈로그 캐시"""
+
+    def __init__(self, max_languages: int, ttl_seconds: float, check_seconds: float):
+        self.check_seconds = check_seconds
+        self._catalogs = TTLLRUCache(max_entries=max_languages, ttl_seconds=ttl_seconds)
+        self._load_locks: Dict[str, asyncio.Lock] = {}
+        self._languages: FrozenSet[str] = frozenset()
+        self._watermark: Optional[Tuple[Any, ...]] = None
+        self._checked_at: Optional[float] = None
+        self._check_lock = asyncio.Lock()
+        self.reloads = 0
+
+    async def get_view(self, db: AsyncSession, language: str) -> CatalogView:
+        """요청 언어 카탈로그 + en-US 대체 카탈로그 (카탈로그에 없는 언어는 en-US 만)"""
+        await self._check_watermark(db)
+
+        if language == DEFAULT_LANGUAGE or language not in self._languages:
+            languages = [DEFAULT_LANGUAGE]
+        else:
+            languages = [language, DEFAULT_LANGUAGE]
+        return CatalogView([await self._get_catalog(db, lang) for lang in languages])
+
+    def invalidate(self) -> None:
+        """전체 무효화 - 다음 조회 시 언어별로 다시 읽음"""
+        self._catalogs.clear()
+
+    def stats(self) -> Dict[str, object]:
+        """캐시 통계"""
+        return {
+            'reloads': self.reloads,
+            'known_languages': len(self._languages),
+            'languages': self._catalogs.stats()
+        }
+
+    async def _get_catalog(self, db: AsyncSession, language: str) -> LanguageCatalog:
+        """언어 카탈로그 조회 (캐시 미스 시 1회 조회, 같은 언어 동시 요청은 한 번만 적재)"""
+        cache_hit, catalog = self._catalogs.get(language)
+        if cache_hit:
+            return catalog
+
+        lock = self._load_locks.setdefault(language, asyncio.Lock())
+        async with lock:
+            cache_hit, catalog = self._catalogs.get(language)
+            if cache_hit:
+                return catalog
+
+            catalog = await self._load_catalog(db, language)
+            self._catalogs.set(language, catalog)
+            self.reloads += 1
+            logger.info(f"카탈로그 캐시 적재 [lang={language}]: 상품명 {len(catalog.product_names)}건, "
+                        f"안내 템플릿 {len(catalog.label_guides)}건")
+            return catalog
+
+    async def _load_catalog(self, db: AsyncSession, language: str) -> LanguageCatalog:
+        """언어 1개의 상품명 / 안내 템플릿 조회"""
+        product_result = await db.execute(
+            select(ModelProductLang.model_product_seq, ModelProductLang.product_name)
+            .where(ModelProductLang.lang_tag == language)
+            .order_by(ModelProductLang.model_product_lang_seq)
+        )
+        product_names: Dict[int, str] = {}
+        for row in product_result:
+            product_names.setdefault(row.model_product_seq, row.product_name)
+
+        # 상품당 안내 모델이 여러 개일 수 있으므로 (상품, 대상 라벨)별 / 상품별 가장 먼저 등록된 1건만 사용
+        guide_result = await db.execute(
+            select(
+                GuidanceModel.model_product_seq,
+                GuidanceModel.target_detection_label,
+                GuidanceModelLang.ai_detection_guide
+            )
+            .join(GuidanceModelLang, GuidanceModelLang.guidance_model_product_seq == GuidanceModel.guidance_model_product_seq)
+            .where(
+                GuidanceModelLang.lang_tag == language,
+                GuidanceModelLang.ai_detection_guide.isnot(None)
+            )
+            .order_by(GuidanceModel.guidance_model_product_seq, GuidanceModelLang.guidance_model_product_lang_seq)
+        )
+        label_guides: Dict[Tuple[int, str], str] = {}
+        product_guides: Dict[int, str] = {}
+        for row in guide_result:
+            label_guides.setdefault((row.model_product_seq, row.target_detection_label), row.ai_detection_guide)
+            product_guides.setdefault(row.model_product_seq, row.ai_detection_guide)
+
+        return LanguageCatalog(language, product_names, label_guides, product_guides)
+
+    async def _load_languages(self, db: AsyncSession) -> FrozenSet[str]:
+        """카탈로그 테이블에 있는 언어 태그 목록"""
+        result = await db.execute(
+            select(ModelProductLang.lang_tag).distinct()
+            .union(select(GuidanceModelLang.lang_tag).distinct())
+        )
+        return frozenset(row[0] for row in result if row[0])
+
+    async def _check_watermark(self, db: AsyncSession) -> None:
+        """check 주기마다 카탈로그 테이블 변경 여부 확인 - 바뀌었으면 전체 무효화 + 언어 목록 재조회"""
+        if self._checked_at is not None and time.monotonic() - self._checked_at < self.check_seconds:
+            return
+
+        async with self._check_lock:
+            if self._checked_at is not None and time.monotonic() - self._checked_at < self.check_seconds:
+                return
+
+            result = await db.execute(
+                select(
+                    select(func.count(ModelProductLang.model_product_lang_seq)).scalar_subquery(),
+                    select(func.max(ModelProductLang.lastup_dt)).scalar_subquery(),
+                    select(func.count(GuidanceModel.guidance_model_product_seq)).scalar_subquery(),
+                    select(func.max(GuidanceModel.lastup_dt)).scalar_subquery(),
+                    select(func.count(GuidanceModelLang.guidance_model_product_lang_seq)).scalar_subquery(),
+                    select(func.max(GuidanceModelLang.guidance_model_product_lang_seq)).scalar_subquery()
+                )
+            )
+            watermark = tuple(result.one())
+
+            if self._watermark is not None and watermark != self._watermark:
+                logger.info("카탈로그 테이블 변경 감지 - 카탈로그 캐시 무효화")
+                self.invalidate()
+            if watermark != self._watermark:
+                self._languages = await self._load_languages(db)
+            self._watermark = watermark
+            self._checked_at = time.monotonic()
+
+
+# 전역 카탈로그 캐시
+catalog_cache = CatalogCache(
+    max_languages=settings.catalog_cache_max_languages,
+    ttl_seconds=settings.catalog_cache_ttl_seconds,
+    check_seconds=settings.catalog_cache_check_seconds
+)
@@ -0,0 +1,150 @@
+"""외부 호출 서킷 브레이커 (프로세스 내)
+- 최근 window_size 건의 호출 결과(실패 / 지연)를 보고 상태 전환
+  - closed: 정상 호출, 최근 호출이 minimum_calls 건 이상이고 실패율 또는 지연 호출 비율이 기준 이상이면 open
+  - open: 호출하지 않고 바로 거부 (open_seconds 동안) -> 호출 측은 대체 경로 사용
+  - half_open: open_seconds 가 지나면 시험 호출 half_open_max_calls 건만 허용
+    - 시험 호출이 모두 성공(지연 아님)하면 closed, 하나라도 실패/지연이면 다시 open
+- 지연 호출: 성공했더라도 slow_call_seconds 이상 걸린 호출 (응답은 사용하지만 비율 계산에 포함)
+- 사용법: allow_request() 가 True 일 때만 호출 -> 결과에 따라 record_success(소요 시간) / record_failure() 호출
+- 워커별 상태 (다른 워커의 실패는 반영되지 않음)
+"""
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """실패율 / 지연 호출 비율 기반 서킷 브레이커"""
+
+    def __init__(self, name: str, window_size: int, minimum_calls: int, failure_rate_threshold: float,
+                 slow_call_rate_threshold: float, slow_call_seconds: float, open_seconds: float,
+                 half_open_max_calls: int, enabled: bool = True):
+        self.name = name
+        self.window_size = max(1, window_size)
+        self.minimum_calls = max(1, min(minimum_calls, self.window_size))
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.enabled = enabled
+
+        self.state = STATE_CLOSED
+        # 최근 호출 결과: (실패 여부, 지연 여부)
+        self._outcomes: Deque = deque(maxlen=self.window_size)
+        self._opened_at: Optional[float] = None
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+
+        # 통계 카운터
+        self.calls = 0
+        self.failures = 0
+        self.slow_calls = 0
+        self.rejected = 0
+        self.opened = 0
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부 (False 면 호출하지 말고 대체 경로 사용)"""
+        if not self.enabled or self.state == STATE_CLOSED:
+            return True
+
+        if self.state == STATE_OPEN:
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                self.rejected += 1
+                return False
+            self._transition(STATE_HALF_OPEN)
+
+        # half_open: 시험 호출 수 제한
+        if self._half_open_calls >= self.half_open_max_calls:
+            self.rejected += 1
+            return False
+        self._half_open_calls += 1
+        return True
+
+    def record_success(self, elapsed_seconds: float) -> None:
+        """호출 성공 기록 (소요 시간이 기준 이상이면 지연 호출)"""
+        slow = elapsed_seconds >= self.slow_call_seconds
+        self._record(failed=False, slow=slow)
+
+    def record_failure(self) -> None:
+        """호출 실패 기록 (연결 실패 / 타임아웃 / 서버 오류)"""
+        self._record(failed=True, slow=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """브레이커 상태 / 통계"""
+        failure_rate, slow_call_rate = self._rates()
+        return {
+            'name': self.name,
+            'enabled': self.enabled,
+            'state': self.state,
+            'window_calls': len(self._outcomes),
+            'failure_rate': round(failure_rate, 4),
+            'slow_call_rate': round(slow_call_rate, 4),
+            'open_remaining_seconds': (
+                round(max(0.0, self.open_seconds - (time.monotonic() - self._opened_at)), 1)
+                if self.state == STATE_OPEN else 0.0
+            ),
+            'calls': self.calls,
+            'failures': self.failures,
+            'slow_calls': self.slow_calls,
+            'rejected': self.rejected,
+            'opened': self.opened
+        }
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        if not self.enabled:
+            return
+
+        self.calls += 1
+        self.failures += failed
+        self.slow_calls += slow
+
+        if self.state == STATE_HALF_OPEN:
+            if failed or slow:
+                self._transition(STATE_OPEN)
+                return
+            self._half_open_successes += 1
+            if self._half_open_successes >= self.half_open_max_calls:
+                self._transition(STATE_CLOSED)
+            return
+
+        if self.state == STATE_OPEN:
+            return  # open 전에 시작된 호출의 결과 - 상태에 반영하지 않음
+
+        self._outcomes.append((failed, slow))
+        if len(self._outcomes) < self.minimum_calls:
+            return
+        failure_rate, slow_call_rate = self._rates()
+        if failure_rate >= self.failure_rate_threshold or slow_call_rate >= self.slow_call_rate_threshold:
+            self._transition(STATE_OPEN)
+
+    def _rates(self) -> Tuple[float, float]:
+        if not self._outcomes:
+            return 0.0, 0.0
+        total = len(self._outcomes)
+        return (
+            sum(1 for failed, _ in self._outcomes if failed) / total,
+            sum(1 for _, slow in self._outcomes if slow) / total
+        )
+
+    def _transition(self, state: str) -> None:
+        failure_rate, slow_call_rate = self._rates()
+        previous, self.state = self.state, state
+        if state == STATE_OPEN:
+            self._opened_at = time.monotonic()
+            self.opened += 1
+            logger.warning(f"서킷 브레이커 open [{self.name}] ({previous} -> open, 실패율 {failure_rate:.2f}, "
+                           f"지연 호출 비율 {slow_call_rate:.2f}, {self.open_seconds}초 후 시험 호출)")
+        else:
+            logger.info(f"서킷 브레이커 상태 변경 [{self.name}]: {previous} -> {state}")
+        if state == STATE_CLOSED:
+            self._outcomes.clear()
+        self._half_open_calls = 0
+        self._half_open_successes = 0
@@ -0,0 +1,50 @@
+"""조건부 GET (ETag / If-None-Match) 유틸리티
+- 데이터 워터마크 + 요청 표현(경로, 쿼리 파라미터)으로 ETag 생성
+- 클라이언트가 보낸 If-None-Match와 일치하면 집계 쿼리 없이 304 응답
+"""
+import hashlib
+import json
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+# 재검증 강제 (캐시는 하되 매 요청마다 ETag 확인)
+CONDITIONAL_CACHE_CONTROL = "private, no-cache"
+
+
+def build_etag(*parts: Any) -> str:
+    """ETag 생성 - 구성 요소를 직렬화한 해시 (JSON 직렬화 결과가 같은 응답은 같은 ETag)"""
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+    digest = hashlib.sha1(payload.encode('utf-8')).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교, 목록 / * 지원)"""
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == '*':
+        return True
+
+    current = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == current:
+            return True
+    return False
+
+
+def not_modified_response(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """If-None-Match 일치 시 304 응답 반환, 불일치 시 본 응답에 ETag 헤더 설정 후 None 반환"""
+    if etag_matches(request.headers.get('if-none-match'), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={'ETag': etag, 'Cache-Control': CONDITIONAL_CACHE_CONTROL}
+        )
+
+    response.headers['ETag'] = etag
+    response.headers['Cache-Control'] = CONDITIONAL_CACHE_CONTROL
+    return None
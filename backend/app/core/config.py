@@ -23,6 +23,8 @@ class Settings(BaseSettings):
     db_user: str = Field(..., description="DB 사용자명")
     db_password: str = Field(..., description="DB 비밀번호")
     db_name: str = Field(..., description="DB 이름")
+    db_pool_size: int = Field(default=10, description="DB 커넥션 풀 기본 크기")
+    db_max_overflow: int = Field(default=10, description="DB 커넥션 풀 초과 허용 개수")
     
     # JWT 보안 설정
     jwt_secret_key: str = Field(..., description="JWT 암호화 키")
@@ -42,6 +44,70 @@ class Settings(BaseSettings):
     web_api_base_url: str = Field(default="https://web.smartoko.com", description="웹 서버 API 기본 URL")
     web_api_enabled: bool = Field(default=True, description="웹 API 연동 활성화 여부")
     web_api_login_endpoint: str = Field(default="/api/auth/login", description="웹 로그인 API 엔드포인트") 
+    web_api_connect_timeout_seconds: float = Field(default=3.0, description="웹 API 연결 타임아웃(초)")
+    web_api_read_timeout_seconds: float = Field(default=10.0, description="웹 API 응답 읽기 타임아웃(초)")
+    web_api_pool_timeout_seconds: float = Field(default=5.0, description="웹 API 연결 풀 대기 타임아웃(초)")
+    web_api_max_connections: int = Field(default=50, description="웹 API 최대 동시 연결 수 (워커당)")
+    web_api_max_keepalive_connections: int = Field(default=20, description="웹 API keep-alive 유지 연결 수 (워커당)")
+    web_api_keepalive_expiry_seconds: float = Field(default=30.0, description="웹 API 유휴 keep-alive 연결 유지 시간(초)")
+    web_api_breaker_enabled: bool = Field(default=True, description="웹 API 로그인 서킷 브레이커 사용 여부")
+    web_api_breaker_window_size: int = Field(default=20, description="서킷 브레이커 판단에 쓰는 최근 호출 수")
+    web_api_breaker_minimum_calls: int = Field(default=10, description="서킷 브레이커가 open 을 판단하기 위한 최소 호출 수")
+    web_api_breaker_failure_rate: float = Field(default=0.5, description="서킷 브레이커 open 실패율 기준 (0-1)")
+    web_api_breaker_slow_call_rate: float = Field(default=0.8, description="서킷 브레이커 open 지연 호출 비율 기준 (0-1)")
+    web_api_slow_call_seconds: float = Field(default=3.0, description="지연 호출로 보는 웹 API 응답 시간(초)")
+    web_api_breaker_open_seconds: float = Field(default=30.0, description="서킷 브레이커 open 유지 시간(초) - 이후 시험 호출")
+    web_api_breaker_half_open_calls: int = Field(default=3, description="half_open 상태의 시험 호출 수")
+    web_api_local_login_fallback: bool = Field(default=True, description="웹 API 를 쓸 수 없을 때 로컬 비밀번호(bcrypt) 검증으로 로그인 여부")
+    
+    # 비밀번호 해싱(bcrypt) 스레드 풀 설정
+    password_hash_workers: int = Field(default=4, description="비밀번호 해싱 / 검증 동시 실행 수 (워커당 스레드 수)")
+    password_hash_max_queue: int = Field(default=64, description="비밀번호 해싱 대기열 상한 - 초과 시 바로 거절")
+
+    # 인증 사용자(principal) 캐시 설정
+    principal_cache_ttl_seconds: float = Field(default=60.0, description="인증 사용자 캐시 TTL(초) - 토큰 exp 를 넘지 않음, 다른 서버의 계정 상태 변경 반영 지연 상한")
+    principal_cache_max_entries: int = Field(default=10000, description="인증 사용자 캐시 최대 토큰 수")
+
+    # 대시보드 설정
+    dashboard_parallel_sections_enabled: bool = Field(default=True, description="대시보드 전체 조회 시 섹션 병렬 조회 여부")
+    dashboard_max_section_connections: int = Field(default=3, description="대시보드 요청 1건이 동시에 점유할 수 있는 최대 DB 커넥션 수")
+    dashboard_cache_enabled: bool = Field(default=True, description="대시보드 결과 캐시 사용 여부")
+    dashboard_cache_ttl_seconds: int = Field(default=30, description="대시보드 결과 캐시 만료 시간(초)")
+    dashboard_cache_max_entries: int = Field(default=5000, description="대시보드 결과 캐시 최대 항목 수 (LRU)")
+    dashboard_etag_enabled: bool = Field(default=True, description="대시보드 조회 api 조건부 GET(ETag/304) 사용 여부")
+    dashboard_stream_queue_size: int = Field(default=100, description="대시보드 스트리밍 연결별 이벤트 큐 크기 (초과 시 재동기화 요청)")
+    dashboard_stream_max_connections_per_user: int = Field(default=5, description="사용자별 대시보드 스트리밍 최대 동시 연결 수")
+    dashboard_stream_heartbeat_seconds: int = Field(default=15, description="대시보드 스트리밍 하트비트 주기(초)")
+    dashboard_stream_debounce_seconds: float = Field(default=1.0, description="대시보드 스트리밍 개요 / 시간대 차트 갱신 모음 간격(초, 사용자별)")
+    dashboard_stream_refresh_concurrency: int = Field(default=4, description="대시보드 스트리밍 개요 / 시간대 차트 동시 계산 수 (워커당)")
+    dashboard_history_cache_enabled: bool = Field(default=True, description="지난 날짜 대시보드 결과 디스크 캐시 사용 여부")
+    dashboard_history_cache_path: str = Field(default="cache/dashboard_history.sqlite3", description="지난 날짜 대시보드 캐시 SQLite 파일 경로")
+    dashboard_history_cache_max_age_days: int = Field(default=30, description="지난 날짜 대시보드 캐시 최대 보관 일수 (다른 인스턴스 지연 저장 대비)")
+    dashboard_trend_max_days: int = Field(default=92, description="기간 탐지 추이 api 최대 조회 일수")
+    
+    # 탐지 권한 인덱스 설정 (구독 / 탐지 매핑 메모리 인덱스)
+    entitlement_mapping_ttl_seconds: int = Field(default=300, description="탐지 매핑(라벨->위험도) 인덱스 갱신 주기(초)")
+    entitlement_user_ttl_seconds: int = Field(default=60, description="사용자 활성 구독 인덱스 만료 시간(초)")
+    entitlement_max_users: int = Field(default=10000, description="사용자 활성 구독 인덱스 최대 사용자 수 (LRU)")
+    
+    # 다국어 카탈로그 캐시 설정 (상품명 / AI 안내 템플릿)
+    catalog_cache_max_languages: int = Field(default=16, description="카탈로그 캐시 최대 언어 수 (LRU)")
+    catalog_cache_ttl_seconds: int = Field(default=3600, description="언어별 카탈로그 캐시 만료 시간(초)")
+    catalog_cache_check_seconds: int = Field(default=60, description="카탈로그 테이블 변경 확인 주기(초)")
+
+    # 구독 사용량 계측 설정 (구독별 일자 사용량 카운터)
+    usage_meter_flush_seconds: int = Field(default=5, description="사용량 증가분 DB 반영 주기(초)")
+    usage_meter_max_pending: int = Field(default=1000, description="주기와 무관하게 즉시 반영할 미반영 카운터 수")
+    usage_meter_read_ttl_seconds: int = Field(default=30, description="DB 사용량 / 구독 한도 메모리 캐시 만료 시간(초, 다른 인스턴스 사용량 반영 주기)")
+    usage_meter_max_entries: int = Field(default=20000, description="사용량 / 구독 한도 메모리 캐시 최대 항목 수 (LRU)")
+
+    # 탐지 결과 일괄 저장 api 설정 (AI 서버 -> 탐지 결과 저장)
+    detection_ingest_api_keys: List[str] = Field(default=[], description="탐지 저장 api 키 목록 (X-Ingest-Key 헤더, 비어 있으면 api 비활성화)")
+    ops_api_keys: List[str] = Field(default=[], description="운영 통계 api 키 목록 (X-Ops-Key 헤더, 비어 있으면 api 비활성화)")
+    detection_ingest_max_batch: int = Field(default=5000, description="탐지 저장 요청 1건의 최대 항목 수")
+    detection_coalesce_window_seconds: int = Field(default=60, description="반복 탐지 병합 구간(초, 같은 디바이스/상품/라벨, 0이면 병합 안 함)")
+    detection_coalesce_flush_seconds: int = Field(default=5, description="병합 누적분 DB 반영 확인 주기(초)")
+    detection_coalesce_max_groups: int = Field(default=50000, description="동시에 열어 둘 최대 병합 구간 수 (초과 시 병합 없이 저장)")
     
     #파일 저장소 설정 ->환경별 분리
     upload_base_directory: str = Field(default="uploads", description="업로드 파일 기본 디렉토리")
@@ -0,0 +1,52 @@
+"""탐지 위험도 분류
+- danger_level: tbl_model_detection_mappings.danger_level ENUM 값
+- severity: 정렬/범위 조회용 숫자 등급 (클수록 위험, 매핑 없는 탐지는 NULL)
+- 탐지 저장 시 annotate_danger_levels 로 위험도/등급을 채워 tbl_detection_results 에 비정규화
+  (앱을 거치지 않는 저장 경로는 BEFORE INSERT 트리거가 같은 규칙으로 채움 - migrations/012)
+- 같은 라벨의 중복 매핑은 가장 위험한 위험도 하나로 고정 (most_severe_danger_level)
+"""
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import case, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.entitlement_index import entitlement_index
+
+# 위험도 버킷 (tbl_model_detection_mappings.danger_level ENUM 순서)
+DANGER_LEVELS = ('critical', 'high', 'medium', 'low', 'safe', 'normal')
+
+# 위험도 -> 숫자 등급
+DANGER_LEVEL_SEVERITY = {
+    'critical': 5,
+    'high': 4,
+    'medium': 3,
+    'low': 2,
+    'safe': 1,
+    'normal': 0
+}
+
+
+def severity_of(danger_level: Optional[str]) -> Optional[int]:
+    """위험도 숫자 등급 (매핑 없으면 None)"""
+    if danger_level is None:
+        return None
+    return DANGER_LEVEL_SEVERITY.get(danger_level)
+
+
+def most_severe_danger_level(danger_level_column: ColumnElement) -> ColumnElement:
+    """그룹 내 가장 위험한 위험도 집계 식 - MAX(등급)을 위험도 값으로 되돌림
+    - ENUM 컬럼에 MIN / MAX 를 쓰면 문자열 비교('critical' < 'high' < 'low' < 'medium' ...)가 되므로 사용 금지
+    """
+    max_severity = func.max(case(DANGER_LEVEL_SEVERITY, value=danger_level_column))
+    return case({severity: level for level, severity in DANGER_LEVEL_SEVERITY.items()}, value=max_severity)
+
+
+async def annotate_danger_levels(db: AsyncSession, detections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """저장할 탐지 목록에 danger_level / severity 채우기 (탐지 권한 인덱스의 전역 매핑 사용)"""
+    danger_levels = await entitlement_index.get_danger_levels(db)
+    for detection in detections:
+        danger_level = danger_levels.get((detection['model_product_seq'], detection['detection_label']))
+        detection['danger_level'] = danger_level
+        detection['severity'] = severity_of(danger_level)
+    return detections
@@ -0,0 +1,93 @@
+"""대시보드 결과 캐시
+- 키: (user_seq, target_date, language, section)
+- TTL + LRU 크기 제한 (app/core/cache.py)
+- 사용자별 세대(generation) 번호를 키에 포함해 사용자 단위 무효화를 O(1)로 처리
+  (무효화 시 세대만 올리면 이전 항목은 더 이상 조회되지 않고 LRU로 자연 제거, 세대 번호도 같은 크기 / TTL 로 제한)
+- 다른 워커 / 웹 서버 / AI 서버의 변경: 조건부 GET 에서 계산한 DB 워터마크가 이 프로세스가 마지막으로 본 값과 다르면 무효화
+  (ETag 는 DB 워터마크만으로 만들고, 응답 본문이 그보다 오래된 캐시 결과가 되지 않도록 함)
+"""
+import logging
+from datetime import date
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from app.core.cache import GenerationMap, TTLLRUCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class DashboardCache:
+    """사용자별 대시보드 결과 캐시"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float, enabled: bool = True):
+        self.enabled = enabled
+        self._cache = TTLLRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._user_generations = GenerationMap(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._watermarks = TTLLRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.invalidations = 0
+
+    def make_key(self, user_seq: int, target_date: Optional[date], language: Optional[str], section: str) -> Hashable:
+        """캐시 키 생성 - 조회 시작 시점의 세대 번호 포함
+        (조회 도중 무효화되면 결과는 이전 세대 키로 저장되어 다시 조회되지 않음)
+        """
+        generation = self.user_generation(user_seq)
+        return (user_seq, generation, target_date.isoformat() if target_date else None, language, section)
+
+    def get(self, key: Hashable) -> Tuple[bool, Optional[Any]]:
+        """캐시 조회 - (히트 여부, 값)"""
+        if not self.enabled:
+            return False, None
+        return self._cache.get(key)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """캐시 저장"""
+        if self.enabled:
+            self._cache.set(key, value)
+
+    def user_generation(self, user_seq: int) -> int:
+        """사용자 세대 번호 (탐지 저장 / DB 워터마크 변경 등 무효화 시 증가)"""
+        return self._user_generations.get(user_seq)
+
+    def invalidate_user(self, user_seq: int) -> None:
+        """사용자 캐시 전체 무효화"""
+        self._user_generations.bump(user_seq)
+        self.invalidations += 1
+
+    def sync_watermark(self, user_seq: int, scope: Optional[date], watermark: Any) -> None:
+        """DB 워터마크 확인 - 처음 보거나 마지막으로 본 값과 다르면 사용자 캐시 무효화
+        - scope: 워터마크 범위 (None: 사용자 전체, 날짜: 지난 날짜 워터마크)
+        - 워터마크 항목이 결과 캐시와 같은 TTL 로 만료되므로 처음 보는 경우도 이전 결과를 신뢰하지 않음
+        """
+        key = (user_seq, scope.isoformat() if scope else None)
+        cache_hit, previous = self._watermarks.get(key)
+        if not cache_hit or previous != watermark:
+            self.invalidate_user(user_seq)
+            self._watermarks.set(key, watermark)
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        self._cache.clear()
+        self._watermarks.clear()
+        self._user_generations.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        return {
+            'enabled': self.enabled,
+            **self._cache.stats(),
+            'invalidations': self.invalidations
+        }
+
+
+# 전역 대시보드 캐시
+dashboard_cache = DashboardCache(
+    max_entries=settings.dashboard_cache_max_entries,
+    ttl_seconds=settings.dashboard_cache_ttl_seconds,
+    enabled=settings.dashboard_cache_enabled
+)
+
+
+async def invalidate_dashboard_cache_for_detections(detections: List[Dict[str, Any]]) -> None:
+    """탐지 커밋 훅 - 탐지가 저장된 사용자의 캐시 무효화"""
+    for user_seq in {detection['user_seq'] for detection in detections}:
+        dashboard_cache.invalidate_user(user_seq)
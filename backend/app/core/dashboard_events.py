@@ -0,0 +1,115 @@
+"""대시보드 실시간 이벤트 pub/sub (프로세스 내)
+- 사용자별 구독자(스트리밍 연결) 목록에 이벤트를 팬아웃
+- 연결마다 크기 제한 큐 사용 (느린 클라이언트가 메모리를 무한히 점유하지 않도록)
+- 느린 소비자 정책: 큐가 가득 차면 밀린 이벤트를 모두 버리고 'resync' 이벤트 1건만 남김
+  (클라이언트는 resync 수신 시 REST /dashboard/complete 로 전체 재조회)
+- 이벤트 루프 단일 스레드에서만 사용 (락 없음)
+"""
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+RESYNC_EVENT = 'resync'
+
+
+class DashboardEventSubscription:
+    """스트리밍 연결 1개의 이벤트 큐"""
+
+    def __init__(self, user_seq: int, queue_size: int):
+        self.user_seq = user_seq
+        self.queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=max(1, queue_size))
+        self.dropped_events = 0
+
+    def offer(self, event: Dict[str, Any]) -> bool:
+        """이벤트 적재 - 큐가 가득 차면 느린 소비자 정책 적용 (적재 성공 여부 반환)"""
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            # 밀린 이벤트는 증분이라 일부만 버리면 화면이 틀어지므로 전부 버리고 재동기화 요청
+            while not self.queue.empty():
+                self.queue.get_nowait()
+                self.dropped_events += 1
+            self.dropped_events += 1
+            self.queue.put_nowait({'event': RESYNC_EVENT, 'data': {'reason': 'slow_consumer'}})
+            return False
+
+    async def next_event(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """다음 이벤트 대기 (timeout 초 동안 없으면 None)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class DashboardEventBroker:
+    """사용자별 대시보드 이벤트 브로커"""
+
+    def __init__(self, queue_size: int, max_connections_per_user: int):
+        self.queue_size = queue_size
+        self.max_connections_per_user = max_connections_per_user
+        self._subscriptions: Dict[int, Set[DashboardEventSubscription]] = {}
+
+        # 통계 카운터
+        self.published_events = 0
+        self.dropped_events = 0
+
+    def subscribe(self, user_seq: int) -> Optional[DashboardEventSubscription]:
+        """구독 등록 - 사용자별 최대 연결 수 초과 시 None"""
+        user_subscriptions = self._subscriptions.setdefault(user_seq, set())
+        if len(user_subscriptions) >= self.max_connections_per_user:
+            return None
+
+        subscription = DashboardEventSubscription(user_seq, self.queue_size)
+        user_subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: DashboardEventSubscription) -> None:
+        """구독 해제"""
+        user_subscriptions = self._subscriptions.get(subscription.user_seq)
+        if not user_subscriptions:
+            return
+
+        user_subscriptions.discard(subscription)
+        self.dropped_events += subscription.dropped_events
+        if not user_subscriptions:
+            del self._subscriptions[subscription.user_seq]
+
+    def has_subscribers(self, user_seq: int) -> bool:
+        """사용자 구독자 존재 여부 (없으면 증분 계산 생략)"""
+        return bool(self._subscriptions.get(user_seq))
+
+    def publish(self, user_seq: int, event_type: str, data: Any) -> int:
+        """사용자 구독자 전체에 이벤트 발행 - 전달된 연결 수 반환"""
+        user_subscriptions = self._subscriptions.get(user_seq)
+        if not user_subscriptions:
+            return 0
+
+        event = {'event': event_type, 'data': data}
+        for subscription in user_subscriptions:
+            if not subscription.offer(event):
+                logger.warning(f"대시보드 스트림 느린 소비자 - 이벤트 폐기 후 재동기화 요청 [user_seq={user_seq}]")
+        self.published_events += 1
+        return len(user_subscriptions)
+
+    def stats(self) -> Dict[str, Any]:
+        """브로커 통계"""
+        return {
+            'users': len(self._subscriptions),
+            'connections': sum(len(subs) for subs in self._subscriptions.values()),
+            'published_events': self.published_events,
+            'dropped_events': self.dropped_events + sum(
+                sub.dropped_events for subs in self._subscriptions.values() for sub in subs
+            )
+        }
+
+
+# 전역 대시보드 이벤트 브로커
+dashboard_event_broker = DashboardEventBroker(
+    queue_size=settings.dashboard_stream_queue_size,
+    max_connections_per_user=settings.dashboard_stream_max_connections_per_user
+)
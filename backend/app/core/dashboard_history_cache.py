@@ -0,0 +1,268 @@
+"""지난 날짜 대시보드 결과 캐시 (로컬 디스크, SQLite)
+- 키: (user_seq, target_date, section) - 오늘 이전 날짜의 날짜별 섹션(개요, 시간대 차트 등)만 저장
+- 지난 날짜 결과는 지연 저장(늦게 도착한 탐지) 외에는 바뀌지 않으므로 만료 없이 보관 (안전장치로 최대 보관 일수만 둠)
+- 서버 재시작 후에도 유지되어 과거 날짜 조회가 무거운 집계 쿼리를 거치지 않음
+- DB 워터마크 검증: 항목마다 저장 시점의 일자 워터마크(DashboardRepository.get_user_day_watermark)를 함께 저장
+  - 조회 시 현재 워터마크와 다르면 미스 -> 웹 서버의 구독/디바이스 변경, 다른 인스턴스 / AI 서버의 지연 저장,
+    위험도 재계산 / 집계 재생성처럼 이 프로세스의 훅을 거치지 않는 변경도 반영 (워터마크 조회 1회는 항상 실행)
+  - 구독/디바이스 변경은 워터마크의 구독 / 디바이스 버전으로만 반영 (이 앱에는 변경 경로가 없음)
+- 무효화 (워터마크 검증 전에 바로 지우는 경로)
+  - 지연 저장 훅: 탐지가 저장된 (사용자, 날짜) 항목 삭제
+  - 위험도 재계산 / 집계 재생성 커맨드: 처리한 (사용자, 날짜) 항목 삭제 (같은 캐시 파일을 쓰는 서버)
+- 버전: 무효화할 때마다 (사용자, 날짜) / 사용자 버전 증가
+  - 조회 시작 시점 버전과 저장 시점 버전이 다르면 저장하지 않음 (조회 도중 무효화된 결과 방지)
+- sqlite3 호출은 이벤트 루프를 막지 않도록 스레드에서 실행 (연결 1개 + 락)
+- 서버 인스턴스별 로컬 파일 (다른 인스턴스의 변경은 워터마크 검증으로 반영)
+"""
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 저장 형식 버전 (응답 스키마가 바뀌면 올려서 이전 항목 무시)
+SCHEMA_VERSION = 2
+
+# 사용자 단위 버전 행의 날짜 값
+USER_SCOPE = ''
+
+_CREATE_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS day_sections (
+        user_seq INTEGER NOT NULL,
+        target_date TEXT NOT NULL,
+        section TEXT NOT NULL,
+        schema_version INTEGER NOT NULL,
+        payload TEXT NOT NULL,
+        watermark TEXT NOT NULL DEFAULT '',
+        stored_at REAL NOT NULL,
+        PRIMARY KEY (user_seq, target_date, section)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS versions (
+        user_seq INTEGER NOT NULL,
+        target_date TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        PRIMARY KEY (user_seq, target_date)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_day_sections_stored_at ON day_sections (stored_at)"
+)
+
+
+class DashboardHistoryCache:
+    """지난 날짜 대시보드 섹션 캐시"""
+
+    def __init__(self, path: str, max_age_days: int, enabled: bool = True):
+        self.path = path
+        self.max_age_seconds = max_age_days * 86400
+        self.enabled = enabled
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+        # 통계 카운터
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.stale_writes = 0
+        self.invalidations = 0
+
+    def is_cacheable(self, target_date: Optional[date]) -> bool:
+        """지난 날짜만 저장 대상"""
+        return self.enabled and target_date is not None and target_date < date.today()
+
+    async def get_version(self, user_seq: int, target_date: date) -> Optional[Tuple[int, int]]:
+        """(사용자 버전, 날짜 버전) - 조회 시작 전에 받아 put 에 전달 (캐시 파일 오류 시 None)"""
+        try:
+            return await asyncio.to_thread(self._get_version, user_seq, target_date.isoformat())
+        except sqlite3.Error as e:
+            logger.error(f"지난 날짜 캐시 버전 조회 실패 [user_seq={user_seq}, date={target_date}]: {str(e)}")
+            return None
+
+    async def get(self, user_seq: int, target_date: date, section: str, watermark: Any) -> Tuple[bool, Optional[Any]]:
+        """섹션 조회 - (히트 여부, JSON 역직렬화 값), 저장 시점 워터마크가 현재 워터마크와 다르면 미스"""
+        try:
+            payload = await asyncio.to_thread(
+                self._get, user_seq, target_date.isoformat(), section, _serialize_watermark(watermark)
+            )
+        except sqlite3.Error as e:
+            logger.error(f"지난 날짜 캐시 조회 실패 [user_seq={user_seq}, date={target_date}, section={section}]: {str(e)}")
+            return False, None
+
+        if payload is None:
+            self.misses += 1
+            return False, None
+
+        self.hits += 1
+        return True, json.loads(payload)
+
+    async def put(self, user_seq: int, target_date: date, section: str, value: Any,
+                  version: Optional[Tuple[int, int]], watermark: Any) -> None:
+        """섹션 저장 - value 는 JSON 직렬화 가능한 값, version / watermark 는 조회 시작 전 값"""
+        if version is None:
+            return
+        try:
+            payload = json.dumps(value, default=str, ensure_ascii=False, separators=(',', ':'))
+            stored = await asyncio.to_thread(
+                self._put, user_seq, target_date.isoformat(), section, payload, version, _serialize_watermark(watermark)
+            )
+        except sqlite3.Error as e:
+            logger.error(f"지난 날짜 캐시 저장 실패 [user_seq={user_seq}, date={target_date}, section={section}]: {str(e)}")
+            return
+
+        if stored:
+            self.writes += 1
+        else:
+            self.stale_writes += 1
+
+    async def invalidate_day(self, user_seq: int, target_date: date) -> None:
+        """(사용자, 날짜) 항목 무효화 - 지연 저장 시"""
+        await asyncio.to_thread(self._invalidate, user_seq, target_date.isoformat())
+        self.invalidations += 1
+
+    async def invalidate_user(self, user_seq: int) -> None:
+        """사용자 항목 전체 무효화"""
+        await asyncio.to_thread(self._invalidate, user_seq, USER_SCOPE)
+        self.invalidations += 1
+
+    def close(self) -> None:
+        """연결 종료 (서버 종료 시)"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            'writes': self.writes,
+            'stale_writes': self.stale_writes,
+            'invalidations': self.invalidations
+        }
+
+    # sqlite3 작업 (스레드에서 실행)
+    def _connect(self) -> sqlite3.Connection:
+        """최초 사용 시 파일/테이블 생성 + 보관 기간이 지난 항목 정리"""
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in _CREATE_STATEMENTS:
+                connection.execute(statement)
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(day_sections)")}
+            if 'watermark' not in columns:  # 워터마크 검증 이전 캐시 파일
+                connection.execute("ALTER TABLE day_sections ADD COLUMN watermark TEXT NOT NULL DEFAULT ''")
+            with connection:
+                connection.execute("DELETE FROM day_sections WHERE stored_at < ?", (time.time() - self.max_age_seconds,))
+            self._connection = connection
+            logger.info(f"지난 날짜 대시보드 캐시 열기: {self.path}")
+        return self._connection
+
+    def _read_version(self, connection: sqlite3.Connection, user_seq: int, target_date: str) -> Tuple[int, int]:
+        rows = connection.execute(
+            "SELECT target_date, version FROM versions WHERE user_seq = ? AND target_date IN (?, ?)",
+            (user_seq, USER_SCOPE, target_date)
+        ).fetchall()
+        versions = dict(rows)
+        return versions.get(USER_SCOPE, 0), versions.get(target_date, 0)
+
+    def _get_version(self, user_seq: int, target_date: str) -> Tuple[int, int]:
+        with self._lock:
+            return self._read_version(self._connect(), user_seq, target_date)
+
+    def _get(self, user_seq: int, target_date: str, section: str, watermark: str) -> Optional[str]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT payload FROM day_sections "
+                "WHERE user_seq = ? AND target_date = ? AND section = ? AND schema_version = ? AND watermark = ? "
+                "AND stored_at >= ?",
+                (user_seq, target_date, section, SCHEMA_VERSION, watermark, time.time() - self.max_age_seconds)
+            ).fetchone()
+            return row[0] if row else None
+
+    def _put(self, user_seq: int, target_date: str, section: str, payload: str, version: Tuple[int, int],
+             watermark: str) -> bool:
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                if self._read_version(connection, user_seq, target_date) != tuple(version):
+                    return False
+                connection.execute(
+                    "INSERT OR REPLACE INTO day_sections "
+                    "(user_seq, target_date, section, schema_version, payload, watermark, stored_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (user_seq, target_date, section, SCHEMA_VERSION, payload, watermark, time.time())
+                )
+            return True
+
+    def _invalidate(self, user_seq: int, target_date: str) -> None:
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                if target_date == USER_SCOPE:
+                    connection.execute("DELETE FROM day_sections WHERE user_seq = ?", (user_seq,))
+                else:
+                    connection.execute(
+                        "DELETE FROM day_sections WHERE user_seq = ? AND target_date = ?", (user_seq, target_date)
+                    )
+                connection.execute(
+                    "INSERT INTO versions (user_seq, target_date, version) VALUES (?, ?, 1) "
+                    "ON CONFLICT (user_seq, target_date) DO UPDATE SET version = version + 1",
+                    (user_seq, target_date)
+                )
+
+
+def _serialize_watermark(watermark: Any) -> str:
+    """워터마크 비교용 직렬화 (키 순서 고정)"""
+    return json.dumps(watermark, sort_keys=True, default=str, separators=(',', ':'))
+
+
+# 전역 지난 날짜 캐시
+dashboard_history_cache = DashboardHistoryCache(
+    path=settings.dashboard_history_cache_path,
+    max_age_days=settings.dashboard_history_cache_max_age_days,
+    enabled=settings.dashboard_history_cache_enabled
+)
+
+
+async def invalidate_history_cache_for_late_detections(detections: List[Dict[str, Any]]) -> None:
+    """탐지 커밋 훅 - 지난 날짜 탐지(지연 저장)가 들어온 (사용자, 날짜) 항목 무효화"""
+    today = date.today()
+    late_days = {
+        (detection['user_seq'], detection['detected_at'].date())
+        for detection in detections
+        if detection['detected_at'].date() < today
+    }
+    if not late_days or not dashboard_history_cache.enabled:
+        return
+
+    for user_seq, target_date in late_days:
+        await dashboard_history_cache.invalidate_day(user_seq, target_date)
+    logger.info(f"지연 저장 탐지로 지난 날짜 캐시 무효화: {len(late_days)}건")
+
+
+async def invalidate_history_cache_for_date(user_seqs: Iterable[int], target_date: date) -> None:
+    """위험도 재계산 / 집계 재생성 커맨드 - 처리한 일자의 사용자 항목 무효화"""
+    if not dashboard_history_cache.is_cacheable(target_date):
+        return
+
+    for user_seq in user_seqs:
+        await dashboard_history_cache.invalidate_day(user_seq, target_date)
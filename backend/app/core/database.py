@@ -11,6 +11,8 @@ engine = create_async_engine(
     echo=settings.debug,  # 개발환경에서는 SQL 쿼리 로그 출력
     pool_pre_ping=True,   # 연결 상태 체크
     pool_recycle=3600,    # 1시간마다 연결 재생성
+    pool_size=settings.db_pool_size,          # 대시보드 섹션 병렬 조회 대비 풀 크기
+    max_overflow=settings.db_max_overflow,
 )
 
 # 비동기 세션 팩토리
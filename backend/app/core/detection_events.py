@@ -0,0 +1,63 @@
+"""탐지 결과 저장 훅
+- 탐지 결과가 저장될 때 캐시 등 파생 데이터를 함께 갱신하기 위한 레지스트리
+- 시간대별 / 일자별 집계는 여기서 갱신하지 않음 -> tbl_detection_results 트리거 (앱을 거치지 않는 저장 경로 포함, migrations/010)
+- on_write: 저장과 같은 트랜잭션 안에서 실행 (실패 시 저장도 롤백)
+- on_commit: 커밋 이후 실행 (실패해도 저장에는 영향 없음, 로그만 기록)
+
+훅에 전달되는 탐지 레코드는 dict 목록이며 아래 키를 가집니다
+- user_seq, device_seq, model_product_seq, detection_label, detected_at
+- detection_count (없으면 1)
+- last_detected_at (선택, 병합된 반복 탐지의 마지막 탐지 시각 - 집계 버킷은 detected_at 기준)
+- usage_metered (선택, True 면 구독 사용량 계측 제외 - 이미 계측된 병합 누적분)
+- coalesced (선택, True 면 반복 탐지 병합 누적분 - detection_seq 가 있으면 기존 행에 더해진 값, 없으면 새로 저장된 누적분 행)
+"""
+import logging
+from typing import Any, Awaitable, Callable, Dict, List
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+DetectionRecord = Dict[str, Any]
+WriteHandler = Callable[[AsyncSession, List[DetectionRecord]], Awaitable[None]]
+CommitHandler = Callable[[List[DetectionRecord]], Awaitable[None]]
+
+
+class DetectionWriteHooks:
+    """탐지 결과 저장 훅 레지스트리"""
+
+    def __init__(self):
+        self._write_handlers: List[WriteHandler] = []
+        self._commit_handlers: List[CommitHandler] = []
+
+    def on_write(self, handler: WriteHandler) -> WriteHandler:
+        """트랜잭션 내 훅 등록"""
+        if handler not in self._write_handlers:
+            self._write_handlers.append(handler)
+        return handler
+
+    def on_commit(self, handler: CommitHandler) -> CommitHandler:
+        """커밋 후 훅 등록"""
+        if handler not in self._commit_handlers:
+            self._commit_handlers.append(handler)
+        return handler
+
+    async def run_write_hooks(self, db: AsyncSession, detections: List[DetectionRecord]) -> None:
+        """트랜잭션 내 훅 실행 - 예외는 호출자에게 전달 (롤백 판단용)"""
+        if not detections:
+            return
+        for handler in self._write_handlers:
+            await handler(db, detections)
+
+    async def run_commit_hooks(self, detections: List[DetectionRecord]) -> None:
+        """커밋 후 훅 실행 - 예외는 로그만 남기고 계속 진행"""
+        if not detections:
+            return
+        for handler in self._commit_handlers:
+            try:
+                await handler(detections)
+            except Exception as e:
+                logger.error(f"탐지 커밋 훅 실행 실패 [{getattr(handler, '__name__', handler)}]: {str(e)}")
+
+
+# 전역 훅 레지스트리
+detection_write_hooks = DetectionWriteHooks()
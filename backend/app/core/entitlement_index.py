@@ -0,0 +1,150 @@
+"""탐지 권한(entitlement) 인덱스 (프로세스 내)
+- 전역 매핑: (model_product_seq, detection_label) -> danger_level  (tbl_model_detection_mappings)
+- 사용자별: 활성 구독(subscription_status='A') model_product_seq 집합 (tbl_model_product_subscription)
+- 두 테이블은 거의 변경되지 않으므로 메모리에 두고 매 쿼리의 구독 조인을 IN 목록 조건으로 대체
+- 매핑은 탐지 저장 시 위험도 비정규화(app.core.danger_levels)에 사용 (조회 쿼리는 탐지 행의 danger_level 사용)
+- 갱신: 매핑은 TTL 만료 또는 invalidate_mappings(), 사용자 구독은 TTL 만료 또는 구독 버전 변경
+  - 사용자 구독 캐시 키에 마지막으로 확인한 tbl_user_data_version.subscription_version 포함
+    (조건부 GET 이 DB 워터마크로 sync_subscription_version 호출 -> 새 ETag 에 이전 구독 기준 결과가 나가지 않음)
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, FrozenSet, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLLRUCache
+from app.core.config import settings
+from app.models.detection_mapping import ModelDetectionMapping
+from app.models.subscription import ModelProductSubscription
+
+logger = logging.getLogger(__name__)
+
+LabelKey = Tuple[int, str]
+
+
+class UserEntitlement:
+    """사용자 탐지 권한 스냅샷 (읽기 전용)
+    - model_product_seqs: 활성 구독 모델 상품 번호
+    """
+
+    def __init__(self, user_seq: int, model_product_seqs: FrozenSet[int]):
+        self.user_seq = user_seq
+        self.model_product_seqs = model_product_seqs
+
+    def allows(self, model_product_seq: int, danger_level: Optional[str]) -> bool:
+        """탐지 권한 확인 - 활성 구독 상품 + 매핑된(위험도 있는) 탐지 (query_filters.entitled_detection 과 같은 조건)"""
+        return danger_level is not None and model_product_seq in self.model_product_seqs
+
+
+class EntitlementIndex:
+    """탐지 권한 인덱스"""
+
+    def __init__(self, mapping_ttl_seconds: float, user_ttl_seconds: float, max_users: int):
+        self.mapping_ttl_seconds = mapping_ttl_seconds
+        self.mapping_version = 0
+        self._mappings: Dict[LabelKey, str] = {}
+        self._mappings_loaded_at: Optional[float] = None
+        self._mapping_lock = asyncio.Lock()
+        self._users = TTLLRUCache(max_entries=max_users, ttl_seconds=user_ttl_seconds)
+        self._subscription_versions = TTLLRUCache(max_entries=max_users, ttl_seconds=user_ttl_seconds)
+
+    async def get_user_entitlement(self, db: AsyncSession, user_seq: int) -> UserEntitlement:
+        """사용자 탐지 권한 조회 (캐시 미스 시 활성 구독 1회 조회)
+        - 조회 시작 시점의 구독 버전을 키에 포함 (조회 도중 버전이 바뀌면 결과는 이전 버전 키로 저장되어 다시 조회되지 않음)
+        """
+        key = self._user_key(user_seq)
+        cache_hit, entitlement = self._users.get(key)
+        if cache_hit:
+            return entitlement
+
+        result = await db.execute(
+            select(ModelProductSubscription.model_product_seq)
+            .where(
+                ModelProductSubscription.user_seq == user_seq,
+                ModelProductSubscription.subscription_status == 'A'  # 활성 구독만
+            )
+            .distinct()
+        )
+        entitlement = UserEntitlement(user_seq, frozenset(result.scalars().all()))
+        self._users.set(key, entitlement)
+        return entitlement
+
+    async def get_danger_levels(self, db: AsyncSession) -> Dict[LabelKey, str]:
+        """전역 (model_product_seq, detection_label) -> danger_level 매핑"""
+        await self._ensure_mappings(db)
+        return self._mappings
+
+    def sync_subscription_version(self, user_seq: int, subscription_version: int) -> None:
+        """DB 구독 버전 확인 - 처음 보거나 마지막으로 본 값과 다르면 이후 조회는 새 키 사용 (이전 권한은 LRU로 자연 제거)
+        - 버전 항목이 권한 캐시와 같은 TTL 로 만료되므로 처음 보는 경우도 이전 권한을 신뢰하지 않음
+        """
+        cache_hit, previous = self._subscription_versions.get(user_seq)
+        if not cache_hit or previous != subscription_version:
+            self._users.delete(self._user_key(user_seq))
+            self._subscription_versions.set(user_seq, subscription_version)
+
+    def invalidate_mappings(self) -> None:
+        """매핑 무효화 - 다음 조회 시 다시 읽음 (매핑 테이블 변경 시)"""
+        self._mappings_loaded_at = None
+
+    def stats(self) -> Dict[str, object]:
+        """인덱스 통계"""
+        return {
+            'mapping_version': self.mapping_version,
+            'mapping_count': len(self._mappings),
+            'users': self._users.stats(),
+            'subscription_versions': self._subscription_versions.stats()
+        }
+
+    def _user_key(self, user_seq: int) -> Tuple[int, Optional[int]]:
+        """사용자 권한 캐시 키 - (user_seq, 마지막으로 확인한 구독 버전)"""
+        _, subscription_version = self._subscription_versions.get(user_seq)
+        return (user_seq, subscription_version)
+
+    async def _ensure_mappings(self, db: AsyncSession) -> None:
+        """매핑이 없거나 만료되었으면 다시 읽기 (동시 요청은 1회만 조회)"""
+        if not self._mappings_expired():
+            return
+
+        async with self._mapping_lock:
+            if not self._mappings_expired():
+                return
+
+            # danger_levels 가 이 모듈을 import 하므로 순환 import 방지
+            from app.core.danger_levels import most_severe_danger_level
+
+            # 같은 라벨이 여러 행(언어별 등)으로 매핑된 경우 가장 위험한 위험도 하나로 고정 (위험도 재계산 커맨드 / 저장 트리거와 동일 규칙)
+            result = await db.execute(
+                select(
+                    ModelDetectionMapping.model_product_seq,
+                    ModelDetectionMapping.detection_label,
+                    most_severe_danger_level(ModelDetectionMapping.danger_level).label('danger_level')
+                ).group_by(
+                    ModelDetectionMapping.model_product_seq,
+                    ModelDetectionMapping.detection_label
+                )
+            )
+
+            self._mappings = {
+                (row.model_product_seq, row.detection_label): row.danger_level
+                for row in result
+            }
+            self._mappings_loaded_at = time.monotonic()
+            self.mapping_version += 1
+            logger.info(f"탐지 매핑 인덱스 갱신 [version={self.mapping_version}, 매핑 {len(self._mappings)}건]")
+
+    def _mappings_expired(self) -> bool:
+        if self._mappings_loaded_at is None:
+            return True
+        return time.monotonic() - self._mappings_loaded_at >= self.mapping_ttl_seconds
+
+
+# 전역 탐지 권한 인덱스
+entitlement_index = EntitlementIndex(
+    mapping_ttl_seconds=settings.entitlement_mapping_ttl_seconds,
+    user_ttl_seconds=settings.entitlement_user_ttl_seconds,
+    max_users=settings.entitlement_max_users
+)
@@ -0,0 +1,56 @@
+"""최근 목록 피드 커서
+- (detected_at, detection_seq) 위치를 URL-safe base64 문자열로 인코딩
+- 정렬 기준이 바뀌는 목록(미디어 목록)은 정렬 키 + 정렬 값 + 번호를 인코딩 (sort cursor)
+- 클라이언트는 커서 내용을 해석하지 않고 그대로 다음 요청에 전달
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Tuple
+
+
+def encode_feed_cursor(detected_at: datetime, detection_seq: int) -> str:
+    """커서 인코딩"""
+    return _encode([detected_at.isoformat(), detection_seq])
+
+
+def decode_feed_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 디코딩 - 형식이 잘못되면 ValueError"""
+    try:
+        detected_at, detection_seq = _decode(cursor)
+        return datetime.fromisoformat(detected_at), int(detection_seq)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def encode_sort_cursor(sort_key: str, sort_value: Any, detection_seq: int) -> str:
+    """정렬 커서 인코딩 - sort_key: 정렬 기준 + 방향 (다른 정렬로 재사용 방지)"""
+    if isinstance(sort_value, datetime):
+        return _encode([sort_key, 'dt', sort_value.isoformat(), detection_seq])
+    return _encode([sort_key, 'str', sort_value, detection_seq])
+
+
+def decode_sort_cursor(cursor: str, sort_key: str) -> Tuple[Any, int]:
+    """정렬 커서 디코딩 - 형식 오류 또는 정렬 기준 불일치 시 ValueError"""
+    try:
+        cursor_sort_key, value_type, sort_value, detection_seq = _decode(cursor)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+    if cursor_sort_key != sort_key:
+        raise ValueError(f"정렬 기준이 다른 커서입니다: {cursor_sort_key} != {sort_key}")
+    if value_type == 'dt' and sort_value is not None:
+        sort_value = datetime.fromisoformat(sort_value)
+    return sort_value, int(detection_seq)
+
+
+def _encode(payload: list) -> str:
+    """JSON 배열 -> URL-safe base64 (패딩 제거)"""
+    raw = json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode(cursor: str) -> list:
+    """URL-safe base64 -> JSON 배열"""
+    padded = cursor + '=' * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
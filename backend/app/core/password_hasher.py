@@ -0,0 +1,83 @@
+"""비밀번호 해싱 / 검증 전용 스레드 풀
+- bcrypt 1회는 수백 ms 의 CPU 작업 -> 이벤트 루프에서 직접 실행하면 같은 워커의 모든 요청이 멈춤
+- core.auth 의 hash_password / verify_password 를 전용 스레드 풀에서 실행 (bcrypt 는 해싱 중 GIL 을 놓음)
+- 동시 실행 수: password_hash_workers (스레드 수)
+- 대기열 상한: 실행 중 + 대기 중 작업이 workers + password_hash_max_queue 이상이면 바로 PasswordHasherBusy
+  - 로그인 / 가입 폭주 시 대기열이 끝없이 늘어 응답이 모두 늦어지는 대신 초과분을 빠르게 거절
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from app.core.auth import hash_password, verify_password
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasherBusy(Exception):
+    """비밀번호 해싱 대기열이 가득 참"""
+
+
+class PasswordHasher:
+    """비밀번호 해싱 / 검증 스레드 풀"""
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = max(1, workers)
+        self.max_pending = self.workers + max(0, max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hasher")
+        self._pending = 0
+
+        # 통계 카운터
+        self.completed = 0
+        self.rejected = 0
+        self.max_pending_seen = 0
+
+    async def hash(self, plain_password: str) -> str:
+        """비밀번호 해싱 ({bcrypt} 형식)"""
+        return await self._run(hash_password, plain_password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증"""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def close(self) -> None:
+        """스레드 풀 종료 (서버 종료 시, 대기 중 작업은 취소)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """스레드 풀 통계"""
+        return {
+            'workers': self.workers,
+            'max_pending': self.max_pending,
+            'pending': self._pending,
+            'max_pending_seen': self.max_pending_seen,
+            'completed': self.completed,
+            'rejected': self.rejected
+        }
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            logger.warning(f"비밀번호 해싱 대기열 초과로 거절 (대기 {self._pending}/{self.max_pending})")
+            raise PasswordHasherBusy("비밀번호 처리 요청이 많습니다. 잠시 후 다시 시도해주세요.")
+
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        self.max_pending_seen = max(self.max_pending_seen, self._pending)
+        future = self._executor.submit(func, *args)
+        # 요청이 취소돼도 스레드 작업이 끝나거나 취소될 때 대기 수를 줄임 (이벤트 루프 스레드에서)
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        return await asyncio.wrap_future(future)
+
+    def _release(self) -> None:
+        self._pending -= 1
+        self.completed += 1
+
+
+# 전역 비밀번호 해싱 풀
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_max_queue
+)
@@ -0,0 +1,105 @@
+"""인증 사용자(principal) 캐시 (프로세스 내 메모리)
+- 키: JWT 의 sha256 해시 (토큰 원문은 보관하지 않음)
+- 값: 검증된 클레임 + 사용자 스냅샷(Principal, 변경 불가)
+  - 캐시 히트 시 JWT 디코딩 / tbl_user 조회 없이 Principal 반환
+- 만료: 기본 TTL 과 토큰 exp 중 빠른 시각 (만료된 토큰이 캐시로 통과되지 않음)
+- 무효화: 계정 상태 변경 훅(비활성화 / 잠금 / 상태 변경)에서 사용자 세대 번호를 올림
+  - 조회 시 항목의 세대 번호가 현재와 다르면 미스 처리 -> 해당 사용자의 모든 토큰 항목이 한 번에 무효화
+  - 세대 번호는 캐시와 같은 크기 / TTL 로 제한 (app/core/cache.py GenerationMap)
+- 다른 시스템(웹 서버)에서 바꾼 계정 상태는 기본 TTL 이 지나면 반영됨
+"""
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from app.core.cache import GenerationMap, TTLLRUCache
+from app.core.config import settings
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """인증된 사용자 스냅샷 (요청 처리 중 DB 세션과 무관하게 사용)"""
+    user_seq: int
+    username: str
+    fullname: Optional[str]
+    enabled: str
+    status: str
+    password_wrong_cnt: int
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            user_seq=user.user_seq,
+            username=user.username,
+            fullname=user.fullname,
+            enabled=user.enabled,
+            status=user.status,
+            password_wrong_cnt=user.password_wrong_cnt
+        )
+
+
+class PrincipalCache:
+    """JWT 해시 -> (클레임, Principal) 캐시"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._entries = TTLLRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._generations = GenerationMap(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+        # 통계 카운터
+        self.stale = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def token_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode('utf-8')).digest()
+
+    def get(self, token: str) -> Optional[Principal]:
+        """캐시된 Principal (없거나 만료 / 무효화된 경우 None)"""
+        cache_hit, entry = self._entries.get(self.token_key(token))
+        if not cache_hit:
+            return None
+
+        generation, _, principal = entry
+        if generation != self._generations.get(principal.user_seq):
+            self._entries.delete(self.token_key(token))
+            self.stale += 1
+            return None
+        return principal
+
+    def generation(self, user_seq: int) -> int:
+        """사용자 세대 번호 - DB 조회 전에 받아 set 에 전달 (조회 도중 무효화된 결과 저장 방지)"""
+        return self._generations.get(user_seq)
+
+    def set(self, token: str, claims: Dict[str, Any], principal: Principal, generation: int) -> None:
+        """검증된 토큰 저장 - TTL 은 토큰 exp 를 넘지 않음"""
+        if generation != self.generation(principal.user_seq):
+            return
+
+        ttl_seconds = self._entries.ttl_seconds
+        expires_at = claims.get('exp')
+        if expires_at is not None:
+            ttl_seconds = min(ttl_seconds, float(expires_at) - time.time())
+        self._entries.set(self.token_key(token), (generation, claims, principal), ttl_seconds=ttl_seconds)
+
+    def invalidate_user(self, user_seq: int) -> None:
+        """사용자 항목 전체 무효화 (계정 상태 변경 시)"""
+        self._generations.bump(user_seq)
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        return {**self._entries.stats(), 'stale': self.stale, 'invalidations': self.invalidations}
+
+
+# 전역 principal 캐시
+principal_cache = PrincipalCache(
+    max_entries=settings.principal_cache_max_entries,
+    ttl_seconds=settings.principal_cache_ttl_seconds
+)
+
+
+async def invalidate_principals_for_user(user_seq: int) -> None:
+    """계정 상태 변경 훅 - 사용자 principal 캐시 무효화"""
+    principal_cache.invalidate_user(user_seq)
@@ -0,0 +1,295 @@
+"""구독 사용량 계측기 (프로세스 내 누적 + DB 일괄 반영)
+- 카운터: (구독, 사용 일자)별 탐지 건수 (tbl_subscription_usage_daily)
+- 증가: 탐지 저장 커밋 훅에서 (user_seq, model_product_seq, 탐지 일자)별로 메모리에 누적만 함 (DB 조회 없음)
+- 반영: flush 주기마다 또는 미반영 카운터 수가 한도를 넘으면 한 번에 upsert
+  - 이때 사용자별 활성 구독을 1회 조회해 구독 번호로 변환 (활성 구독이 없는 상품의 탐지는 계측하지 않음)
+  - 실패 시 증가분을 다시 미반영 카운터에 합쳐 다음 반영 때 재시도
+- 조회: DB 카운터(read TTL 캐시) + 반영 중 / 미반영 증가분 -> 구독 수에 비례하는 비용 (탐지 스캔 없음)
+- 한도: 구독 usage_limit (없으면 상품 usage_limit) 을 일자 사용량 한도로 사용, None 이면 무제한
+- 다른 인스턴스의 증가분은 DB 카운터 캐시 만료(read TTL) 후 반영됨
+- 구독 한도도 read TTL 동안 캐시 (구독은 웹 서버가 수정 -> 변경은 TTL 만료 후 반영)
+"""
+import asyncio
+import logging
+from datetime import date
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import select, func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLLRUCache
+from app.core.config import settings
+from app.core.database import async_session
+from app.models.model_product import ModelProduct
+from app.models.subscription import ModelProductSubscription
+from app.models.subscription_usage import SubscriptionUsageDaily
+
+logger = logging.getLogger(__name__)
+
+# (user_seq, model_product_seq, 사용 일자)
+UsageKey = Tuple[int, int, date]
+
+
+class SubscriptionQuota:
+    """활성 구독 1건의 사용량 한도 (읽기 전용)
+    - usage_limit: 일자 사용량 한도 (None 이면 무제한)
+    """
+
+    def __init__(self, subscription_seq: int, model_product_seq: int, usage_limit: Optional[int]):
+        self.subscription_seq = subscription_seq
+        self.model_product_seq = model_product_seq
+        self.usage_limit = usage_limit
+
+
+class UsageMeter:
+    """구독 사용량 계측기"""
+
+    def __init__(self, flush_seconds: float, max_pending: int, read_ttl_seconds: float, max_entries: int):
+        self.flush_seconds = flush_seconds
+        self.max_pending = max(1, max_pending)
+        self._pending: Dict[UsageKey, int] = {}
+        self._inflight: Dict[UsageKey, int] = {}
+        self._quotas = TTLLRUCache(max_entries=max_entries, ttl_seconds=read_ttl_seconds)
+        self._flushed = TTLLRUCache(max_entries=max_entries, ttl_seconds=read_ttl_seconds)
+        self._flush_lock = asyncio.Lock()
+        self._flush_generation = 0
+        self._flush_loop_task: Optional[asyncio.Task] = None
+        self._background_flushes: Set[asyncio.Task] = set()
+
+        # 통계 카운터
+        self.flushes = 0
+        self.flush_failures = 0
+        self.flushed_rows = 0
+        self.unmetered = 0
+
+    def record(self, detections: List[Dict[str, Any]]) -> None:
+        """탐지 사용량 누적 (메모리만, 한도 초과 시 백그라운드 반영 예약)"""
+        for detection in detections:
+            if detection.get('usage_metered'):
+                continue  # 병합된 반복 탐지 - 병합 시점에 이미 계측
+            key = (detection['user_seq'], detection['model_product_seq'], detection['detected_at'].date())
+            self._pending[key] = self._pending.get(key, 0) + (detection.get('detection_count') or 1)
+
+        if len(self._pending) >= self.max_pending and not self._flush_lock.locked():
+            task = asyncio.create_task(self.flush())
+            self._background_flushes.add(task)
+            task.add_done_callback(self._background_flushes.discard)
+
+    async def flush(self) -> int:
+        """미반영 증가분을 DB 카운터에 일괄 반영 - 반환값: upsert 한 카운터 행 수"""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            self._inflight, self._pending = self._pending, {}
+            self._flush_generation += 1
+            try:
+                rows = await self._write_inflight()
+            except Exception as e:
+                self.flush_failures += 1
+                for key, count in self._inflight.items():
+                    self._pending[key] = self._pending.get(key, 0) + count
+                logger.error(f"사용량 카운터 반영 실패 (다음 주기 재시도, {len(self._inflight)}건): {str(e)}")
+                return 0
+            finally:
+                self._inflight = {}
+
+            # 반영한 카운터는 캐시에서 제거 (다음 조회 시 DB 값 다시 읽음)
+            for row in rows:
+                self._flushed.delete((row['subscription_seq'], row['usage_date']))
+
+            self.flushes += 1
+            self.flushed_rows += len(rows)
+            return len(rows)
+
+    async def get_quotas(self, db: AsyncSession, user_seq: int) -> Dict[int, SubscriptionQuota]:
+        """사용자 활성 구독 한도 (model_product_seq -> 한도, 캐시 미스 시 1회 조회)"""
+        cache_hit, quotas = self._quotas.get(user_seq)
+        if cache_hit:
+            return quotas
+
+        result = await db.execute(
+            select(
+                ModelProductSubscription.subscription_seq,
+                ModelProductSubscription.model_product_seq,
+                func.coalesce(ModelProductSubscription.usage_limit, ModelProduct.usage_limit).label('usage_limit')
+            ).outerjoin(
+                ModelProduct, ModelProduct.model_product_seq == ModelProductSubscription.model_product_seq
+            ).where(
+                ModelProductSubscription.user_seq == user_seq,
+                ModelProductSubscription.subscription_status == 'A'
+            ).order_by(
+                ModelProductSubscription.subscription_seq
+            )
+        )
+        # 같은 상품의 활성 구독이 여러 건이면 가장 최근 구독 사용 (반영 시 구독 번호 변환과 같은 규칙)
+        quotas = {
+            row.model_product_seq: SubscriptionQuota(row.subscription_seq, row.model_product_seq, row.usage_limit)
+            for row in result
+        }
+        self._quotas.set(user_seq, quotas)
+        return quotas
+
+    async def get_usage(self, db: AsyncSession, user_seq: int,
+                        usage_date: Optional[date] = None) -> Dict[int, int]:
+        """사용자 활성 구독별 일자 사용량 (subscription_seq -> 탐지 건수, 기본: 오늘)"""
+        usage_date = usage_date or date.today()
+        quotas = await self.get_quotas(db, user_seq)
+        if not quotas:
+            return {}
+
+        usage: Dict[int, int] = {}
+        missing_seqs = []
+        for quota in quotas.values():
+            cache_hit, flushed_count = self._flushed.get((quota.subscription_seq, usage_date))
+            if cache_hit:
+                usage[quota.subscription_seq] = flushed_count
+            else:
+                missing_seqs.append(quota.subscription_seq)
+
+        if missing_seqs:
+            flush_generation = None if self._flush_lock.locked() else self._flush_generation
+            result = await db.execute(
+                select(SubscriptionUsageDaily.subscription_seq, SubscriptionUsageDaily.detection_count)
+                .where(
+                    SubscriptionUsageDaily.subscription_seq.in_(missing_seqs),
+                    SubscriptionUsageDaily.usage_date == usage_date
+                )
+            )
+            loaded = {row.subscription_seq: row.detection_count for row in result}
+            # 조회 도중 반영이 시작/진행된 경우 반영분 포함 여부를 알 수 없으므로 캐시하지 않음
+            cacheable = flush_generation == self._flush_generation
+            for subscription_seq in missing_seqs:
+                usage[subscription_seq] = loaded.get(subscription_seq, 0)
+                if cacheable:
+                    self._flushed.set((subscription_seq, usage_date), usage[subscription_seq])
+
+        # 반영 중 / 미반영 증가분
+        for quota in quotas.values():
+            key = (user_seq, quota.model_product_seq, usage_date)
+            usage[quota.subscription_seq] += self._inflight.get(key, 0) + self._pending.get(key, 0)
+
+        return usage
+
+    async def check_limit(self, db: AsyncSession, user_seq: int, model_product_seq: int, amount: int = 1,
+                          usage_date: Optional[date] = None,
+                          reserved: Optional[Dict[Tuple[int, date], Dict[int, int]]] = None) -> bool:
+        """일자 사용량에 amount 를 더해도 한도 이내인지 (활성 구독이 없으면 False, 한도가 없으면 True, 기본: 오늘)
+        - reserved: 한 요청에서 여러 항목을 확인할 때 넘기는 (사용자, 일자)별 사용량 스냅샷
+          - 처음 확인할 때 1회 조회해 담고, 한도 이내면 amount 를 더해 둠 (같은 요청의 이후 항목에 반영)
+        """
+        usage_date = usage_date or date.today()
+        quota = (await self.get_quotas(db, user_seq)).get(model_product_seq)
+        if quota is None:
+            return False
+        if quota.usage_limit is None:
+            return True
+
+        snapshot_key = (user_seq, usage_date)
+        usage = reserved.get(snapshot_key) if reserved is not None else None
+        if usage is None:
+            usage = await self.get_usage(db, user_seq, usage_date)
+            if reserved is not None:
+                reserved[snapshot_key] = usage
+
+        used = usage.get(quota.subscription_seq, 0)
+        if used + amount > quota.usage_limit:
+            return False
+        if reserved is not None:
+            usage[quota.subscription_seq] = used + amount
+        return True
+
+    def start(self) -> None:
+        """주기적 반영 시작 (서버 시작 시)"""
+        if self._flush_loop_task is None:
+            self._flush_loop_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """주기적 반영 중지 + 남은 증가분 반영 (서버 종료 시)"""
+        if self._flush_loop_task is not None:
+            self._flush_loop_task.cancel()
+            try:
+                await self._flush_loop_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_loop_task = None
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        """계측기 통계"""
+        return {
+            'pending': len(self._pending),
+            'flushes': self.flushes,
+            'flush_failures': self.flush_failures,
+            'flushed_rows': self.flushed_rows,
+            'unmetered': self.unmetered,
+            'quotas': self._quotas.stats(),
+            'flushed_counters': self._flushed.stats()
+        }
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            await self.flush()
+
+    async def _write_inflight(self) -> List[Dict[str, Any]]:
+        """반영 중 증가분을 구독 번호로 변환해 upsert (별도 세션 / 트랜잭션)"""
+        user_seqs = {user_seq for user_seq, _, _ in self._inflight}
+
+        async with async_session() as session:
+            result = await session.execute(
+                select(
+                    ModelProductSubscription.subscription_seq,
+                    ModelProductSubscription.user_seq,
+                    ModelProductSubscription.model_product_seq
+                ).where(
+                    ModelProductSubscription.user_seq.in_(user_seqs),
+                    ModelProductSubscription.subscription_status == 'A'
+                ).order_by(
+                    ModelProductSubscription.subscription_seq
+                )
+            )
+            subscription_seqs = {(row.user_seq, row.model_product_seq): row.subscription_seq for row in result}
+
+            rows = []
+            for (user_seq, model_product_seq, usage_date), count in self._inflight.items():
+                subscription_seq = subscription_seqs.get((user_seq, model_product_seq))
+                if subscription_seq is None:
+                    self.unmetered += count
+                    continue
+                rows.append({
+                    'subscription_seq': subscription_seq,
+                    'usage_date': usage_date,
+                    'user_seq': user_seq,
+                    'model_product_seq': model_product_seq,
+                    'detection_count': count
+                })
+            if not rows:
+                return rows
+
+            upsert = mysql_insert(SubscriptionUsageDaily).values(rows)
+            upsert = upsert.on_duplicate_key_update(
+                detection_count=SubscriptionUsageDaily.detection_count + upsert.inserted.detection_count
+            )
+            try:
+                await session.execute(upsert)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+            return rows
+
+
+# 전역 사용량 계측기
+usage_meter = UsageMeter(
+    flush_seconds=settings.usage_meter_flush_seconds,
+    max_pending=settings.usage_meter_max_pending,
+    read_ttl_seconds=settings.usage_meter_read_ttl_seconds,
+    max_entries=settings.usage_meter_max_entries
+)
+
+
+async def record_usage_for_detections(detections: List[Dict[str, Any]]) -> None:
+    """탐지 커밋 훅 - 구독 사용량 누적"""
+    usage_meter.record(detections)
@@ -0,0 +1,44 @@
+"""사용자 데이터 변경 훅
+- 계정 상태(tbl_user 의 enabled / status / password_wrong_cnt) 변경 시 인증 사용자 캐시 무효화
+- 계정 상태를 변경하는 쓰기 경로(로그인 실패 / 잠금 등)는 커밋 후 notify_account_changed 를 호출해야 함
+- 구독(tbl_model_product_subscription) / 디바이스(tbl_device)는 이 앱에서 변경하지 않음 (웹 서버가 직접 수정)
+  -> 파생 캐시는 훅 대신 tbl_user_data_version 워터마크로 검증 (migrations/011)
+  - 대시보드 결과 캐시 / 탐지 권한 인덱스: 조건부 GET 의 DB 워터마크가 바뀌면 무효화
+  - 지난 날짜 캐시: 항목별 저장 시점 일자 워터마크 비교
+  - 구독 사용량 한도: read TTL 만료 후 다시 조회
+"""
+import logging
+from typing import Awaitable, Callable, List
+
+logger = logging.getLogger(__name__)
+
+UserChangeHandler = Callable[[int], Awaitable[None]]
+
+
+class UserChangeHooks:
+    """사용자 계정 상태 변경 훅 레지스트리"""
+
+    def __init__(self):
+        self._account_handlers: List[UserChangeHandler] = []
+
+    def on_account_change(self, handler: UserChangeHandler) -> UserChangeHandler:
+        """계정 상태 변경 훅 등록 (비활성화 / 잠금 / 상태 변경)"""
+        if handler not in self._account_handlers:
+            self._account_handlers.append(handler)
+        return handler
+
+    async def notify_account_changed(self, user_seq: int) -> None:
+        """계정 상태 변경 알림"""
+        await self._run(self._account_handlers, user_seq, "계정 상태")
+
+    async def _run(self, handlers: List[UserChangeHandler], user_seq: int, change_type: str) -> None:
+        """훅 실행 - 예외는 로그만 남기고 계속 진행"""
+        for handler in handlers:
+            try:
+                await handler(user_seq)
+            except Exception as e:
+                logger.error(f"{change_type} 변경 훅 실행 실패 [user_seq={user_seq}, {getattr(handler, '__name__', handler)}]: {str(e)}")
+
+
+# 전역 훅 레지스트리
+user_change_hooks = UserChangeHooks()
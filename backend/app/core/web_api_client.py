@@ -0,0 +1,126 @@
+"""웹 서버(Spring) API 호출용 비동기 HTTP 클라이언트 (앱 수명 동안 공유)
+- httpx.AsyncClient 1개를 서버 시작 시 만들고 종료 시 닫음 -> keep-alive 연결 재사용 (요청마다 TCP/TLS 연결 안 함)
+- 연결 풀 크기 제한: 웹 API 가 느려져도 동시 연결 수가 한도를 넘지 않음 (초과 요청은 pool 타임아웃까지 대기)
+- 타임아웃 분리: 연결(connect) / 응답 읽기(read) / 요청 쓰기(write) / 풀 대기(pool)
+- 이벤트 루프를 막지 않으므로 웹 API 응답을 기다리는 동안 같은 워커의 다른 요청(대시보드 등)이 처리됨
+- 로그인 호출은 서킷 브레이커로 감쌈 -> 웹 API 가 느리거나 죽으면 타임아웃을 기다리지 않고 바로 WebApiUnavailable
+  - 실패: 연결 실패 / 타임아웃 / 5xx / JSON 이 아닌 응답, 지연: web_api_slow_call_seconds 이상 걸린 성공 응답
+"""
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.config import settings
+
+# 웹 API 공통 헤더
+DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json"
+}
+
+
+class WebApiUnavailable(Exception):
+    """서킷 브레이커가 열려 웹 API 를 호출하지 않음"""
+
+
+class WebApiClient:
+    """웹 API 클라이언트 (연결 풀 공유)"""
+
+    def __init__(self, connect_timeout: float, read_timeout: float, pool_timeout: float,
+                 max_connections: int, max_keepalive_connections: int, keepalive_expiry: float,
+                 breaker: CircuitBreaker):
+        self.timeout = httpx.Timeout(
+            connect=connect_timeout, read=read_timeout, write=connect_timeout, pool=pool_timeout
+        )
+        self.limits = httpx.Limits(
+            max_connections=max(1, max_connections),
+            max_keepalive_connections=max(0, max_keepalive_connections),
+            keepalive_expiry=keepalive_expiry
+        )
+        self.breaker = breaker
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # 통계 카운터
+        self.requests = 0
+        self.failures = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 클라이언트 (서버 시작 전 호출 시 생성 - 커맨드 / 스크립트용)"""
+        if self._client is None or self._client.is_closed:
+            self.start()
+        return self._client
+
+    def start(self) -> None:
+        """클라이언트 생성 (서버 시작 시)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits, headers=DEFAULT_HEADERS)
+
+    async def close(self) -> None:
+        """연결 풀 종료 (서버 종료 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def login(self, username: str, password: str) -> Dict[str, Any]:
+        """웹 로그인 API 호출 - 응답 JSON 반환
+        - 서킷 브레이커 open: WebApiUnavailable (호출하지 않음)
+        - 연결 실패 / 타임아웃 / 5xx: httpx.HTTPError
+        - JSON 이 아닌 응답: ValueError
+        """
+        if not self.breaker.allow_request():
+            raise WebApiUnavailable(f"웹 API 서킷 브레이커 open ({settings.web_api_base_url})")
+
+        # 환경별 기본 URL 은 요청마다 읽음 (설정 변경 / 부하 테스트의 stub 서버 지정 반영)
+        web_api_url = f"{settings.web_api_base_url}{settings.web_api_login_endpoint}"
+        self.requests += 1
+        started_at = time.monotonic()
+        try:
+            response = await self.client.post(web_api_url, json={"username": username, "password": password})
+            if response.status_code >= 500:
+                response.raise_for_status()
+            web_data = response.json()
+        except BaseException:
+            # 요청 취소(클라이언트 연결 끊김)도 실패로 기록 -> half_open 시험 호출이 결과 없이 끝나지 않도록
+            self.failures += 1
+            self.breaker.record_failure()
+            raise
+
+        self.breaker.record_success(time.monotonic() - started_at)
+        return web_data
+
+    def stats(self) -> Dict[str, Any]:
+        """클라이언트 통계"""
+        return {
+            'requests': self.requests,
+            'failures': self.failures,
+            'max_connections': self.limits.max_connections,
+            'max_keepalive_connections': self.limits.max_keepalive_connections,
+            'connect_timeout_seconds': self.timeout.connect,
+            'read_timeout_seconds': self.timeout.read,
+            'circuit_breaker': self.breaker.stats()
+        }
+
+
+# 전역 웹 API 클라이언트
+web_api_client = WebApiClient(
+    connect_timeout=settings.web_api_connect_timeout_seconds,
+    read_timeout=settings.web_api_read_timeout_seconds,
+    pool_timeout=settings.web_api_pool_timeout_seconds,
+    max_connections=settings.web_api_max_connections,
+    max_keepalive_connections=settings.web_api_max_keepalive_connections,
+    keepalive_expiry=settings.web_api_keepalive_expiry_seconds,
+    breaker=CircuitBreaker(
+        name="web_api_login",
+        window_size=settings.web_api_breaker_window_size,
+        minimum_calls=settings.web_api_breaker_minimum_calls,
+        failure_rate_threshold=settings.web_api_breaker_failure_rate,
+        slow_call_rate_threshold=settings.web_api_breaker_slow_call_rate,
+        slow_call_seconds=settings.web_api_slow_call_seconds,
+        open_seconds=settings.web_api_breaker_open_seconds,
+        half_open_max_calls=settings.web_api_breaker_half_open_calls,
+        enabled=settings.web_api_breaker_enabled
+    )
+)
@@ -1,4 +1,5 @@
 """JWT 토큰 + SHA 세션 동시 지원 인증 의존성 주입 모듈"""
+import hmac
 from typing import Optional
 from fastapi import Depends, HTTPException, status, Request, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -7,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.core.config import settings
+from app.core.principal_cache import Principal, principal_cache
 from app.models.user import User
 from app.repositories.user_repository import UserRepository
 
@@ -18,9 +20,10 @@ async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     session_token: Optional[str] = Header(None, alias="X-Session-Token"),
     db: AsyncSession = Depends(get_db)
-) -> User:
-    """JWT 토큰 또는 SHA 세션을 검증하여 현재 사용자 정보 반환
+) -> Principal:
+    """JWT 토큰 또는 SHA 세션을 검증하여 현재 사용자 정보(Principal 스냅샷) 반환
     - JWT Bearer 토큰: Authorization: Bearer <jwt_token>
+      - 검증된 토큰은 principal 캐시에 보관 -> 캐시 히트 시 디코딩 / 사용자 조회 생략
     - 세션 토큰: X-Session-Token: <session_token>
     - 쿠키 세션: session_token 쿠키
     """
@@ -38,16 +41,23 @@ async def get_current_user(
     if credentials and credentials.credentials:
         try:
             token = credentials.credentials
+            principal = principal_cache.get(token)
+            if principal is not None:
+                return principal
+
             payload = jwt.decode(token, settings.jwt_secret_key, algorithms=["HS256"])
 
             # user_seq 추출
             user_seq_str: str = payload.get("sub")
             if user_seq_str is not None:
                 user_seq = int(user_seq_str)
+                generation = principal_cache.generation(user_seq)
                 user = await user_repository.get_user_with_basic_info(user_seq)
 
                 if user is not None:
-                    return user
+                    principal = Principal.from_user(user)
+                    principal_cache.set(token, payload, principal, generation)
+                    return principal
 
         except (JWTError, ValueError) as e:
             print(f"JWT 토큰 인증 실패: {str(e)}")
@@ -59,7 +69,7 @@ async def get_current_user(
         try:
             user = await _verify_session_token(session_token, user_repository)
             if user:
-                return user
+                return Principal.from_user(user)
         except Exception as e:
             print(f"세션 토큰 헤더 인증 실패: {str(e)}")
             pass
@@ -70,7 +80,7 @@ async def get_current_user(
         try:
             user = await _verify_session_token(session_token_cookie, user_repository)
             if user:
-                return user
+                return Principal.from_user(user)
         except Exception as e:
             print(f"세션 토큰 쿠키 인증 실패: {str(e)}")
             pass
@@ -78,12 +88,42 @@ async def get_current_user(
     # 모든 인증 방식 실패
     raise credentials_exception
 
+async def verify_ingest_api_key(
+    ingest_key: Optional[str] = Header(None, alias="X-Ingest-Key")
+) -> None:
+    """AI 서버용 탐지 저장 api 키 검증 (X-Ingest-Key 헤더)
+    - 설정(detection_ingest_api_keys)이 비어 있으면 api 비활성화
+    """
+    if not settings.detection_ingest_api_keys:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="탐지 저장 api가 비활성화되어 있습니다.")
+
+    if not ingest_key or not any(
+        hmac.compare_digest(ingest_key.encode(), api_key.encode()) for api_key in settings.detection_ingest_api_keys
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="탐지 저장 api 키가 유효하지 않습니다.")
+
+async def verify_ops_api_key(
+    ops_key: Optional[str] = Header(None, alias="X-Ops-Key")
+) -> None:
+    """운영 통계 api 키 검증 (X-Ops-Key 헤더) - 캐시 / 연결 풀 통계 등 일반 사용자에게 노출하지 않는 api
+    - 설정(ops_api_keys)이 비어 있으면 api 비활성화
+    """
+    if not settings.ops_api_keys:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="운영 통계 api가 비활성화되어 있습니다.")
+
+    if not ops_key or not any(
+        hmac.compare_digest(ops_key.encode(), api_key.encode()) for api_key in settings.ops_api_keys
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="운영 통계 api 키가 유효하지 않습니다.")
+
 async def store_session_token(session_token: str, user_seq: int, session_id: str, db: AsyncSession) -> None:
     """DB 세션 토큰 저장 - Spring Session 테이블"""
     import uuid
     import json
     from datetime import datetime
     from app.models.user import SpringSession, SpringSessionAttributes
+    from app.models.session_token import SessionToken
+    from sqlalchemy import insert
 
     try:
         # 1시간 후 만료
@@ -120,8 +160,20 @@ async def store_session_token(session_token: str, user_seq: int, session_id: str
 
         # DB에 저장
         db.add(spring_session)
+        await db.flush()
         for attr in session_attrs:
             db.add(attr)
+        await db.flush()
+
+        # 토큰 조회 키 (인증 시 기본키 조회) - 속성 트리거(migrations/013)가 먼저 넣었으면 무시
+        await db.execute(
+            insert(SessionToken).prefix_with("IGNORE").values(
+                token_hash=SessionToken.hash_token(session_token),
+                session_primary_id=primary_id,
+                user_seq=user_seq,
+                expiry_time=expires_ms
+            )
+        )
 
         await db.commit()
         print(f"세션 저장 성공: {session_token[:16]}... -> user_seq: {user_seq}")
@@ -131,11 +183,14 @@ async def store_session_token(session_token: str, user_seq: int, session_id: str
         print(f"세션 저장 실패: {str(e)}")
 
 async def _verify_session_token(session_token: str, user_repository: UserRepository) -> Optional[User]:
-    """실운영급 DB 기반 세션 토큰 검증 - Spring Session 테이블 활용"""
-    import json
+    """실운영급 DB 기반 세션 토큰 검증 - Spring Session 테이블 활용
+    - 토큰 해시로 tbl_session_token 기본키 조회 + SPRING_SESSION 기본키 조인 (속성 TEXT 비교 스캔 없음)
+    - 웹 서버(Spring Session)가 만든 세션의 키는 SPRING_SESSION_ATTRIBUTES 트리거가 저장 (migrations/013)
+    """
     from datetime import datetime
-    from app.models.user import SpringSession, SpringSessionAttributes
-    from sqlalchemy import select, and_
+    from app.models.user import SpringSession
+    from app.models.session_token import SessionToken
+    from sqlalchemy import select
 
     try:
         # 토큰 형식 검증
@@ -148,15 +203,11 @@ async def _verify_session_token(session_token: str, user_repository: UserReposit
             SpringSession.EXPIRY_TIME,
             SpringSession.PRINCIPAL_NAME
         ).select_from(
-            SpringSession.join(
-                SpringSessionAttributes,
-                SpringSession.PRIMARY_ID == SpringSessionAttributes.SESSION_PRIMARY_ID
-            )
+            SessionToken
+        ).join(
+            SpringSession, SpringSession.PRIMARY_ID == SessionToken.session_primary_id
         ).where(
-            and_(
-                SpringSessionAttributes.ATTRIBUTE_NAME == "session_token",
-                SpringSessionAttributes.ATTRIBUTE_BYTES == json.dumps(session_token)
-            )
+            SessionToken.token_hash == SessionToken.hash_token(session_token)
         )
 
         result = await user_repository.db.execute(query)
@@ -194,10 +245,14 @@ async def _verify_session_token(session_token: str, user_repository: UserReposit
 async def _cleanup_expired_session(primary_id: str, db: AsyncSession) -> None:
     """만료된 세션 정리"""
     from app.models.user import SpringSession, SpringSessionAttributes
+    from app.models.session_token import SessionToken
     from sqlalchemy import delete
 
     try:
-        # 속성 먼저 삭제
+        # 토큰 조회 키 / 속성 먼저 삭제
+        await db.execute(
+            delete(SessionToken).where(SessionToken.session_primary_id == primary_id)
+        )
         await db.execute(
             delete(SpringSessionAttributes).where(
                 SpringSessionAttributes.SESSION_PRIMARY_ID == primary_id
@@ -1,7 +1,17 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.routers import auth, dashboard
+from app.routers import auth, dashboard, detections
+from app.core.detection_events import detection_write_hooks
+from app.core.user_change_events import user_change_hooks
+from app.core.dashboard_cache import invalidate_dashboard_cache_for_detections
+from app.core.dashboard_history_cache import dashboard_history_cache, invalidate_history_cache_for_late_detections
+from app.core.password_hasher import password_hasher
+from app.core.principal_cache import invalidate_principals_for_user
+from app.core.usage_meter import usage_meter, record_usage_for_detections
+from app.services.dashboard_stream_service import publish_dashboard_deltas, dashboard_delta_publisher
+from app.services.detection_coalescer import detection_coalescer
+from app.core.web_api_client import web_api_client
 
 # 환경별 설정으로 FastAPI 앱 생성
 app = FastAPI(
@@ -22,9 +32,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 탐지 저장 훅 등록 (시간대별 / 일자별 집계는 DB 트리거가 갱신 - migrations/010)
+detection_write_hooks.on_commit(invalidate_dashboard_cache_for_detections)
+detection_write_hooks.on_commit(invalidate_history_cache_for_late_detections)  # 지난 날짜 지연 저장
+detection_write_hooks.on_commit(publish_dashboard_deltas)  # 탐지 행만 바로 발행, 집계 이벤트는 디바운스 후 백그라운드
+detection_write_hooks.on_commit(record_usage_for_detections)  # 구독 사용량 누적 (주기적 일괄 반영)
+
+# 계정 상태 변경 훅 등록 (principal 캐시 무효화)
+# 구독 / 디바이스는 웹 서버가 수정 -> 대시보드 캐시 / 탐지 권한 / 지난 날짜 캐시는 DB 워터마크로 검증 (app/core/user_change_events.py)
+user_change_hooks.on_account_change(invalidate_principals_for_user)  # 비활성화 / 잠금 / 상태 변경
+
+@app.on_event("startup")
+async def startup():
+    """서버 시작 시 백그라운드 작업 시작"""
+    usage_meter.start()
+    detection_coalescer.start()
+    web_api_client.start()  # 웹 API 연결 풀 (로그인 연동)
+
+@app.on_event("shutdown")
+async def shutdown():
+    """서버 종료 시 로컬 리소스 정리"""
+    await detection_coalescer.stop()  # 열린 반복 탐지 병합 구간 반영 (사용량 계측보다 먼저)
+    await usage_meter.stop()  # 남은 사용량 증가분 반영
+    await dashboard_delta_publisher.stop()  # 예약된 스트리밍 갱신 취소
+    dashboard_history_cache.close()
+    await web_api_client.close()
+    password_hasher.close()
+
 # 라우터 등록
 app.include_router(auth.router, prefix=settings.api_prefix)
 app.include_router(dashboard.router, prefix=settings.api_prefix)
+app.include_router(detections.router, prefix=settings.api_prefix)
 
 @app.get("/")
 async def root():
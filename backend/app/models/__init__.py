@@ -1,12 +1,16 @@
 # SQLAlchemy 모델 통합 import
 from .user import User, LoginLog
+from .session_token import SessionToken
 from .device import Device
 from .group import Group
 from .detection_result import DetectionResult
+from .detection_rollup import DetectionHourlyRollup, DetectionDailyRollup
 from .alert import AIAlert, Alert  # 하위 호환성을 위한 별칭 포함
 from .detection_mapping import ModelDetectionMapping
 from .model_product import ModelProduct, ModelProductLang
 from .subscription import DeviceProductSubscription
+from .subscription_usage import SubscriptionUsageDaily
+from .user_data_version import UserDataVersion
 from .guidance_model import GuidanceModel, GuidanceModelLang
 
 # 모든 모델을 __all__에 등록하여 외부에서 import 가능하도록 설정
@@ -14,6 +18,7 @@ __all__ = [
     # 사용자 관련
     "User", 
     "LoginLog",
+    "SessionToken",
     
     # 디바이스 관련
     "Device", 
@@ -21,6 +26,8 @@ __all__ = [
     
     # 탐지 및 알림
     "DetectionResult",
+    "DetectionHourlyRollup",
+    "DetectionDailyRollup",
     "AIAlert",
     "Alert",  # 하위 호환성
     "ModelDetectionMapping",
@@ -31,6 +38,8 @@ __all__ = [
     
     # 구독 관리
     "DeviceProductSubscription",
+    "SubscriptionUsageDaily",
+    "UserDataVersion",
     
     # AI 안내 모델
     "GuidanceModel",
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, DECIMAL, Text, CHAR, Enum, ForeignKey
+from sqlalchemy import Column, Integer, SmallInteger, String, DateTime, DECIMAL, Text, CHAR, Enum, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.mysql import LONGTEXT
 from sqlalchemy.sql import func
@@ -21,6 +21,10 @@ class DetectionResult(Base):
     detection_label = Column(String(32), nullable=False)  # 탐지 세부 라벨 (fire, helmet, weapon 등)
     confidence = Column(DECIMAL(5, 2), nullable=False)
     
+    # 위험도 (저장 시 tbl_model_detection_mappings 에서 비정규화, 매핑 없으면 NULL - migrations/004)
+    danger_level = Column(Enum('critical', 'high', 'medium', 'low', 'safe', 'normal'), nullable=True)
+    severity = Column(SmallInteger, nullable=True)  # 숫자 등급 (critical=5 ~ normal=0, app/core/danger_levels.py)
+    
     # 미디어 정보
     image_url = Column(String(255), nullable=True)          # 이미지 URL
     media_type = Column(Enum('image', 'video'), nullable=False, default='image')  # 미디어 타입
@@ -40,10 +44,20 @@ class DetectionResult(Base):
     detection_details = Column(LONGTEXT, nullable=True)
     
     # 타임스탬프
-    detected_at = Column(DateTime, nullable=False)  # 탐지 시각
+    detected_at = Column(DateTime, nullable=False)  # 탐지 시각 (병합된 행은 첫 탐지 시각)
+    last_detected_at = Column(DateTime, nullable=True)  # 병합된 반복 탐지의 마지막 탐지 시각 (병합 없으면 NULL - migrations/008)
     reg_dt = Column(DateTime, nullable=False, default=func.current_timestamp())  # 등록 시각
 
     # 관계 정의
     device = relationship("Device")
     user = relationship("User")
-    model_product = relationship("ModelProduct")
\ No newline at end of file
+    model_product = relationship("ModelProduct")
+
+    # 인덱스 (날짜 범위 조회용 - migrations/002, 미디어 목록 키셋 페이징용 - migrations/003, 위험도별 조회용 - migrations/004, 최근 목록 커버링 - migrations/005, 집계 재생성용 - migrations/010)
+    __table_args__ = (
+        Index('idx_detection_results_user_feed', 'user_seq', 'detected_at', 'model_product_seq', 'danger_level'),
+        Index('idx_detection_results_detected', 'detected_at'),
+        Index('idx_detection_results_device_detected', 'device_seq', 'detected_at'),
+        Index('idx_detection_results_reg_dt', 'reg_dt'),
+        Index('idx_detection_results_user_level_detected', 'user_seq', 'danger_level', 'detected_at'),
+    )
\ No newline at end of file
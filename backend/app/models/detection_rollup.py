@@ -0,0 +1,59 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+# 매핑(tbl_model_detection_mappings)이 없는 탐지의 위험도 값
+UNMAPPED_DANGER_LEVEL = 'unmapped'
+
+class DetectionHourlyRollup(Base):
+    """시간대별 탐지 집계 테이블 - tbl_detection_results 트리거로 증분 갱신 (migrations/010)
+    - 키: (user_seq, hour_bucket, device_seq, model_product_seq, danger_level)
+    - 차트 조회 비용이 탐지 건수가 아닌 버킷 수에 비례
+    """
+    __tablename__ = "tbl_detection_hourly_rollup"
+
+    # 복합 기본키 (user_seq + 시간 범위 조회가 선두 컬럼을 타도록 순서 지정)
+    user_seq = Column(Integer, primary_key=True, autoincrement=False)
+    hour_bucket = Column(DateTime, primary_key=True)        # 시 단위로 절삭한 탐지 시각 (YYYY-MM-DD HH:00:00)
+    device_seq = Column(Integer, primary_key=True, autoincrement=False)
+    model_product_seq = Column(Integer, primary_key=True, autoincrement=False)
+    danger_level = Column(String(16), primary_key=True)     # critical/high/medium/low/safe/normal/unmapped
+
+    # 집계 값
+    detection_count = Column(Integer, nullable=False, default=0)   # 버킷 내 탐지 건수
+    last_detected_at = Column(DateTime, nullable=True)             # 버킷 내 마지막 탐지 시각
+
+    # 타임스탬프
+    lastup_dt = Column(DateTime, nullable=False, default=func.current_timestamp(), onupdate=func.current_timestamp())
+
+    # 인덱스
+    __table_args__ = (
+        Index('idx_hourly_rollup_device_hour', 'device_seq', 'hour_bucket'),
+    )
+
+
+class DetectionDailyRollup(Base):
+    """일자별 탐지 집계 테이블 - 시간대별 집계와 같은 트리거 / 재집계에서 함께 갱신
+    - 키: (user_seq, day_bucket, device_seq, model_product_seq, danger_level)
+    - 주간/월간 추이 조회 비용이 탐지 건수가 아닌 (일수 x 버킷 수)에 비례
+    """
+    __tablename__ = "tbl_detection_daily_rollup"
+
+    # 복합 기본키 (user_seq + 날짜 범위 조회가 선두 컬럼을 타도록 순서 지정)
+    user_seq = Column(Integer, primary_key=True, autoincrement=False)
+    day_bucket = Column(Date, primary_key=True)             # 탐지 일자
+    device_seq = Column(Integer, primary_key=True, autoincrement=False)
+    model_product_seq = Column(Integer, primary_key=True, autoincrement=False)
+    danger_level = Column(String(16), primary_key=True)     # critical/high/medium/low/safe/normal/unmapped
+
+    # 집계 값
+    detection_count = Column(Integer, nullable=False, default=0)   # 일자 내 탐지 건수
+    last_detected_at = Column(DateTime, nullable=True)             # 일자 내 마지막 탐지 시각
+
+    # 타임스탬프
+    lastup_dt = Column(DateTime, nullable=False, default=func.current_timestamp(), onupdate=func.current_timestamp())
+
+    # 인덱스
+    __table_args__ = (
+        Index('idx_daily_rollup_device_day', 'device_seq', 'day_bucket'),
+    )
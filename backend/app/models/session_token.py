@@ -0,0 +1,30 @@
+import hashlib
+
+from sqlalchemy import Column, Integer, BigInteger, CHAR, DateTime, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class SessionToken(Base):
+    """세션 토큰 조회 테이블 - 토큰 해시로 SPRING_SESSION 을 기본키 조회
+    - 토큰 원문 대신 sha256(hex) 저장
+    - SPRING_SESSION_ATTRIBUTES 의 session_token 속성 트리거로 유지 (웹 서버 세션 포함, migrations/013)
+    - 세션 만료 / 삭제 시 함께 삭제 (정리: app.commands.purge_session_tokens)
+    """
+    __tablename__ = "tbl_session_token"
+
+    token_hash = Column(CHAR(64), primary_key=True)                  # 세션 토큰 sha256 (hex)
+    session_primary_id = Column(CHAR(36), nullable=False)            # SPRING_SESSION.PRIMARY_ID
+    user_seq = Column(Integer, nullable=False)
+    expiry_time = Column(BigInteger, nullable=False)                 # 발급 시 만료 시각 (epoch ms)
+    reg_dt = Column(DateTime, nullable=False, default=func.current_timestamp())
+
+    # 인덱스
+    __table_args__ = (
+        Index('idx_session_token_session', 'session_primary_id'),
+        Index('idx_session_token_expiry', 'expiry_time'),
+    )
+
+    @staticmethod
+    def hash_token(session_token: str) -> str:
+        """세션 토큰 -> 조회 키 (sha256 hex)"""
+        return hashlib.sha256(session_token.encode('utf-8')).hexdigest()
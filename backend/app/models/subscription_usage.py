@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, Date, DateTime, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class SubscriptionUsageDaily(Base):
+    """구독별 일자 사용량 카운터 테이블 - 사용량 계측기(app.core.usage_meter)가 일괄 반영
+    - 키: (subscription_seq, usage_date)
+    - 사용량 / usage_limit 조회 비용이 탐지 건수가 아닌 구독 수에 비례
+    """
+    __tablename__ = "tbl_subscription_usage_daily"
+
+    # 복합 기본키
+    subscription_seq = Column(Integer, primary_key=True, autoincrement=False)
+    usage_date = Column(Date, primary_key=True)                    # 사용 일자 (탐지 일자 기준)
+
+    # 조회용 컬럼
+    user_seq = Column(Integer, nullable=False)
+    model_product_seq = Column(Integer, nullable=False)
+
+    # 사용량
+    detection_count = Column(Integer, nullable=False, default=0)   # 일자 내 탐지 건수
+
+    # 타임스탬프
+    lastup_dt = Column(DateTime, nullable=False, default=func.current_timestamp(), onupdate=func.current_timestamp())
+
+    # 인덱스
+    __table_args__ = (
+        Index('idx_subscription_usage_user_date', 'user_seq', 'usage_date'),
+    )
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, BigInteger, DateTime
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+class UserDataVersion(Base):
+    """사용자별 데이터 버전 테이블 - 구독 / 디바이스 / 탐지 테이블 트리거로 증가 (migrations/011)
+    - 웹 서버 / AI 서버 등 앱을 거치지 않는 변경도 반영되는 워터마크 (대시보드 ETag, 지난 날짜 캐시 검증)
+    - 행이 없는 사용자는 모든 버전 0
+    """
+    __tablename__ = "tbl_user_data_version"
+
+    user_seq = Column(Integer, primary_key=True, autoincrement=False)
+    subscription_version = Column(BigInteger, nullable=False, default=0)   # 구독 변경 횟수
+    device_version = Column(BigInteger, nullable=False, default=0)         # 디바이스 변경 횟수
+    detection_version = Column(BigInteger, nullable=False, default=0)      # 탐지 수정 / 삭제 횟수 (저장 제외)
+
+    # 타임스탬프
+    lastup_dt = Column(DateTime, nullable=False, default=func.current_timestamp(), onupdate=func.current_timestamp())
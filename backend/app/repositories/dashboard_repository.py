@@ -1,20 +1,29 @@
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import date, datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, desc, distinct
+from sqlalchemy import select, func, and_, case
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.repositories.base_repository import BaseRepository
+from app.core.entitlement_index import entitlement_index
+from app.core.catalog_cache import catalog_cache
+from app.core.usage_meter import usage_meter
+from app.repositories.query_filters import on_date, FEED_OLDER
+from app.repositories.detection_stats_engine import DetectionStatsEngine
+from app.repositories.recent_detection_query import RecentDetectionQuery
 from app.models.detection_result import DetectionResult
+from app.models.detection_rollup import DetectionHourlyRollup, DetectionDailyRollup, UNMAPPED_DANGER_LEVEL
 from app.models.device import Device
 from app.models.group import Group
-from app.models.detection_mapping import ModelDetectionMapping
 from app.models.subscription import ModelProductSubscription
+from app.models.user_data_version import UserDataVersion
 
 
 class DashboardRepository(BaseRepository):
     def __init__(self, db: AsyncSession):
         super().__init__(db)
+        self.stats_engine = DetectionStatsEngine(db)
+        self.recent_query = RecentDetectionQuery(db)
 
     async def get_today_dashboard_summary(self, user_seq: int, target_date: Optional[date] = None) -> Dict[str, Any]:
         """오늘 대시보드 요약 통계
@@ -29,22 +38,18 @@ class DashboardRepository(BaseRepository):
             if target_date is None:
                 target_date = date.today()
 
-            # 기본 탐지 통계 조회
-            basic_detection_stats = await self._get_basic_detection_stats(user_seq, target_date)
-
-            # 디바이스 등록 통계 조회
-            device_registration_stats = await self._get_device_registration_stats(user_seq)
-
-            # 위험도별 탐지 건수 조회
-            risk_breakdown_counts = await self._get_risk_breakdown_counts(user_seq, target_date)
+            # 탐지 건수 / 디바이스 수 / 위험도별 건수를 한 번의 스캔으로 조회
+            daily_stats = await self.stats_engine.get_daily_stats(user_seq, target_date)
+            level_counts = daily_stats['level_counts']
 
             return {
-                'total_detections_today': basic_detection_stats.get('total_count', 0),
-                'devices_detected_today': basic_detection_stats.get('detected_device_count', 0),
-                'total_registered_devices': device_registration_stats.get('registered_count', 0),
-                'risk_detections_count': risk_breakdown_counts[0],      # critical + high + medium
-                'safe_detections_count': risk_breakdown_counts[1],      # low + safe
-                'normal_detections_count': risk_breakdown_counts[2],    # normal
+                'total_detections_today': daily_stats['total_count'],
+                'devices_detected_today': daily_stats['detected_device_count'],
+                'total_registered_devices': daily_stats['registered_device_count'],
+                'risk_detections_count': level_counts['critical'] + level_counts['high'] + level_counts['medium'],
+                'safe_detections_count': level_counts['low'] + level_counts['safe'],
+                'normal_detections_count': level_counts['normal'],
+                'level_counts': level_counts,
                 'target_date': target_date.isoformat()
             }
 
@@ -52,191 +57,49 @@ class DashboardRepository(BaseRepository):
             self.logger.error(f"Dashboard summary query failed for user {user_seq}: {str(e)}")
             raise
 
-    async def _get_basic_detection_stats(self, user_seq: int, target_date: date) -> Dict[str, int]:
-        """기본 탐지 통계 조회 (사용자가 활성화한 모델 상품만)"""
-        query = select(
-            func.count(DetectionResult.detection_seq).label('total_count'),
-            func.count(distinct(DetectionResult.device_seq)).label('detected_device_count')
-        ).select_from(
-            DetectionResult.join(Device, DetectionResult.device_seq == Device.device_seq)
-            .join(ModelDetectionMapping, and_(
-                DetectionResult.model_product_seq == ModelDetectionMapping.model_product_seq,
-                DetectionResult.detection_label == ModelDetectionMapping.detection_label
-            ))
-            .join(ModelProductSubscription,
-                  and_(
-                      ModelDetectionMapping.model_product_seq == ModelProductSubscription.model_product_seq,
-                      ModelProductSubscription.user_seq == user_seq
-                  ))
-        ).where(
-            and_(
-                Device.user_seq == user_seq,
-                DetectionResult.user_seq == user_seq,
-                func.date(DetectionResult.detected_at) == target_date,
-                ModelProductSubscription.subscription_status == 'A'  # 활성화된 구독만
-            )
-        )
-
-        result = await self.db.execute(query)
-        row = result.fetchone()
-
-        return {
-            'total_count': row.total_count if row.total_count else 0,
-            'detected_device_count': row.detected_device_count if row.detected_device_count else 0
-        }
-
-    async def _get_device_registration_stats(self, user_seq: int) -> Dict[str, int]:
-        """디바이스 등록 통계 조회"""
-        query = select(
-            func.count(Device.device_seq).label('registered_count')
-        ).where(
-            Device.user_seq == user_seq
-        )
-
-        result = await self.db.execute(query)
-        row = result.fetchone()
-
-        return {
-            'registered_count': row.registered_count if row.registered_count else 0
-        }
-
-    async def _get_risk_breakdown_counts(self, user_seq: int, target_date: date) -> tuple[int, int, int]:
-        """위험도별 탐지 건수 조회 (사용자가 활성화한 모델 상품만)
-        - risk_count: 위험 탐지 건수
-        - safe_count: 안전 탐지 건수
-        - normal_count: 일반 객체 탐지 건수
-        """
-        # critical + high + medium = 위험
-        risk_query = select(
-            func.count(DetectionResult.detection_seq)
-        ).select_from(
-            DetectionResult.join(Device, DetectionResult.device_seq == Device.device_seq)
-            .join(ModelDetectionMapping, and_(
-                DetectionResult.model_product_seq == ModelDetectionMapping.model_product_seq,
-                DetectionResult.detection_label == ModelDetectionMapping.detection_label
-            ))
-            .join(ModelProductSubscription,
-                  and_(
-                      ModelDetectionMapping.model_product_seq == ModelProductSubscription.model_product_seq,
-                      ModelProductSubscription.user_seq == user_seq
-                  ))
-        ).where(
-            and_(
-                Device.user_seq == user_seq,
-                DetectionResult.user_seq == user_seq,
-                func.date(DetectionResult.detected_at) == target_date,
-                ModelDetectionMapping.danger_level.in_(['critical', 'high', 'medium']),
-                ModelProductSubscription.subscription_status == 'A'  # 활성화된 구독만
-            )
-        )
-
-        # low + safe = 안전
-        safe_query = select(
-            func.count(DetectionResult.detection_seq)
-        ).select_from(
-            DetectionResult.join(Device, DetectionResult.device_seq == Device.device_seq)
-            .join(ModelDetectionMapping, and_(
-                DetectionResult.model_product_seq == ModelDetectionMapping.model_product_seq,
-                DetectionResult.detection_label == ModelDetectionMapping.detection_label
-            ))
-            .join(ModelProductSubscription,
-                  and_(
-                      ModelDetectionMapping.model_product_seq == ModelProductSubscription.model_product_seq,
-                      ModelProductSubscription.user_seq == user_seq
-                  ))
-        ).where(
-            and_(
-                Device.user_seq == user_seq,
-                DetectionResult.user_seq == user_seq,
-                func.date(DetectionResult.detected_at) == target_date,
-                ModelDetectionMapping.danger_level.in_(['low', 'safe']),
-                ModelProductSubscription.subscription_status == 'A'
-            )
-        )
-
-        # normal = 일반 객체
-        normal_query = select(
-            func.count(DetectionResult.detection_seq)
-        ).select_from(
-            DetectionResult.join(Device, DetectionResult.device_seq == Device.device_seq)
-            .join(ModelDetectionMapping, and_(
-                DetectionResult.model_product_seq == ModelDetectionMapping.model_product_seq,
-                DetectionResult.detection_label == ModelDetectionMapping.detection_label
-            ))
-            .join(ModelProductSubscription,
-                  and_(
-                      ModelDetectionMapping.model_product_seq == ModelProductSubscription.model_product_seq,
-                      ModelProductSubscription.user_seq == user_seq
-                  ))
-        ).where(
-            and_(
-                Device.user_seq == user_seq,
-                DetectionResult.user_seq == user_seq,
-                func.date(DetectionResult.detected_at) == target_date,
-                ModelDetectionMapping.danger_level == 'normal',
-                ModelProductSubscription.subscription_status == 'A'
-            )
-        )
-
-        risk_result = await self.db.execute(risk_query)
-        safe_result = await self.db.execute(safe_query)
-        normal_result = await self.db.execute(normal_query)
-
-        risk_count = risk_result.scalar() or 0
-        safe_count = safe_result.scalar() or 0
-        normal_count = normal_result.scalar() or 0
-
-        return (risk_count, safe_count, normal_count)
-
     async def get_hourly_detection_chart_data(self, user_seq: int, target_date: Optional[date] = None) -> List[Dict[str, Any]]:
         """시간대별 탐지 차트 데이터 조회"""
         try:
             if target_date is None:
                 target_date = date.today()
+            entitlement = await entitlement_index.get_user_entitlement(self.db, user_seq)
 
+            # 원본 탐지 대신 시간대별 집계 테이블에서 조회 (버킷 수에 비례하는 비용)
             query = select(
-                func.hour(DetectionResult.detected_at).label('hour'),
-                func.count(DetectionResult.detection_seq).label('detection_count'),
+                func.hour(DetectionHourlyRollup.hour_bucket).label('hour'),
+                func.sum(DetectionHourlyRollup.detection_count).label('detection_count'),
                 func.sum(
-                    func.case(
-                        (ModelDetectionMapping.danger_level.in_(['critical', 'high', 'medium']), 1),
+                    case(
+                        (DetectionHourlyRollup.danger_level.in_(['critical', 'high', 'medium']), DetectionHourlyRollup.detection_count),
                         else_=0
                     )
                 ).label('risk_count'),
                 func.sum(
-                    func.case(
-                        (ModelDetectionMapping.danger_level.in_(['low', 'safe']), 1),
+                    case(
+                        (DetectionHourlyRollup.danger_level.in_(['low', 'safe']), DetectionHourlyRollup.detection_count),
                         else_=0
                     )
                 ).label('safe_count'),
                 func.sum(
-                    func.case(
-                        (ModelDetectionMapping.danger_level == 'normal', 1),
+                    case(
+                        (DetectionHourlyRollup.danger_level == 'normal', DetectionHourlyRollup.detection_count),
                         else_=0
                     )
                 ).label('normal_count')
-            ).select_from(
-                DetectionResult.join(Device, DetectionResult.device_seq == Device.device_seq)
-                .join(ModelDetectionMapping, and_(
-                    DetectionResult.model_product_seq == ModelDetectionMapping.model_product_seq,
-                    DetectionResult.detection_label == ModelDetectionMapping.detection_label
-                ))
-                .join(ModelProductSubscription,
-                      and_(
-                          ModelDetectionMapping.model_product_seq == ModelProductSubscription.model_product_seq,
-                          ModelProductSubscription.user_seq == user_seq
-                      ))
+            ).select_from(DetectionHourlyRollup).join(
+                Device, DetectionHourlyRollup.device_seq == Device.device_seq
             ).where(
                 and_(
                     Device.user_seq == user_seq,
-                    DetectionResult.user_seq == user_seq,
-                    func.date(DetectionResult.detected_at) == target_date,
-                    ModelProductSubscription.subscription_status == 'A'
+                    DetectionHourlyRollup.user_seq == user_seq,
+                    on_date(DetectionHourlyRollup.hour_bucket, target_date),
+                    DetectionHourlyRollup.danger_level != UNMAPPED_DANGER_LEVEL,  # 매핑된 탐지만
+                    DetectionHourlyRollup.model_product_seq.in_(entitlement.model_product_seqs)  # 활성 구독 상품만
                 )
             ).group_by(
-                func.hour(DetectionResult.detected_at)
+                func.hour(DetectionHourlyRollup.hour_bucket)
             ).order_by(
-                func.hour(DetectionResult.detected_at)
+                func.hour(DetectionHourlyRollup.hour_bucket)
             )
 
             result = await self.db.execute(query)
@@ -245,10 +108,10 @@ class DashboardRepository(BaseRepository):
             for row in result:
                 chart_data.append({
                     'hour': row.hour,
-                    'detection_count': row.detection_count or 0,
-                    'risk_count': row.risk_count or 0,
-                    'safe_count': row.safe_count or 0,
-                    'normal_count': row.normal_count or 0
+                    'detection_count': int(row.detection_count or 0),
+                    'risk_count': int(row.risk_count or 0),
+                    'safe_count': int(row.safe_count or 0),
+                    'normal_count': int(row.normal_count or 0)
                 })
 
             return chart_data
@@ -257,22 +120,86 @@ class DashboardRepository(BaseRepository):
             self.logger.error(f"Hourly chart data query failed for user {user_seq}: {str(e)}")
             raise
 
+    async def get_daily_trend_data(self, user_seq: int, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """기간 내 일자별 탐지 추이 조회 (일자별 집계 테이블)
+        - (일자, 디바이스, 위험도) 단위 합계 행 반환 - 비용은 일수 x 디바이스 x 위험도에 비례
+        - 활성 구독 상품 + 매핑된 탐지만 (시간대별 차트와 같은 조건)
+        """
+        try:
+            entitlement = await entitlement_index.get_user_entitlement(self.db, user_seq)
+
+            query = select(
+                DetectionDailyRollup.day_bucket,
+                DetectionDailyRollup.device_seq,
+                Device.device_label,
+                DetectionDailyRollup.danger_level,
+                func.sum(DetectionDailyRollup.detection_count).label('detection_count')
+            ).select_from(DetectionDailyRollup).join(
+                Device, DetectionDailyRollup.device_seq == Device.device_seq
+            ).where(
+                and_(
+                    Device.user_seq == user_seq,
+                    DetectionDailyRollup.user_seq == user_seq,
+                    DetectionDailyRollup.day_bucket.between(start_date, end_date),
+                    DetectionDailyRollup.danger_level != UNMAPPED_DANGER_LEVEL,  # 매핑된 탐지만
+                    DetectionDailyRollup.model_product_seq.in_(entitlement.model_product_seqs)  # 활성 구독 상품만
+                )
+            ).group_by(
+                DetectionDailyRollup.day_bucket,
+                DetectionDailyRollup.device_seq,
+                Device.device_label,
+                DetectionDailyRollup.danger_level
+            )
+
+            result = await self.db.execute(query)
+            return [
+                {
+                    'day': row.day_bucket,
+                    'device_seq': row.device_seq,
+                    'device_label': row.device_label,
+                    'danger_level': row.danger_level,
+                    'detection_count': int(row.detection_count or 0)
+                }
+                for row in result
+            ]
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"Daily trend data query failed for user {user_seq}: {str(e)}")
+            raise
+
     async def get_user_device_status_list(self, user_seq: int) -> List[Dict[str, Any]]:
         """사용자 디바이스 상태 목록 조회"""
         try:
             # 오늘 날짜 설정
             today = date.today()
 
-            # 기본 디바이스 정보와 그룹 정보 조회
+            # 디바이스별 오늘 탐지 집계 (사용자 + 날짜 범위 인덱스로 하루치만 스캔)
+            today_detection_stats = select(
+                DetectionResult.device_seq,
+                func.sum(DetectionResult.detection_count).label('today_count'),
+                func.max(func.coalesce(DetectionResult.last_detected_at, DetectionResult.detected_at)).label('last_detection_time')
+            ).where(
+                and_(
+                    DetectionResult.user_seq == user_seq,
+                    on_date(DetectionResult.detected_at, today)
+                )
+            ).group_by(
+                DetectionResult.device_seq
+            ).subquery()
+
+            # 디바이스 + 그룹 + 오늘 탐지 집계를 한 번에 조회 (디바이스 수와 무관하게 쿼리 1회)
             device_query = select(
                 Device.device_seq,
                 Device.device_label,
                 Device.device_type,
                 Device.group_seq,
                 Group.group_name,
-                Device.reg_dt
+                Device.reg_dt,
+                today_detection_stats.c.today_count,
+                today_detection_stats.c.last_detection_time
             ).select_from(
                 Device.outerjoin(Group, Device.group_seq == Group.group_seq)
+                .outerjoin(today_detection_stats, today_detection_stats.c.device_seq == Device.device_seq)
             ).where(
                 Device.user_seq == user_seq
             ).order_by(
@@ -285,29 +212,14 @@ class DashboardRepository(BaseRepository):
             device_status_list = []
 
             for device in devices:
-                # 각 디바이스별 오늘 탐지 건수 조회
-                today_detection_query = select(
-                    func.count(DetectionResult.detection_seq).label('today_count'),
-                    func.max(DetectionResult.detected_at).label('last_detection_time')
-                ).where(
-                    and_(
-                        DetectionResult.device_seq == device.device_seq,
-                        DetectionResult.user_seq == user_seq,
-                        func.date(DetectionResult.detected_at) == today
-                    )
-                )
-
-                detection_result = await self.db.execute(today_detection_query)
-                detection_stats = detection_result.fetchone()
-
                 device_status_list.append({
                     'device_seq': device.device_seq,
                     'device_label': device.device_label or f"디바이스 {device.device_seq}",
                     'device_type': device.device_type,
                     'group_name': device.group_name or "미분류",
                     'status': 'registered',
-                    'last_detection_time': detection_stats.last_detection_time.isoformat() if detection_stats.last_detection_time else None,
-                    'today_detection_count': detection_stats.today_count or 0,
+                    'last_detection_time': device.last_detection_time.isoformat() if device.last_detection_time else None,
+                    'today_detection_count': int(device.today_count or 0),
                     'registration_date': device.reg_dt.isoformat() if device.reg_dt else None
                 })
 
@@ -317,9 +229,21 @@ class DashboardRepository(BaseRepository):
             self.logger.error(f"Device status list query failed for user {user_seq}: {str(e)}")
             raise
 
-    async def get_recent_critical_alert_list(self, user_seq: int, limit: int = 10) -> List[Dict[str, Any]]:
-        """최근 위험 알림 목록 조회"""
+    async def get_recent_critical_alert_list(self, user_seq: int, limit: int = 10,
+                                             position: Optional[Tuple[datetime, int]] = None,
+                                             direction: str = FEED_OLDER) -> List[Dict[str, Any]]:
+        """최근 위험 알림 목록 조회
+        - position / direction: 커서 위치 기준 최신(newer) / 과거(older) 행만 조회 (반환은 항상 최신순)
+        """
         try:
+            # 1단계: 상위 N개 번호 (인덱스만 사용)
+            detection_seqs = await self.recent_query.get_recent_detection_seqs(
+                user_seq, limit, ['critical', 'high', 'medium'], position, direction
+            )
+            if not detection_seqs:
+                return []
+
+            # 2단계: N건만 디바이스/그룹 정보 보강
             query = select(
                 DetectionResult.detection_seq,
                 DetectionResult.confidence,
@@ -328,41 +252,30 @@ class DashboardRepository(BaseRepository):
                 DetectionResult.thumbnail_url,
                 Device.device_label,
                 Group.group_name,
-                ModelDetectionMapping.detection_label.label('detection_name'),
-                ModelDetectionMapping.danger_level.label('risk_level')
-            ).select_from(
-                DetectionResult.join(Device, DetectionResult.device_seq == Device.device_seq)
-                .join(ModelDetectionMapping, and_(
-                    DetectionResult.model_product_seq == ModelDetectionMapping.model_product_seq,
-                    DetectionResult.detection_label == ModelDetectionMapping.detection_label
-                ))
-                .join(ModelProductSubscription,
-                      and_(
-                          ModelDetectionMapping.model_product_seq == ModelProductSubscription.model_product_seq,
-                          ModelProductSubscription.user_seq == user_seq
-                      ))
-                .outerjoin(Group, Device.group_seq == Group.group_seq)
+                DetectionResult.detection_label.label('detection_name'),
+                DetectionResult.danger_level
+            ).select_from(DetectionResult).join(
+                Device, DetectionResult.device_seq == Device.device_seq
+            ).outerjoin(
+                Group, Device.group_seq == Group.group_seq
             ).where(
                 and_(
                     Device.user_seq == user_seq,
-                    DetectionResult.user_seq == user_seq,
-                    ModelDetectionMapping.danger_level.in_(['critical', 'high', 'medium']),
-                    ModelProductSubscription.subscription_status == 'A'
+                    DetectionResult.detection_seq.in_(detection_seqs)
                 )
-            ).order_by(
-                desc(DetectionResult.detected_at)
-            ).limit(limit)
+            )
 
             result = await self.db.execute(query)
+            rows = self.recent_query.order_rows(result.fetchall(), detection_seqs)
             alert_list = []
 
-            for row in result:
+            for row in rows:
                 alert_list.append({
                     'detection_seq': row.detection_seq,
                     'device_label': row.device_label or f"디바이스 {row.detection_seq}",
                     'detection_class': row.detection_class,
                     'detection_name': row.detection_name,
-                    'risk_level': row.risk_level,
+                    'risk_level': row.danger_level,
                     'confidence': float(row.confidence) if row.confidence else 0.0,
                     'detection_time': row.detected_at.isoformat() if row.detected_at else None,
                     'thumbnail_url': row.thumbnail_url,
@@ -375,9 +288,19 @@ class DashboardRepository(BaseRepository):
             self.logger.error(f"Recent critical alerts query failed for user {user_seq}: {str(e)}")
             raise
 
-    async def get_recent_general_detection_list(self, user_seq: int, limit: int = 20) -> List[Dict[str, Any]]:
-        """최근 일반 탐지 목록 조회 (썸네일 포함)"""
+    async def get_recent_general_detection_list(self, user_seq: int, limit: int = 20,
+                                                position: Optional[Tuple[datetime, int]] = None,
+                                                direction: str = FEED_OLDER) -> List[Dict[str, Any]]:
+        """최근 일반 탐지 목록 조회 (썸네일 포함)
+        - position / direction: 커서 위치 기준 최신(newer) / 과거(older) 행만 조회 (반환은 항상 최신순)
+        """
         try:
+            # 1단계: 상위 N개 번호 (인덱스만 사용)
+            detection_seqs = await self.recent_query.get_recent_detection_seqs(user_seq, limit, None, position, direction)
+            if not detection_seqs:
+                return []
+
+            # 2단계: N건만 디바이스/그룹 정보 보강
             query = select(
                 DetectionResult.detection_seq,
                 DetectionResult.confidence,
@@ -386,40 +309,30 @@ class DashboardRepository(BaseRepository):
                 DetectionResult.thumbnail_url,
                 Device.device_label,
                 Group.group_name,
-                ModelDetectionMapping.detection_label.label('detection_name'),
-                ModelDetectionMapping.danger_level.label('risk_level')
-            ).select_from(
-                DetectionResult.join(Device, DetectionResult.device_seq == Device.device_seq)
-                .join(ModelDetectionMapping, and_(
-                    DetectionResult.model_product_seq == ModelDetectionMapping.model_product_seq,
-                    DetectionResult.detection_label == ModelDetectionMapping.detection_label
-                ))
-                .join(ModelProductSubscription,
-                      and_(
-                          ModelDetectionMapping.model_product_seq == ModelProductSubscription.model_product_seq,
-                          ModelProductSubscription.user_seq == user_seq
-                      ))
-                .outerjoin(Group, Device.group_seq == Group.group_seq)
+                DetectionResult.detection_label.label('detection_name'),
+                DetectionResult.danger_level
+            ).select_from(DetectionResult).join(
+                Device, DetectionResult.device_seq == Device.device_seq
+            ).outerjoin(
+                Group, Device.group_seq == Group.group_seq
             ).where(
                 and_(
                     Device.user_seq == user_seq,
-                    DetectionResult.user_seq == user_seq,
-                    ModelProductSubscription.subscription_status == 'A'
+                    DetectionResult.detection_seq.in_(detection_seqs)
                 )
-            ).order_by(
-                desc(DetectionResult.detected_at)
-            ).limit(limit)
+            )
 
             result = await self.db.execute(query)
+            rows = self.recent_query.order_rows(result.fetchall(), detection_seqs)
             detection_list = []
 
-            for row in result:
+            for row in rows:
                 detection_list.append({
                     'detection_seq': row.detection_seq,
                     'device_label': row.device_label or f"디바이스 {row.detection_seq}",
                     'detection_class': row.detection_class,
                     'detection_name': row.detection_name,
-                    'risk_level': row.risk_level,
+                    'risk_level': row.danger_level,
                     'confidence': float(row.confidence) if row.confidence else 0.0,
                     'detection_time': row.detected_at.isoformat() if row.detected_at else None,
                     'thumbnail_url': row.thumbnail_url,
@@ -432,67 +345,48 @@ class DashboardRepository(BaseRepository):
             self.logger.error(f"Recent detections query failed for user {user_seq}: {str(e)}")
             raise
 
-    async def get_user_active_model_subscriptions(self, user_seq: int) -> List[Dict[str, Any]]:
-        """사용자가 활성화한 모델 상품 구독 목록 조회"""
+    async def get_user_active_model_subscriptions(self, user_seq: int, language: str = 'en-US') -> List[Dict[str, Any]]:
+        """사용자가 활성화한 모델 상품 구독 목록 조회
+        - 오늘 사용량은 구독 사용량 카운터(usage_meter)에서 조회 (탐지 스캔 없음, 구독 수에 비례)
+        - 상품명은 다국어 카탈로그 캐시
+        """
         try:
-            from app.models.model_product import ModelProduct
-
-            # 오늘 날짜 설정
-            today = date.today()
-
-            # 활성화된 구독과 오늘 탐지 건수 조회
-            query = select(
-                ModelProductSubscription.subscription_seq,
-                ModelProductSubscription.model_product_seq,
-                ModelProduct.product_name.label('model_product_name'),
-                ModelProductSubscription.subscription_status,
-                ModelProductSubscription.subscribed_dt,
-                ModelProductSubscription.expires_dt,
-                func.count(DetectionResult.detection_seq).label('detection_count_today')
-            ).select_from(
-                ModelProductSubscription.join(ModelProduct, ModelProductSubscription.model_product_seq == ModelProduct.model_product_seq)
-                .outerjoin(
-                    ModelDetectionMapping,
-                    ModelProductSubscription.model_product_seq == ModelDetectionMapping.model_product_seq
-                )
-                .outerjoin(
-                    DetectionResult,
-                    and_(
-                        DetectionResult.model_product_seq == ModelDetectionMapping.model_product_seq,
-                        DetectionResult.detection_label == ModelDetectionMapping.detection_label,
-                        func.date(DetectionResult.detected_at) == today
-                    )
-                )
-                .outerjoin(Device, DetectionResult.device_seq == Device.device_seq)
-            ).where(
-                and_(
+            result = await self.db.execute(
+                select(
+                    ModelProductSubscription.subscription_seq,
+                    ModelProductSubscription.model_product_seq,
+                    ModelProductSubscription.subscription_status,
+                    ModelProductSubscription.subscribed_dt,
+                    ModelProductSubscription.expires_dt
+                ).where(
                     ModelProductSubscription.user_seq == user_seq,
-                    ModelProductSubscription.subscription_status == 'A',
-                    func.coalesce(Device.user_seq, user_seq) == user_seq
+                    ModelProductSubscription.subscription_status == 'A'
+                ).order_by(
+                    ModelProductSubscription.subscribed_dt.desc()
                 )
-            ).group_by(
-                ModelProductSubscription.subscription_seq,
-                ModelProductSubscription.model_product_seq,
-                ModelProduct.product_name,
-                ModelProductSubscription.subscription_status,
-                ModelProductSubscription.subscribed_dt,
-                ModelProductSubscription.expires_dt
-            ).order_by(
-                ModelProductSubscription.subscribed_dt.desc()
             )
+            subscriptions = result.fetchall()
+            if not subscriptions:
+                return []
+
+            catalog = await catalog_cache.get_view(self.db, language)
+            quotas = await usage_meter.get_quotas(self.db, user_seq)
+            usage = await usage_meter.get_usage(self.db, user_seq)
 
-            result = await self.db.execute(query)
             subscription_list = []
+            for row in subscriptions:
+                quota = quotas.get(row.model_product_seq)
+                usage_limit = quota.usage_limit if quota and quota.subscription_seq == row.subscription_seq else None
 
-            for row in result:
                 subscription_list.append({
                     'subscription_seq': row.subscription_seq,
                     'model_product_seq': row.model_product_seq,
-                    'model_product_name': row.model_product_name or f"모델 상품 {row.model_product_seq}",
+                    'model_product_name': catalog.product_name(row.model_product_seq) or f"모델 상품 {row.model_product_seq}",
                     'subscription_status': row.subscription_status,
                     'subscribed_date': row.subscribed_dt.isoformat() if row.subscribed_dt else None,
                     'expires_date': row.expires_dt.isoformat() if row.expires_dt else None,
-                    'detection_count_today': row.detection_count_today or 0
+                    'detection_count_today': usage.get(row.subscription_seq, 0),
+                    'usage_limit': usage_limit
                 })
 
             return subscription_list
@@ -501,67 +395,66 @@ class DashboardRepository(BaseRepository):
             self.logger.error(f"Active model subscriptions query failed for user {user_seq}: {str(e)}")
             raise
 
-    async def get_device_model_subscriptions(self, user_seq: int) -> List[Dict[str, Any]]:
-        """등록된 디바이스별 활성화된 모델 상품명 조회"""
+    async def get_device_model_subscriptions(self, user_seq: int, language: str = 'en-US') -> List[Dict[str, Any]]:
+        """등록된 디바이스별 활성화된 모델 상품명 조회
+        - 디바이스 x 구독 x 탐지 조인 대신 독립된 조회 3개를 메모리에서 병합
+          1) 사용자 디바이스 목록
+          2) 활성 구독 상품명 (탐지 권한 인덱스 + 다국어 카탈로그 캐시, DB 조회 없음)
+          3) 디바이스별 오늘 탐지 건수 / 마지막 탐지 시각 (시간대별 집계 테이블)
+        - 구독은 사용자 단위이므로 모든 디바이스에 같은 상품 목록이 붙음 (활성 구독이 없으면 빈 목록 반환)
+        """
         try:
-            from app.models.model_product import ModelProduct
-
-            # 오늘 날짜 설정
             today = date.today()
+            entitlement = await entitlement_index.get_user_entitlement(self.db, user_seq)
+            if not entitlement.model_product_seqs:
+                return []
+
+            # 활성 구독 상품명
+            catalog = await catalog_cache.get_view(self.db, language)
+            activated_models = sorted(
+                catalog.product_name(model_product_seq) or f"모델 상품 {model_product_seq}"
+                for model_product_seq in entitlement.model_product_seqs
+            )
 
-            # 디바이스별 활성화된 모델 상품 목록 조회
-            query = select(
-                Device.device_seq,
-                Device.device_label,
-                Device.device_type,
-                func.group_concat(ModelProduct.product_name.distinct()).label('activated_models'),
-                func.count(distinct(DetectionResult.detection_seq)).label('today_detection_count'),
-                func.max(DetectionResult.detected_at).label('last_detection_time')
-            ).select_from(
-                Device.join(
-                    ModelProductSubscription,
-                    ModelProductSubscription.user_seq == Device.user_seq
-                )
-                .join(ModelProduct, ModelProductSubscription.model_product_seq == ModelProduct.model_product_seq)
-                .outerjoin(
-                    ModelDetectionMapping,
-                    ModelProductSubscription.model_product_seq == ModelDetectionMapping.model_product_seq
-                )
-                .outerjoin(
-                    DetectionResult,
-                    and_(
-                        DetectionResult.device_seq == Device.device_seq,
-                        DetectionResult.model_product_seq == ModelDetectionMapping.model_product_seq,
-                        DetectionResult.detection_label == ModelDetectionMapping.detection_label,
-                        func.date(DetectionResult.detected_at) == today
-                    )
-                )
-            ).where(
-                and_(
-                    Device.user_seq == user_seq,
-                    ModelProductSubscription.subscription_status == 'A'
+            # 디바이스 목록
+            device_result = await self.db.execute(
+                select(Device.device_seq, Device.device_label, Device.device_type)
+                .where(Device.user_seq == user_seq)
+                .order_by(Device.device_label)
+            )
+            devices = device_result.fetchall()
+            if not devices:
+                return []
+
+            # 디바이스별 오늘 탐지 건수 / 마지막 탐지 시각 (활성 구독 + 매핑된 탐지만)
+            today_result = await self.db.execute(
+                select(
+                    DetectionHourlyRollup.device_seq,
+                    func.sum(DetectionHourlyRollup.detection_count).label('today_detection_count'),
+                    func.max(DetectionHourlyRollup.last_detected_at).label('last_detection_time')
+                ).where(
+                    DetectionHourlyRollup.user_seq == user_seq,
+                    on_date(DetectionHourlyRollup.hour_bucket, today),
+                    DetectionHourlyRollup.danger_level != UNMAPPED_DANGER_LEVEL,
+                    DetectionHourlyRollup.model_product_seq.in_(entitlement.model_product_seqs)
+                ).group_by(
+                    DetectionHourlyRollup.device_seq
                 )
-            ).group_by(
-                Device.device_seq,
-                Device.device_label,
-                Device.device_type
-            ).order_by(
-                Device.device_label
             )
+            today_by_device = {row.device_seq: row for row in today_result}
 
-            result = await self.db.execute(query)
             device_model_list = []
-
-            for row in result:
-                activated_models = row.activated_models.split(',') if row.activated_models else []
+            for device in devices:
+                today_row = today_by_device.get(device.device_seq)
+                last_detection_time = today_row.last_detection_time if today_row else None
 
                 device_model_list.append({
-                    'device_seq': row.device_seq,
-                    'device_label': row.device_label or f"디바이스 {row.device_seq}",
-                    'device_type': row.device_type,
-                    'activated_model_products': activated_models,
-                    'today_detection_count': row.today_detection_count or 0,
-                    'last_detection_time': row.last_detection_time.isoformat() if row.last_detection_time else None
+                    'device_seq': device.device_seq,
+                    'device_label': device.device_label or f"디바이스 {device.device_seq}",
+                    'device_type': device.device_type,
+                    'activated_model_products': list(activated_models),
+                    'today_detection_count': int(today_row.today_detection_count or 0) if today_row else 0,
+                    'last_detection_time': last_detection_time.isoformat() if last_detection_time else None
                 })
 
             return device_model_list
@@ -570,52 +463,51 @@ class DashboardRepository(BaseRepository):
             self.logger.error(f"Device model subscriptions query failed for user {user_seq}: {str(e)}")
             raise
 
-    async def get_recent_alert_notifications(self, user_seq: int, limit: int = 5) -> List[Dict[str, Any]]:
-        """최근 알림 목록 조회 (탐지 결과 기반 위험 알림)"""
+    async def get_recent_alert_notifications(self, user_seq: int, limit: int = 5,
+                                             position: Optional[Tuple[datetime, int]] = None,
+                                             direction: str = FEED_OLDER) -> List[Dict[str, Any]]:
+        """최근 알림 목록 조회 (탐지 결과 기반 위험 알림)
+        - position / direction: 커서 위치 기준 최신(newer) / 과거(older) 행만 조회 (반환은 항상 최신순)
+        """
         try:
-            # AI 알림 테이블이 없으므로 위험 탐지 결과를 알림으로 변환
+            # 1단계: 상위 N개 번호 (인덱스만 사용)
+            detection_seqs = await self.recent_query.get_recent_detection_seqs(
+                user_seq, limit, ['critical', 'high'], position, direction
+            )
+            if not detection_seqs:
+                return []
+
+            # 2단계: AI 알림 테이블이 없으므로 N건의 위험 탐지 결과를 알림으로 변환
             query = select(
                 DetectionResult.detection_seq.label('alert_seq'),
                 Device.device_seq,
                 Device.device_label,
                 DetectionResult.detection_class,
                 DetectionResult.detection_label,
-                ModelDetectionMapping.danger_level.label('alert_type'),
+                DetectionResult.danger_level,
                 DetectionResult.detected_at.label('alert_time'),
                 DetectionResult.detection_seq.label('related_detection_seq')
-            ).select_from(
-                DetectionResult.join(Device, DetectionResult.device_seq == Device.device_seq)
-                .join(ModelDetectionMapping, and_(
-                    DetectionResult.model_product_seq == ModelDetectionMapping.model_product_seq,
-                    DetectionResult.detection_label == ModelDetectionMapping.detection_label
-                ))
-                .join(ModelProductSubscription,
-                      and_(
-                          ModelDetectionMapping.model_product_seq == ModelProductSubscription.model_product_seq,
-                          ModelProductSubscription.user_seq == user_seq
-                      ))
+            ).select_from(DetectionResult).join(
+                Device, DetectionResult.device_seq == Device.device_seq
             ).where(
                 and_(
                     Device.user_seq == user_seq,
-                    DetectionResult.user_seq == user_seq,
-                    ModelDetectionMapping.danger_level.in_(['critical', 'high']),
-                    ModelProductSubscription.subscription_status == 'A'
+                    DetectionResult.detection_seq.in_(detection_seqs)
                 )
-            ).order_by(
-                desc(DetectionResult.detected_at)
-            ).limit(limit)
+            )
 
             result = await self.db.execute(query)
+            rows = self.recent_query.order_rows(result.fetchall(), detection_seqs, 'alert_seq')
             alert_list = []
 
-            for row in result:
+            for row in rows:
                 # 알림 메시지 생성
                 alert_message = f"{row.detection_class} 분류에서 {row.detection_label} 탐지됨"
 
                 alert_list.append({
                     'alert_seq': row.alert_seq,
                     'device_label': row.device_label or f"디바이스 {row.device_seq}",
-                    'alert_type': row.alert_type,
+                    'alert_type': row.danger_level,
                     'alert_message': alert_message,
                     'alert_time': row.alert_time.isoformat() if row.alert_time else None,
                     'is_read': False,  # 기본값으로 미읽음 처리
@@ -626,4 +518,104 @@ class DashboardRepository(BaseRepository):
 
         except SQLAlchemyError as e:
             self.logger.error(f"Recent alert notifications query failed for user {user_seq}: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def _user_version_columns(self, user_seq: int) -> List[Any]:
+        """사용자 데이터 버전 (구독 / 디바이스 / 탐지 수정) - tbl_user_data_version 기본키 조회, 행이 없으면 0"""
+        return [
+            func.coalesce(
+                select(column).where(UserDataVersion.user_seq == user_seq).scalar_subquery(), 0
+            ).label(column.key)
+            for column in (UserDataVersion.subscription_version, UserDataVersion.device_version,
+                           UserDataVersion.detection_version)
+        ]
+
+    async def get_user_data_watermark(self, user_seq: int) -> Dict[str, Any]:
+        """대시보드 데이터 변경 감지용 워터마크 조회 (ETag 생성용)
+        - 무거운 집계 없이 인덱스만으로 계산되는 값들을 한 번의 왕복으로 조회
+        - 최신 탐지 번호: user_seq 인덱스(InnoDB는 PK가 포함됨)에서 MAX(detection_seq) 바로 조회 (탐지 저장)
+        - 사용자 데이터 버전: 구독 / 디바이스 변경, 탐지 수정(반복 탐지 병합, 위험도 재계산) / 삭제 시 트리거가 증가
+          (웹 서버 / AI 서버 등 앱을 거치지 않는 변경 포함, migrations/011)
+        - 구독 / 디바이스 수: 트리거 적용 전 변경 대비
+        """
+        try:
+            latest_detection_seq = (
+                select(func.max(DetectionResult.detection_seq))
+                .where(DetectionResult.user_seq == user_seq)
+                .scalar_subquery()
+            )
+            subscription_count = (
+                select(func.count(ModelProductSubscription.subscription_seq))
+                .where(ModelProductSubscription.user_seq == user_seq)
+                .scalar_subquery()
+            )
+            device_count = (
+                select(func.count(Device.device_seq))
+                .where(Device.user_seq == user_seq)
+                .scalar_subquery()
+            )
+
+            query = select(
+                latest_detection_seq.label('latest_detection_seq'),
+                subscription_count.label('subscription_count'),
+                device_count.label('device_count'),
+                *self._user_version_columns(user_seq)
+            )
+
+            result = await self.db.execute(query)
+            row = result.fetchone()
+
+            return {
+                'latest_detection_seq': int(row.latest_detection_seq or 0),
+                'subscription_count': int(row.subscription_count or 0),
+                'device_count': int(row.device_count or 0),
+                'subscription_version': int(row.subscription_version),
+                'device_version': int(row.device_version),
+                'detection_version': int(row.detection_version)
+            }
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"User data watermark query failed for user {user_seq}: {str(e)}")
+            raise
+
+    async def get_user_day_watermark(self, user_seq: int, target_date: date) -> Dict[str, Any]:
+        """지난 날짜 섹션 변경 감지용 워터마크 조회 (ETag / 지난 날짜 캐시 검증용)
+        - 해당 일자 일자별 집계 버킷 요약: 버킷 수 / 건수 합 / 마지막 탐지 시각 / 버킷별 건수 체크섬
+          (지연 저장, 병합, 삭제, 위험도 재계산으로 버킷 간 건수가 옮겨가는 경우 모두 값이 바뀜)
+        - 구독 / 디바이스 버전: 권한 상품 / 등록 디바이스 정보가 결과에 포함됨
+        - 오늘 탐지 저장 / 병합으로는 바뀌지 않음 (지난 날짜 ETag 가 계속 유지됨)
+        """
+        try:
+            bucket_checksum = func.sum(
+                func.crc32(func.concat_ws(':', DetectionDailyRollup.device_seq, DetectionDailyRollup.model_product_seq,
+                                          DetectionDailyRollup.danger_level))
+                * DetectionDailyRollup.detection_count
+            )
+            day_summary = select(
+                func.count().label('bucket_count'),
+                func.coalesce(func.sum(DetectionDailyRollup.detection_count), 0).label('detection_count'),
+                func.max(DetectionDailyRollup.last_detected_at).label('last_detected_at'),
+                func.coalesce(bucket_checksum, 0).label('bucket_checksum')
+            ).where(
+                DetectionDailyRollup.user_seq == user_seq,
+                DetectionDailyRollup.day_bucket == target_date
+            ).subquery()
+
+            subscription_version, device_version, _ = self._user_version_columns(user_seq)
+            result = await self.db.execute(
+                select(day_summary, subscription_version, device_version)
+            )
+            row = result.fetchone()
+
+            return {
+                'bucket_count': int(row.bucket_count or 0),
+                'detection_count': int(row.detection_count or 0),
+                'last_detected_at': row.last_detected_at.isoformat() if row.last_detected_at else None,
+                'bucket_checksum': int(row.bucket_checksum or 0),
+                'subscription_version': int(row.subscription_version),
+                'device_version': int(row.device_version)
+            }
+
+        except SQLAlchemyError as e:
+            self.logger.error(f"User day watermark query failed for user {user_seq}, date {target_date}: {str(e)}")
+            raise
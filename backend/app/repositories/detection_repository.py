@@ -1,18 +1,22 @@
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, desc, case
+from sqlalchemy import select, func, and_, case, update, insert, not_, tuple_
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.repositories.base_repository import BaseRepository
+from app.core.entitlement_index import entitlement_index
+from app.core.danger_levels import DANGER_LEVEL_SEVERITY, most_severe_danger_level
+from app.core.catalog_cache import catalog_cache
+from app.repositories.query_filters import on_date, FEED_OLDER
+from app.repositories.detection_stats_engine import DetectionStatsEngine
+from app.repositories.recent_detection_query import RecentDetectionQuery
 from app.models.detection_result import DetectionResult
+from app.models.detection_rollup import DetectionHourlyRollup
+from app.models.detection_mapping import ModelDetectionMapping
 from app.models.device import Device
 from app.models.group import Group
-from app.models.detection_mapping import ModelDetectionMapping
-from app.models.model_product import ModelProduct, ModelProductLang
-from app.models.guidance_model import GuidanceModel, GuidanceModelLang
 from app.models.alert import Alert
-from app.models.subscription import ModelProductSubscription
 
 class DetectionRepository(BaseRepository):
     """탐지 결과 관련 레포지토리"""
@@ -26,8 +30,31 @@ class DetectionRepository(BaseRepository):
         "th-TH": "กำลังพัฒนา",
         "fil-PH": "Sa pag-develop pa"
     }
+
+    # 카탈로그에 상품명이 없을 때 표시할 다국어 메시지
+    UNKNOWN_PRODUCT_MESSAGES = {
+        "ko-KR": "알 수 없는 모델",
+        "en-US": "Unknown Model",
+        "zh-CN": "未知模型",
+        "ja-JP": "不明なモデル",
+        "th-TH": "โมเดลที่ไม่รู้จัก",
+        "fil-PH": "Hindi kilalang modelo"
+    }
+
+    # 위험도 표시명 (app/core/danger_levels.py 의 위험도 값)
+    DANGER_LEVEL_DISPLAY = {
+        'critical': "Critical",
+        'high': "High",
+        'medium': "Medium",
+        'low': "Low",
+        'safe': "Safe",
+        'normal': "Normal"
+    }
+
     def __init__(self, db: AsyncSession):
         super().__init__(db)
+        self.stats_engine = DetectionStatsEngine(db)
+        self.recent_query = RecentDetectionQuery(db)
         
     async def get_today_stats(self, user_seq: int) -> Dict[str, Any]:
         """오늘의 탐지 통계 조회 - 메인 페이지 대시 보드용
@@ -38,71 +65,23 @@ class DetectionRepository(BaseRepository):
         try:
             today = date.today()
             
-            # 오늘의 위험도별 통계 쿼리 (삼중 보안 필터링: 디바이스 + 탐지결과 + 구독)
-            stats_query = select(
-                func.count(DetectionResult.detection_seq).label('total_detections'),
-                func.count(func.distinct(DetectionResult.device_seq)).label('devices_active'),
-                ModelDetectionMapping.danger_level,
-                func.count(DetectionResult.detection_seq).label('level_count')
-            ).select_from(
-                DetectionResult
-                .join(Device, DetectionResult.device_seq == Device.device_seq)
-                .join(ModelDetectionMapping, and_(
-                    DetectionResult.model_product_seq == ModelDetectionMapping.model_product_seq,
-                    DetectionResult.detection_label == ModelDetectionMapping.detection_label
-                ))
-                .join(ModelProductSubscription, and_(
-                    ModelProductSubscription.user_seq == user_seq,                    # 구독 소유자 확인
-                    ModelProductSubscription.model_product_seq == DetectionResult.model_product_seq,  # 모델 상품 연결
-                    ModelProductSubscription.subscription_status == 'A'              # 활성 구독만
-                ))
-            ).where(
-                and_(
-                    Device.user_seq == user_seq,                                      # 디바이스 소유자 확인
-                    DetectionResult.user_seq == user_seq,                            # 탐지 결과 소유자 확인
-                    func.date(DetectionResult.detected_at) == today                   # 오늘 데이터만
-                )
-            ).group_by(ModelDetectionMapping.danger_level)
+            # 총 탐지 / 활성 디바이스 / 전체 디바이스 / 위험도별 건수를 한 번의 스캔으로 조회
+            daily_stats = await self.stats_engine.get_daily_stats(user_seq, today)
+            level_counts = daily_stats['level_counts']
             
-            result = await self.db.execute(stats_query)
-            stats_data = result.fetchall()
-            
-            # 전체 디바이스 수 조회 - 사용자별 필터링
-            total_devices_query = select(func.count(Device.device_seq)).where(Device.user_seq == user_seq)
-            total_device_result = await self.db.execute(total_devices_query)
-            total_devices = total_device_result.scalar() or 0
-            
-            # 통계 데이터 정리
-            total_detections = 0
-            devices_active = 0
+            total_detections = daily_stats['total_count']
             risk_distribution = {
-                'critical': 0,  # 위험
-                'high': 0,     # 경고
-                'medium': 0,   # 주의
-                'safe': 0   # 정상 => low + safe + normal 합계
+                'critical': level_counts['critical'],  # 위험
+                'high': level_counts['high'],          # 경고
+                'medium': level_counts['medium'],      # 주의
+                'safe': level_counts['low'] + level_counts['safe'] + level_counts['normal']   # 정상 => low + safe + normal 합계
             }
-            
-            for row in stats_data:
-                if devices_active == 0:
-                    devices_active = row.devices_active
-                    
-                total_detections += row.level_count
-                
-                # 위험도별 그룹핑 처리
-                if row.danger_level == 'critical':
-                    risk_distribution['critical'] = row.level_count
-                elif row.danger_level == 'high':
-                    risk_distribution['high'] = row.level_count
-                elif row.danger_level == 'medium':
-                    risk_distribution['medium'] = row.level_count
-                elif row.danger_level in ['low', 'safe', 'normal']:    # low, safe, normal 모두 safe로 통합
-                    risk_distribution['safe'] += row.level_count
                     
             result_stats = {
                 'total_detections': total_detections,
-                'devices_active': devices_active,
+                'devices_active': daily_stats['detected_device_count'],
                 'risk_distribution': risk_distribution,
-                'total_devices': total_devices
+                'total_devices': daily_stats['registered_device_count']
             }
             
             self.logger.info(f"오늘 통게 조회 완료 [user_seq={user_seq}]: 총 {total_detections}건, (위험:{risk_distribution['critical']}, 경고:{risk_distribution['high']}, 주의:{risk_distribution['medium']}, 정상:{risk_distribution['safe']})")
@@ -117,10 +96,21 @@ class DetectionRepository(BaseRepository):
                 'total_devices': 0
             }
             
-    async def get_recent_detections_with_full_info(self, user_seq: int, language: str = 'en-US', limit: int = 10) -> List[Dict[str, Any]]:
-        """최근 탐지 목록 조회"""
+    async def get_recent_detections_with_full_info(self, user_seq: int, language: str = 'en-US', limit: int = 10,
+                                                   position: Optional[Tuple[datetime, int]] = None,
+                                                   direction: str = FEED_OLDER) -> List[Dict[str, Any]]:
+        """최근 탐지 목록 조회
+        - position: 커서 위치 (detected_at, detection_seq) - 지정 시 해당 위치보다 최신(newer)/과거(older) 행만 조회
+        - 반환 순서는 방향과 관계없이 항상 최신순
+        """
         try:
-            # 7개 테이블 join 쿼리 (Alert + Subscription 테이블 추가)
+            # 1단계: 사용자 + 탐지 권한(활성 구독 + 매핑된 라벨) 조건으로 상위 N개 번호만 조회 (인덱스만 사용)
+            detection_seqs = await self.recent_query.get_recent_detection_seqs(user_seq, limit, None, position, direction)
+            if not detection_seqs:
+                return []
+            
+            # 2단계: N건만 디바이스/그룹/알림 정보 보강
+            # 상품명 / AI 안내 템플릿은 조인하지 않고 다국어 카탈로그 캐시에서 붙임
             query = select(
                 # 탐지 정보
                 DetectionResult.detection_seq,
@@ -137,66 +127,45 @@ class DetectionRepository(BaseRepository):
                 # 그룹 정보
                 Group.group_name,
 
-                # 위험도
-                ModelDetectionMapping.danger_level,
+                # 위험도 (저장 시 비정규화)
+                DetectionResult.danger_level,
 
-                # 상품명 (다국어)
-                ModelProductLang.product_name,
+                # 카탈로그 조회용
+                DetectionResult.model_product_seq,
 
                 # AI 안내문 (실제 알림 기록)
-                Alert.ai_detection_guide.label('alert_guide'),
-
-                # AI 안내문 템플릿 (다국어)
-                GuidanceModelLang.ai_detection_guide.label('template_guide')
-            ).select_from(
-                DetectionResult
-                .join(Device, DetectionResult.device_seq == Device.device_seq)
-                .join(ModelDetectionMapping, and_(
-                    DetectionResult.model_product_seq == ModelDetectionMapping.model_product_seq,
-                    DetectionResult.detection_label == ModelDetectionMapping.detection_label
-                ))
-                .join(ModelProductSubscription, and_(
-                    ModelProductSubscription.user_seq == user_seq,                    # 구독 소유자 확인
-                    ModelProductSubscription.model_product_seq == DetectionResult.model_product_seq,  # 모델 상품 연결
-                    ModelProductSubscription.subscription_status == 'A'              # 활성 구독만
-                ))
-                .outerjoin(Group, Device.group_seq == Group.group_seq)
-                .outerjoin(ModelProductLang, and_(
-                    DetectionResult.model_product_seq == ModelProductLang.model_product_seq,
-                    ModelProductLang.lang_tag == language
-                ))
-                .outerjoin(GuidanceModel,
-                    GuidanceModel.model_product_seq == DetectionResult.model_product_seq
-                )
-                .outerjoin(GuidanceModelLang, and_(
-                    GuidanceModelLang.guidance_model_product_seq == GuidanceModel.guidance_model_product_seq,
-                    GuidanceModelLang.lang_tag == language
-                ))
-                .outerjoin(Alert, and_(
+                Alert.ai_detection_guide.label('alert_guide')
+            ).select_from(DetectionResult).join(
+                Device, DetectionResult.device_seq == Device.device_seq
+            ).outerjoin(
+                Group, Device.group_seq == Group.group_seq
+            ).outerjoin(
+                Alert, and_(
                     Alert.detection_seq == DetectionResult.detection_seq,
                     Alert.lang_tag == language
-                ))
+                )
             ).where(
                 and_(
                     Device.user_seq == user_seq,                                      # 디바이스 소유자 확인
-                    DetectionResult.user_seq == user_seq                             # 탐지 결과 소유자 확인
+                    DetectionResult.detection_seq.in_(detection_seqs)
                 )
-            ).order_by(desc(DetectionResult.detected_at)).limit(limit)
+            )
             
             result = await self.db.execute(query)
-            raw_data = result.fetchall()
+            raw_data = self.recent_query.order_rows(result.fetchall(), detection_seqs)
+            catalog = await catalog_cache.get_view(self.db, language)
             
             # 데이터 가공
             detections = []
             for row in raw_data:
                 location_info = self._get_location_info(row.group_name, row.device_label)
-                product_name = row.product_name or self._get_default_product_message(language)
+                product_name = catalog.product_name(row.model_product_seq) or self._get_default_product_message(language)
                 danger_level_display = self._get_danger_level_display(row.danger_level)
 
                 # AI 안내문 처리 - 실제 알림 → 템플릿 → "개발중"
                 ai_guide = (
                     row.alert_guide or                           # 1순위: 실제 알림 (tbl_ai_alerts)
-                    row.template_guide or                        # 2순위: AI 안내 템플릿 (tbl_guidance_model_product_lang)
+                    catalog.detection_guide(row.model_product_seq, row.detection_label) or  # 2순위: AI 안내 템플릿 (tbl_guidance_model_product_lang)
                     self.DEVELOPMENT_MESSAGES.get(language, "Under Development")  # 3순위: 개발중 메시지
                 )
 
@@ -226,40 +195,34 @@ class DetectionRepository(BaseRepository):
             return []
         
     async def get_hourly_chart_data(self, user_seq: int, target_date: date) -> List[Dict[str, Any]]:
-        """시간대별 탐지 차트 데이터 조회 (차트 모달용)"""
+        """시간대별 탐지 차트 데이터 조회 (차트 모달용)
+        - 원본 탐지 대신 시간대별 집계 테이블(tbl_detection_hourly_rollup)에서 조회
+        """
         try:
-            user_devices = await self._get_user_device_list(user_seq)
-            if not user_devices:
-                self.logger.warning(f"시간대별 차트 데이터 없음 - 디바이스 없음 [user_seq={user_seq}]")
-                return self._get_empty_hourly_data_list()
-
+            entitlement = await entitlement_index.get_user_entitlement(self.db, user_seq)
             hourly_result = await self.db.execute(
                 select(
-                    func.hour(DetectionResult.detected_at).label('hour'),
-                    func.count(DetectionResult.detection_seq).label('count')
+                    func.hour(DetectionHourlyRollup.hour_bucket).label('hour'),
+                    func.sum(DetectionHourlyRollup.detection_count).label('count')
                 )
-                .select_from(DetectionResult)
-                .join(Device, DetectionResult.device_seq == Device.device_seq)
-                .join(ModelProductSubscription, and_(
-                    ModelProductSubscription.user_seq == user_seq,                    # 구독 소유자 확인
-                    ModelProductSubscription.model_product_seq == DetectionResult.model_product_seq,  # 모델 상품 연결
-                    ModelProductSubscription.subscription_status == 'A'              # 활성 구독만
-                ))
+                .select_from(DetectionHourlyRollup)
+                .join(Device, DetectionHourlyRollup.device_seq == Device.device_seq)
                 .where(
                     and_(
                         Device.user_seq == user_seq,                                  # 디바이스 소유자 확인
-                        DetectionResult.user_seq == user_seq,                        # 탐지 결과 소유자 확인
-                        func.date(DetectionResult.detected_at) == target_date         # 대상 날짜만
+                        DetectionHourlyRollup.user_seq == user_seq,                  # 탐지 결과 소유자 확인
+                        on_date(DetectionHourlyRollup.hour_bucket, target_date),      # 대상 날짜만
+                        DetectionHourlyRollup.model_product_seq.in_(entitlement.model_product_seqs)  # 활성 구독 상품만
                     )
                 )
-                .group_by(func.hour(DetectionResult.detected_at))
-                .order_by(func.hour(DetectionResult.detected_at))
+                .group_by(func.hour(DetectionHourlyRollup.hour_bucket))
+                .order_by(func.hour(DetectionHourlyRollup.hour_bucket))
             )
 
             hourly_data = self._get_empty_hourly_data()
 
             for hour, count in hourly_result.fetchall():
-                hourly_data[hour]['count'] = count
+                hourly_data[hour]['count'] = int(count or 0)
 
             self.logger.info(f"시간대별 차트 데이터 조회 완료 [user_seq={user_seq}, date={target_date}]")
             return list(hourly_data.values())
@@ -282,42 +245,52 @@ class DetectionRepository(BaseRepository):
         """빈 시간대별 데이터를 리스트로 반환"""
         return list(self._get_empty_hourly_data().values())
 
+    def _get_location_info(self, group_name: Optional[str], device_label: Optional[str]) -> str:
+        """위치 정보 - '그룹 / 디바이스' (그룹이 없으면 디바이스 이름만)"""
+        device_label = device_label or "Unknown Device"
+        return f"{group_name} / {device_label}" if group_name else device_label
+
+    def _get_default_product_message(self, language: str) -> str:
+        """카탈로그에 상품명이 없을 때 표시할 메시지"""
+        return self.UNKNOWN_PRODUCT_MESSAGES.get(language, self.UNKNOWN_PRODUCT_MESSAGES["en-US"])
+
+    def _get_danger_level_display(self, danger_level: Optional[str]) -> Optional[str]:
+        """위험도 표시명 (매핑 없는 탐지는 None)"""
+        if danger_level is None:
+            return None
+        return self.DANGER_LEVEL_DISPLAY.get(danger_level, danger_level)
+
     async def get_device_distribution_chart(self, user_seq: int, target_date: date) -> List[Dict[str, Any]]:
-        """디바이스별 탐지 분포 차트 데이터 조회 (차트 모달용)"""
+        """디바이스별 탐지 분포 차트 데이터 조회 (차트 모달용)
+        - 원본 탐지 대신 시간대별 집계 테이블(tbl_detection_hourly_rollup)에서 조회
+        """
         try:
-            user_devices = await self._get_user_device_list(user_seq)
-            if not user_devices:
-                self.logger.warning(f"디바이스별 차트 데이터 없음 - 디바이스 없음 [user_seq={user_seq}]")
-                return []
-
+            entitlement = await entitlement_index.get_user_entitlement(self.db, user_seq)
+            detection_count = func.sum(DetectionHourlyRollup.detection_count)
             distribution_result = await self.db.execute(
                 select(
                     Device.device_label,
                     Group.group_name,
                     Device.device_seq,
-                    func.count(DetectionResult.detection_seq).label('count')
+                    detection_count.label('detection_count')
                 )
-                .select_from(DetectionResult)
-                .join(Device, DetectionResult.device_seq == Device.device_seq)
-                .join(ModelProductSubscription, and_(
-                    ModelProductSubscription.user_seq == user_seq,                    # 구독 소유자 확인
-                    ModelProductSubscription.model_product_seq == DetectionResult.model_product_seq,  # 모델 상품 연결
-                    ModelProductSubscription.subscription_status == 'A'              # 활성 구독만
-                ))
+                .select_from(DetectionHourlyRollup)
+                .join(Device, DetectionHourlyRollup.device_seq == Device.device_seq)
                 .outerjoin(Group, Device.group_seq == Group.group_seq)
                 .where(
                     and_(
                         Device.user_seq == user_seq,                                  # 디바이스 소유자 확인
-                        DetectionResult.user_seq == user_seq,                        # 탐지 결과 소유자 확인
-                        func.date(DetectionResult.detected_at) == target_date         # 대상 날짜만
+                        DetectionHourlyRollup.user_seq == user_seq,                  # 탐지 결과 소유자 확인
+                        on_date(DetectionHourlyRollup.hour_bucket, target_date),      # 대상 날짜만
+                        DetectionHourlyRollup.model_product_seq.in_(entitlement.model_product_seqs)  # 활성 구독 상품만
                     )
                 )
                 .group_by(Device.device_seq, Device.device_label, Group.group_name)
-                .order_by(func.count(DetectionResult.detection_seq).desc())
+                .order_by(detection_count.desc())
             )
 
             results = distribution_result.fetchall()
-            total_count = sum(row.count for row in results)
+            total_count = sum(int(row.detection_count or 0) for row in results)
 
             if total_count == 0:
                 self.logger.info(f"디바이스별 차트 데이터 없음 - 탐지 없음 [user_seq={user_seq}, date={target_date}]")
@@ -325,13 +298,14 @@ class DetectionRepository(BaseRepository):
 
             distribution_data = []
             for row in results:
-                percentage = round((row.count / total_count) * 100, 1)
+                device_count = int(row.detection_count or 0)
+                percentage = round((device_count / total_count) * 100, 1)
 
                 distribution_data.append({
                     'device_seq': row.device_seq,
                     'device_label': row.device_label or f"디바이스_{row.device_seq}",
                     'group_name': row.group_name or "기본 그룹",
-                    'count': row.count,
+                    'count': device_count,
                     'percentage': percentage
                 })
 
@@ -340,4 +314,133 @@ class DetectionRepository(BaseRepository):
 
         except SQLAlchemyError as e:
             self.logger.error(f"디바이스별 차트 데이터 조회 오류 [user_seq={user_seq}, date={target_date}]: {str(e)}")
-            return []
\ No newline at end of file
+            return []
+
+    async def reconcile_danger_levels(self, target_date: date) -> int:
+        """특정 일자 탐지 행의 위험도(danger_level) / 등급(severity)을 현재 매핑 기준으로 다시 계산
+        - 매핑(tbl_model_detection_mappings) 변경 후 실행, 값이 달라진 행만 갱신
+        - 같은 라벨의 중복 매핑은 가장 위험한 위험도 하나로 고정 (탐지 권한 인덱스 / 저장 트리거와 동일 규칙)
+        - 커밋은 호출자가 처리
+        - 반환값: 위험도가 바뀐 행 수
+        """
+        mapped_level = select(
+            most_severe_danger_level(ModelDetectionMapping.danger_level)
+        ).where(
+            ModelDetectionMapping.model_product_seq == DetectionResult.model_product_seq,
+            ModelDetectionMapping.detection_label == DetectionResult.detection_label
+        ).scalar_subquery()
+
+        level_result = await self.db.execute(
+            update(DetectionResult)
+            .where(
+                on_date(DetectionResult.detected_at, target_date),
+                not_(DetectionResult.danger_level.is_not_distinct_from(mapped_level))
+            )
+            .values(danger_level=mapped_level)
+            .execution_options(synchronize_session=False)
+        )
+
+        severity = case(DANGER_LEVEL_SEVERITY, value=DetectionResult.danger_level)
+        await self.db.execute(
+            update(DetectionResult)
+            .where(
+                on_date(DetectionResult.detected_at, target_date),
+                not_(DetectionResult.severity.is_not_distinct_from(severity))
+            )
+            .values(severity=severity)
+            .execution_options(synchronize_session=False)
+        )
+
+        changed_count = level_result.rowcount or 0
+        self.logger.info(f"탐지 위험도 재계산 완료 [date={target_date}]: {changed_count}건 변경")
+        return changed_count
+
+    async def get_user_seqs_on_date(self, target_date: date) -> List[int]:
+        """특정 일자에 탐지가 있는 사용자 번호 목록 (idx_detection_results_detected 로 일자 범위만 조회)"""
+        result = await self.db.execute(
+            select(DetectionResult.user_seq).where(on_date(DetectionResult.detected_at, target_date)).distinct()
+        )
+        return [row.user_seq for row in result]
+
+    async def get_device_owners(self, device_seqs: List[int]) -> Dict[int, int]:
+        """디바이스 소유자 조회 (device_seq -> user_seq, 없는 디바이스는 제외)"""
+        if not device_seqs:
+            return {}
+
+        result = await self.db.execute(
+            select(Device.device_seq, Device.user_seq).where(Device.device_seq.in_(device_seqs))
+        )
+        return {row.device_seq: row.user_seq for row in result}
+
+    async def bulk_insert_detections(self, detections: List[Dict[str, Any]]) -> int:
+        """탐지 결과 일괄 저장 (다중 행 executemany, 행별 flush/refresh 없음)
+        - detections: tbl_detection_results 컬럼명 dict 목록 (danger_level / severity 포함)
+        - 커밋 / 저장 훅 실행은 호출자가 처리
+        - 반환값: 저장된 행 수
+        """
+        if not detections:
+            return 0
+
+        await self.db.execute(insert(DetectionResult), detections)
+        return len(detections)
+
+    async def insert_detections_returning_seqs(self, detections: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """탐지 결과 다중 행 1문 저장 + 행별 detection_seq 조회 (반복 탐지 병합 구간의 첫 행용)
+        - INSERT ... VALUES (...), (...) 1회 -> LAST_INSERT_ID()(첫 행 번호) 이후 행을 자연키 (디바이스, 모델 상품, 라벨, 탐지 시각)로 1회 조회
+        - 한 배치의 첫 행끼리는 자연키가 겹치지 않음 (같은 키는 병합되거나 다른 탐지 시각으로 새 구간을 엶)
+        - 다른 요청이 같은 자연키 행을 동시에 저장했으면 연속 번호 범위(첫 행 번호 + 순번) 안의 행 우선, 없으면 가장 작은 번호
+          (innodb_autoinc_lock_mode=2 에서는 한 문의 번호가 연속이 아닐 수 있어 범위만으로 정하지 않음)
+        - 커밋 / 저장 훅 실행은 호출자가 처리
+        - 반환값: detections 순서의 detection_seq (찾지 못한 행은 None)
+        """
+        if not detections:
+            return []
+
+        result = await self.db.execute(insert(DetectionResult).values(detections))
+        first_seq = result.lastrowid
+
+        natural_key = (DetectionResult.device_seq, DetectionResult.model_product_seq,
+                       DetectionResult.detection_label, DetectionResult.detected_at)
+        keys = [
+            (detection['device_seq'], detection['model_product_seq'], detection['detection_label'], detection['detected_at'])
+            for detection in detections
+        ]
+        rows = await self.db.execute(
+            select(DetectionResult.detection_seq, *natural_key)
+            .where(
+                DetectionResult.detection_seq >= first_seq,
+                tuple_(*natural_key).in_(keys)
+            )
+            .order_by(DetectionResult.detection_seq)
+        )
+
+        candidates: Dict[Tuple[int, int, str, datetime], List[int]] = {}
+        for row in rows:
+            candidates.setdefault((row.device_seq, row.model_product_seq, row.detection_label, row.detected_at), []).append(row.detection_seq)
+
+        detection_seqs: List[Optional[int]] = []
+        for position, key in enumerate(keys):
+            seqs = candidates.get(key, [])
+            expected_seq = first_seq + position
+            detection_seqs.append(expected_seq if expected_seq in seqs else (seqs[0] if seqs else None))
+        return detection_seqs
+
+    async def merge_coalesced_detection(self, detection_seq: int, merged_count: int,
+                                        last_detected_at: datetime, media: Dict[str, Any]) -> int:
+        """병합 구간 누적분을 첫 행에 반영 (detection_count 증가 + 마지막 탐지 시각 / 미디어 갱신)
+        - 첫 행은 기본키로 갱신 ((디바이스, 탐지 시각, 모델 상품, 라벨)은 같은 초의 프레임끼리 겹칠 수 있음)
+        - 반환값: 갱신된 행 수 (첫 행이 삭제되었으면 0 - 삭제된 탐지는 되살리지 않음)
+        """
+        detection_table = DetectionResult.__table__
+        result = await self.db.execute(
+            update(detection_table)
+            .where(detection_table.c.detection_seq == detection_seq)
+            .values(
+                detection_count=detection_table.c.detection_count + merged_count,
+                last_detected_at=func.greatest(
+                    func.coalesce(detection_table.c.last_detected_at, detection_table.c.detected_at), last_detected_at
+                ),
+                **media
+            )
+        )
+        return result.rowcount or 0
@@ -0,0 +1,97 @@
+from datetime import date
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, delete
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+
+from app.repositories.base_repository import BaseRepository
+from app.repositories.query_filters import on_date
+from app.models.detection_result import DetectionResult
+from app.models.detection_rollup import DetectionHourlyRollup, DetectionDailyRollup, UNMAPPED_DANGER_LEVEL
+
+
+class DetectionRollupRepository(BaseRepository):
+    """시간대별 / 일자별 탐지 집계(tbl_detection_hourly_rollup / tbl_detection_daily_rollup) 레포지토리
+    - 증분 갱신은 tbl_detection_results 트리거가 담당 (저장 경로와 무관, migrations/010)
+    - 과거 일자 재집계 (rebuild / backfill / 트리거 적용 전 기간 복구)
+    - 일자별 집계는 항상 시간대별 버킷을 일 단위로 합산한 값 (두 집계가 같은 데이터에서 파생)
+    """
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(db)
+
+    async def rebuild_day(self, target_date: date) -> int:
+        """특정 일자의 시간대별 / 일자별 집계를 원본 탐지 결과로부터 재생성
+        - 해당 일자 버킷 삭제 후 INSERT ... SELECT 로 재집계 (일자별 집계는 재생성된 시간대별 버킷을 합산)
+        - 원본은 idx_detection_results_detected (detected_at) 인덱스로 일자 범위만 조회
+        - 같은 일자에 탐지가 계속 저장되는 중이면 트리거와 잠금이 겹칠 수 있으므로 오늘 재생성은 한가한 시간에 실행
+        - 커밋은 호출자가 처리
+        - 반환값: 생성된 시간대 버킷 수
+        """
+        await self.db.execute(
+            delete(DetectionHourlyRollup).where(
+                on_date(DetectionHourlyRollup.hour_bucket, target_date)
+            )
+        )
+
+        # 위험도는 탐지 행에 비정규화된 값 사용 (매핑 변경은 reconcile_detection_danger_levels 의 행 UPDATE 로 트리거가 반영)
+        hour_bucket = func.date_format(DetectionResult.detected_at, '%Y-%m-%d %H:00:00')
+        danger_level = func.coalesce(DetectionResult.danger_level, UNMAPPED_DANGER_LEVEL)
+
+        aggregate_query = select(
+            DetectionResult.user_seq,
+            hour_bucket,
+            DetectionResult.device_seq,
+            DetectionResult.model_product_seq,
+            danger_level,
+            func.sum(DetectionResult.detection_count),
+            func.max(func.coalesce(DetectionResult.last_detected_at, DetectionResult.detected_at))
+        ).where(
+            on_date(DetectionResult.detected_at, target_date)
+        ).group_by(
+            DetectionResult.user_seq,
+            hour_bucket,
+            DetectionResult.device_seq,
+            DetectionResult.model_product_seq,
+            danger_level
+        )
+
+        result = await self.db.execute(
+            mysql_insert(DetectionHourlyRollup).from_select(
+                ['user_seq', 'hour_bucket', 'device_seq', 'model_product_seq', 'danger_level',
+                 'detection_count', 'last_detected_at'],
+                aggregate_query
+            )
+        )
+
+        bucket_count = result.rowcount or 0
+
+        # 일자별 집계 재생성 (시간대별 버킷 합산)
+        await self.db.execute(
+            delete(DetectionDailyRollup).where(DetectionDailyRollup.day_bucket == target_date)
+        )
+        daily_query = select(
+            DetectionHourlyRollup.user_seq,
+            func.date(DetectionHourlyRollup.hour_bucket),
+            DetectionHourlyRollup.device_seq,
+            DetectionHourlyRollup.model_product_seq,
+            DetectionHourlyRollup.danger_level,
+            func.sum(DetectionHourlyRollup.detection_count),
+            func.max(DetectionHourlyRollup.last_detected_at)
+        ).where(
+            on_date(DetectionHourlyRollup.hour_bucket, target_date)
+        ).group_by(
+            DetectionHourlyRollup.user_seq,
+            func.date(DetectionHourlyRollup.hour_bucket),
+            DetectionHourlyRollup.device_seq,
+            DetectionHourlyRollup.model_product_seq,
+            DetectionHourlyRollup.danger_level
+        )
+        await self.db.execute(
+            mysql_insert(DetectionDailyRollup).from_select(
+                ['user_seq', 'day_bucket', 'device_seq', 'model_product_seq', 'danger_level',
+                 'detection_count', 'last_detected_at'],
+                daily_query
+            )
+        )
+        self.logger.info(f"시간대별 집계 재생성 완료 [date={target_date}]: {bucket_count}개 버킷")
+        return bucket_count
@@ -0,0 +1,74 @@
+from typing import Dict, Any
+from datetime import date
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, and_, case, distinct
+import logging
+
+from app.core.danger_levels import DANGER_LEVELS
+from app.core.entitlement_index import entitlement_index
+from app.repositories.query_filters import on_date, entitled_detection
+from app.models.detection_result import DetectionResult
+from app.models.device import Device
+
+
+class DetectionStatsEngine:
+    """일자별 탐지 통계 엔진
+    - 총 탐지 건수, 탐지 디바이스 수, 위험도별 건수를 한 번의 스캔으로 계산
+    - 조건부 집계(SUM(CASE ...))로 위험도 버킷을 한 쿼리에서 모두 산출
+    - 전체 등록 디바이스 수는 스칼라 서브쿼리로 같은 왕복에 포함
+    - 구독 조인 대신 탐지 권한 인덱스의 상품 IN 목록으로 필터링
+    - 위험도는 탐지 행에 비정규화된 danger_level 컬럼으로 바로 집계 (매핑 조인 없음)
+    - DashboardRepository / DetectionRepository 공용
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def get_daily_stats(self, user_seq: int, target_date: date) -> Dict[str, Any]:
+        """일자별 탐지 통계 조회 (사용자가 활성화한 모델 상품만)
+        - total_count: 전체 탐지 건수
+        - detected_device_count: 탐지가 발생한 디바이스 수
+        - registered_device_count: 사용자 전체 등록 디바이스 수
+        - level_counts: 위험도별 탐지 건수 (critical/high/medium/low/safe/normal)
+        """
+        entitlement = await entitlement_index.get_user_entitlement(self.db, user_seq)
+
+        level_columns = [
+            func.sum(case((DetectionResult.danger_level == level, DetectionResult.detection_count), else_=0)).label(f'{level}_count')
+            for level in DANGER_LEVELS
+        ]
+
+        registered_device_count = (
+            select(func.count(Device.device_seq))
+            .where(Device.user_seq == user_seq)
+            .scalar_subquery()
+        )
+
+        query = select(
+            func.sum(DetectionResult.detection_count).label('total_count'),
+            func.count(distinct(DetectionResult.device_seq)).label('detected_device_count'),
+            registered_device_count.label('registered_device_count'),
+            *level_columns
+        ).select_from(DetectionResult).join(
+            Device, DetectionResult.device_seq == Device.device_seq
+        ).where(
+            and_(
+                Device.user_seq == user_seq,
+                DetectionResult.user_seq == user_seq,
+                on_date(DetectionResult.detected_at, target_date),
+                entitled_detection(DetectionResult.model_product_seq, DetectionResult.danger_level, entitlement)  # 활성 구독 + 매핑된 라벨만
+            )
+        )
+
+        result = await self.db.execute(query)
+        row = result.fetchone()
+
+        level_counts = {level: int(getattr(row, f'{level}_count') or 0) for level in DANGER_LEVELS}
+
+        return {
+            'total_count': int(row.total_count or 0),
+            'detected_device_count': int(row.detected_device_count or 0),
+            'registered_device_count': int(row.registered_device_count or 0),
+            'level_counts': level_counts
+        }
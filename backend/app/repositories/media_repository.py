@@ -1,12 +1,14 @@
 from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import select, func, and_, or_, desc, asc, text
+from sqlalchemy import select, func, and_, or_, desc, text
 from sqlalchemy import exc
 from sqlalchemy.orm import joinedload
 from sqlalchemy.exc import SQLAlchemyError
 import math
 
 from app.repositories.base_repository import BaseRepository
+from app.core.feed_cursor import encode_sort_cursor, decode_sort_cursor
+from app.repositories.query_filters import date_range_bounds, keyset_condition, keyset_order, FEED_NEWER, FEED_OLDER
 from app.models.detection_result import DetectionResult
 from app.models.device import Device
 from app.models.model_product import ModelProduct, ModelProductLang
@@ -18,6 +20,10 @@ class MediaRepository(BaseRepository):
     - 다국어 지원 (기본: 영어 / 지원: 한국어, 중국어, 일본어, 태국어, 필리핀어)
     - 페이징, 필터링, 통계 기능 제공
     """
+    def __init__(self, db):
+        super().__init__(db)
+        self.session = db  # 기존 메서드들이 self.session 으로 세션 사용
+        
     async def get_detection_media_by_id(self, detection_id: int, lang_tag: str = "en-US") -> Optional[Dict[str, Any]]:
         """탐지 결과 미디어 정보 조회
         - detection_id: 탐지 결과 id
@@ -72,7 +78,11 @@ class MediaRepository(BaseRepository):
             raise Exception(f"미디어 조회 중 오류 발생: {str(e)}")
         
     async def get_media_list_paginated(self, query: MediaListQuery, lang_tag: str = "en-US") -> MediaListResult:
-        """페이징 처리된 미디어 목록 조회"""
+        """페이징 처리된 미디어 목록 조회
+        - page 모드: OFFSET 페이징 (기존 방식, 페이지 번호 이동용)
+        - cursor 모드: (정렬 컬럼, detection_seq) 키셋 페이징 - 깊은 페이지도 인덱스 탐색 비용만 발생
+        - 전체 개수(COUNT)는 page 모드 또는 include_total_count 요청 시에만 계산
+        """
         try:
             base_query = (select(DetectionResult, Device.device_label, ModelProductLang.product_name)
                           .select_from(DetectionResult)
@@ -99,36 +109,58 @@ class MediaRepository(BaseRepository):
             if query.date_from:
                 conditions.append(DetectionResult.detected_at >= query.date_from)
             if query.date_to:
-                end_date = query.date_to.replace(hour=23, minute=59, second=59)
-                conditions.append(DetectionResult.detected_at <= end_date)
+                # 종료일 당일 전체 포함 (반열린 구간: < 종료일 다음날 00시)
+                _, end_date = date_range_bounds(query.date_to.date())
+                conditions.append(DetectionResult.detected_at < end_date)
                 
             if conditions:
                 base_query = base_query.where(and_(*conditions))
                 
-            # 전체 개수 계산
-            count_query = select(func.count()).select_from(base_query.subquery())
-            total_count_result = await self.session.execute(count_query)
-            total_count = total_count_result.scalar() or 0
+            # 전체 개수 계산 (필요할 때만 - 필터 결과 전체를 스캔하므로 비용이 큼)
+            total_count = None
+            if query.should_count_total:
+                count_query = select(func.count()).select_from(base_query.subquery())
+                total_count_result = await self.session.execute(count_query)
+                total_count = total_count_result.scalar() or 0
             
-            # 정렬 적용
+            # 정렬 기준 (NULL 장치명은 빈 문자열로 취급해 커서 비교가 가능하도록 함)
             sort_column = DetectionResult.reg_dt
             if query.sort_by == "device_name":
-                sort_column = Device.device_label
+                sort_column = func.coalesce(Device.device_label, "")
             elif query.sort_by == "created_at":
                 sort_column = DetectionResult.reg_dt
+            
+            # 동일 정렬 값은 detection_seq로 정렬해 페이지 간 순서 고정
+            direction = FEED_NEWER if query.sort_order == "asc" else FEED_OLDER
+            base_query = base_query.order_by(*keyset_order(sort_column, DetectionResult.detection_seq, direction))
+            sort_key = f"{query.sort_by}:{query.sort_order}"
+            
+            if query.pagination_mode == "cursor":
+                # 키셋 페이징 - 커서 위치 이후만 조회, 다음 페이지 존재 확인용으로 1건 더 조회
+                if query.cursor:
+                    position = decode_sort_cursor(query.cursor, sort_key)
+                    base_query = base_query.where(keyset_condition(sort_column, DetectionResult.detection_seq, position, direction))
+                
+                result = await self.session.execute(base_query.limit(query.page_size + 1))
+                rows = result.all()
+                has_next = len(rows) > query.page_size
+                rows = rows[:query.page_size]
+                has_previous = query.cursor is not None
                 
-            if query.sort_order == "asc":
-                base_query = base_query.order_by(asc(sort_column))
+                next_cursor = None
+                if has_next:
+                    last_detection, last_device_label, _ = rows[-1]
+                    last_sort_value = (last_device_label or "") if query.sort_by == "device_name" else last_detection.reg_dt
+                    next_cursor = encode_sort_cursor(sort_key, last_sort_value, last_detection.detection_seq)
             else:
-                base_query = base_query.order_by(desc(sort_column))
+                # 페이징 적용
+                offset = (query.page - 1) * query.page_size
+                paginated_query = base_query.offset(offset).limit(query.page_size)
+                
+                result = await self.session.execute(paginated_query)
+                rows = result.all()
+                next_cursor = None
                 
-            # 페이징 적용
-            offset = (query.page - 1) * query.page_size
-            paginated_query = base_query.offset(offset).limit(query.page_size)
-            
-            result = await self.session.execute(paginated_query)
-            rows = result.all()
-            
             # 결과 변환
             items = []
             for detection_result, device_label, product_name in rows:
@@ -159,9 +191,12 @@ class MediaRepository(BaseRepository):
                 items.append(detection_media)
                 
             # 페이징 메타 데이터 계산
-            total_pages = math.ceil(total_count / query.page_size) if total_count > 0 else 1
-            has_next = query.page < total_pages
-            has_previous = query.page > 1
+            total_pages = None
+            if total_count is not None:
+                total_pages = math.ceil(total_count / query.page_size) if total_count > 0 else 1
+            if query.pagination_mode == "page":
+                has_next = query.page < total_pages if total_pages is not None else len(rows) == query.page_size
+                has_previous = query.page > 1
             
             return {
                 "total_count": total_count,
@@ -170,9 +205,12 @@ class MediaRepository(BaseRepository):
                 "total_pages": total_pages,
                 "has_next": has_next,
                 "has_previous": has_previous,
+                "next_cursor": next_cursor,
                 "items": items
             }
             
+        except ValueError:
+            raise
         except SQLAlchemyError as e:
             await self.session.rollback()
             raise Exception(f"미디어 목록 조회 중 데이터 베이스 오류 발생: {str(e)}")
@@ -0,0 +1,72 @@
+"""레포지토리 공용 쿼리 필터
+- 날짜 조건을 인덱스를 탈 수 있는 반열린 구간(>= 시작, < 끝)으로 변환
+- func.date(컬럼) == 날짜 형태는 컬럼을 함수로 감싸 인덱스를 사용할 수 없으므로 사용 금지
+- 커서 조회용 키셋 조건 / 정렬 ((detected_at 등 정렬 컬럼), detection_seq)
+- 탐지 권한 조건 (매핑·구독 테이블 조인 대신 app/core/entitlement_index.py 사용)
+"""
+from typing import Any, Iterable, List, Optional, Tuple
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.entitlement_index import UserEntitlement
+
+
+def date_range_bounds(start_date: date, end_date: Optional[date] = None) -> Tuple[datetime, datetime]:
+    """날짜(또는 날짜 범위)를 반열린 datetime 구간으로 변환
+    - start_date: 시작일 (포함)
+    - end_date: 종료일 (포함, None이면 start_date 하루)
+    - 반환값: (시작일 00:00:00, 종료일 다음날 00:00:00)
+    """
+    if end_date is None:
+        end_date = start_date
+    range_start = datetime.combine(start_date, time.min)
+    range_end = datetime.combine(end_date, time.min) + timedelta(days=1)
+    return range_start, range_end
+
+
+def on_date(column: ColumnElement, target_date: date) -> ColumnElement:
+    """컬럼 값이 해당 날짜에 속하는 조건 (column >= 당일 00시 AND column < 다음날 00시)"""
+    return between_dates(column, target_date, target_date)
+
+
+def between_dates(column: ColumnElement, start_date: date, end_date: date) -> ColumnElement:
+    """컬럼 값이 날짜 범위(양 끝 포함)에 속하는 조건"""
+    range_start, range_end = date_range_bounds(start_date, end_date)
+    return and_(column >= range_start, column < range_end)
+
+
+# 키셋(커서) 조회 방향
+FEED_NEWER = 'newer'
+FEED_OLDER = 'older'
+
+
+def keyset_condition(sort_column: ColumnElement, seq_column: ColumnElement,
+                     position: Tuple[Any, int], direction: str) -> ColumnElement:
+    """키셋 페이지네이션 조건 - (정렬 값, 번호) 위치보다 큰(newer) 또는 작은(older) 행
+    - (user_seq, detected_at) 인덱스는 InnoDB에서 PK(detection_seq)가 뒤에 붙으므로 그대로 범위 조회 가능
+    - 행 값 비교 (a, b) > (x, y) 대신 OR 형태로 작성 (MySQL 옵티마이저의 range 접근 보장)
+    """
+    position_value, position_seq = position
+    if direction == FEED_NEWER:
+        return or_(sort_column > position_value, and_(sort_column == position_value, seq_column > position_seq))
+    return or_(sort_column < position_value, and_(sort_column == position_value, seq_column < position_seq))
+
+
+def keyset_order(sort_column: ColumnElement, seq_column: ColumnElement, direction: str) -> List[ColumnElement]:
+    """키셋 정렬 - newer는 커서에 가까운 행부터 오름차순, older는 내림차순 (번호로 동률 정렬)"""
+    if direction == FEED_NEWER:
+        return [sort_column.asc(), seq_column.asc()]
+    return [sort_column.desc(), seq_column.desc()]
+
+
+def entitled_detection(model_product_column: ColumnElement, danger_level_column: ColumnElement,
+                       entitlement: UserEntitlement, danger_levels: Optional[Iterable[str]] = None) -> ColumnElement:
+    """탐지 권한 조건 - 활성 구독 상품 + 매핑된(위험도 있는) 탐지만 (danger_levels 지정 시 해당 위험도만)
+    - 기존 ModelDetectionMapping + ModelProductSubscription 내부 조인과 같은 결과
+    - 위험도는 저장 시 비정규화된 tbl_detection_results.danger_level 사용
+      (앱 외 저장 경로도 BEFORE INSERT 트리거가 채움 - migrations/012, NULL 은 매핑이 없는 탐지)
+    """
+    level_condition = danger_level_column.isnot(None) if danger_levels is None else danger_level_column.in_(list(danger_levels))
+    return and_(model_product_column.in_(entitlement.model_product_seqs), level_condition)
+
@@ -0,0 +1,61 @@
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from datetime import datetime
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+import logging
+
+from app.core.entitlement_index import entitlement_index
+from app.repositories.query_filters import keyset_condition, keyset_order, FEED_NEWER, FEED_OLDER, entitled_detection
+from app.models.detection_result import DetectionResult
+
+
+class RecentDetectionQuery:
+    """최근 탐지 목록 2단계 조회
+    - 1단계: 사용자 + 탐지 권한 조건만으로 상위 N개 detection_seq 조회
+      (user_seq, detected_at, model_product_seq, danger_level) 커버링 인덱스를 역순으로 읽고 N건에서 멈춤 (조인/정렬 없음)
+    - 2단계: 각 레포지토리에서 N개 번호 IN 목록으로 디바이스/그룹 등을 한 번에 붙임 (order_rows 로 1단계 순서 복원)
+    - 사용자 전체 탐지 건수와 무관하게 읽는 행 수가 N(+ 권한 없는 행)으로 제한됨
+    - DashboardRepository / DetectionRepository 공용
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def get_recent_detection_seqs(self, user_seq: int, limit: int,
+                                        danger_levels: Optional[Iterable[str]] = None,
+                                        position: Optional[Tuple[datetime, int]] = None,
+                                        direction: str = FEED_OLDER) -> List[int]:
+        """최근 탐지 번호 상위 N개 (항상 최신순)
+        - danger_levels: 지정 시 해당 위험도만
+        - position / direction: 커서 위치 기준 최신(newer) / 과거(older) 행만
+        """
+        entitlement = await entitlement_index.get_user_entitlement(self.db, user_seq)
+
+        query = select(
+            DetectionResult.detection_seq
+        ).where(
+            DetectionResult.user_seq == user_seq,
+            entitled_detection(DetectionResult.model_product_seq, DetectionResult.danger_level, entitlement, danger_levels)
+        ).order_by(
+            *keyset_order(DetectionResult.detected_at, DetectionResult.detection_seq, direction)
+        ).limit(limit)
+        if position is not None:
+            query = query.where(keyset_condition(DetectionResult.detected_at, DetectionResult.detection_seq, position, direction))
+
+        result = await self.db.execute(query)
+        detection_seqs = list(result.scalars().all())
+        if direction == FEED_NEWER:
+            detection_seqs.reverse()
+        return detection_seqs
+
+    @staticmethod
+    def order_rows(rows: Iterable[Any], detection_seqs: Sequence[int], seq_attr: str = 'detection_seq') -> List[Any]:
+        """2단계 조회 결과를 1단계 순서로 정렬
+        - 번호당 첫 행만 사용 (1:N 외부 조인으로 늘어난 행 제거)
+        - 2단계에서 빠진 번호(디바이스 소유자 불일치 등)는 건너뜀
+        """
+        rows_by_seq = {}
+        for row in rows:
+            rows_by_seq.setdefault(getattr(row, seq_attr), row)
+        return [rows_by_seq[detection_seq] for detection_seq in detection_seqs if detection_seq in rows_by_seq]
@@ -8,7 +8,7 @@ from datetime import datetime
 
 from app.repositories.base_repository import BaseRepository
 from app.models.user import User, LoginLog, UserRole
-from app.core.auth import verify_password
+from app.core.password_hasher import password_hasher
 
 class UserRepository(BaseRepository):
     """사용자 관련 데이터 접근 Repository"""
@@ -93,7 +93,7 @@ class UserRepository(BaseRepository):
                 return None
             
             # 비밀번호 검증
-            if verify_password(password, user.password):
+            if await password_hasher.verify(password, user.password):
                 # 계정 상태 확인 -> enabled = 1: 활성화 , enabled = 0: 비활성화
                 if user.enabled == '1':
                     self.logger.info(f"로그인 성공: {username}")
@@ -1,11 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-import requests
+import httpx
 
 from app.core.database import get_db
 from app.core.config import settings
+from app.core.auth import create_access_token
+from app.core.password_hasher import password_hasher, PasswordHasherBusy
+from app.core.web_api_client import web_api_client, WebApiUnavailable
+from app.core.user_change_events import user_change_hooks
 from app.services.auth_service import AuthService
 from app.repositories.user_repository import UserRepository
+from app.dependencies.auth import verify_ops_api_key
 from app.schemas.auth import LoginRequest, LoginResponse, UserInfo, SignUpRequest, SignUpResponse
 
 router = APIRouter(prefix='/auth', tags=["인증"])
@@ -53,6 +58,9 @@ async def login(request: Request, login_data: LoginRequest, auth_service: AuthSe
     - 개발: https://dev.smartoko.com/api
     - 스테이징: https://beta.smartoko.com/api
     - 프로덕션: https://beta.smartoko.com/api
+
+    웹 API 를 쓸 수 없으면(서킷 브레이커 open / 연결 실패 / 타임아웃) 로컬 DB 비밀번호(bcrypt)로 검증합니다.
+    이때 액세스 토큰은 이 서버가 발급한 JWT 입니다.
     """
     try:
         # 웹 API 엔드포인트 생성 (환경별로 자동 설정됨)
@@ -60,30 +68,33 @@ async def login(request: Request, login_data: LoginRequest, auth_service: AuthSe
 
         print(f"[웹 API 로그인] {settings.environment} 환경 - {web_api_url}")
 
-        # 웹 API 로그인 시도
-        headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
-        web_response = requests.post(
-            web_api_url,
-            json={"username": login_data.username, "password": login_data.password},
-            headers=headers,
-            timeout=10
-        )
-
-        web_data = web_response.json()
+        # 웹 API 로그인 시도 (공유 비동기 클라이언트 - 응답 대기 중에도 이벤트 루프를 막지 않음)
+        web_data = None
+        try:
+            web_data = await web_api_client.login(login_data.username, login_data.password)
+        except (WebApiUnavailable, httpx.HTTPError, ValueError) as e:
+            if not settings.web_api_local_login_fallback:
+                raise
+            print(f"웹 API 사용 불가 -> 로컬 비밀번호 검증으로 로그인: {str(e)}")
 
-        # 웹 API 로그인 실패 (비밀번호 틀림)
-        if not web_data.get("success"):
-            print(f"웹 API 로그인 실패: {web_data.get('message')}")
+        if web_data is not None:
+            authenticated = bool(web_data.get("success"))
+            if not authenticated:
+                print(f"웹 API 로그인 실패: {web_data.get('message')}")
+        else:
+            # 로컬 검증 (웹 API 와 같은 bcrypt 해시 형식)
+            local_user = await auth_service.user_repo.find_by_username(login_data.username)
+            authenticated = local_user is not None and await password_hasher.verify(login_data.password, local_user.password)
 
+        # 로그인 실패 (비밀번호 틀림)
+        if not authenticated:
             # DB에서 사용자 조회해서 현재 틀린 횟수 확인
             user = await auth_service.user_repo.find_by_username(login_data.username)
             if user:
                 # 틀린 횟수 증가
                 user.password_wrong_cnt += 1
                 await auth_service.user_repo.db.commit()
+                await user_change_hooks.notify_account_changed(user.user_seq)  # 잠금 여부 변경 가능
 
                 current_count = user.password_wrong_cnt
                 remaining = 5 - current_count
@@ -106,7 +117,7 @@ async def login(request: Request, login_data: LoginRequest, auth_service: AuthSe
                     access_token=None
                 )
         
-        # 웹 API 로그인 성공 -> DB에서 사용자 정보 조회
+        # 로그인 성공 (웹 API / 로컬 검증) -> DB에서 사용자 정보 조회
         print(f"웹 API 로그인 성공! DB에서 사용자 조회 중: {login_data.username}")
         user = await auth_service.user_repo.find_by_username(login_data.username)
         print(f"DB 조회 결과: {user}")
@@ -186,8 +197,20 @@ async def login(request: Request, login_data: LoginRequest, auth_service: AuthSe
         if user.password_wrong_cnt > 0:
             user.password_wrong_cnt = 0
             await auth_service.user_repo.db.commit()
+            await user_change_hooks.notify_account_changed(user.user_seq)
             print(f"✅ 비밀번호 틀림 횟수 리셋: {login_data.username}")
         
+        # 로컬 검증으로 로그인한 경우 -> 이 서버의 JWT 발급
+        if web_data is None:
+            return LoginResponse(
+                success=True,
+                message="로그인 성공",
+                user=user_info,
+                access_token=create_access_token(data={"sub": str(user.user_seq), "username": user.username}),
+                token_type="Bearer",
+                expires_in=settings.jwt_access_token_expire_minutes * 60
+            )
+
         # 웹토큰 + 사용자 정보 반환
         return LoginResponse(
             success=True,
@@ -198,7 +221,17 @@ async def login(request: Request, login_data: LoginRequest, auth_service: AuthSe
             expires_in=web_data["data"].get("expires_in")
         )
         
-    except requests.exceptions.RequestException as e:
+    except PasswordHasherBusy as e:
+        # 로컬 비밀번호 검증 대기열 초과 (로그인 폭주)
+        print(f"비밀번호 검증 대기열 초과: {str(e)}")
+        return LoginResponse(
+            success=False,
+            message="SERVER_BUSY",
+            user=None,
+            access_token=None
+        )
+
+    except (WebApiUnavailable, httpx.HTTPError, ValueError) as e:
         # 웹 api 연결 실패
         print(f"웹 api 연결 실패: {str(e)}")
         return LoginResponse(
@@ -217,4 +250,15 @@ async def login(request: Request, login_data: LoginRequest, auth_service: AuthSe
             user=None,
             access_token=None
         )
-    
\ No newline at end of file
+
+
+@router.get("/web-api/stats", dependencies=[Depends(verify_ops_api_key)])
+async def get_web_api_stats():
+    """웹 API 로그인 연동 통계 (요청 / 실패 카운터, 서킷 브레이커 상태, 운영 api 키 필요)"""
+    return web_api_client.stats()
+
+
+@router.get("/password-hasher/stats", dependencies=[Depends(verify_ops_api_key)])
+async def get_password_hasher_stats():
+    """비밀번호 해싱 스레드 풀 통계 (대기 / 완료 / 거절 카운터, 운영 api 키 필요)"""
+    return password_hasher.stats()
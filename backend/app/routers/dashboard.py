@@ -1,14 +1,25 @@
-from typing import List, Optional
-from datetime import datetime, date
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Any, Dict, List, Optional
+from datetime import datetime, date, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
-from app.core.database import get_db
-from app.dependencies.auth import get_current_user
-from app.models.user import User
+from app.core.config import settings
+from app.core.database import get_db, async_session
+from app.core.dashboard_cache import dashboard_cache
+from app.core.dashboard_history_cache import dashboard_history_cache
+from app.core.entitlement_index import entitlement_index
+from app.core.usage_meter import usage_meter
+from app.services.detection_coalescer import detection_coalescer
+from app.core.conditional_get import build_etag, not_modified_response
+from app.core.dashboard_events import dashboard_event_broker
+from app.core.feed_cursor import decode_feed_cursor
+from app.dependencies.auth import get_current_user, verify_ops_api_key
+from app.core.principal_cache import Principal, principal_cache
 
 from app.services.dashboard_service import DashboardService
+from app.services.dashboard_stream_service import stream_dashboard_events, dashboard_delta_publisher
 from app.repositories.dashboard_repository import DashboardRepository
 from app.repositories.detection_repository import DetectionRepository
 
@@ -16,10 +27,14 @@ from app.schemas.dashboard import (
     DashboardCompleteData,
     DashboardOverview,
     DeviceModelSubscription,
+    ActiveModelSubscription,
     RecentRiskDetection,
     RecentAlert,
     HourlyChartData,
-    DashboardResponse
+    DashboardResponse,
+    RecentDetectionFeed,
+    RecentAlertFeed,
+    DetectionTrend
 )
 
 # 라우터 인스턴스 생성
@@ -31,6 +46,54 @@ class DashboardHealthResponse(BaseModel):
     status: str # healthy or error
     message: str    # 상태 설명 메시지
     
+async def _sync_data_watermark(db: AsyncSession, user_seq: int, target_date: Optional[date] = None,
+                               day_only: bool = False) -> Dict[str, Any]:
+    """DB 데이터 워터마크 조회 + 이 워커의 결과 캐시 / 탐지 권한 인덱스 동기화
+    - 캐시를 거치는 모든 조회 api 에서 ETag 사용 여부와 무관하게 실행
+      (웹 서버 등 다른 프로세스의 구독 / 디바이스 변경은 워터마크로만 감지)
+    - 워터마크는 DB 값만 사용 - 최신 탐지 번호 + 사용자 데이터 버전(구독 / 디바이스 변경, 탐지 병합 / 위험도 재계산, 트리거가 증가)
+    - day_only: 날짜별 섹션만 응답하는 api - 지난 날짜는 해당 일자 집계 요약 + 구독/디바이스 버전을 워터마크로 사용
+    """
+    dashboard_repo = DashboardRepository(db)
+    watermark_scope = target_date if day_only and target_date is not None and target_date < date.today() else None
+    if watermark_scope is not None:
+        watermark = await dashboard_repo.get_user_day_watermark(user_seq, watermark_scope)
+    else:
+        watermark = await dashboard_repo.get_user_data_watermark(user_seq)
+    # 이 워커가 모르는 변경이면 결과 캐시 무효화 (새 ETag 로 이전 결과가 나가지 않도록)
+    dashboard_cache.sync_watermark(user_seq, watermark_scope, watermark)
+    entitlement_index.sync_subscription_version(user_seq, watermark['subscription_version'])
+    return watermark
+
+async def _check_not_modified(request: Request, response: Response, db: AsyncSession, user_seq: int,
+                              target_date: Optional[date] = None, day_only: bool = False) -> Optional[Response]:
+    """조건부 GET 처리 - 데이터 워터마크로 ETag 생성, 변경 없으면 304 응답 반환
+    - 워터마크 동기화는 ETag 비활성 시에도 실행 (_sync_data_watermark)
+    - 프로세스별 캐시 세대 / 로컬 캐시 버전은 ETag 에서 제외 -> 워커 / 인스턴스가 달라도 같은 ETag
+    - 날짜 미지정 요청은 오늘 날짜를 포함해 자정이 지나면 ETag가 바뀌도록 함
+    - day_only: 지난 날짜 ETag 는 오늘 탐지가 저장돼도 유지
+    """
+    watermark = await _sync_data_watermark(db, user_seq, target_date, day_only)
+    if not settings.dashboard_etag_enabled:
+        return None
+
+    etag = build_etag(
+        request.url.path,
+        sorted(request.query_params.multi_items()),
+        (target_date or date.today()).isoformat(),
+        watermark
+    )
+    return not_modified_response(request, response, etag)
+
+def _parse_feed_cursor(cursor: Optional[str]):
+    """피드 커서 파싱 (형식 오류 시 400)"""
+    if not cursor:
+        return None
+    try:
+        return decode_feed_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="올바른 커서 형식이 아닙니다.")
+
 # 헬스 체크 api
 @router.get("/health", response_model=DashboardHealthResponse)
 async def dashboard_health(db: AsyncSession = Depends(get_db)):
@@ -46,12 +109,53 @@ async def dashboard_health(db: AsyncSession = Depends(get_db)):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"대시보드 서비스 상태 확인 실패: {str(e)}")
     
+# 캐시 통계 api
+@router.get("/cache/stats", dependencies=[Depends(verify_ops_api_key)])
+async def get_dashboard_cache_stats():
+    """대시보드 결과 캐시 통계 (히트/미스/제거 카운터) - 캐시 크기 산정용 (운영 api 키 필요)
+    - history: 지난 날짜 디스크 캐시 통계
+    - usage_meter: 구독 사용량 계측기 통계
+    - coalescer: 반복 탐지 병합기 통계
+    - principals: 인증 사용자(principal) 캐시 통계
+    - stream_deltas: 스트리밍 증분 이벤트 발행기 통계 (이 워커)
+    """
+    return {**dashboard_cache.stats(), 'history': dashboard_history_cache.stats(), 'usage_meter': usage_meter.stats(),
+            'coalescer': detection_coalescer.stats(), 'principals': principal_cache.stats(),
+            'stream_deltas': dashboard_delta_publisher.stats()}
+    
+# 실시간 스트리밍 api
+@router.get("/stream")
+async def stream_dashboard(request: Request, current_user: Principal = Depends(get_current_user)):
+    """대시보드 실시간 증분 스트림 (Server-Sent Events)
+    - detections: 새 탐지 행
+    - detections_merged: 이미 받은 탐지 행에 병합된 반복 탐지 (detection_seq, added_count, last_detected_at)
+    - overview: 갱신된 오늘 개요 통계
+    - hourly: 변경된 시간대 버킷
+    - resync: 이벤트가 밀려 폐기됨 -> /complete 로 전체 재조회 필요
+    """
+    subscription = dashboard_event_broker.subscribe(current_user.user_seq)
+    if subscription is None:
+        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="동시 스트리밍 연결 수를 초과했습니다.")
+    
+    return StreamingResponse(
+        stream_dashboard_events(request, subscription, settings.dashboard_stream_heartbeat_seconds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+    
+@router.get("/stream/stats", dependencies=[Depends(verify_ops_api_key)])
+async def get_dashboard_stream_stats():
+    """대시보드 스트리밍 통계 (연결 수 / 발행 / 폐기 이벤트 수, 운영 api 키 필요)"""
+    return dashboard_event_broker.stats()
+    
 # 메인 대시보드 api
 @router.get("/complete", response_model=DashboardCompleteData)
 async def get_complete_dashboard_data(
+    request: Request,
+    response: Response,
     target_date: Optional[str] = Query(None, description="조회 날짜 (YYYY-MM-DD)"),
     user_language: str = Query("en-US", description="사용자 언어 (ko, en, zh, ja, th, ph)"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """메인 대시보드 데이터 조회
@@ -70,10 +174,15 @@ async def get_complete_dashboard_data(
             except ValueError:
                 raise HTTPException(status_code=400, detail="올바른 날짜 형식이 아닙니다. (YYYY-MM-DD)")
             
-        # 서비스 인스턴스 생성
+        # 변경 없으면 집계 없이 304 응답
+        not_modified = await _check_not_modified(request, response, db, current_user.user_seq, parsed_date)
+        if not_modified is not None:
+            return not_modified
+            
+        # 서비스 인스턴스 생성 (섹션 병렬 조회용 세션 팩토리 전달)
         dashboard_repo = DashboardRepository(db)
         detection_repo = DetectionRepository(db)
-        dashboard_service = DashboardService(dashboard_repo, detection_repo)
+        dashboard_service = DashboardService(dashboard_repo, detection_repo, session_factory=async_session)
         
         # 통합 대시보드 데이터 조회
         complete_data = await dashboard_service.get_comprehensive_dashboard_data(
@@ -81,6 +190,12 @@ async def get_complete_dashboard_data(
             user_language=user_language,
             target_date=parsed_date
         )
+        
+        # 일부 섹션 실패 결과는 재검증 대상에서 제외 (다음 요청에서 다시 조회)
+        if complete_data.failed_sections:
+            if 'etag' in response.headers:
+                del response.headers['etag']
+            response.headers['Cache-Control'] = 'no-store'
         return complete_data
     
     except HTTPException:
@@ -91,8 +206,10 @@ async def get_complete_dashboard_data(
 # 개별 컴포넌트 api들
 @router.get("/overview", response_model=DashboardOverview)
 async def get_dashboard_overview(
+    request: Request,
+    response: Response,
     target_date: Optional[str] = Query(None, description="조회 날짜 (YYYY-MM-DD)"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """대시보드 개요 통계만 조회"""
@@ -105,6 +222,11 @@ async def get_dashboard_overview(
             except ValueError:
                 raise HTTPException(status_code=400, detail="올바른 날짜 형식이 아닙니다. (YYYY-MM-DD)")
             
+        # 변경 없으면 집계 없이 304 응답
+        not_modified = await _check_not_modified(request, response, db, current_user.user_seq, parsed_date, day_only=True)
+        if not_modified is not None:
+            return not_modified
+            
         # 서비스 생성
         dashboard_repo = DashboardRepository(db)
         detection_repo = DetectionRepository(db)
@@ -124,15 +246,19 @@ async def get_dashboard_overview(
     
 @router.get("/device-subscriptions", response_model=List[DeviceModelSubscription])
 async def get_device_model_subscriptions(
-    current_user: User = Depends(get_current_user),
+    user_language: str = Query("en-US", description="사용자 언어 (ko, en, zh, ja, th, ph)"),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """등록된 디바이스별 활성화된 모델 상품명 조회"""
     try:
+        # 다른 프로세스의 구독 / 디바이스 변경 반영
+        await _sync_data_watermark(db, current_user.user_seq)
         dashboard_repo = DashboardRepository(db)
         
         device_subscriptions_data = await dashboard_repo.get_device_model_subscriptions(
-            user_seq=current_user.user_seq
+            user_seq=current_user.user_seq,
+            language=user_language
         )
         
         # 스키마 객체로 변환
@@ -151,46 +277,67 @@ async def get_device_model_subscriptions(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"디바이스 구독 조회 실패: {str(e)}")
     
+@router.get("/subscriptions", response_model=List[ActiveModelSubscription])
+async def get_active_model_subscriptions(
+    user_language: str = Query("en-US", description="사용자 언어 (ko, en, zh, ja, th, ph)"),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """활성 모델 상품 구독 목록 + 오늘 사용량 / 일일 한도"""
+    try:
+        # 다른 프로세스의 구독 / 디바이스 변경 반영
+        await _sync_data_watermark(db, current_user.user_seq)
+        dashboard_repo = DashboardRepository(db)
+        
+        subscriptions_data = await dashboard_repo.get_user_active_model_subscriptions(
+            user_seq=current_user.user_seq,
+            language=user_language
+        )
+        return [ActiveModelSubscription(**subscription_data) for subscription_data in subscriptions_data]
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"구독 목록 조회 실패: {str(e)}")
+    
 @router.get("/recent-detections", response_model=List[RecentRiskDetection])
 async def get_recent_risk_detections(
+    request: Request,
+    response: Response,
     limit: int = Query(10, ge=1, le=50, description="조회 건수 (1~50)"),
-    current_user: User = Depends(get_current_user),
+    user_language: str = Query("en-US", description="사용자 언어 (ko, en, zh, ja, th, ph)"),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """최근 위험 탐지 목록 조회"""
     try:
-        detection_repo = DetectionRepository(db)
+        # 변경 없으면 조회 없이 304 응답
+        not_modified = await _check_not_modified(request, response, db, current_user.user_seq)
+        if not_modified is not None:
+            return not_modified
         
-        # 최근 위험 탐지 조회
-        detections_data = await detection_repo.get_recent_detections_with_full_info(user_seq=current_user.user_seq, limit=limit)
+        dashboard_service = DashboardService(DashboardRepository(db), DetectionRepository(db))
         
-        # 스키마 변환
-        result = []
-        for detection in detections_data:
-            result.append(RecentRiskDetection(
-                detection_seq=detection['detection_seq'],
-                device_label=detection['device_label'],
-                detection_class=detection['detection_class'],
-                detection_label=detection['detection_label'],
-                danger_level=detection['danger_level'],
-                detection_confidence=detection['detection_confidence'],
-                thumbnail_image_path=detection['thumbnail_image_path'],
-                detection_time=detection['detection_time'],
-                ai_detection_guide=detection.get('ai_detection_guide'),
-                location_info=detection.get('location_info'),
-                bounding_box_info=detection.get('bounding_box_info')       
-            ))
+        # 최근 위험 탐지 조회 (스키마 변환은 통합 대시보드 섹션과 같은 서비스 변환 사용)
+        result = await dashboard_service.get_recent_risk_detections(current_user.user_seq, limit=limit, user_language=user_language)
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"최근 탐지 조회 실패: {str(e)}")
     
 @router.get("/recent-alerts", response_model=List[RecentAlert])
-async def get_recent_alerts(limit: int = Query(5, ge=1, le=20, description="조회할 알림 수 (1~20개)"),
-                            current_user: User = Depends(get_current_user),
+async def get_recent_alerts(request: Request,
+                            response: Response,
+                            limit: int = Query(5, ge=1, le=20, description="조회할 알림 수 (1~20개)"),
+                            current_user: Principal = Depends(get_current_user),
                             db: AsyncSession = Depends(get_db)):
     """최근 알림 목록 조회"""
     try:
+        # 변경 없으면 조회 없이 304 응답 (알림은 탐지 결과 기반이므로 탐지 워터마크로 판단)
+        not_modified = await _check_not_modified(request, response, db, current_user.user_seq)
+        if not_modified is not None:
+            return not_modified
+        
         dashboard_repo = DashboardRepository(db)
         # 최근 알림 조회
         alerts_data = await dashboard_repo.get_recent_alert_notifications(
@@ -212,13 +359,71 @@ async def get_recent_alerts(limit: int = Query(5, ge=1, le=20, description="조
         
         return result
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"최근 알림 조회 실패: {str(e)}")
     
+@router.get("/recent-detections/feed", response_model=RecentDetectionFeed)
+async def get_recent_detection_feed(
+    cursor: Optional[str] = Query(None, description="이전 응답의 newest_cursor / oldest_cursor"),
+    direction: str = Query("older", pattern="^(newer|older)$", description="newer: 새 탐지, older: 이전 탐지"),
+    limit: int = Query(10, ge=1, le=50, description="조회 건수 (1~50)"),
+    user_language: str = Query("en-US", description="사용자 언어 (ko, en, zh, ja, th, ph)"),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """최근 위험 탐지 커서 피드 - 새로고침 시 newest_cursor + newer 로 변경분만 조회"""
+    try:
+        position = _parse_feed_cursor(cursor)
+        await _sync_data_watermark(db, current_user.user_seq)
+        
+        dashboard_service = DashboardService(DashboardRepository(db), DetectionRepository(db))
+        return await dashboard_service.get_recent_detection_feed(
+            user_seq=current_user.user_seq,
+            user_language=user_language,
+            limit=limit,
+            position=position,
+            direction=direction
+        )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"최근 탐지 피드 조회 실패: {str(e)}")
+    
+@router.get("/recent-alerts/feed", response_model=RecentAlertFeed)
+async def get_recent_alert_feed(
+    cursor: Optional[str] = Query(None, description="이전 응답의 newest_cursor / oldest_cursor"),
+    direction: str = Query("older", pattern="^(newer|older)$", description="newer: 새 알림, older: 이전 알림"),
+    limit: int = Query(5, ge=1, le=20, description="조회할 알림 수 (1~20개)"),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """최근 알림 커서 피드"""
+    try:
+        position = _parse_feed_cursor(cursor)
+        await _sync_data_watermark(db, current_user.user_seq)
+        
+        dashboard_service = DashboardService(DashboardRepository(db), DetectionRepository(db))
+        return await dashboard_service.get_recent_alert_feed(
+            user_seq=current_user.user_seq,
+            limit=limit,
+            position=position,
+            direction=direction
+        )
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"최근 알림 피드 조회 실패: {str(e)}")
+    
 @router.get("/hourly-chart", response_model=List[HourlyChartData])
 async def get_hourly_detection_chart(
+    request: Request,
+    response: Response,
     target_date: Optional[str] = Query(None, description="조회 날짜 (YYYY-MM-DD)"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """시간대별 탐지 차트 데이터 조회 (24시간)"""
@@ -231,6 +436,11 @@ async def get_hourly_detection_chart(
             except ValueError:
                 raise HTTPException(status_code=400, detail="올바른 날짜 형식이 아닙니다. (YYYY-MM-DD)")
             
+        # 변경 없으면 집계 없이 304 응답
+        not_modified = await _check_not_modified(request, response, db, current_user.user_seq, parsed_date, day_only=True)
+        if not_modified is not None:
+            return not_modified
+            
         # 서비스 생성
         dashboard_repo = DashboardRepository(db)
         detection_repo = DetectionRepository(db)
@@ -246,21 +456,70 @@ async def get_hourly_detection_chart(
         raise HTTPException(status_code=500, detail=f"차트 데이터 조회 실패: {str(e)}")
     
     
+@router.get("/trend", response_model=DetectionTrend)
+async def get_detection_trend(
+    request: Request,
+    response: Response,
+    start_date: Optional[str] = Query(None, description="시작일 (YYYY-MM-DD, 기본: 종료일 6일 전)"),
+    end_date: Optional[str] = Query(None, description="종료일 (YYYY-MM-DD, 기본: 오늘)"),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """기간 탐지 추이 조회 (주간 / 월간)
+    - dates[] 와 같은 순서의 일자별 건수 배열: 전체 / 위험도별 / 디바이스별
+    - 최대 조회 일수: dashboard_trend_max_days
+    """
+    try:
+        # 날짜 파싱
+        try:
+            parsed_end_date = datetime.strptime(end_date, "%Y-%m-%d").date() if end_date else date.today()
+            parsed_start_date = (datetime.strptime(start_date, "%Y-%m-%d").date() if start_date
+                                 else parsed_end_date - timedelta(days=6))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="올바른 날짜 형식이 아닙니다. (YYYY-MM-DD)")
+
+        if parsed_start_date > parsed_end_date:
+            raise HTTPException(status_code=400, detail="시작일이 종료일보다 늦을 수 없습니다.")
+        if (parsed_end_date - parsed_start_date).days + 1 > settings.dashboard_trend_max_days:
+            raise HTTPException(status_code=400, detail=f"조회 기간은 최대 {settings.dashboard_trend_max_days}일입니다.")
+
+        # 변경 없으면 집계 없이 304 응답
+        not_modified = await _check_not_modified(request, response, db, current_user.user_seq, parsed_end_date)
+        if not_modified is not None:
+            return not_modified
+
+        # 서비스 생성
+        dashboard_repo = DashboardRepository(db)
+        detection_repo = DetectionRepository(db)
+        dashboard_service = DashboardService(dashboard_repo, detection_repo)
+
+        # 추이 데이터 조회
+        return await dashboard_service.get_detection_trend(current_user.user_seq, parsed_start_date, parsed_end_date)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"탐지 추이 데이터 조회 실패: {str(e)}")
+    
+    
 # 레커시 api
 @router.get("/legacy-overview", response_model=DashboardResponse)
 async def get_dashboard_overview_legacy(
     user_ui_language: str = Query("en-US", description="사용자 언어 (ko, en, zh, ja, th, ph)"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """레거시 대시보드 api
     - 프론트엔드와 호환성을 위해
     """
     try:
-        # 서비스 생성
+        # 다른 프로세스의 구독 / 디바이스 변경 반영
+        await _sync_data_watermark(db, current_user.user_seq)
+        
+        # 서비스 생성 (섹션 병렬 조회용 세션 팩토리 전달)
         dashboard_repo = DashboardRepository(db)
         detection_repo = DetectionRepository(db)
-        dashboard_service = DashboardService(dashboard_repo, detection_repo)
+        dashboard_service = DashboardService(dashboard_repo, detection_repo, session_factory=async_session)
         
         # 대시보드 데이터 조회
         complete_data = await dashboard_service.get_comprehensive_dashboard_data(
@@ -0,0 +1,76 @@
+import json
+from typing import Any, Dict, List, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.dependencies.auth import verify_ingest_api_key
+from app.services.detection_ingest_service import DetectionIngestService
+from app.schemas.detection_ingest import DetectionIngestResponse
+
+# 라우터 인스턴스 생성
+router = APIRouter(prefix="/detections", tags=["detections"])
+
+# 줄 단위 JSON(NDJSON) 요청 Content-Type
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines")
+
+@router.post("/bulk", response_model=DetectionIngestResponse, dependencies=[Depends(verify_ingest_api_key)])
+async def ingest_detections(request: Request, db: AsyncSession = Depends(get_db)):
+    """AI 서버 탐지 결과 일괄 저장
+    - 본문: JSON 배열 (Content-Type: application/json) 또는 줄 단위 JSON (Content-Type: application/x-ndjson)
+    - 요청 1건 = 트랜잭션 1건, 형식 오류 / 거부 항목은 건너뛰고 나머지 저장 (항목별 결과 반환)
+    - 요청당 최대 detection_ingest_max_batch 건
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type in NDJSON_CONTENT_TYPES:
+        payloads, parse_errors = await _read_ndjson(request)
+    else:
+        payloads, parse_errors = await _read_json_array(request), {}
+
+    ingest_service = DetectionIngestService(db)
+    return await ingest_service.ingest(payloads, parse_errors)
+
+async def _read_json_array(request: Request) -> List[Any]:
+    """JSON 배열 본문 읽기"""
+    try:
+        payloads = json.loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="요청 본문이 올바른 JSON이 아닙니다.")
+
+    if not isinstance(payloads, list):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="요청 본문은 탐지 항목 JSON 배열이어야 합니다.")
+    _check_batch_size(len(payloads))
+    return payloads
+
+async def _read_ndjson(request: Request) -> Tuple[List[Any], Dict[int, str]]:
+    """줄 단위 JSON 본문을 스트림으로 읽기 (빈 줄 무시, 잘못된 줄은 항목 오류로 기록)"""
+    payloads: List[Any] = []
+    parse_errors: Dict[int, str] = {}
+    buffer = b""
+
+    def add_line(line: bytes) -> None:
+        if not line.strip():
+            return
+        try:
+            payloads.append(json.loads(line))
+        except ValueError as e:
+            parse_errors[len(payloads)] = f"JSON 파싱 오류: {str(e)}"
+            payloads.append(None)
+        _check_batch_size(len(payloads))
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            add_line(line)
+    add_line(buffer)
+
+    return payloads, parse_errors
+
+def _check_batch_size(count: int) -> None:
+    if count > settings.detection_ingest_max_batch:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"요청당 최대 {settings.detection_ingest_max_batch}건까지 저장할 수 있습니다."
+        )
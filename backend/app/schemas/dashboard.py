@@ -1,6 +1,6 @@
 """대시보드 api 응답 데이터 형식 정의"""
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import date, datetime
 from pydantic import BaseModel, Field
 
 # 메인 대시보드 응답 모델들
@@ -31,6 +31,17 @@ class DeviceModelSubscription(BaseModel):
     today_detection_count: int = Field(..., description="오늘 탐지 건수")
     last_detection_time: Optional[datetime] = Field(None, description="마지막 탐지 시간")
 
+class ActiveModelSubscription(BaseModel):
+    """활성 모델 상품 구독 + 오늘 사용량"""
+    subscription_seq: int = Field(..., description="구독 고유 번호")
+    model_product_seq: int = Field(..., description="모델 상품 고유 번호")
+    model_product_name: str = Field(..., description="모델 상품명")
+    subscription_status: str = Field(..., description="구독 상태 (A:활성)")
+    subscribed_date: Optional[datetime] = Field(None, description="구독 시작 시간")
+    expires_date: Optional[datetime] = Field(None, description="구독 만료 시간")
+    detection_count_today: int = Field(..., description="오늘 사용량 (탐지 건수)")
+    usage_limit: Optional[int] = Field(None, description="일일 사용량 한도 (없으면 무제한)")
+
 class DeviceStatus(BaseModel):
     """디바이스 상태 요약 (레거시)"""
     device_seq: int = Field(..., description="디바이스 고유 번호")
@@ -74,6 +85,7 @@ class DashboardCompleteData(BaseModel):
     recent_alerts: List[RecentAlert] = Field(..., description="최근 알림 목록")
     last_updated: datetime = Field(..., description="데이터 마지막 업데이트 시간")
     user_language: str = Field(..., description="사용자 UI 언어")
+    failed_sections: List[str] = Field(default_factory=list, description="조회에 실패해 기본값으로 채워진 섹션 목록")
 
 # 레거시 응답
 class DashboardResponse(BaseModel):
@@ -82,4 +94,36 @@ class DashboardResponse(BaseModel):
     overview: DashboardOverview = Field(..., description="전체 개요 통계")
     hourly_chart: List[HourlyChartData] = Field(..., description="시간대별 차트 데이터")
     device_status: List[DeviceStatus] = Field(..., description="디바이스 상태 요약")
-    recent_risks: List[RecentRiskDetection] = Field(..., description="최근 긴급 상황")
\ No newline at end of file
+    recent_risks: List[RecentRiskDetection] = Field(..., description="최근 긴급 상황")
+
+class RecentDetectionFeed(BaseModel):
+    """최근 탐지 커서 피드 응답 모델"""
+    items: List[RecentRiskDetection] = Field(..., description="탐지 목록 (최신순)")
+    newest_cursor: Optional[str] = Field(None, description="이후 새 탐지 조회용 커서 (direction=newer)")
+    oldest_cursor: Optional[str] = Field(None, description="이전 탐지 조회용 커서 (direction=older, 무한 스크롤)")
+    has_more: bool = Field(..., description="요청 방향으로 추가 데이터 존재 여부")
+
+class RecentAlertFeed(BaseModel):
+    """최근 알림 커서 피드 응답 모델"""
+    items: List[RecentAlert] = Field(..., description="알림 목록 (최신순)")
+    newest_cursor: Optional[str] = Field(None, description="이후 새 알림 조회용 커서 (direction=newer)")
+    oldest_cursor: Optional[str] = Field(None, description="이전 알림 조회용 커서 (direction=older, 무한 스크롤)")
+    has_more: bool = Field(..., description="요청 방향으로 추가 데이터 존재 여부")
+
+# 기간 추이 (주간 / 월간)
+class DeviceTrendSeries(BaseModel):
+    """디바이스별 일자 탐지 건수 시리즈"""
+    device_seq: int = Field(..., description="디바이스 고유 번호")
+    device_label: str = Field(..., description="디바이스 이름")
+    counts: List[int] = Field(..., description="일자별 탐지 건수 (dates 순서)")
+
+class DetectionTrend(BaseModel):
+    """기간 탐지 추이 - 열(column) 단위 배열 응답
+    - 모든 시리즈는 dates 와 같은 길이/순서 (탐지가 없는 날은 0)
+    """
+    start_date: date = Field(..., description="시작일")
+    end_date: date = Field(..., description="종료일")
+    dates: List[date] = Field(..., description="일자 목록")
+    total_counts: List[int] = Field(..., description="일자별 전체 탐지 건수")
+    danger_level_counts: Dict[str, List[int]] = Field(..., description="위험도별 일자 탐지 건수 (critical/high/medium/low/safe/normal)")
+    device_series: List[DeviceTrendSeries] = Field(..., description="디바이스별 일자 탐지 건수 (기간 합계 내림차순)")
@@ -0,0 +1,56 @@
+"""탐지 결과 일괄 저장 api 요청/응답 데이터 형식 정의"""
+from typing import List, Optional, Literal, Union, Dict, Any
+from datetime import datetime
+from pydantic import BaseModel, Field, field_validator
+
+# 항목 처리 결과
+INGEST_STORED = "stored"
+INGEST_COALESCED = "coalesced"
+INGEST_INVALID = "invalid"
+INGEST_REJECTED = "rejected"
+
+class DetectionIngestItem(BaseModel):
+    """AI 서버가 전송하는 탐지 1건
+    - user_seq 는 받지 않고 디바이스 소유자로 결정
+    - danger_level / severity 는 저장 시 매핑으로 채움
+    """
+    device_seq: int = Field(..., gt=0, description="디바이스 고유 번호")
+    model_product_seq: int = Field(..., gt=0, description="모델 상품 고유 번호")
+    detection_class: str = Field(..., min_length=1, max_length=50, description="탐지 대분류 (safety, security, transportation)")
+    detection_label: str = Field(..., min_length=1, max_length=32, description="탐지 세부 라벨 (fire, helmet, weapon 등)")
+    confidence: float = Field(..., ge=0, le=100, description="신뢰도 (0-100)")
+    bbox_x: int = Field(..., description="바운딩 박스 X 좌표")
+    bbox_y: int = Field(..., description="바운딩 박스 Y 좌표")
+    bbox_width: int = Field(..., ge=0, description="바운딩 박스 너비")
+    bbox_height: int = Field(..., ge=0, description="바운딩 박스 높이")
+    detected_at: datetime = Field(..., description="탐지 시각")
+    detection_count: int = Field(1, ge=1, description="탐지 건수")
+    media_type: Literal['image', 'video'] = Field('image', description="미디어 타입")
+    image_url: Optional[str] = Field(None, max_length=255, description="이미지 URL")
+    video_url: Optional[str] = Field(None, max_length=255, description="비디오 URL")
+    video_duration: int = Field(10, ge=0, description="비디오 길이(초)")
+    thumbnail_url: Optional[str] = Field(None, max_length=255, description="썸네일 URL")
+    detection_details: Optional[Union[str, Dict[str, Any], List[Any]]] = Field(None, description="탐지 상세 (문자열 또는 JSON)")
+
+    @field_validator('detected_at')
+    @classmethod
+    def normalize_detected_at(cls, v: datetime) -> datetime:
+        """서버 로컬 시각(시간대 없음, 초 단위)으로 맞춤 - DATETIME 컬럼에 저장되는 값과 동일하게"""
+        if v.tzinfo is not None:
+            v = v.astimezone().replace(tzinfo=None)
+        return v.replace(microsecond=0)
+
+class DetectionIngestItemResult(BaseModel):
+    """탐지 1건 처리 결과"""
+    index: int = Field(..., description="요청 내 순번 (0부터)")
+    status: Literal['stored', 'coalesced', 'invalid', 'rejected'] = Field(..., description="stored: 저장 / coalesced: 반복 탐지로 기존 행에 병합 / invalid: 형식 오류 / rejected: 저장 거부")
+    error: Optional[str] = Field(None, description="오류 사유")
+
+class DetectionIngestResponse(BaseModel):
+    """탐지 결과 일괄 저장 결과"""
+    received: int = Field(..., description="받은 항목 수")
+    stored: int = Field(..., description="새 행으로 저장된 항목 수")
+    coalesced: int = Field(..., description="반복 탐지로 기존 행에 병합된 항목 수 (병합 구간이 끝나면 반영)")
+    invalid: int = Field(..., description="형식 오류 항목 수")
+    rejected: int = Field(..., description="저장 거부 항목 수 (디바이스 없음, 미구독, 사용량 한도 초과)")
+    results: List[DetectionIngestItemResult] = Field(..., description="항목별 처리 결과 (요청 순서)")
@@ -90,6 +90,11 @@ class MediaListQuery(BaseModel):
     page: int = Field(1, ge=1, description="페이지 번호")
     page_size: int = Field(20, ge=1, le=100, description="페이지 크기")
     
+    # 키셋(커서) 페이징 - 깊은 페이지에서도 OFFSET 없이 일정한 비용
+    pagination_mode: str = Field("page", description="페이징 방식 (page: 페이지 번호, cursor: 키셋 커서)", pattern="^(page|cursor)$")
+    cursor: Optional[str] = Field(None, description="이전 응답의 next_cursor (cursor 모드, 없으면 첫 페이지)")
+    include_total_count: Optional[bool] = Field(None, description="전체 개수 계산 여부 (기본: page 모드만 계산)")
+    
     # 사용자 필터링 옵션
     device_name: Optional[str] = Field(None, description="장치별 필터")
     media_type: Optional[MediaType] = Field(None, description="미디어 타입별 필터")
@@ -108,6 +113,13 @@ class MediaListQuery(BaseModel):
             raise ValueError("페이지 크기는 1~100 사이여야 합니다.")
         return v
     
+    @property
+    def should_count_total(self) -> bool:
+        """전체 개수 계산 여부 (미지정 시 page 모드만 계산)"""
+        if self.include_total_count is None:
+            return self.pagination_mode == "page"
+        return self.include_total_count
+    
     @model_validator(mode='after')
     def validate_date_range(self):
         """날짜 범위 논리 검증"""
@@ -118,12 +130,13 @@ class MediaListQuery(BaseModel):
 class MediaListResult(BaseModel):
     """미디어 목록 조회 결과"""
     #페이징 메타 데이터
-    total_count: int = Field(..., ge=0, description="전체 항목 수")
+    total_count: Optional[int] = Field(None, ge=0, description="전체 항목 수 (cursor 모드는 요청 시에만 계산)")
     page: int = Field(..., ge=1, description="현재 페이지")
     page_size: int = Field(..., ge=1, description="페이지 크기")
-    total_pages: int = Field(..., ge=1, description="전체 페이지 수")
+    total_pages: Optional[int] = Field(None, ge=1, description="전체 페이지 수 (전체 항목 수가 있을 때만)")
     has_next: bool = Field(..., description="다음 페이지 존재")
     has_previous: bool = Field(..., description="이전 페이지 존재")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (cursor 모드)")
     
     # 실제 데이터
     items: List[DetectionMedia] = Field(default_factory=list, description="탐지 미디어 목록")
@@ -134,7 +147,10 @@ class MediaListResult(BaseModel):
         """전체 페이지 수 자동 계산"""
         import math
         if hasattr(info, 'data'):
-            total_count = info.data.get('total_count', 0)
+            total_count = info.data.get('total_count')
+            if total_count is None:
+                return None
+            total_count = total_count or 0
             page_size = info.data.get('page_size', 1)
             return max(1, math.ceil(total_count / page_size))
         return v
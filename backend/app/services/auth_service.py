@@ -5,7 +5,8 @@ import re
 
 from app.repositories.user_repository import UserRepository
 from app.models.user import User
-from app.core.auth import create_access_token, generate_session_id, hash_password
+from app.core.auth import create_access_token, generate_session_id
+from app.core.password_hasher import password_hasher, PasswordHasherBusy
 
 class AuthService:
     """인증 서비스"""
@@ -30,8 +31,11 @@ class AuthService:
         if not re.match(email_regex, username):
             raise HTTPException(status_code=400, detail="아이디는 이메일 형식이어야 합니다.")
         
-        # 비밀번호 해싱(bcrypt)
-        hashed_password = hash_password(password)
+        # 비밀번호 해싱(bcrypt, 전용 스레드 풀 - 대기열이 가득 차면 바로 거절)
+        try:
+            hashed_password = await password_hasher.hash(password)
+        except PasswordHasherBusy as e:
+            raise HTTPException(status_code=503, detail=str(e))
         
         # 사용자 생성(enabled='1' - 즉시 활성화)
         new_user = await self.user_repo.create_user(
@@ -1,12 +1,21 @@
+import asyncio
 import logging
 from math import exp
 from pstats import Stats
-from typing import List, Dict, Any, Optional
-from datetime import date, datetime
+from typing import List, Dict, Any, Optional, Callable, Awaitable, Tuple
+from datetime import date, datetime, timedelta
 from fastapi import HTTPException, status
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.orm import sessionmaker
 
+from app.core.config import settings
+from app.core.danger_levels import DANGER_LEVELS
+from app.core.dashboard_cache import dashboard_cache
+from app.core.dashboard_history_cache import dashboard_history_cache
+from app.core.feed_cursor import encode_feed_cursor
 from app.repositories.dashboard_repository import DashboardRepository
 from app.repositories.detection_repository import DetectionRepository
+from app.repositories.query_filters import FEED_NEWER, FEED_OLDER
 from app.schemas.dashboard import (
     DashboardOverview,
     HourlyChartData,
@@ -14,9 +23,20 @@ from app.schemas.dashboard import (
     DeviceModelSubscription,
     RecentRiskDetection,
     RecentAlert,
-    DashboardCompleteData
+    DashboardCompleteData,
+    RecentDetectionFeed,
+    RecentAlertFeed,
+    DetectionTrend,
+    DeviceTrendSeries
 )
 
+# 지난 날짜 디스크 캐시 대상 섹션 (target_date 에만 의존하는 섹션) -> 역직렬화 타입
+HISTORY_SECTION_TYPES: Dict[str, TypeAdapter] = {
+    'overview': TypeAdapter(DashboardOverview),
+    'hourly_chart': TypeAdapter(List[HourlyChartData]),
+    'device_distribution': TypeAdapter(List[Dict[str, Any]])
+}
+
 class DashboardService:
     """대시보드 비즈니스 로직 서비스
     - 사용자별 대시보드 통계 데이터
@@ -25,9 +45,15 @@ class DashboardService:
     - 다국어 지원 및 권한 기반 데이터 필터링
     """
     
-    def __init__(self, dashboard_repo: DashboardRepository, detection_repo: DetectionRepository):
+    def __init__(self, dashboard_repo: DashboardRepository, detection_repo: DetectionRepository,
+                 session_factory: Optional[sessionmaker] = None):
+        """
+        - session_factory: 섹션 병렬 조회용 세션 팩토리 (async_session)
+          None이면 하나의 세션으로 순차 조회
+        """
         self.dashboard_repo = dashboard_repo
         self.detection_repo = detection_repo
+        self.session_factory = session_factory
         self.logger = logging.getLogger(__name__)
         
     async def get_comprehensive_dashboard_data(self, user_seq: int, user_language: str = 'en-US', target_date: Optional[date] = None) -> DashboardCompleteData:
@@ -38,14 +64,33 @@ class DashboardService:
                 
             self.logger.info(f"대시보드 전체 데이터 조회 시작 [user_seq={user_seq}, date={target_date}]")
             
+            # 캐시 조회 (사용자 + 날짜 + 언어 + 섹션)
+            cache_key = dashboard_cache.make_key(user_seq, target_date, user_language, 'complete')
+            cache_hit, cached_data = dashboard_cache.get(cache_key)
+            if cache_hit:
+                self.logger.info(f"대시보드 전체 데이터 캐시 히트 [user_seq={user_seq}, date={target_date}]")
+                return cached_data
+            
+            # 섹션 병렬 조회 (섹션별 개별 세션)
+            if self.session_factory is not None and settings.dashboard_parallel_sections_enabled:
+                complete_dashboard_data = await self._get_comprehensive_dashboard_data_parallel(user_seq, user_language, target_date)
+                # 일부 섹션이 실패한 결과는 캐시하지 않음
+                if not complete_dashboard_data.failed_sections:
+                    dashboard_cache.set(cache_key, complete_dashboard_data)
+                return complete_dashboard_data
+            
             # 대시보드 개요 통계 조회
-            dashboard_overview_data = await self._get_dashboard_overview(user_seq, target_date)
+            dashboard_overview_data = await self._get_day_section(
+                user_seq, target_date, 'overview', lambda: self._get_dashboard_overview(user_seq, target_date)
+            )
             
             # 시간대별 차트 데이터 조회
-            hourly_chart_data = await self._get_hourly_chart(user_seq, target_date)
+            hourly_chart_data = await self._get_day_section(
+                user_seq, target_date, 'hourly_chart', lambda: self._get_hourly_chart(user_seq, target_date)
+            )
 
             # 등록된 디바이스별 활성화된 모델 상품명 조회
-            device_model_subscriptions = await self._get_device_model_subscriptions(user_seq)
+            device_model_subscriptions = await self._get_device_model_subscriptions(user_seq, user_language)
 
             # 최근 위험 탐지 목록 조회
             recent_risk_detections = await self._get_recent_risk_detections(user_seq, user_language)
@@ -64,6 +109,8 @@ class DashboardService:
                 user_language=user_language
             )
             
+            dashboard_cache.set(cache_key, complete_dashboard_data)
+            
             self.logger.info(f"대시보드 데이터 조회 완료 [user_seq={user_seq}]: 탐지 {dashboard_overview_data.today_total_detections}건")
             return complete_dashboard_data
         
@@ -73,10 +120,79 @@ class DashboardService:
             self.logger.error(f"대시보드 데이터 조회 오류 [user_seq={user_seq}]: {str(e)}", exc_info=True)
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="대시보드 데이터를 불러오는 중 오류가 발생했습니다.")
         
+    async def _get_comprehensive_dashboard_data_parallel(self, user_seq: int, user_language: str, target_date: date) -> DashboardCompleteData:
+        """대시보드 전체 데이터 병렬 조회
+        - 독립적인 섹션을 asyncio.gather로 동시에 조회 (섹션마다 별도 세션)
+        - 요청 1건이 점유하는 커넥션 수는 dashboard_max_section_connections로 제한
+        - 일부 섹션 실패 시 해당 섹션만 기본값으로 채우고 failed_sections에 기록
+        """
+        connection_limiter = asyncio.Semaphore(max(1, settings.dashboard_max_section_connections))
+
+        sections: Dict[str, Callable[['DashboardService'], Awaitable[Any]]] = {
+            'overview': lambda service: service._get_day_section(
+                user_seq, target_date, 'overview', lambda: service._get_dashboard_overview(user_seq, target_date)
+            ),
+            'hourly_chart': lambda service: service._get_day_section(
+                user_seq, target_date, 'hourly_chart', lambda: service._get_hourly_chart(user_seq, target_date)
+            ),
+            'device_model_subscriptions': lambda service: service._get_device_model_subscriptions(user_seq, user_language),
+            'recent_detections': lambda service: service._get_recent_risk_detections(user_seq, user_language),
+            'recent_alerts': lambda service: service._get_recent_alerts(user_seq),
+        }
+
+        section_results = await asyncio.gather(
+            *(self._run_section_in_own_session(name, loader, connection_limiter) for name, loader in sections.items()),
+            return_exceptions=True
+        )
+
+        section_data: Dict[str, Any] = {}
+        failed_sections: List[str] = []
+        for section_name, section_result in zip(sections.keys(), section_results):
+            if isinstance(section_result, BaseException):
+                self.logger.error(f"대시보드 섹션 조회 실패 [user_seq={user_seq}, section={section_name}]: {str(section_result)}")
+                failed_sections.append(section_name)
+                section_data[section_name] = None
+            else:
+                section_data[section_name] = section_result
+
+        # 모든 섹션 실패 시 전체 오류로 처리
+        if len(failed_sections) == len(sections):
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="대시보드 데이터를 불러오는 중 오류가 발생했습니다.")
+
+        dashboard_overview_data = section_data['overview'] or self._get_empty_dashboard_overview()
+
+        complete_dashboard_data = DashboardCompleteData(
+            overview=dashboard_overview_data,
+            hourly_chart=section_data['hourly_chart'] or [],
+            device_model_subscriptions=section_data['device_model_subscriptions'] or [],
+            recent_detections=section_data['recent_detections'] or [],
+            recent_alerts=section_data['recent_alerts'] or [],
+            last_updated=datetime.now(),
+            user_language=user_language,
+            failed_sections=failed_sections
+        )
+
+        self.logger.info(f"대시보드 데이터 병렬 조회 완료 [user_seq={user_seq}]: 탐지 {dashboard_overview_data.today_total_detections}건, 실패 섹션 {failed_sections}")
+        return complete_dashboard_data
+
+    async def _run_section_in_own_session(self, section_name: str, loader: Callable[['DashboardService'], Awaitable[Any]],
+                                          connection_limiter: asyncio.Semaphore) -> Any:
+        """섹션 하나를 풀에서 꺼낸 별도 세션으로 조회
+        - AsyncSession은 동시 사용이 불가하므로 섹션마다 세션을 새로 생성
+        """
+        async with connection_limiter:
+            async with self.session_factory() as session:
+                section_service = DashboardService(DashboardRepository(session), DetectionRepository(session))
+                return await loader(section_service)
+
     async def get_dashboard_overview(self, user_seq: int, target_date: Optional[date] = None) -> DashboardOverview:
         """대시보드 개요 통계 조회"""
         try:
-            dashboard_overview = await self._get_dashboard_overview(user_seq, target_date or date.today())
+            target_date = target_date or date.today()
+            dashboard_overview = await self._get_cached_section(
+                user_seq, target_date, None, 'overview',
+                lambda: self._get_dashboard_overview(user_seq, target_date)
+            )
             self.logger.info(f"대시보드 개요 조회 완료 [user_seq={user_seq}]")
             return dashboard_overview
         
@@ -87,7 +203,11 @@ class DashboardService:
     async def get_hourly_detection_chart(self, user_seq: int, target_date: Optional[date] = None) -> List[HourlyChartData]:
         """시간대별 탐지 차트 데이터 조회"""
         try:
-            hourly_char_data = await self._get_hourly_chart(user_seq, target_date or date.today())
+            target_date = target_date or date.today()
+            hourly_char_data = await self._get_cached_section(
+                user_seq, target_date, None, 'hourly_chart',
+                lambda: self._get_hourly_chart(user_seq, target_date)
+            )
             self.logger.info(f"디바이스별 분포 차트 데이터 조회 완료 [user_seq={user_seq}]")
             return hourly_char_data
         
@@ -98,7 +218,11 @@ class DashboardService:
     async def get_device_distribution_chart(self, user_seq: int, target_date: Optional[date] = None) -> List[Dict[str, Any]]:
         """디바이스별 탐지 분포 차트 데이터 조회"""
         try:
-            distribution_data = await self.detection_repo.get_device_distribution_chart(user_seq, target_date or date.today())
+            target_date = target_date or date.today()
+            distribution_data = await self._get_cached_section(
+                user_seq, target_date, None, 'device_distribution',
+                lambda: self.detection_repo.get_device_distribution_chart(user_seq, target_date)
+            )
             self.logger.info(f"디바이스별 분포 차트 데이터 조회 완료 [user_seq={user_seq}]")
             return distribution_data
         
@@ -106,7 +230,150 @@ class DashboardService:
             self.logger.error(f"디바이스별 분포 차트 데이터 조회 오류 [user_seq={user_seq}]: {str(e)}")
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="디바이스 분포 차트 데이터를 불러올 수 없습니다.")
         
+    async def get_detection_trend(self, user_seq: int, start_date: date, end_date: date) -> DetectionTrend:
+        """기간 탐지 추이 조회 (주간 / 월간) - 일자별 집계 기반 열 단위 배열
+        - 기간 길이 제한은 라우터에서 검증 (dashboard_trend_max_days)
+        """
+        try:
+            detection_trend = await self._get_cached_section(
+                user_seq, end_date, None, f'trend:{start_date.isoformat()}',
+                lambda: self._get_detection_trend(user_seq, start_date, end_date)
+            )
+            self.logger.info(f"기간 탐지 추이 조회 완료 [user_seq={user_seq}, {start_date} ~ {end_date}]")
+            return detection_trend
+
+        except Exception as e:
+            self.logger.error(f"기간 탐지 추이 조회 오류 [user_seq={user_seq}, {start_date} ~ {end_date}]: {str(e)}")
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="탐지 추이 데이터를 불러올 수 없습니다.")
+
+    async def get_recent_detection_feed(self, user_seq: int, user_language: str = 'en-US', limit: int = 10,
+                                        position: Optional[Tuple[datetime, int]] = None,
+                                        direction: str = FEED_OLDER) -> RecentDetectionFeed:
+        """최근 위험 탐지 커서 피드
+        - position 없음: 최신 limit건 (첫 화면)
+        - direction=newer: 커서 이후 새로 들어온 탐지만 (새로고침)
+        - direction=older: 커서 이전 탐지 (무한 스크롤)
+        """
+        try:
+            # 커서가 없으면 항상 최신 목록부터
+            if position is None:
+                direction = FEED_OLDER
+            
+            # 추가 데이터 존재 여부 판단을 위해 1건 더 조회
+            detections = await self.detection_repo.get_recent_detections_with_full_info(
+                user_seq, user_language, limit=limit + 1, position=position, direction=direction
+            )
+            has_more = len(detections) > limit
+            detections = self._trim_feed_page(detections, limit, direction)
+
+            newest_cursor, oldest_cursor = self._get_feed_cursors(
+                [(detection['detected_at'], detection['detection_seq']) for detection in detections], position, direction
+            )
+            return RecentDetectionFeed(
+                items=[self._to_recent_risk_detection(detection) for detection in detections],
+                newest_cursor=newest_cursor,
+                oldest_cursor=oldest_cursor,
+                has_more=has_more
+            )
+
+        except Exception as e:
+            self.logger.error(f"최근 탐지 피드 조회 오류 [user_seq={user_seq}]: {str(e)}")
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="최근 탐지 목록을 불러올 수 없습니다.")
+
+    async def get_recent_alert_feed(self, user_seq: int, limit: int = 5,
+                                    position: Optional[Tuple[datetime, int]] = None,
+                                    direction: str = FEED_OLDER) -> RecentAlertFeed:
+        """최근 알림 커서 피드 (알림은 탐지 결과 기반이므로 탐지 커서를 그대로 사용)"""
+        try:
+            if position is None:
+                direction = FEED_OLDER
+            
+            alerts = await self.dashboard_repo.get_recent_alert_notifications(
+                user_seq, limit=limit + 1, position=position, direction=direction
+            )
+            has_more = len(alerts) > limit
+            alerts = self._trim_feed_page(alerts, limit, direction)
+
+            newest_cursor, oldest_cursor = self._get_feed_cursors(
+                [(datetime.fromisoformat(alert['alert_time']), alert['alert_seq']) for alert in alerts], position, direction
+            )
+            return RecentAlertFeed(
+                items=[self._to_recent_alert(alert) for alert in alerts],
+                newest_cursor=newest_cursor,
+                oldest_cursor=oldest_cursor,
+                has_more=has_more
+            )
+
+        except Exception as e:
+            self.logger.error(f"최근 알림 피드 조회 오류 [user_seq={user_seq}]: {str(e)}")
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="최근 알림 목록을 불러올 수 없습니다.")
+
     # 헬퍼 메서드
+    def _trim_feed_page(self, rows: List[Dict[str, Any]], limit: int, direction: str) -> List[Dict[str, Any]]:
+        """limit + 1건 조회 결과를 limit건으로 자르기 (최신순 목록 기준 커서에서 먼 쪽 제거)
+        - newer: 커서에 가까운 과거 쪽부터 채우므로 가장 최신 행을 제거 (다음 newer 요청에서 이어서 조회)
+        - older: 가장 과거 행 제거
+        """
+        if len(rows) <= limit:
+            return rows
+        return rows[1:] if direction == FEED_NEWER else rows[:limit]
+
+    def _get_feed_cursors(self, positions: List[Tuple[datetime, int]], position: Optional[Tuple[datetime, int]],
+                          direction: str) -> Tuple[Optional[str], Optional[str]]:
+        """피드 응답 커서 생성 (positions는 최신순)
+        - 결과가 없으면 요청 커서를 그대로 돌려줘 클라이언트가 같은 위치에서 계속 조회
+        """
+        if positions:
+            return encode_feed_cursor(*positions[0]), encode_feed_cursor(*positions[-1])
+
+        request_cursor = encode_feed_cursor(*position) if position else None
+        if direction == FEED_NEWER:
+            return request_cursor, None
+        return None, request_cursor
+
+    async def _get_cached_section(self, user_seq: int, target_date: date, language: Optional[str], section: str,
+                                  loader: Callable[[], Awaitable[Any]]) -> Any:
+        """섹션 단위 캐시 조회 - 미스 시 loader 실행 후 저장
+        - 메모리 캐시 -> (날짜별 섹션이면) 지난 날짜 디스크 캐시 -> loader 순서
+        """
+        cache_key = dashboard_cache.make_key(user_seq, target_date, language, section)
+        cache_hit, cached_data = dashboard_cache.get(cache_key)
+        if cache_hit:
+            return cached_data
+
+        if section in HISTORY_SECTION_TYPES:
+            section_data = await self._get_day_section(user_seq, target_date, section, loader)
+        else:
+            section_data = await loader()
+        dashboard_cache.set(cache_key, section_data)
+        return section_data
+
+    async def _get_day_section(self, user_seq: int, target_date: date, section: str,
+                               loader: Callable[[], Awaitable[Any]]) -> Any:
+        """날짜별 섹션 조회 - 지난 날짜는 디스크 캐시 우선, 미스 시 loader 실행 후 저장
+        - 오늘 이후 날짜 / 캐시 비활성 시 loader 바로 실행
+        - 항목은 DB 일자 워터마크가 저장 시점과 같을 때만 사용 (구독/디바이스 버전 + 일자 집계 요약)
+        - 저장은 조회 시작 전 버전 / 워터마크 기준 (조회 도중 바뀌면 저장 안 함 / 다음 조회에서 미스)
+        """
+        if not dashboard_history_cache.is_cacheable(target_date):
+            return await loader()
+
+        section_type = HISTORY_SECTION_TYPES[section]
+        watermark = await self.dashboard_repo.get_user_day_watermark(user_seq, target_date)
+        cache_hit, cached_data = await dashboard_history_cache.get(user_seq, target_date, section, watermark)
+        if cache_hit:
+            try:
+                return section_type.validate_python(cached_data)
+            except ValidationError as e:
+                self.logger.warning(f"지난 날짜 캐시 항목 형식 불일치 - 다시 조회 [user_seq={user_seq}, date={target_date}, section={section}]: {str(e)}")
+
+        version = await dashboard_history_cache.get_version(user_seq, target_date)
+        section_data = await loader()
+        await dashboard_history_cache.put(
+            user_seq, target_date, section, section_type.dump_python(section_data, mode='json'), version, watermark
+        )
+        return section_data
+
     async def _get_dashboard_overview(self, user_seq: int, target_date: date) -> DashboardOverview:
         """대시보드 개요 조회"""
         try:
@@ -154,10 +421,45 @@ class DashboardService:
             self.logger.error(f"시간대별 차트 데이터 조회 실패 [user_seq={user_seq}]: {str(e)}")
             raise
 
-    async def _get_device_model_subscriptions(self, user_seq: int) -> List[DeviceModelSubscription]:
-        """등록된 디바이스별 활성화된 모델 상품명 조회"""
+    async def _get_detection_trend(self, user_seq: int, start_date: date, end_date: date) -> DetectionTrend:
+        """일자별 집계 행 -> 열 단위 시리즈 변환 (탐지가 없는 날은 0)"""
+        trend_rows = await self.dashboard_repo.get_daily_trend_data(user_seq, start_date, end_date)
+
+        dates = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+        date_index = {day: index for index, day in enumerate(dates)}
+
+        total_counts = [0] * len(dates)
+        danger_level_counts = {level: [0] * len(dates) for level in DANGER_LEVELS}
+        device_series: Dict[int, DeviceTrendSeries] = {}
+
+        for row in trend_rows:
+            index = date_index[row['day']]
+            total_counts[index] += row['detection_count']
+            if row['danger_level'] in danger_level_counts:
+                danger_level_counts[row['danger_level']][index] += row['detection_count']
+
+            series = device_series.get(row['device_seq'])
+            if series is None:
+                series = device_series[row['device_seq']] = DeviceTrendSeries(
+                    device_seq=row['device_seq'],
+                    device_label=row['device_label'] or f"디바이스 {row['device_seq']}",
+                    counts=[0] * len(dates)
+                )
+            series.counts[index] += row['detection_count']
+
+        return DetectionTrend(
+            start_date=start_date,
+            end_date=end_date,
+            dates=dates,
+            total_counts=total_counts,
+            danger_level_counts=danger_level_counts,
+            device_series=sorted(device_series.values(), key=lambda series: (-sum(series.counts), series.device_seq))
+        )
+
+    async def _get_device_model_subscriptions(self, user_seq: int, user_language: str = 'en-US') -> List[DeviceModelSubscription]:
+        """등록된 디바이스별 활성화된 모델 상품명 조회 (상품명은 사용자 언어)"""
         try:
-            device_model_data = await self.dashboard_repo.get_device_model_subscriptions(user_seq)
+            device_model_data = await self.dashboard_repo.get_device_model_subscriptions(user_seq, user_language)
 
             device_subscriptions = []
             for device_data in device_model_data:
@@ -181,51 +483,71 @@ class DashboardService:
         try:
             alert_data = await self.dashboard_repo.get_recent_alert_notifications(user_seq, limit=5)
 
-            recent_alerts = []
-            for alert in alert_data:
-                recent_alerts.append(RecentAlert(
-                    alert_seq=alert['alert_seq'],
-                    device_label=alert['device_label'],
-                    alert_type=alert['alert_type'],
-                    alert_message=alert['alert_message'],
-                    alert_time=alert['alert_time'],
-                    is_read=alert['is_read'],
-                    related_detection_seq=alert['related_detection_seq']
-                ))
-
-            return recent_alerts
+            return [self._to_recent_alert(alert) for alert in alert_data]
 
         except Exception as e:
             self.logger.error(f"최근 알림 조회 실패 [user_seq={user_seq}]: {str(e)}")
             raise
 
     async def _get_recent_risk_detections(self, user_seq: int, user_language: str = 'en-US') -> List[RecentRiskDetection]:
-        """최근 위험 탐지 목록 조회"""
+        """최근 위험 탐지 목록 조회 (통합 대시보드 섹션)"""
+        return await self.get_recent_risk_detections(user_seq, limit=10, user_language=user_language)
+
+    async def get_recent_risk_detections(self, user_seq: int, limit: int = 10, user_language: str = 'en-US') -> List[RecentRiskDetection]:
+        """최근 위험 탐지 목록 조회 (상품명 / AI 안내는 사용자 언어 카탈로그)"""
         try:
-            risk_detections_data = await self.detection_repo.get_recent_detections_with_full_info(user_seq, limit=10)
-
-            recent_detections = []
-            for detection in risk_detections_data:
-                recent_detections.append(RecentRiskDetection(
-                    detection_seq=detection['detection_seq'],
-                    device_label=detection['device_label'],
-                    detection_class=detection['detection_class'],
-                    detection_label=detection['detection_label'],
-                    danger_level=detection['danger_level'],
-                    detection_confidence=detection['detection_confidence'],
-                    thumbnail_image_path=detection['thumbnail_image_path'],
-                    detection_time=detection['detection_time'],
-                    ai_detection_guide=detection.get('ai_detection_guide'),
-                    location_info=detection.get('location_info'),
-                    bounding_box_info=detection.get('bounding_box_info')
-                ))
+            risk_detections_data = await self.detection_repo.get_recent_detections_with_full_info(
+                user_seq, language=user_language, limit=limit
+            )
 
-            return recent_detections
+            return [self._to_recent_risk_detection(detection) for detection in risk_detections_data]
 
         except Exception as e:
             self.logger.error(f"최근 위험 탐지 조회 실패 [user_seq={user_seq}]: {str(e)}")
             raise
 
+    def _to_recent_risk_detection(self, detection: Dict[str, Any]) -> RecentRiskDetection:
+        """레포지토리 탐지 행 -> 최근 위험 탐지 스키마 변환"""
+        return RecentRiskDetection(
+            detection_seq=detection['detection_seq'],
+            device_label=detection['device_label'],
+            detection_class=detection['detection_class'],
+            detection_label=detection['detection_label'],
+            danger_level=detection['danger_level'],
+            detection_confidence=detection['confidence'],
+            thumbnail_image_path=detection['thumbnail_url'],
+            detection_time=detection['detected_at'],
+            ai_detection_guide=detection.get('ai_detection_guide'),
+            location_info=detection.get('location_info'),
+            bounding_box_info=detection.get('bounding_box_info')
+        )
+
+    def _to_recent_alert(self, alert: Dict[str, Any]) -> RecentAlert:
+        """레포지토리 알림 행 -> 최근 알림 스키마 변환"""
+        return RecentAlert(
+            alert_seq=alert['alert_seq'],
+            device_label=alert['device_label'],
+            alert_type=alert['alert_type'],
+            alert_message=alert['alert_message'],
+            alert_time=alert['alert_time'],
+            is_read=alert['is_read'],
+            related_detection_seq=alert['related_detection_seq']
+        )
+
+    def _get_empty_dashboard_overview(self) -> DashboardOverview:
+        """개요 섹션 조회 실패 시 사용할 빈 개요 데이터"""
+        return DashboardOverview(
+            today_total_detections=0,
+            devices_detected_today=0,
+            total_registered_devices=0,
+            risk_level_critical_count=0,
+            risk_level_high_count=0,
+            risk_level_medium_count=0,
+            security_safe_count=0,
+            general_detection_count=0,
+            last_updated=datetime.now()
+        )
+
     def _classify_risk_levels_for_frontend(self, summary_stats: Dict[str, Any]) -> Dict[str, int]:
         """위험 수준 분류 (프론트엔드용)"""
         return {
@@ -0,0 +1,216 @@
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Set
+
+from fastapi import Request
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.dashboard_events import dashboard_event_broker, DashboardEventSubscription
+from app.core.entitlement_index import entitlement_index
+from app.repositories.dashboard_repository import DashboardRepository
+from app.repositories.detection_repository import DetectionRepository
+from app.services.dashboard_service import DashboardService
+
+logger = logging.getLogger(__name__)
+
+
+class DashboardDeltaPublisher:
+    """대시보드 증분 이벤트 발행기 (사용자별 디바운스 백그라운드 작업)
+    - 탐지 커밋 훅에서는 새 탐지 행 / 병합 이벤트만 바로 발행 -> 저장 요청이 집계 조회를 기다리지 않음
+      (REST 피드와 같은 탐지 권한 조건 적용 - 권한 인덱스 캐시 미스일 때만 구독 조회)
+    - 반복 탐지 병합 누적분은 이미 발행된 첫 행의 갱신(detections_merged)으로 발행 (같은 행을 다시 보내지 않음)
+    - 개요 통계 / 시간대 차트는 사용자별로 debounce_seconds 동안 모은 뒤 백그라운드 작업에서 1회만 계산
+      (탐지가 몰려도 사용자당 debounce_seconds 마다 최대 1회, 동시 계산 수는 max_concurrency 로 제한)
+    - dashboard_event_broker 는 워커(프로세스)별 -> 이 워커에 연결된 구독자에게만, 이 워커가 저장한 탐지만 발행
+      (다른 워커 / AI 서버가 저장한 탐지는 발행되지 않음, 클라이언트는 resync / REST 재조회로 보정)
+    """
+
+    def __init__(self, debounce_seconds: float, max_concurrency: int):
+        self.debounce_seconds = max(0.0, debounce_seconds)
+        self._limiter = asyncio.Semaphore(max(1, max_concurrency))
+        self._pending_hours: Dict[int, Set[int]] = {}
+        self._tasks: Dict[int, asyncio.Task] = {}
+
+        # 통계 카운터
+        self.scheduled = 0
+        self.debounced = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    async def publish(self, detections: List[Dict[str, Any]]) -> None:
+        """탐지 커밋 훅 - 새 탐지 행 / 병합 발행 + 오늘 탐지가 있는 사용자의 개요 / 시간대 차트 갱신 예약
+        - detections: 새 탐지 행 또는 병합 누적분 (커밋 완료된 것)
+        - 구독자가 없는 사용자는 건너뜀 (추가 조회 없음)
+        - 구독하지 않은 상품 / 매핑 없는(위험도 NULL) 탐지는 발행하지 않음
+        """
+        detections_by_user: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        for detection in detections:
+            if dashboard_event_broker.has_subscribers(detection['user_seq']):
+                detections_by_user[detection['user_seq']].append(detection)
+        if not detections_by_user:
+            return
+
+        today = date.today()
+        # 세션은 권한 인덱스 캐시 미스일 때만 커넥션을 사용
+        async with async_session() as session:
+            for user_seq, user_detections in detections_by_user.items():
+                entitlement = await entitlement_index.get_user_entitlement(session, user_seq)
+                user_detections = [
+                    detection for detection in user_detections
+                    if entitlement.allows(detection['model_product_seq'], detection.get('danger_level'))
+                ]
+                if not user_detections:
+                    continue
+
+                # 1) 새 탐지 행 (첫 행이 없어 새로 저장된 병합 누적분 포함)
+                new_rows = [
+                    detection for detection in user_detections
+                    if not detection.get('coalesced') or detection.get('detection_seq') is None
+                ]
+                if new_rows:
+                    dashboard_event_broker.publish(user_seq, 'detections', [
+                        _serialize_detection(detection) for detection in new_rows
+                    ])
+
+                # 2) 이미 발행된 첫 행에 더해진 병합 누적분
+                merges = [
+                    detection for detection in user_detections
+                    if detection.get('coalesced') and detection.get('detection_seq') is not None
+                ]
+                if merges:
+                    dashboard_event_broker.publish(user_seq, 'detections_merged', [
+                        _serialize_merge(merge) for merge in merges
+                    ])
+
+                # 오늘 탐지만 개요/시간대 차트에 반영 (지난 날짜 지연 저장은 탐지 행만 전달)
+                changed_hours = {
+                    detection['detected_at'].hour for detection in user_detections
+                    if detection['detected_at'].date() == today
+                }
+                if changed_hours:
+                    self._schedule(user_seq, changed_hours)
+
+    async def stop(self) -> None:
+        """예약된 갱신 취소 (서버 종료 시)"""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._pending_hours.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """발행기 통계"""
+        return {
+            'pending_users': len(self._tasks),
+            'scheduled': self.scheduled,
+            'debounced': self.debounced,
+            'refreshes': self.refreshes,
+            'refresh_failures': self.refresh_failures
+        }
+
+    def _schedule(self, user_seq: int, changed_hours: Set[int]) -> None:
+        """사용자 갱신 예약 - 이미 대기 중이면 변경 시간대만 합침"""
+        self._pending_hours.setdefault(user_seq, set()).update(changed_hours)
+        if user_seq in self._tasks:
+            self.debounced += 1
+            return
+        self._tasks[user_seq] = asyncio.create_task(self._refresh_after_delay(user_seq))
+        self.scheduled += 1
+
+    async def _refresh_after_delay(self, user_seq: int) -> None:
+        """debounce_seconds 대기 후 개요 통계 / 변경된 시간대 버킷 발행
+        - 계산을 시작하면 예약을 비움 (계산 중 도착한 탐지는 다음 예약으로 반영)
+        """
+        try:
+            await asyncio.sleep(self.debounce_seconds)
+        finally:
+            changed_hours = self._pending_hours.pop(user_seq, set())
+            self._tasks.pop(user_seq, None)
+
+        if not dashboard_event_broker.has_subscribers(user_seq):
+            return
+
+        try:
+            async with self._limiter:
+                today = date.today()
+                async with async_session() as session:
+                    dashboard_service = DashboardService(DashboardRepository(session), DetectionRepository(session))
+
+                    # 3) 개요 통계
+                    overview = await dashboard_service.get_dashboard_overview(user_seq, today)
+                    dashboard_event_broker.publish(user_seq, 'overview', overview.model_dump(mode='json'))
+
+                    # 4) 변경된 시간대 버킷
+                    hourly_chart = await dashboard_service.get_hourly_detection_chart(user_seq, today)
+                    dashboard_event_broker.publish(user_seq, 'hourly', [
+                        bucket.model_dump(mode='json') for bucket in hourly_chart if bucket.hour in changed_hours
+                    ])
+            self.refreshes += 1
+
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.error(f"대시보드 증분 이벤트 발행 실패 [user_seq={user_seq}]: {str(e)}")
+
+
+# 전역 대시보드 증분 이벤트 발행기
+dashboard_delta_publisher = DashboardDeltaPublisher(
+    debounce_seconds=settings.dashboard_stream_debounce_seconds,
+    max_concurrency=settings.dashboard_stream_refresh_concurrency
+)
+
+
+async def publish_dashboard_deltas(detections: List[Dict[str, Any]]) -> None:
+    """탐지 커밋 훅 - 스트리밍 구독자에게 대시보드 증분 이벤트 발행 (집계 계산은 백그라운드, DashboardDeltaPublisher 참고)"""
+    await dashboard_delta_publisher.publish(detections)
+
+
+async def stream_dashboard_events(request: Request, subscription: DashboardEventSubscription,
+                                  heartbeat_seconds: float) -> AsyncIterator[str]:
+    """Server-Sent Events 스트림 생성
+    - 연결 직후 ready 이벤트 전송
+    - 이벤트가 없으면 heartbeat_seconds 마다 주석 라인 전송 (프록시 유휴 연결 종료 방지 + 끊김 감지)
+    - 연결 종료 시 구독 해제
+    """
+    try:
+        yield _format_sse('ready', {'user_seq': subscription.user_seq})
+
+        while True:
+            if await request.is_disconnected():
+                break
+
+            event = await subscription.next_event(timeout=heartbeat_seconds)
+            if event is None:
+                yield ": heartbeat\n\n"
+                continue
+
+            yield _format_sse(event['event'], event['data'])
+
+    finally:
+        dashboard_event_broker.unsubscribe(subscription)
+
+
+def _format_sse(event_type: str, data: Any) -> str:
+    """SSE 메시지 형식 변환"""
+    return f"event: {event_type}\ndata: {json.dumps(data, default=str, ensure_ascii=False)}\n\n"
+
+
+def _serialize_detection(detection: Dict[str, Any]) -> Dict[str, Any]:
+    """탐지 행 직렬화 (datetime -> ISO 문자열)"""
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in detection.items()
+    }
+
+
+def _serialize_merge(merge: Dict[str, Any]) -> Dict[str, Any]:
+    """병합 누적분 직렬화 - 첫 행 번호 + 더해진 탐지 건수 + 마지막 탐지 시각"""
+    return {
+        'detection_seq': merge['detection_seq'],
+        'added_count': merge['detection_count'],
+        'last_detected_at': merge['last_detected_at'].isoformat() if merge.get('last_detected_at') else None
+    }
@@ -0,0 +1,289 @@
+"""반복 탐지 병합기 (탐지 저장 경로, 프로세스 내)
+- 키: (device_seq, model_product_seq, detection_label)
+- 키의 첫 탐지는 바로 저장(새 행)하고 병합 구간을 엶 -> 구간(첫 탐지 시각 + window) 안의 같은 키 탐지는 저장하지 않고 메모리에 누적
+- 첫 탐지들은 다중 행 1문으로 따로 저장한 뒤 자연키로 detection_seq 를 조회해 받아 둠 (나머지 탐지는 다중 행 저장)
+  - (디바이스, 탐지 시각, 모델 상품, 라벨)은 유일하지 않으므로(같은 초의 프레임 등) 반영은 기본키로만 함
+- 구간이 끝나면(주기적 반영 / 같은 키의 구간 밖 탐지 / 서버 종료) 첫 행에 한 번에 반영
+  - detection_count += 누적 건수, last_detected_at = 마지막 탐지 시각, 미디어 = 마지막 탐지의 미디어
+  - detected_at 은 첫 탐지 시각 유지 -> 집계 버킷은 첫 행과 같은 시간대에 누적
+  - 첫 행이 저장되지 않았으면(저장 트랜잭션 롤백 등) 누적분을 새 행으로 저장
+- admit 은 구간에 자리만 예약하고, 저장 트랜잭션 커밋 후 confirm 에서 누적 (롤백 시 revert 로 예약 해제)
+  - 예약이 남은 구간은 반영하지 않음 -> 롤백된 탐지가 누적분에 섞여 저장되지 않음
+- 반영 시에도 탐지 저장 훅(캐시 / 스트리밍)을 같은 방식으로 실행 (집계는 행 UPDATE 트리거가 증가분만큼 갱신)
+- 반영은 행 UPDATE 이므로 tbl_user_data_version.detection_version 트리거(migrations/011)가 대시보드 워터마크를 올림
+  (다른 워커의 ETag / 지난 날짜 캐시도 무효화)
+- 누적분의 구독 사용량은 병합 시점에 바로 계측 (반영 훅에서는 중복 계측하지 않음)
+- 다중 워커 환경에서는 워커별로 병합 (같은 키가 다른 워커로 가면 각각 첫 행이 생김)
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.database import async_session
+from app.core.detection_events import detection_write_hooks
+from app.repositories.detection_repository import DetectionRepository
+
+logger = logging.getLogger(__name__)
+
+# (device_seq, model_product_seq, detection_label)
+CoalesceKey = Tuple[int, int, str]
+
+# 마지막 탐지 값으로 갱신하는 미디어 컬럼
+MEDIA_FIELDS = ('media_type', 'image_url', 'video_url', 'video_duration', 'thumbnail_url')
+
+# 서버 종료 시 반영 재시도 횟수
+SHUTDOWN_FLUSH_ATTEMPTS = 3
+
+
+class CoalesceGroup:
+    """병합 구간 1개 - 첫 행(opener)은 저장됨, 이후 반복 탐지는 누적만
+    - pending: 커밋 대기 중인 예약 수 (첫 행 저장 + admit 된 반복 탐지)
+    - detection_seq: 저장 커밋된 첫 행 번호 (없으면 반영 시 누적분을 새 행으로 저장)
+    """
+
+    def __init__(self, opener: Dict[str, Any]):
+        self.source = opener
+        self.opener = dict(opener)
+        self.opened_at: datetime = opener['detected_at']
+        self.opened_monotonic = time.monotonic()
+        self.merged_count = 0
+        self.pending = 1
+        self.detection_seq: Optional[int] = None
+        self.last_detected_at: Optional[datetime] = None
+        self.media: Dict[str, Any] = {}
+
+    def merge(self, detection: Dict[str, Any]) -> None:
+        """반복 탐지 누적 (마지막 탐지 시각 / 미디어 갱신)"""
+        self.merged_count += detection.get('detection_count') or 1
+        if self.last_detected_at is None or detection['detected_at'] >= self.last_detected_at:
+            self.last_detected_at = detection['detected_at']
+            self.media = {field: detection[field] for field in MEDIA_FIELDS if detection.get(field) is not None}
+
+    def to_hook_detection(self) -> Dict[str, Any]:
+        """저장 훅에 전달할 누적분 (집계 버킷은 첫 탐지 시각 기준)
+        - detection_seq: 누적분을 더한 첫 행 번호 (첫 행이 없어 새 행으로 저장한 경우 None)
+        """
+        return {
+            'detection_seq': self.detection_seq,
+            'user_seq': self.opener['user_seq'],
+            'device_seq': self.opener['device_seq'],
+            'model_product_seq': self.opener['model_product_seq'],
+            'detection_label': self.opener['detection_label'],
+            'danger_level': self.opener.get('danger_level'),
+            'severity': self.opener.get('severity'),
+            'detected_at': self.opened_at,
+            'last_detected_at': self.last_detected_at,
+            'detection_count': self.merged_count,
+            'usage_metered': True,
+            'coalesced': True
+        }
+
+    def to_row(self) -> Dict[str, Any]:
+        """첫 행이 없을 때 저장할 누적분 행"""
+        row = {**self.opener, **self.media}
+        row['detection_count'] = self.merged_count
+        row['last_detected_at'] = self.last_detected_at
+        return row
+
+
+class DetectionCoalescer:
+    """반복 탐지 병합기"""
+
+    def __init__(self, window_seconds: float, flush_seconds: float, max_groups: int):
+        self.window_seconds = window_seconds
+        self.flush_seconds = flush_seconds
+        self.max_groups = max(1, max_groups)
+        self._groups: Dict[CoalesceKey, CoalesceGroup] = {}
+        self._closed: List[CoalesceGroup] = []
+        self._reserved: Dict[int, CoalesceGroup] = {}   # id(탐지) -> 예약한 구간 (커밋 / 롤백 전까지)
+        self._flush_lock = asyncio.Lock()
+        self._flush_loop_task: Optional[asyncio.Task] = None
+
+        # 통계 카운터
+        self.coalesced = 0
+        self.flushed_groups = 0
+        self.fallback_inserts = 0
+        self.flush_failures = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.window_seconds > 0
+
+    def admit(self, detection: Dict[str, Any]) -> bool:
+        """저장할 탐지 1건 확인 (동기, 저장 전에 호출)
+        - True: 열린 구간에 예약됨 -> 저장하지 않음 (커밋 후 confirm 에서 누적)
+        - False: 새 행으로 저장해야 함 (필요하면 이 탐지로 새 구간 시작)
+        """
+        if not self.enabled:
+            return False
+
+        key = self._key(detection)
+        group = self._groups.get(key)
+        if group is not None:
+            offset = (detection['detected_at'] - group.opened_at).total_seconds()
+            if offset < 0:
+                return False  # 구간 시작보다 이전 탐지(늦게 도착) -> 그대로 저장
+            if offset < self.window_seconds:
+                group.pending += 1
+                self._reserved[id(detection)] = group
+                return True
+            self._close(key)
+
+        if len(self._groups) < self.max_groups:
+            group = CoalesceGroup(detection)
+            self._groups[key] = group
+            self._reserved[id(detection)] = group
+        return False
+
+    def is_opener(self, detection: Dict[str, Any]) -> bool:
+        """admit 이 False 였던 탐지가 새 구간의 첫 행인지 (따로 저장해 detection_seq 를 받아야 함)"""
+        group = self._reserved.get(id(detection))
+        return group is not None and group.source is detection
+
+    def confirm(self, opened: List[Dict[str, Any]], coalesced: List[Dict[str, Any]]) -> None:
+        """저장 트랜잭션 커밋 후 예약 확정
+        - opened: admit 이 False 였던 탐지 (첫 행 저장 확정, 첫 행은 detection_seq 포함)
+        - coalesced: admit 이 True 였던 탐지 (구간에 누적)
+        """
+        for detection in coalesced:
+            group = self._reserved.pop(id(detection), None)
+            if group is not None:
+                group.merge(detection)
+                group.pending -= 1
+                self.coalesced += 1
+        for detection in opened:
+            group = self._reserved.pop(id(detection), None)
+            if group is not None:
+                group.pending -= 1
+                if group.source is detection:
+                    group.detection_seq = detection.get('detection_seq')
+
+    def revert(self, opened: List[Dict[str, Any]], coalesced: List[Dict[str, Any]]) -> None:
+        """저장 트랜잭션 실패 시 예약 해제
+        - opened: admit 이 False 였던 탐지 (저장 실패 -> 이 탐지로 연 구간 제거, 다른 요청의 누적분이 있으면 반영 시 새 행으로 저장)
+        - coalesced: admit 이 True 였던 탐지 (누적하지 않음)
+        """
+        for detection in coalesced:
+            group = self._reserved.pop(id(detection), None)
+            if group is not None:
+                group.pending -= 1
+        for detection in opened:
+            group = self._reserved.pop(id(detection), None)
+            if group is None:
+                continue
+            group.pending -= 1
+            key = self._key(detection)
+            if self._groups.get(key) is group and group.merged_count <= 0 and group.pending <= 0:
+                del self._groups[key]
+
+    async def flush(self, force: bool = False) -> int:
+        """구간이 끝난 누적분 반영 (force: 열린 구간 전체) - 반환값: 반영한 구간 수"""
+        async with self._flush_lock:
+            now = time.monotonic()
+            for key, group in list(self._groups.items()):
+                if force or now - group.opened_monotonic >= self.window_seconds:
+                    self._close(key)
+
+            # 예약이 남은 구간은 커밋 / 롤백 후 다음 주기에 반영, 누적분 없이 예약이 모두 해제된 구간은 버림
+            closing = [group for group in self._closed if group.pending <= 0 and group.merged_count > 0]
+            self._closed = [group for group in self._closed if group.pending > 0]
+            if not closing:
+                return 0
+
+            try:
+                detections = await self._write(closing)
+            except Exception as e:
+                self.flush_failures += 1
+                self._closed = closing + self._closed
+                logger.error(f"반복 탐지 누적분 반영 실패 (다음 주기 재시도, {len(closing)}건): {str(e)}")
+                return 0
+
+            self.flushed_groups += len(closing)
+            await detection_write_hooks.run_commit_hooks(detections)
+            return len(closing)
+
+    def start(self) -> None:
+        """주기적 반영 시작 (서버 시작 시)"""
+        if self.enabled and self._flush_loop_task is None:
+            self._flush_loop_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """주기적 반영 중지 + 열린 구간 전체 반영 (서버 종료 시)"""
+        if self._flush_loop_task is not None:
+            self._flush_loop_task.cancel()
+            try:
+                await self._flush_loop_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_loop_task = None
+        for attempt in range(SHUTDOWN_FLUSH_ATTEMPTS):
+            await self.flush(force=True)
+            if not self._closed:
+                return
+            await asyncio.sleep(attempt + 1)
+        logger.error(f"서버 종료 시 반복 탐지 누적분 반영 실패: {len(self._closed)}건 유실")
+
+    def stats(self) -> Dict[str, Any]:
+        """병합기 통계"""
+        return {
+            'enabled': self.enabled,
+            'window_seconds': self.window_seconds,
+            'open_groups': len(self._groups),
+            'closed_groups': len(self._closed),
+            'pending_reservations': len(self._reserved),
+            'coalesced': self.coalesced,
+            'flushed_groups': self.flushed_groups,
+            'fallback_inserts': self.fallback_inserts,
+            'flush_failures': self.flush_failures
+        }
+
+    @staticmethod
+    def _key(detection: Dict[str, Any]) -> CoalesceKey:
+        return (detection['device_seq'], detection['model_product_seq'], detection['detection_label'])
+
+    def _close(self, key: CoalesceKey) -> None:
+        """구간 닫기 - 누적분 또는 커밋 대기 예약이 있으면 반영 대기 목록으로"""
+        group = self._groups.pop(key)
+        if group.merged_count > 0 or group.pending > 0:
+            self._closed.append(group)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            await self.flush()
+
+    async def _write(self, groups: List[CoalesceGroup]) -> List[Dict[str, Any]]:
+        """누적분을 첫 행에 반영 + 트랜잭션 내 저장 훅 실행 (별도 세션 / 트랜잭션)"""
+        async with async_session() as session:
+            try:
+                detection_repo = DetectionRepository(session)
+                fallback_rows = []
+                for group in groups:
+                    if group.detection_seq is None:
+                        fallback_rows.append(group.to_row())
+                        continue
+                    await detection_repo.merge_coalesced_detection(
+                        group.detection_seq, group.merged_count, group.last_detected_at, group.media
+                    )
+
+                await detection_repo.bulk_insert_detections(fallback_rows)
+                detections = [group.to_hook_detection() for group in groups]
+                await detection_write_hooks.run_write_hooks(session, detections)
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+        self.fallback_inserts += len(fallback_rows)
+        return detections
+
+
+# 전역 반복 탐지 병합기
+detection_coalescer = DetectionCoalescer(
+    window_seconds=settings.detection_coalesce_window_seconds,
+    flush_seconds=settings.detection_coalesce_flush_seconds,
+    max_groups=settings.detection_coalesce_max_groups
+)
@@ -0,0 +1,152 @@
+import asyncio
+import json
+import logging
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.danger_levels import annotate_danger_levels
+from app.core.detection_events import detection_write_hooks
+from app.core.usage_meter import usage_meter
+from app.repositories.detection_repository import DetectionRepository
+from app.services.detection_coalescer import detection_coalescer
+from app.schemas.detection_ingest import (
+    DetectionIngestItem,
+    DetectionIngestItemResult,
+    DetectionIngestResponse,
+    INGEST_STORED,
+    INGEST_COALESCED,
+    INGEST_INVALID,
+    INGEST_REJECTED
+)
+
+
+class DetectionIngestService:
+    """탐지 결과 일괄 저장 서비스 (AI 서버 -> tbl_detection_results)
+    - 항목별 형식 검증 -> 디바이스 소유자 / 구독 / 일일 사용량 한도 확인 -> 위험도 채우기 -> 반복 탐지 병합 -> 다중 행 저장
+    - 배치 1건 = 트랜잭션 1건: 저장(집계는 DB 트리거) + 트랜잭션 내 훅 후 커밋, 커밋 후 훅(캐시 / 스트리밍 / 사용량) 실행
+    - 형식 오류 / 거부 항목은 건너뛰고 나머지만 저장 (항목별 결과 반환)
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.detection_repo = DetectionRepository(db)
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    async def ingest(self, payloads: List[Any], parse_errors: Optional[Dict[int, str]] = None) -> DetectionIngestResponse:
+        """탐지 목록 저장
+        - payloads: 요청 항목 (역직렬화된 JSON 값, 순서 유지)
+        - parse_errors: 역직렬화에 실패한 항목 순번 -> 오류 (NDJSON 줄 단위 오류)
+        """
+        parse_errors = parse_errors or {}
+        results: List[Optional[DetectionIngestItemResult]] = [None] * len(payloads)
+
+        # 1) 형식 검증
+        items: List[Tuple[int, DetectionIngestItem]] = []
+        for index, payload in enumerate(payloads):
+            if index in parse_errors:
+                results[index] = DetectionIngestItemResult(index=index, status=INGEST_INVALID, error=parse_errors[index])
+                continue
+            try:
+                items.append((index, DetectionIngestItem.model_validate(payload)))
+            except ValidationError as e:
+                results[index] = DetectionIngestItemResult(index=index, status=INGEST_INVALID, error=self._summarize_error(e))
+
+        detections: List[Dict[str, Any]] = []
+        coalesced: List[Dict[str, Any]] = []
+        try:
+            # 2) 디바이스 소유자 / 구독 / 일일 사용량 한도 확인 (사용자, 일자별 1회 조회)
+            owners = await self.detection_repo.get_device_owners(list({item.device_seq for _, item in items}))
+            day_usage: Dict[Tuple[int, date], Dict[int, int]] = {}
+
+            accepted: List[Dict[str, Any]] = []
+            accepted_indexes: List[int] = []
+            for index, item in items:
+                user_seq = owners.get(item.device_seq)
+                if user_seq is None:
+                    results[index] = DetectionIngestItemResult(index=index, status=INGEST_REJECTED, error="device_not_found")
+                    continue
+
+                quota = (await usage_meter.get_quotas(self.db, user_seq)).get(item.model_product_seq)
+                if quota is None:
+                    results[index] = DetectionIngestItemResult(index=index, status=INGEST_REJECTED, error="not_subscribed")
+                    continue
+
+                # 같은 배치의 이후 항목에 반영되도록 (사용자, 일자)별 사용량 스냅샷을 공유
+                if not await usage_meter.check_limit(self.db, user_seq, item.model_product_seq, item.detection_count,
+                                                     item.detected_at.date(), reserved=day_usage):
+                    results[index] = DetectionIngestItemResult(index=index, status=INGEST_REJECTED, error="usage_limit_exceeded")
+                    continue
+
+                accepted.append(self._to_row(item, user_seq))
+                accepted_indexes.append(index)
+
+            # 3) 위험도 채우기 + 반복 탐지 병합 (열린 병합 구간에 예약된 항목은 저장하지 않음, 커밋 후 누적)
+            await annotate_danger_levels(self.db, accepted)
+            for index, detection in zip(accepted_indexes, accepted):
+                if detection_coalescer.admit(detection):
+                    coalesced.append(detection)
+                    results[index] = DetectionIngestItemResult(index=index, status=INGEST_COALESCED)
+                else:
+                    detections.append(detection)
+                    results[index] = DetectionIngestItemResult(index=index, status=INGEST_STORED)
+
+            # 4) 저장 + 트랜잭션 내 훅 (병합 구간 첫 행은 다중 행 1문으로 따로 저장한 뒤 반영 대상 detection_seq 조회)
+            if detections:
+                openers = [detection for detection in detections if detection_coalescer.is_opener(detection)]
+                await self.detection_repo.bulk_insert_detections(
+                    [detection for detection in detections if not detection_coalescer.is_opener(detection)]
+                )
+                detection_seqs = await self.detection_repo.insert_detections_returning_seqs(openers)
+                for detection, detection_seq in zip(openers, detection_seqs):
+                    detection['detection_seq'] = detection_seq
+                await detection_write_hooks.run_write_hooks(self.db, detections)
+            await self.db.commit()
+            detection_coalescer.confirm(detections, coalesced)
+
+        except asyncio.CancelledError:
+            detection_coalescer.revert(detections, coalesced)
+            raise
+        except Exception as e:
+            await self.db.rollback()
+            detection_coalescer.revert(detections, coalesced)
+            self.logger.error(f"탐지 일괄 저장 실패 [{len(payloads)}건]: {str(e)}", exc_info=True)
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="탐지 결과 저장 중 오류가 발생했습니다.")
+
+        # 5) 커밋 후 훅 (캐시 무효화 / 스트리밍 / 사용량), 병합된 항목은 사용량만 바로 계측
+        await detection_write_hooks.run_commit_hooks(detections)
+        usage_meter.record(coalesced)
+
+        invalid_count = sum(1 for result in results if result.status == INGEST_INVALID)
+        rejected_count = sum(1 for result in results if result.status == INGEST_REJECTED)
+        self.logger.info(f"탐지 일괄 저장 완료: 수신 {len(payloads)}건, 저장 {len(detections)}건, 병합 {len(coalesced)}건, "
+                         f"형식 오류 {invalid_count}건, 거부 {rejected_count}건")
+
+        return DetectionIngestResponse(
+            received=len(payloads),
+            stored=len(detections),
+            coalesced=len(coalesced),
+            invalid=invalid_count,
+            rejected=rejected_count,
+            results=results
+        )
+
+    @staticmethod
+    def _to_row(item: DetectionIngestItem, user_seq: int) -> Dict[str, Any]:
+        """검증된 항목 -> tbl_detection_results 행 dict"""
+        row = item.model_dump()
+        row['user_seq'] = user_seq
+        if row['detection_details'] is not None and not isinstance(row['detection_details'], str):
+            row['detection_details'] = json.dumps(row['detection_details'], ensure_ascii=False)
+        return row
+
+    @staticmethod
+    def _summarize_error(error: ValidationError) -> str:
+        """검증 오류 요약 (필드: 메시지)"""
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc']) or 'item'}: {detail['msg']}"
+            for detail in error.errors()
+        )
@@ -1,5 +1,6 @@
 import logging
 import os
+from fastapi import HTTPException, status
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -153,8 +154,12 @@ class MediaService:
             self.logger.info(
                 f"미디어 목록 조회 [user_id={user_id}, page={query.page}, size={query.page_size}]")
 
-            # 레파지토리를 통한 데이터 조회
-            media_result = await self.media_repo.get_media_list_paginated(query, lang_tag)
+            # 레파지토리를 통한 데이터 조회 (잘못된 커서 / 다른 정렬의 커서는 ValueError -> 400)
+            try:
+                media_result = await self.media_repo.get_media_list_paginated(query, lang_tag)
+            except ValueError as e:
+                self.logger.warning(f"미디어 목록 커서 오류 [user_id={user_id}: {str(e)}]")
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="유효하지 않은 커서입니다.")
 
             # 감사 로그 기록
             await self._log_media_action(
@@ -176,7 +181,7 @@ class MediaService:
                 f"미디어 목록 조회 완료 [user_id={user_id}, count={media_result['total_count']}]")
             return media_result
 
-        except PermissionError:
+        except (PermissionError, HTTPException):
             raise
         except Exception as e:
             self.logger.error(f"미디어 목록 조회 오류 [user_id={user_id}: {str(e)}]")
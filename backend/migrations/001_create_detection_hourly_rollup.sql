@@ -0,0 +1,15 @@
+-- 시간대별 탐지 집계 테이블
+-- 생성 후 백필: python -m app.commands.rebuild_detection_rollup --start-date <YYYY-MM-DD> --workers 4
+
+CREATE TABLE IF NOT EXISTS tbl_detection_hourly_rollup (
+    user_seq          INT          NOT NULL,
+    hour_bucket       DATETIME     NOT NULL COMMENT '시 단위로 절삭한 탐지 시각',
+    device_seq        INT          NOT NULL,
+    model_product_seq INT          NOT NULL,
+    danger_level      VARCHAR(16)  NOT NULL COMMENT 'critical/high/medium/low/safe/normal/unmapped',
+    detection_count   INT          NOT NULL DEFAULT 0,
+    last_detected_at  DATETIME     NULL,
+    lastup_dt         DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_seq, hour_bucket, device_seq, model_product_seq, danger_level),
+    KEY idx_hourly_rollup_device_hour (device_seq, hour_bucket)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
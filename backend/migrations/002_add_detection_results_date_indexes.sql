@@ -0,0 +1,19 @@
+-- tbl_detection_results 날짜 범위 조회용 복합 인덱스
+-- 레포지토리의 날짜 조건은 detected_at >= 시작 AND detected_at < 끝 (app/repositories/query_filters.py) 형태이므로
+-- (소유자 컬럼, detected_at) 인덱스로 사용자/디바이스별 하루치 범위만 스캔
+-- 온라인 DDL (테이블 잠금 없이 생성)
+-- idx_detection_results_user_detected 는 migrations/005 에서 더 넓은 idx_detection_results_user_feed
+--   (user_seq, detected_at, model_product_seq, danger_level) 로 대체 후 삭제 (같은 접두로 범위 조회)
+-- 전후 비교: python -m app.commands.benchmark_date_predicates --days 365 --devices 10
+
+ALTER TABLE tbl_detection_results
+    ADD INDEX idx_detection_results_user_detected (user_seq, detected_at),
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE tbl_detection_results
+    ADD INDEX idx_detection_results_device_detected (device_seq, detected_at),
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+-- 적용 확인 (type=range, key=idx_detection_results_user_detected - 005 적용 후에는 idx_detection_results_user_feed 이어야 함)
+-- EXPLAIN SELECT COUNT(*) FROM tbl_detection_results
+--  WHERE user_seq = 1 AND detected_at >= '2025-01-01 00:00:00' AND detected_at < '2025-01-02 00:00:00';
@@ -0,0 +1,13 @@
+-- tbl_detection_results 미디어 목록 키셋 페이징용 인덱스
+-- 미디어 목록 기본 정렬은 reg_dt DESC, detection_seq DESC (app/repositories/media_repository.py)
+-- InnoDB 보조 인덱스에는 PK(detection_seq)가 포함되므로 (reg_dt) 인덱스로 (reg_dt, detection_seq) 커서 탐색 가능
+-- 온라인 DDL (테이블 잠금 없이 생성)
+
+ALTER TABLE tbl_detection_results
+    ADD INDEX idx_detection_results_reg_dt (reg_dt),
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+-- 적용 확인 (key=idx_detection_results_reg_dt, Extra에 filesort 없어야 함)
+-- EXPLAIN SELECT detection_seq FROM tbl_detection_results
+--  WHERE reg_dt < '2025-01-02 00:00:00' OR (reg_dt = '2025-01-02 00:00:00' AND detection_seq < 100)
+--  ORDER BY reg_dt DESC, detection_seq DESC LIMIT 21;
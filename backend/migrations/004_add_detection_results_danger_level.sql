@@ -0,0 +1,35 @@
+-- tbl_detection_results 위험도 비정규화
+-- 위험도 집계마다 tbl_model_detection_mappings 를 (model_product_seq, detection_label) 복합키로 조인하지 않도록
+-- 저장 시점의 위험도(danger_level)와 숫자 등급(severity)을 탐지 행에 함께 저장
+-- 매핑이 없는 탐지는 NULL (기존 내부 조인에서 제외되던 행)
+-- 매핑이 수정되면 reconcile 커맨드로 재동기화: python -m app.commands.reconcile_detection_danger_levels
+
+ALTER TABLE tbl_detection_results
+    ADD COLUMN danger_level ENUM('critical', 'high', 'medium', 'low', 'safe', 'normal') NULL AFTER confidence,
+    ADD COLUMN severity SMALLINT NULL AFTER danger_level,
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+-- 사용자별 위험도 + 날짜 범위 조회용 (위험 알림 목록, 위험도별 일간 집계)
+ALTER TABLE tbl_detection_results
+    ADD INDEX idx_detection_results_user_level_detected (user_seq, danger_level, detected_at),
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+-- 기존 데이터 백필 (중복 매핑은 가장 위험한 위험도 사용 - ENUM 순번(danger_level + 0)의 최솟값, 문자열 MIN 아님)
+-- 대용량 테이블은 커맨드로 일자별 분할 실행 권장:
+--   python -m app.commands.reconcile_detection_danger_levels --start-date 2024-01-01 --workers 4
+UPDATE tbl_detection_results d
+    JOIN (
+        SELECT model_product_seq, detection_label,
+               ELT(MIN(danger_level + 0), 'critical', 'high', 'medium', 'low', 'safe', 'normal') AS danger_level
+        FROM tbl_model_detection_mappings
+        GROUP BY model_product_seq, detection_label
+    ) m ON m.model_product_seq = d.model_product_seq AND m.detection_label = d.detection_label
+SET d.danger_level = m.danger_level,
+    d.severity = CASE m.danger_level
+        WHEN 'critical' THEN 5
+        WHEN 'high' THEN 4
+        WHEN 'medium' THEN 3
+        WHEN 'low' THEN 2
+        WHEN 'safe' THEN 1
+        WHEN 'normal' THEN 0
+    END;
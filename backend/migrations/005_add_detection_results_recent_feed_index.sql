@@ -0,0 +1,20 @@
+-- tbl_detection_results 최근 목록 1단계(상위 N개 번호) 조회용 커버링 인덱스
+-- WHERE user_seq = ? AND model_product_seq IN (...) AND danger_level IN (...)
+-- ORDER BY detected_at DESC, detection_seq DESC LIMIT N (app/repositories/recent_detection_query.py)
+-- 필터 컬럼이 인덱스에 모두 있으므로 테이블 행을 읽지 않고 인덱스 역순 탐색 후 N건에서 멈춤 (Extra: Using where; Using index)
+-- InnoDB 보조 인덱스에는 PK(detection_seq)가 포함되므로 (detected_at, detection_seq) 커서 조건도 인덱스로 처리
+-- (user_seq, detected_at) 접두가 같아 idx_detection_results_user_detected 는 대체 후 삭제 (쓰기 비용 절감)
+-- 온라인 DDL (테이블 잠금 없이 생성)
+
+ALTER TABLE tbl_detection_results
+    ADD INDEX idx_detection_results_user_feed (user_seq, detected_at, model_product_seq, danger_level),
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+ALTER TABLE tbl_detection_results
+    DROP INDEX idx_detection_results_user_detected,
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+-- 적용 확인 (key=idx_detection_results_user_feed, Extra에 Using index 포함 / filesort 없어야 함)
+-- EXPLAIN SELECT detection_seq FROM tbl_detection_results
+--  WHERE user_seq = 1 AND model_product_seq IN (1, 2) AND danger_level IN ('critical', 'high')
+--  ORDER BY detected_at DESC, detection_seq DESC LIMIT 10;
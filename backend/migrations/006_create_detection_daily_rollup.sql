@@ -0,0 +1,27 @@
+-- 일자별 탐지 집계 테이블 (주간/월간 추이 조회용)
+-- 시간대별 집계(tbl_detection_hourly_rollup)와 같은 탐지 저장 훅 / 재집계 커맨드에서 함께 갱신
+-- 생성 후 기존 시간대별 집계로부터 백필 (원본 탐지 재스캔 불필요)
+--   또는: python -m app.commands.rebuild_detection_rollup --start-date <YYYY-MM-DD> --workers 4
+
+CREATE TABLE IF NOT EXISTS tbl_detection_daily_rollup (
+    user_seq          INT          NOT NULL,
+    day_bucket        DATE         NOT NULL COMMENT '탐지 일자',
+    device_seq        INT          NOT NULL,
+    model_product_seq INT          NOT NULL,
+    danger_level      VARCHAR(16)  NOT NULL COMMENT 'critical/high/medium/low/safe/normal/unmapped',
+    detection_count   INT          NOT NULL DEFAULT 0,
+    last_detected_at  DATETIME     NULL,
+    lastup_dt         DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_seq, day_bucket, device_seq, model_product_seq, danger_level),
+    KEY idx_daily_rollup_device_day (device_seq, day_bucket)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+INSERT INTO tbl_detection_daily_rollup
+    (user_seq, day_bucket, device_seq, model_product_seq, danger_level, detection_count, last_detected_at)
+SELECT user_seq, DATE(hour_bucket), device_seq, model_product_seq, danger_level,
+       SUM(detection_count), MAX(last_detected_at)
+FROM tbl_detection_hourly_rollup
+GROUP BY user_seq, DATE(hour_bucket), device_seq, model_product_seq, danger_level
+ON DUPLICATE KEY UPDATE
+    detection_count = VALUES(detection_count),
+    last_detected_at = VALUES(last_detected_at);
@@ -0,0 +1,30 @@
+-- 구독별 일자 사용량 카운터 테이블 (사용량 계측 / usage_limit 확인용)
+-- 탐지 저장 커밋 훅에서 메모리에 누적한 증가분을 주기적으로 일괄 반영 (app.core.usage_meter)
+-- 사용량 단위: 탐지 건수 (detection_count 합계)
+-- 생성 후 오늘 사용량은 원본 탐지로부터 백필 (이전 일자는 필요 시 같은 방식으로 기간 지정)
+
+CREATE TABLE IF NOT EXISTS tbl_subscription_usage_daily (
+    subscription_seq  INT          NOT NULL,
+    usage_date        DATE         NOT NULL COMMENT '사용 일자 (탐지 일자 기준)',
+    user_seq          INT          NOT NULL,
+    model_product_seq INT          NOT NULL,
+    detection_count   INT          NOT NULL DEFAULT 0,
+    lastup_dt         DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (subscription_seq, usage_date),
+    KEY idx_subscription_usage_user_date (user_seq, usage_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+INSERT INTO tbl_subscription_usage_daily
+    (subscription_seq, usage_date, user_seq, model_product_seq, detection_count)
+SELECT s.subscription_seq, DATE(d.detected_at), d.user_seq, d.model_product_seq, SUM(d.detection_count)
+FROM tbl_detection_results d
+JOIN (
+    SELECT user_seq, model_product_seq, MAX(subscription_seq) AS subscription_seq
+    FROM tbl_model_product_subscription
+    WHERE subscription_status = 'A'
+    GROUP BY user_seq, model_product_seq
+) s ON s.user_seq = d.user_seq AND s.model_product_seq = d.model_product_seq
+WHERE d.detected_at >= CURDATE()
+GROUP BY s.subscription_seq, DATE(d.detected_at), d.user_seq, d.model_product_seq
+ON DUPLICATE KEY UPDATE
+    detection_count = VALUES(detection_count);
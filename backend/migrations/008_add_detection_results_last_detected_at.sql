@@ -0,0 +1,9 @@
+-- 반복 탐지 병합(coalescing)용 마지막 탐지 시각
+-- 같은 (디바이스, 모델 상품, 라벨) 탐지가 병합 구간 안에 반복되면 새 행을 만들지 않고
+-- 첫 행의 detection_count 를 늘리고 마지막 탐지 시각 / 미디어를 갱신 (app.services.detection_coalescer)
+-- detected_at 은 첫 탐지 시각으로 유지 (시간대별 / 일자별 집계 버킷 기준이 바뀌지 않도록)
+-- 병합되지 않은 행은 NULL (마지막 탐지 시각 = detected_at)
+
+ALTER TABLE tbl_detection_results
+    ADD COLUMN last_detected_at DATETIME NULL AFTER detected_at,
+    ALGORITHM=INPLACE, LOCK=NONE;
@@ -0,0 +1,24 @@
+-- 세션 토큰 조회 테이블 (X-Session-Token 헤더 / session_token 쿠키 인증용)
+-- 기존 조회는 SPRING_SESSION_ATTRIBUTES.ATTRIBUTE_BYTES(TEXT, 인덱스 없음) = JSON 문자열 비교 -> 요청마다 속성 전체 스캔
+-- 토큰 sha256(hex) 을 기본키로 저장 -> 인증 1건 = 기본키 조회 1회 + SPRING_SESSION 기본키 조인
+-- 토큰 원문은 저장하지 않음, SPRING_SESSION 테이블 구조는 바꾸지 않음 (웹 서버 Spring Session 과 공유)
+-- 생성 후 기존 세션의 토큰은 SPRING_SESSION_ATTRIBUTES 에서 백필
+
+CREATE TABLE IF NOT EXISTS tbl_session_token (
+    token_hash          CHAR(64)     NOT NULL COMMENT '세션 토큰 sha256 (hex)',
+    session_primary_id  CHAR(36)     NOT NULL COMMENT 'SPRING_SESSION.PRIMARY_ID',
+    user_seq            INT          NOT NULL,
+    expiry_time         BIGINT       NOT NULL COMMENT '발급 시 만료 시각 (epoch ms, 정리용)',
+    reg_dt              DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (token_hash),
+    KEY idx_session_token_session (session_primary_id),
+    KEY idx_session_token_expiry (expiry_time)
+) ENGINE=InnoDB DEFAULT CHARSET=ascii;
+
+INSERT IGNORE INTO tbl_session_token (token_hash, session_primary_id, user_seq, expiry_time)
+SELECT SHA2(SUBSTRING(CAST(a.ATTRIBUTE_BYTES AS CHAR), 2, 64), 256), s.PRIMARY_ID, CAST(s.PRINCIPAL_NAME AS UNSIGNED), s.EXPIRY_TIME
+FROM SPRING_SESSION_ATTRIBUTES a
+JOIN SPRING_SESSION s ON s.PRIMARY_ID = a.SESSION_PRIMARY_ID
+WHERE a.ATTRIBUTE_NAME = 'session_token'
+  AND LENGTH(a.ATTRIBUTE_BYTES) = 66
+  AND s.PRINCIPAL_NAME REGEXP '^[0-9]+$';
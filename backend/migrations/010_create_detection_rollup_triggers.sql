@@ -0,0 +1,113 @@
+-- 시간대별 / 일자별 탐지 집계를 DB 트리거로 유지
+-- 기존에는 앱의 탐지 저장 훅(run_write_hooks)에서만 집계를 갱신 -> AI 서버 등 다른 경로로 저장된 탐지는 집계에 빠짐
+-- tbl_detection_results 의 INSERT / UPDATE / DELETE 마다 같은 트랜잭션에서 집계 버킷을 증감 (저장 경로와 무관)
+--   - INSERT: 버킷에 detection_count 더함 (위험도 없는 행은 'unmapped' 버킷, app.models.detection_rollup.UNMAPPED_DANGER_LEVEL)
+--   - UPDATE: 버킷 키 / detection_count / last_detected_at 이 바뀌면 이전 버킷에서 빼고 새 버킷에 더함
+--             (반복 탐지 병합 반영, 위험도 재계산이 집계에 자동 반영)
+--   - DELETE: 버킷에서 뺌 (last_detected_at 은 되돌리지 않음)
+-- 앱의 집계 저장 훅(apply_detections_to_hourly_rollup)은 중복 집계를 막기 위해 제거
+-- 적용 전 기간 백필 / 복구: python -m app.commands.rebuild_detection_rollup --start-date <YYYY-MM-DD> --workers 4
+-- 바이너리 로그 사용 시 트리거 생성에 TRIGGER 권한 + log_bin_trust_function_creators=1 (또는 SUPER) 필요
+-- mysql 클라이언트로 실행 (DELIMITER 사용)
+
+-- 집계 재생성(rebuild_day)의 일자 범위 조회용 - 기존 인덱스는 user_seq / device_seq / reg_dt 선두라 일자 전체 조회 시 풀 스캔
+ALTER TABLE tbl_detection_results
+    ADD INDEX idx_detection_results_detected (detected_at),
+    ALGORITHM=INPLACE, LOCK=NONE;
+
+DROP PROCEDURE IF EXISTS sp_apply_detection_rollup;
+DROP TRIGGER IF EXISTS trg_detection_results_rollup_insert;
+DROP TRIGGER IF EXISTS trg_detection_results_rollup_update;
+DROP TRIGGER IF EXISTS trg_detection_results_rollup_delete;
+
+DELIMITER $$
+
+-- 집계 버킷 1개 증감 (p_count > 0: 더함, p_count < 0: 뺌)
+CREATE PROCEDURE sp_apply_detection_rollup(
+    IN p_user_seq INT,
+    IN p_detected_at DATETIME,
+    IN p_device_seq INT,
+    IN p_model_product_seq INT,
+    IN p_danger_level VARCHAR(16),
+    IN p_count INT,
+    IN p_last_detected_at DATETIME
+)
+BEGIN
+    DECLARE v_hour_bucket DATETIME DEFAULT DATE_FORMAT(p_detected_at, '%Y-%m-%d %H:00:00');
+    DECLARE v_danger_level VARCHAR(16) DEFAULT COALESCE(p_danger_level, 'unmapped');
+
+    IF p_count > 0 THEN
+        INSERT INTO tbl_detection_hourly_rollup
+            (user_seq, hour_bucket, device_seq, model_product_seq, danger_level, detection_count, last_detected_at)
+        VALUES
+            (p_user_seq, v_hour_bucket, p_device_seq, p_model_product_seq, v_danger_level, p_count, p_last_detected_at)
+        ON DUPLICATE KEY UPDATE
+            detection_count = detection_count + VALUES(detection_count),
+            last_detected_at = GREATEST(COALESCE(last_detected_at, VALUES(last_detected_at)), VALUES(last_detected_at));
+
+        INSERT INTO tbl_detection_daily_rollup
+            (user_seq, day_bucket, device_seq, model_product_seq, danger_level, detection_count, last_detected_at)
+        VALUES
+            (p_user_seq, DATE(p_detected_at), p_device_seq, p_model_product_seq, v_danger_level, p_count, p_last_detected_at)
+        ON DUPLICATE KEY UPDATE
+            detection_count = detection_count + VALUES(detection_count),
+            last_detected_at = GREATEST(COALESCE(last_detected_at, VALUES(last_detected_at)), VALUES(last_detected_at));
+    ELSEIF p_count < 0 THEN
+        UPDATE tbl_detection_hourly_rollup
+        SET detection_count = GREATEST(detection_count + p_count, 0)
+        WHERE user_seq = p_user_seq AND hour_bucket = v_hour_bucket AND device_seq = p_device_seq
+          AND model_product_seq = p_model_product_seq AND danger_level = v_danger_level;
+
+        UPDATE tbl_detection_daily_rollup
+        SET detection_count = GREATEST(detection_count + p_count, 0)
+        WHERE user_seq = p_user_seq AND day_bucket = DATE(p_detected_at) AND device_seq = p_device_seq
+          AND model_product_seq = p_model_product_seq AND danger_level = v_danger_level;
+    END IF;
+END$$
+
+CREATE TRIGGER trg_detection_results_rollup_insert
+AFTER INSERT ON tbl_detection_results
+FOR EACH ROW
+BEGIN
+    CALL sp_apply_detection_rollup(
+        NEW.user_seq, NEW.detected_at, NEW.device_seq, NEW.model_product_seq, NEW.danger_level,
+        NEW.detection_count, COALESCE(NEW.last_detected_at, NEW.detected_at)
+    );
+END$$
+
+CREATE TRIGGER trg_detection_results_rollup_update
+AFTER UPDATE ON tbl_detection_results
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.user_seq <=> NEW.user_seq
+            AND OLD.detected_at <=> NEW.detected_at
+            AND OLD.device_seq <=> NEW.device_seq
+            AND OLD.model_product_seq <=> NEW.model_product_seq
+            AND OLD.danger_level <=> NEW.danger_level
+            AND OLD.detection_count <=> NEW.detection_count
+            AND OLD.last_detected_at <=> NEW.last_detected_at) THEN
+        CALL sp_apply_detection_rollup(
+            OLD.user_seq, OLD.detected_at, OLD.device_seq, OLD.model_product_seq, OLD.danger_level,
+            -OLD.detection_count, NULL
+        );
+        CALL sp_apply_detection_rollup(
+            NEW.user_seq, NEW.detected_at, NEW.device_seq, NEW.model_product_seq, NEW.danger_level,
+            NEW.detection_count, COALESCE(NEW.last_detected_at, NEW.detected_at)
+        );
+    END IF;
+END$$
+
+CREATE TRIGGER trg_detection_results_rollup_delete
+AFTER DELETE ON tbl_detection_results
+FOR EACH ROW
+BEGIN
+    CALL sp_apply_detection_rollup(
+        OLD.user_seq, OLD.detected_at, OLD.device_seq, OLD.model_product_seq, OLD.danger_level,
+        -OLD.detection_count, NULL
+    );
+END$$
+
+DELIMITER ;
+
+-- 적용 전 오늘 집계 재생성 (앱 훅 제거 ~ 트리거 생성 사이 저장분 포함)
+--   python -m app.commands.rebuild_detection_rollup --start-date <오늘 YYYY-MM-DD>
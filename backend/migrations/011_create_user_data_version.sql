@@ -0,0 +1,114 @@
+-- 사용자별 데이터 버전 테이블 (대시보드 ETag 워터마크 / 지난 날짜 캐시 검증용)
+-- 구독 / 디바이스는 웹 서버가, 탐지는 AI 서버 등 여러 경로가 직접 수정 -> 앱의 변경 훅만으로는 변경을 알 수 없음
+-- 트리거가 행 변경마다 사용자 버전을 올림 (저장 경로와 무관, 같은 트랜잭션에서 커밋)
+--   - subscription_version: tbl_model_product_subscription INSERT / UPDATE / DELETE (상태 변경, 만료, 취소 등)
+--   - device_version: tbl_device INSERT / UPDATE / DELETE (이름 / 유형 / 그룹 변경 등)
+--   - detection_version: tbl_detection_results UPDATE / DELETE (반복 탐지 병합, 위험도 재계산 등)
+--     INSERT 는 MAX(detection_seq) 로 감지되므로 제외 (저장 경로마다 사용자 행 잠금이 생기지 않도록)
+-- 행이 없는 사용자는 버전 0 으로 취급 (백필 불필요)
+-- 바이너리 로그 사용 시 트리거 생성에 TRIGGER 권한 + log_bin_trust_function_creators=1 (또는 SUPER) 필요
+-- mysql 클라이언트로 실행 (DELIMITER 사용)
+
+CREATE TABLE IF NOT EXISTS tbl_user_data_version (
+    user_seq              INT          NOT NULL,
+    subscription_version  BIGINT       NOT NULL DEFAULT 0 COMMENT '구독 변경 횟수',
+    device_version        BIGINT       NOT NULL DEFAULT 0 COMMENT '디바이스 변경 횟수',
+    detection_version     BIGINT       NOT NULL DEFAULT 0 COMMENT '탐지 수정 / 삭제 횟수 (저장 제외)',
+    lastup_dt             DATETIME     NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (user_seq)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+DROP PROCEDURE IF EXISTS sp_bump_user_data_version;
+DROP TRIGGER IF EXISTS trg_model_product_subscription_version_insert;
+DROP TRIGGER IF EXISTS trg_model_product_subscription_version_update;
+DROP TRIGGER IF EXISTS trg_model_product_subscription_version_delete;
+DROP TRIGGER IF EXISTS trg_device_version_insert;
+DROP TRIGGER IF EXISTS trg_device_version_update;
+DROP TRIGGER IF EXISTS trg_device_version_delete;
+DROP TRIGGER IF EXISTS trg_detection_results_version_update;
+DROP TRIGGER IF EXISTS trg_detection_results_version_delete;
+
+DELIMITER $$
+
+-- 사용자 버전 증가 (각 인자: 해당 버전 증가량)
+CREATE PROCEDURE sp_bump_user_data_version(
+    IN p_user_seq INT,
+    IN p_subscription INT,
+    IN p_device INT,
+    IN p_detection INT
+)
+BEGIN
+    INSERT INTO tbl_user_data_version (user_seq, subscription_version, device_version, detection_version)
+    VALUES (p_user_seq, p_subscription, p_device, p_detection)
+    ON DUPLICATE KEY UPDATE
+        subscription_version = subscription_version + VALUES(subscription_version),
+        device_version = device_version + VALUES(device_version),
+        detection_version = detection_version + VALUES(detection_version);
+END$$
+
+CREATE TRIGGER trg_model_product_subscription_version_insert
+AFTER INSERT ON tbl_model_product_subscription
+FOR EACH ROW
+BEGIN
+    CALL sp_bump_user_data_version(NEW.user_seq, 1, 0, 0);
+END$$
+
+CREATE TRIGGER trg_model_product_subscription_version_update
+AFTER UPDATE ON tbl_model_product_subscription
+FOR EACH ROW
+BEGIN
+    CALL sp_bump_user_data_version(NEW.user_seq, 1, 0, 0);
+    IF NOT (OLD.user_seq <=> NEW.user_seq) THEN
+        CALL sp_bump_user_data_version(OLD.user_seq, 1, 0, 0);
+    END IF;
+END$$
+
+CREATE TRIGGER trg_model_product_subscription_version_delete
+AFTER DELETE ON tbl_model_product_subscription
+FOR EACH ROW
+BEGIN
+    CALL sp_bump_user_data_version(OLD.user_seq, 1, 0, 0);
+END$$
+
+CREATE TRIGGER trg_device_version_insert
+AFTER INSERT ON tbl_device
+FOR EACH ROW
+BEGIN
+    CALL sp_bump_user_data_version(NEW.user_seq, 0, 1, 0);
+END$$
+
+CREATE TRIGGER trg_device_version_update
+AFTER UPDATE ON tbl_device
+FOR EACH ROW
+BEGIN
+    CALL sp_bump_user_data_version(NEW.user_seq, 0, 1, 0);
+    IF NOT (OLD.user_seq <=> NEW.user_seq) THEN
+        CALL sp_bump_user_data_version(OLD.user_seq, 0, 1, 0);
+    END IF;
+END$$
+
+CREATE TRIGGER trg_device_version_delete
+AFTER DELETE ON tbl_device
+FOR EACH ROW
+BEGIN
+    CALL sp_bump_user_data_version(OLD.user_seq, 0, 1, 0);
+END$$
+
+CREATE TRIGGER trg_detection_results_version_update
+AFTER UPDATE ON tbl_detection_results
+FOR EACH ROW
+BEGIN
+    CALL sp_bump_user_data_version(NEW.user_seq, 0, 0, 1);
+    IF NOT (OLD.user_seq <=> NEW.user_seq) THEN
+        CALL sp_bump_user_data_version(OLD.user_seq, 0, 0, 1);
+    END IF;
+END$$
+
+CREATE TRIGGER trg_detection_results_version_delete
+AFTER DELETE ON tbl_detection_results
+FOR EACH ROW
+BEGIN
+    CALL sp_bump_user_data_version(OLD.user_seq, 0, 0, 1);
+END$$
+
+DELIMITER ;
@@ -0,0 +1,45 @@
+-- tbl_detection_results 위험도(danger_level / severity) 저장 시점 채우기 - 모든 저장 경로
+-- 앱은 저장 전에 annotate_danger_levels 로 채우지만 AI 서버 등 다른 경로로 저장된 행은 NULL
+--   -> 탐지 권한 조건(danger_level IS NOT NULL)에서 빠져 대시보드 / 목록에 보이지 않음
+-- BEFORE INSERT 트리거가 NULL 인 행만 현재 매핑으로 채움 (앱이 채운 값은 그대로)
+--   - 같은 라벨의 중복 매핑은 가장 위험한 위험도 하나로 고정 (app.core.danger_levels.most_severe_danger_level 과 동일 규칙)
+--   - ENUM 에 MIN() 을 쓰면 문자열 비교가 되므로 ENUM 순번(danger_level + 0, 1 = critical)의 최솟값 사용
+--   - 매핑이 없으면 NULL 유지
+-- 집계 트리거(migrations/010, AFTER INSERT)는 채워진 값으로 버킷을 정함
+-- 바이너리 로그 사용 시 트리거 생성에 TRIGGER 권한 + log_bin_trust_function_creators=1 (또는 SUPER) 필요
+-- mysql 클라이언트로 실행 (DELIMITER 사용)
+
+DROP TRIGGER IF EXISTS trg_detection_results_danger_level_insert;
+
+DELIMITER $$
+
+CREATE TRIGGER trg_detection_results_danger_level_insert
+BEFORE INSERT ON tbl_detection_results
+FOR EACH ROW
+BEGIN
+    IF NEW.danger_level IS NULL THEN
+        SET NEW.danger_level = (
+            SELECT ELT(MIN(m.danger_level + 0), 'critical', 'high', 'medium', 'low', 'safe', 'normal')
+            FROM tbl_model_detection_mappings m
+            WHERE m.model_product_seq = NEW.model_product_seq
+              AND m.detection_label = NEW.detection_label
+        );
+    END IF;
+
+    IF NEW.danger_level IS NOT NULL AND NEW.severity IS NULL THEN
+        SET NEW.severity = CASE NEW.danger_level
+            WHEN 'critical' THEN 5
+            WHEN 'high' THEN 4
+            WHEN 'medium' THEN 3
+            WHEN 'low' THEN 2
+            WHEN 'safe' THEN 1
+            WHEN 'normal' THEN 0
+        END;
+    END IF;
+END$$
+
+DELIMITER ;
+
+-- 기존 행 재계산: 트리거 적용 전 다른 경로로 저장된 NULL 행 + 이전 규칙(MIN(danger_level), 문자열 비교)으로 고른 중복 매핑 위험도
+-- 집계 버킷은 행 UPDATE 트리거(migrations/010)가 함께 옮김
+--   python -m app.commands.reconcile_detection_danger_levels --start-date <가장 오래된 탐지 일자> --workers 4
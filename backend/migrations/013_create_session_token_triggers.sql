@@ -0,0 +1,74 @@
+-- 세션 토큰 조회 키(tbl_session_token)를 DB 트리거로 유지
+-- 009 는 생성 시점 백필 + 앱의 store_session_token 저장만 반영 -> 웹 서버(Spring Session)가 만든 세션은 키가 없어 인증 실패(401)
+-- SPRING_SESSION_ATTRIBUTES 의 session_token 속성 변경마다 같은 트랜잭션에서 키를 갱신 (저장 경로와 무관)
+--   - INSERT: 토큰 sha256(hex) 키 추가 (SPRING_SESSION 행이 먼저 저장된 세션만 - Spring Session 저장 순서와 같음)
+--   - UPDATE: 토큰이 바뀌면 이전 키 삭제 후 새 키 추가
+--   - DELETE: 해당 세션의 키 삭제 (세션 삭제 시 FK CASCADE 로 지워지는 속성은 트리거 미실행 -> purge_session_tokens 로 정리)
+-- user_seq 는 PRINCIPAL_NAME 이 숫자가 아니면 0 (인증은 SPRING_SESSION.PRINCIPAL_NAME 을 다시 읽음)
+-- 009 이후 웹 서버가 만든 세션은 아래 백필로 반영
+-- 바이너리 로그 사용 시 트리거 생성에 TRIGGER 권한 + log_bin_trust_function_creators=1 (또는 SUPER) 필요
+-- mysql 클라이언트로 실행 (DELIMITER 사용)
+
+DROP PROCEDURE IF EXISTS sp_apply_session_token;
+DROP TRIGGER IF EXISTS trg_spring_session_attributes_token_insert;
+DROP TRIGGER IF EXISTS trg_spring_session_attributes_token_update;
+DROP TRIGGER IF EXISTS trg_spring_session_attributes_token_delete;
+
+DELIMITER $$
+
+-- 세션 토큰 키 추가 (속성 값: JSON 문자열 "<64자 hex>")
+CREATE PROCEDURE sp_apply_session_token(
+    IN p_session_primary_id CHAR(36),
+    IN p_attribute_bytes TEXT
+)
+BEGIN
+    IF LENGTH(p_attribute_bytes) = 66 THEN
+        INSERT IGNORE INTO tbl_session_token (token_hash, session_primary_id, user_seq, expiry_time)
+        SELECT SHA2(SUBSTRING(CAST(p_attribute_bytes AS CHAR), 2, 64), 256), s.PRIMARY_ID,
+               IF(s.PRINCIPAL_NAME REGEXP '^[0-9]+$', CAST(s.PRINCIPAL_NAME AS UNSIGNED), 0), s.EXPIRY_TIME
+        FROM SPRING_SESSION s
+        WHERE s.PRIMARY_ID = p_session_primary_id;
+    END IF;
+END$$
+
+CREATE TRIGGER trg_spring_session_attributes_token_insert
+AFTER INSERT ON SPRING_SESSION_ATTRIBUTES
+FOR EACH ROW
+BEGIN
+    IF NEW.ATTRIBUTE_NAME = 'session_token' THEN
+        CALL sp_apply_session_token(NEW.SESSION_PRIMARY_ID, NEW.ATTRIBUTE_BYTES);
+    END IF;
+END$$
+
+CREATE TRIGGER trg_spring_session_attributes_token_update
+AFTER UPDATE ON SPRING_SESSION_ATTRIBUTES
+FOR EACH ROW
+BEGIN
+    IF OLD.ATTRIBUTE_NAME = 'session_token'
+       AND NOT (OLD.ATTRIBUTE_NAME <=> NEW.ATTRIBUTE_NAME AND OLD.ATTRIBUTE_BYTES <=> NEW.ATTRIBUTE_BYTES) THEN
+        DELETE FROM tbl_session_token WHERE session_primary_id = OLD.SESSION_PRIMARY_ID;
+    END IF;
+    IF NEW.ATTRIBUTE_NAME = 'session_token' THEN
+        CALL sp_apply_session_token(NEW.SESSION_PRIMARY_ID, NEW.ATTRIBUTE_BYTES);
+    END IF;
+END$$
+
+CREATE TRIGGER trg_spring_session_attributes_token_delete
+AFTER DELETE ON SPRING_SESSION_ATTRIBUTES
+FOR EACH ROW
+BEGIN
+    IF OLD.ATTRIBUTE_NAME = 'session_token' THEN
+        DELETE FROM tbl_session_token WHERE session_primary_id = OLD.SESSION_PRIMARY_ID;
+    END IF;
+END$$
+
+DELIMITER ;
+
+-- 009 ~ 트리거 생성 사이 웹 서버가 만든 세션 백필
+INSERT IGNORE INTO tbl_session_token (token_hash, session_primary_id, user_seq, expiry_time)
+SELECT SHA2(SUBSTRING(CAST(a.ATTRIBUTE_BYTES AS CHAR), 2, 64), 256), s.PRIMARY_ID,
+       IF(s.PRINCIPAL_NAME REGEXP '^[0-9]+$', CAST(s.PRINCIPAL_NAME AS UNSIGNED), 0), s.EXPIRY_TIME
+FROM SPRING_SESSION_ATTRIBUTES a
+JOIN SPRING_SESSION s ON s.PRIMARY_ID = a.SESSION_PRIMARY_ID
+WHERE a.ATTRIBUTE_NAME = 'session_token'
+  AND LENGTH(a.ATTRIBUTE_BYTES) = 66;
@@ -0,0 +1,144 @@
+"""테스트 공용 픽스처
+
+- DB 테스트는 실제 MySQL 스키마(migrations 적용)를 사용 - ENVIRONMENT=test 의 .env.test 또는 DB_* 환경변수
+- 설정이 없거나 DB 에 연결할 수 없으면 DB 테스트는 건너뜀
+- DB 없이 도는 단위 테스트는 database 픽스처를 쓰지 않음
+- 테스트 데이터는 하나의 트랜잭션에서만 사용하고 마지막에 롤백
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+# backend/ 를 import 경로에 추가 (pytest tests/ 로 실행)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("ENVIRONMENT", "test")
+
+# 설정 파일이 없으면 설정 로드에 필요한 값만 채움 (DB 없이 도는 단위 테스트용, DB 테스트는 연결 실패로 건너뜀)
+if not os.path.exists(f".env.{os.environ['ENVIRONMENT']}"):
+    for name in ("DB_HOST", "DB_USER", "DB_PASSWORD", "DB_NAME", "JWT_SECRET_KEY"):
+        os.environ.setdefault(name, "127.0.0.1" if name == "DB_HOST" else "test")
+
+
+async def _check_connection() -> None:
+    from sqlalchemy import text
+    from app.core.database import engine
+
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def database():
+    """테스트 DB 사용 가능 여부 확인 (불가 시 skip)"""
+    try:
+        asyncio.run(_check_connection())
+    except Exception as e:
+        pytest.skip(f"테스트 DB 를 사용할 수 없습니다: {e}")
+
+
+class FakeClock:
+    """time 모듈 대체 - monotonic / time 을 테스트에서 직접 진행"""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """메모리 캐시(app/core/cache.py) / 서킷 브레이커(app/core/circuit_breaker.py)의 시계를 FakeClock 으로 대체"""
+    from app.core import cache as cache_module
+    from app.core import circuit_breaker as circuit_breaker_module
+
+    fake_clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", fake_clock)
+    monkeypatch.setattr(circuit_breaker_module, "time", fake_clock)
+    return fake_clock
+
+
+class RecordingResult:
+    """쿼리 결과 대체 - 준비된 행(namedtuple / 스칼라) 반환, INSERT 결과는 lastrowid"""
+
+    def __init__(self, rows, lastrowid=None):
+        self._rows = list(rows)
+        self.lastrowid = lastrowid
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def all(self):
+        return list(self._rows)
+
+    def first(self):
+        return self.fetchone()
+
+    def scalar(self):
+        row = self.fetchone()
+        return row[0] if isinstance(row, tuple) else row
+
+    def scalar_one_or_none(self):
+        return self.scalar()
+
+    def scalars(self) -> "RecordingResult":
+        return RecordingResult([row[0] if isinstance(row, tuple) else row for row in self._rows])
+
+
+class RecordingSession:
+    """AsyncSession 대체 - 실행한 문을 MySQL 방언으로 컴파일해 기록하고 준비된 결과를 순서대로 반환
+    - 컴파일 실패(잘못된 조인 / 컬럼 등)는 DB 없이도 테스트에서 바로 드러남
+    - 준비된 결과가 없으면 빈 결과
+    """
+
+    def __init__(self):
+        self.statements = []
+        self._results = []
+
+    def queue(self, *rows) -> None:
+        self._results.append(RecordingResult(rows))
+
+    def queue_insert(self, lastrowid: int) -> None:
+        """INSERT 결과 준비 (다중 행 INSERT 는 첫 행 번호 = LAST_INSERT_ID())"""
+        self._results.append(RecordingResult((), lastrowid=lastrowid))
+
+    async def execute(self, statement, params=None):
+        from sqlalchemy.dialects import mysql
+
+        self.statements.append(str(statement.compile(dialect=mysql.dialect())))
+        return self._results.pop(0) if self._results else RecordingResult(())
+
+    async def commit(self) -> None:
+        return None
+
+    async def rollback(self) -> None:
+        return None
+
+    async def __aenter__(self) -> "RecordingSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+@pytest.fixture
+def recording_session():
+    """DB 없이 레포지토리 쿼리 경로를 실행하는 세션"""
+    return RecordingSession()
@@ -0,0 +1,152 @@
+"""로그인 api 웹 API 대체 경로 테스트 (DB 없음)
+
+- 웹 API 클라이언트는 서킷 브레이커가 열린 실제 클라이언트 / 연결 실패하는 가짜로 대체 (네트워크 호출 없음)
+- 사용자 레포지토리 / 비밀번호 검증 / 계정 변경 알림은 고정 값으로 대체
+"""
+from datetime import datetime
+from types import SimpleNamespace
+from typing import List, Optional
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.auth import verify_token
+from app.core.circuit_breaker import STATE_OPEN, CircuitBreaker
+from app.core.config import settings
+from app.core.password_hasher import PasswordHasherBusy
+from app.core.web_api_client import WebApiClient
+from app.routers import auth as auth_router
+
+SYNTHETIC_USER_SEQ = 2_000_000_010
+USERNAME = "test@example.com"
+PASSWORD = "correct-password"
+
+
+def _user(**overrides) -> SimpleNamespace:
+    user = SimpleNamespace(
+        user_seq=SYNTHETIC_USER_SEQ, username=USERNAME, password="hashed", fullname=None, email=None, phone=None,
+        enabled='1', status='A', status_msg=None, password_wrong_cnt=0, group_limit=5, device_limit=5,
+        alarm_yn=None, alarm_line_yn=None, alarm_whatsapp_yn=None, ai_status=None, ai_toggle_yn=None,
+        last_access_dt=None, reg_dt=datetime(2026, 1, 1)
+    )
+    for name, value in overrides.items():
+        setattr(user, name, value)
+    return user
+
+
+class _FakeUserRepository:
+    def __init__(self, user: Optional[SimpleNamespace]):
+        self.user = user
+        self.login_logs: List[int] = []
+        self.db = SimpleNamespace(commit=self._commit)
+
+    async def _commit(self) -> None:
+        return None
+
+    async def find_by_username(self, username: str) -> Optional[SimpleNamespace]:
+        return self.user if self.user is not None and self.user.username == username else None
+
+    async def save_login_log(self, user_seq: int, ip_address: str, device_type: str) -> bool:
+        self.login_logs.append(user_seq)
+        return True
+
+
+class _UnreachableWebApiClient:
+    async def login(self, username: str, password: str):
+        raise httpx.ConnectError("connection refused")
+
+
+def _open_breaker_client() -> WebApiClient:
+    breaker = CircuitBreaker(name="test", window_size=1, minimum_calls=1, failure_rate_threshold=0.5,
+                             slow_call_rate_threshold=1.0, slow_call_seconds=5, open_seconds=30, half_open_max_calls=1)
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    return WebApiClient(connect_timeout=1, read_timeout=1, pool_timeout=1, max_connections=1,
+                        max_keepalive_connections=0, keepalive_expiry=1, breaker=breaker)
+
+
+@pytest.fixture
+def user_repo(monkeypatch) -> _FakeUserRepository:
+    async def _verify(plain_password, hashed_password):
+        return plain_password == PASSWORD
+
+    async def _notify_account_changed(user_seq):
+        return None
+
+    monkeypatch.setattr(auth_router.password_hasher, "verify", _verify)
+    monkeypatch.setattr(auth_router.user_change_hooks, "notify_account_changed", _notify_account_changed)
+    monkeypatch.setattr(settings, "web_api_local_login_fallback", True)
+    return _FakeUserRepository(_user())
+
+
+@pytest.fixture
+def client(user_repo):
+    app = FastAPI()
+    app.include_router(auth_router.router)
+    app.dependency_overrides[auth_router.get_auth_service] = lambda: SimpleNamespace(user_repo=user_repo)
+    return TestClient(app)
+
+
+def _login(client, password: str = PASSWORD) -> dict:
+    response = client.post("/auth/login", json={"username": USERNAME, "password": password})
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.parametrize("web_api_client_factory", [_open_breaker_client, _UnreachableWebApiClient])
+def test_local_password_login_issues_a_server_jwt(client, user_repo, monkeypatch, web_api_client_factory):
+    monkeypatch.setattr(auth_router, "web_api_client", web_api_client_factory())
+    user_repo.user.password_wrong_cnt = 2
+
+    body = _login(client)
+
+    assert body['success'] is True
+    assert body['expires_in'] == settings.jwt_access_token_expire_minutes * 60
+    assert verify_token(body['access_token'])['sub'] == str(SYNTHETIC_USER_SEQ)
+    assert user_repo.user.password_wrong_cnt == 0
+    assert user_repo.login_logs == [SYNTHETIC_USER_SEQ]
+
+
+def test_local_password_mismatch_counts_a_wrong_password(client, user_repo, monkeypatch):
+    monkeypatch.setattr(auth_router, "web_api_client", _open_breaker_client())
+
+    body = _login(client, password="wrong-password")
+
+    assert (body['success'], body['message']) == (False, "INVALID_CREDENTIALS")
+    assert body['error_data'] == {'current': 1, 'remaining': 4}
+    assert user_repo.login_logs == []
+
+
+def test_local_login_still_applies_account_checks(client, user_repo, monkeypatch):
+    monkeypatch.setattr(auth_router, "web_api_client", _open_breaker_client())
+    user_repo.user.password_wrong_cnt = 5
+
+    body = _login(client)
+
+    assert (body['success'], body['message']) == (False, "ACCOUNT_LOCKED")
+    assert body['access_token'] is None
+
+
+def test_unavailable_web_api_without_fallback(client, user_repo, monkeypatch):
+    monkeypatch.setattr(auth_router, "web_api_client", _open_breaker_client())
+    monkeypatch.setattr(settings, "web_api_local_login_fallback", False)
+
+    body = _login(client)
+
+    assert body['success'] is False
+    assert body['message'] == "인증 서버에 연결할 수 없습니다. 잠시 후 다시 시도해주세요."
+    assert user_repo.login_logs == []
+
+
+def test_busy_password_hasher_returns_server_busy(client, monkeypatch):
+    async def _busy_verify(plain_password, hashed_password):
+        raise PasswordHasherBusy("queue full")
+
+    monkeypatch.setattr(auth_router, "web_api_client", _open_breaker_client())
+    monkeypatch.setattr(auth_router.password_hasher, "verify", _busy_verify)
+
+    body = _login(client)
+
+    assert (body['success'], body['message']) == (False, "SERVER_BUSY")
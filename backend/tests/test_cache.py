@@ -0,0 +1,79 @@
+"""프로세스 내 메모리 캐시 테스트 (TTLLRUCache / GenerationMap)"""
+from app.core.cache import GenerationMap, TTLLRUCache
+
+
+def test_get_returns_value_until_ttl_expires(clock):
+    cache = TTLLRUCache(max_entries=10, ttl_seconds=30)
+    cache.set("a", 1)
+
+    clock.advance(29)
+    assert cache.get("a") == (True, 1)
+
+    clock.advance(1)
+    assert cache.get("a") == (False, None)
+    assert cache.expirations == 1
+    assert len(cache) == 0
+
+
+def test_per_entry_ttl_and_non_positive_ttl(clock):
+    cache = TTLLRUCache(max_entries=10, ttl_seconds=30)
+    cache.set("short", 1, ttl_seconds=5)
+    cache.set("expired", 2, ttl_seconds=0)
+
+    assert cache.get("expired") == (False, None)
+    clock.advance(5)
+    assert cache.get("short") == (False, None)
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLLRUCache(max_entries=2, ttl_seconds=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")       # a 를 최근 사용으로
+    cache.set("c", 3)    # b 제거
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.get("c") == (True, 3)
+    assert cache.evictions == 1
+
+
+def test_stats_hit_ratio(clock):
+    cache = TTLLRUCache(max_entries=10, ttl_seconds=30)
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses'], stats['hit_ratio']) == (1, 1, 0.5)
+
+
+def test_generation_bump_changes_only_that_key(clock):
+    generations = GenerationMap(max_entries=10, ttl_seconds=30)
+    before_a, before_b = generations.get("a"), generations.get("b")
+
+    generations.bump("a")
+
+    assert generations.get("a") != before_a
+    assert generations.get("b") == before_b
+
+
+def test_evicted_generation_never_returns_to_an_invalidated_value(clock):
+    generations = GenerationMap(max_entries=1, ttl_seconds=30)
+    stale = generations.get("a")
+    generations.bump("a")
+    current = generations.get("a")
+
+    generations.get("b")  # a 제거
+
+    restarted = generations.get("a")
+    assert restarted != stale
+    assert restarted >= current
+
+
+def test_expired_generation_keeps_value_when_nothing_was_invalidated(clock):
+    generations = GenerationMap(max_entries=10, ttl_seconds=30)
+    generation = generations.bump("a")
+
+    clock.advance(30)
+    assert generations.get("a") == generation
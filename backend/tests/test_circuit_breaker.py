@@ -0,0 +1,128 @@
+"""서킷 브레이커 상태 전환 테스트 (closed -> open -> half_open -> closed / open)"""
+from app.core.circuit_breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN, CircuitBreaker
+
+
+def _breaker(**overrides) -> CircuitBreaker:
+    options = {
+        'name': "test",
+        'window_size': 4,
+        'minimum_calls': 4,
+        'failure_rate_threshold': 0.5,
+        'slow_call_rate_threshold': 0.5,
+        'slow_call_seconds': 2,
+        'open_seconds': 30,
+        'half_open_max_calls': 2
+    }
+    options.update(overrides)
+    return CircuitBreaker(**options)
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.minimum_calls):
+        breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+
+
+def test_opens_on_failure_rate_after_minimum_calls(clock):
+    breaker = _breaker()
+    breaker.record_success(0.1)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED     # 최소 호출 수 전에는 판단하지 않음
+
+    breaker.record_success(0.1)
+    assert breaker.state == STATE_OPEN
+    assert breaker.allow_request() is False
+    assert (breaker.opened, breaker.rejected) == (1, 1)
+
+
+def test_opens_on_slow_call_rate(clock):
+    breaker = _breaker()
+    breaker.record_success(0.1)
+    breaker.record_success(0.1)
+    breaker.record_success(2)
+    breaker.record_success(5)
+
+    assert breaker.state == STATE_OPEN
+    assert breaker.slow_calls == 2
+    assert breaker.failures == 0
+
+
+def test_only_the_recent_window_is_rated(clock):
+    breaker = _breaker()
+    breaker.record_failure()
+    for _ in range(4):
+        breaker.record_success(0.1)
+    breaker.record_failure()
+
+    assert breaker.state == STATE_CLOSED     # 첫 실패는 창 밖 -> 실패율 0.25
+    assert breaker.stats()['failure_rate'] == 0.25
+
+
+def test_half_open_after_open_seconds(clock):
+    breaker = _breaker()
+    _open(breaker)
+
+    clock.advance(29)
+    assert breaker.allow_request() is False
+    assert breaker.stats()['open_remaining_seconds'] == 1.0
+
+    clock.advance(1)
+    assert breaker.allow_request() is True
+    assert breaker.state == STATE_HALF_OPEN
+
+
+def test_half_open_limits_trial_calls_and_closes_on_success(clock):
+    breaker = _breaker()
+    _open(breaker)
+    clock.advance(30)
+
+    assert [breaker.allow_request() for _ in range(3)] == [True, True, False]
+
+    breaker.record_success(0.1)
+    assert breaker.state == STATE_HALF_OPEN
+    breaker.record_success(0.1)
+    assert breaker.state == STATE_CLOSED
+    assert breaker.stats()['window_calls'] == 0
+    assert breaker.allow_request() is True
+
+
+def test_half_open_reopens_on_failure_or_slow_call(clock):
+    for record in (lambda breaker: breaker.record_failure(), lambda breaker: breaker.record_success(3)):
+        breaker = _breaker()
+        _open(breaker)
+        clock.advance(30)
+        assert breaker.allow_request() is True
+
+        record(breaker)
+
+        assert breaker.state == STATE_OPEN
+        assert breaker.opened == 2
+        assert breaker.allow_request() is False     # open_seconds 를 처음부터 다시 셈
+
+
+def test_results_arriving_while_open_are_ignored(clock):
+    breaker = _breaker()
+    _open(breaker)
+    calls = breaker.calls
+
+    for _ in range(4):
+        breaker.record_success(0.1)   # open 전에 시작된 호출의 결과
+
+    assert breaker.state == STATE_OPEN
+    assert breaker.calls == calls + 4
+    assert breaker.stats()['failure_rate'] == 1.0
+
+    clock.advance(30)
+    assert breaker.allow_request() is True
+    assert breaker.state == STATE_HALF_OPEN
+
+
+def test_disabled_breaker_always_allows(clock):
+    breaker = _breaker(enabled=False)
+    for _ in range(10):
+        breaker.record_failure()
+
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow_request() is True
+    assert breaker.calls == 0
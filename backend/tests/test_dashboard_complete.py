@@ -0,0 +1,85 @@
+"""/dashboard/complete 일부 섹션 실패 응답 테스트 (DB 없음)
+
+- 섹션 조회 / 워터마크 조회는 가짜 값으로 대체, 세션은 아무것도 하지 않는 객체
+- 일부 섹션이 실패해도 200 + failed_sections, 재검증 대상이 아니므로 ETag 없이 no-store
+"""
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.database import get_db
+from app.core.principal_cache import Principal
+from app.dependencies.auth import get_current_user
+from app.repositories.dashboard_repository import DashboardRepository
+from app.routers import dashboard as dashboard_router
+from app.schemas.dashboard import DashboardOverview
+from app.services.dashboard_service import DashboardService
+
+# 합성 사용자 번호 (결과 캐시가 다른 테스트와 겹치지 않도록)
+SYNTHETIC_USER_SEQ = 2_000_000_002
+
+
+class _FakeSession:
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+async def _get_user_data_watermark(self, user_seq):
+    return {'max_detection_seq': 1, 'subscription_version': 1}
+
+
+async def _get_dashboard_overview(self, user_seq, target_date):
+    return DashboardOverview(
+        today_total_detections=3,
+        devices_detected_today=1,
+        total_registered_devices=2,
+        risk_level_critical_count=1,
+        risk_level_high_count=2,
+        risk_level_medium_count=0,
+        security_safe_count=0,
+        general_detection_count=0,
+        last_updated=datetime.now()
+    )
+
+
+async def _empty_section(self, *args, **kwargs):
+    return []
+
+
+async def _failing_section(self, user_seq):
+    raise RuntimeError("alerts unavailable")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(DashboardRepository, "get_user_data_watermark", _get_user_data_watermark)
+    monkeypatch.setattr(DashboardService, "_get_dashboard_overview", _get_dashboard_overview)
+    monkeypatch.setattr(DashboardService, "_get_hourly_chart", _empty_section)
+    monkeypatch.setattr(DashboardService, "_get_device_model_subscriptions", _empty_section)
+    monkeypatch.setattr(DashboardService, "_get_recent_risk_detections", _empty_section)
+    monkeypatch.setattr(DashboardService, "_get_recent_alerts", _failing_section)
+    monkeypatch.setattr(dashboard_router, "async_session", _FakeSession)
+
+    app = FastAPI()
+    app.include_router(dashboard_router.router)
+    app.dependency_overrides[get_current_user] = lambda: Principal(
+        user_seq=SYNTHETIC_USER_SEQ, username="test@example.com", fullname=None,
+        enabled='Y', status='A', password_wrong_cnt=0
+    )
+    app.dependency_overrides[get_db] = _FakeSession
+    return TestClient(app)
+
+
+def test_partial_section_failure_returns_uncached_partial_payload(client):
+    response = client.get("/dashboard/complete")
+
+    assert response.status_code == 200
+    assert response.json()['failed_sections'] == ['recent_alerts']
+    assert response.json()['overview']['today_total_detections'] == 3
+    assert 'etag' not in response.headers
+    assert response.headers['cache-control'] == 'no-store'
@@ -0,0 +1,69 @@
+"""지난 날짜 대시보드 캐시 테스트 - 워터마크 검증 / 조회 도중 무효화된 결과 저장 방지 (임시 SQLite 파일)"""
+import asyncio
+from datetime import date
+
+import pytest
+
+from app.core.dashboard_history_cache import DashboardHistoryCache
+
+USER_SEQ = 1
+TARGET_DATE = date(2026, 9, 30)
+WATERMARK = {'bucket_count': 2, 'detection_count': 5, 'subscription_version': 1, 'device_version': 0}
+
+
+@pytest.fixture
+def history_cache(tmp_path):
+    cache = DashboardHistoryCache(path=str(tmp_path / "history.sqlite3"), max_age_days=30)
+    yield cache
+    cache.close()
+
+
+def _store(cache: DashboardHistoryCache, value, watermark=WATERMARK, version=None) -> None:
+    async def store():
+        stored_version = version if version is not None else await cache.get_version(USER_SEQ, TARGET_DATE)
+        await cache.put(USER_SEQ, TARGET_DATE, "overview", value, stored_version, watermark)
+    asyncio.run(store())
+
+
+def _lookup(cache: DashboardHistoryCache, watermark=WATERMARK):
+    return asyncio.run(cache.get(USER_SEQ, TARGET_DATE, "overview", watermark))
+
+
+def test_hit_requires_the_same_watermark(history_cache):
+    _store(history_cache, {'total': 5})
+
+    assert _lookup(history_cache) == (True, {'total': 5})
+    assert _lookup(history_cache, {**WATERMARK, 'detection_count': 6}) == (False, None)
+    assert _lookup(history_cache, {**WATERMARK, 'subscription_version': 2}) == (False, None)
+
+
+def test_watermark_key_order_does_not_matter(history_cache):
+    _store(history_cache, {'total': 5})
+
+    assert _lookup(history_cache, dict(reversed(list(WATERMARK.items())))) == (True, {'total': 5})
+
+
+def test_result_read_before_day_invalidation_is_not_stored(history_cache):
+    version = asyncio.run(history_cache.get_version(USER_SEQ, TARGET_DATE))   # 조회 시작
+    asyncio.run(history_cache.invalidate_day(USER_SEQ, TARGET_DATE))          # 조회 도중 지연 저장
+
+    _store(history_cache, {'total': 5}, version=version)
+
+    assert _lookup(history_cache) == (False, None)
+    assert history_cache.stale_writes == 1
+
+
+def test_user_invalidation_removes_entries_and_bumps_version(history_cache):
+    _store(history_cache, {'total': 5})
+    version = asyncio.run(history_cache.get_version(USER_SEQ, TARGET_DATE))
+
+    asyncio.run(history_cache.invalidate_user(USER_SEQ))
+
+    assert _lookup(history_cache) == (False, None)
+    assert asyncio.run(history_cache.get_version(USER_SEQ, TARGET_DATE)) != version
+
+
+def test_only_past_dates_are_cacheable(history_cache):
+    assert history_cache.is_cacheable(TARGET_DATE)
+    assert not history_cache.is_cacheable(date.today())
+    assert not history_cache.is_cacheable(None)
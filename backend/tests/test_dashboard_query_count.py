@@ -0,0 +1,91 @@
+"""대시보드 레포지토리 쿼리 수 테스트 (N+1 회귀 방지)
+
+- SQLAlchemy before_cursor_execute 이벤트로 실행된 SQL 문 수를 셈
+- 디바이스 수가 달라도 get_user_device_status_list 의 SQL 문 수가 같아야 함
+"""
+import asyncio
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import event, insert, text
+
+# 합성 사용자 번호 (실제 사용자와 겹치지 않는 값)
+SYNTHETIC_USER_SEQ = 2_000_000_000
+
+
+class StatementCounter:
+    """엔진에서 실행된 SQL 문 수 (with 블록 안에서만 셈)"""
+
+    def __init__(self, engine):
+        self._engine = engine.sync_engine
+        self.statements: List[str] = []
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self) -> "StatementCounter":
+        event.listen(self._engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self._engine, "before_cursor_execute", self._before_cursor_execute)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+async def _count_device_status_statements(device_count: int, detections_per_device: int = 3) -> int:
+    """디바이스 N대 + 오늘 탐지를 넣고 get_user_device_status_list 실행 중 SQL 문 수 반환 (종료 시 롤백)"""
+    from app.core.database import async_session, engine
+    from app.models.detection_result import DetectionResult
+    from app.models.device import Device
+    from app.repositories.dashboard_repository import DashboardRepository
+
+    try:
+        async with async_session() as session:
+            try:
+                await session.execute(text("SET SESSION foreign_key_checks = 0"))
+                devices = [
+                    Device(user_seq=SYNTHETIC_USER_SEQ, device_label=f"test device {index:03d}", device_type='A')
+                    for index in range(device_count)
+                ]
+                session.add_all(devices)
+                await session.flush()
+
+                now = datetime.now()
+                start_of_day = datetime.combine(now.date(), datetime.min.time())
+                await session.execute(insert(DetectionResult), [
+                    {
+                        'device_seq': device.device_seq,
+                        'user_seq': SYNTHETIC_USER_SEQ,
+                        'model_product_seq': 0,
+                        'detection_class': 'safety',
+                        'detection_label': 'test',
+                        'confidence': 90,
+                        'bbox_x': 0, 'bbox_y': 0, 'bbox_width': 10, 'bbox_height': 10,
+                        'detected_at': start_of_day + (now - start_of_day) * (index + 1) / (detections_per_device + 1)
+                    }
+                    for device in devices
+                    for index in range(detections_per_device)
+                ])
+                await session.flush()
+
+                with StatementCounter(engine) as counter:
+                    device_status_list = await DashboardRepository(session).get_user_device_status_list(SYNTHETIC_USER_SEQ)
+
+                assert len(device_status_list) == device_count
+                assert all(device['today_detection_count'] == detections_per_device for device in device_status_list)
+                return counter.count
+            finally:
+                await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+def test_device_status_list_statement_count_is_constant(database):
+    single_device_count = asyncio.run(_count_device_status_statements(1))
+    many_devices_count = asyncio.run(_count_device_status_statements(25))
+
+    assert single_device_count == many_devices_count
+    assert single_device_count == 1
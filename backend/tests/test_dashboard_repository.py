@@ -0,0 +1,99 @@
+"""대시보드 레포지토리 쿼리 경로 테스트 (DB 없음)
+
+- RecordingSession 으로 쿼리를 실행 - 문이 MySQL 방언으로 컴파일되는지와 결과 매핑 확인
+- 탐지 권한 인덱스는 고정 값으로 대체
+"""
+import asyncio
+from collections import namedtuple
+from datetime import date, datetime
+
+import pytest
+
+from app.core.entitlement_index import UserEntitlement, entitlement_index
+from app.repositories.dashboard_repository import DashboardRepository
+from app.repositories.detection_repository import DetectionRepository
+from app.services.dashboard_service import DashboardService
+
+SYNTHETIC_USER_SEQ = 2_000_000_003
+TARGET_DATE = date(2026, 10, 1)
+
+HourlyRow = namedtuple('HourlyRow', ['hour', 'detection_count', 'risk_count', 'safe_count', 'normal_count'])
+RecentRow = namedtuple('RecentRow', ['detection_seq', 'confidence', 'detected_at', 'detection_class', 'thumbnail_url',
+                                     'device_label', 'group_name', 'detection_name', 'danger_level'])
+TrendRow = namedtuple('TrendRow', ['day_bucket', 'device_seq', 'device_label', 'danger_level', 'detection_count'])
+AlertRow = namedtuple('AlertRow', ['alert_seq', 'device_seq', 'device_label', 'detection_class', 'detection_label',
+                                   'danger_level', 'alert_time', 'related_detection_seq'])
+
+
+@pytest.fixture(autouse=True)
+def entitlement(monkeypatch):
+    async def _get_user_entitlement(db, user_seq):
+        return UserEntitlement(user_seq, frozenset({1}))
+
+    monkeypatch.setattr(entitlement_index, "get_user_entitlement", _get_user_entitlement)
+
+
+def test_hourly_chart_reads_the_hourly_rollup_joined_to_devices(recording_session):
+    recording_session.queue(HourlyRow(9, 5, 3, 2, None))
+
+    chart_data = asyncio.run(
+        DashboardRepository(recording_session).get_hourly_detection_chart_data(SYNTHETIC_USER_SEQ, TARGET_DATE)
+    )
+
+    assert 'FROM tbl_detection_hourly_rollup INNER JOIN tbl_device' in recording_session.statements[0]
+    assert chart_data == [{'hour': 9, 'detection_count': 5, 'risk_count': 3, 'safe_count': 2, 'normal_count': 0}]
+
+
+def test_detection_trend_is_built_from_the_daily_rollup(recording_session):
+    start_date, end_date = date(2026, 9, 29), date(2026, 10, 1)
+    recording_session.queue(
+        TrendRow(date(2026, 9, 29), 7, "카메라 1", 'critical', 2),
+        TrendRow(date(2026, 10, 1), 7, "카메라 1", 'low', 1),
+        TrendRow(date(2026, 10, 1), 8, None, 'high', 4),
+    )
+    service = DashboardService(DashboardRepository(recording_session), DetectionRepository(recording_session))
+
+    trend = asyncio.run(service.get_detection_trend(SYNTHETIC_USER_SEQ, start_date, end_date))
+
+    assert 'FROM tbl_detection_daily_rollup INNER JOIN tbl_device' in recording_session.statements[0]
+    assert trend.dates == [date(2026, 9, 29), date(2026, 9, 30), date(2026, 10, 1)]
+    assert trend.total_counts == [2, 0, 5]
+    assert trend.danger_level_counts['critical'] == [2, 0, 0]
+    assert [(series.device_label, series.counts) for series in trend.device_series] == [
+        ("디바이스 8", [0, 0, 4]),
+        ("카메라 1", [2, 0, 1])
+    ]
+
+
+@pytest.mark.parametrize("method", ["get_recent_critical_alert_list", "get_recent_general_detection_list"])
+def test_recent_lists_enrich_top_n_ids_in_id_order(recording_session, method):
+    recording_session.queue((102,), (101,))
+    recording_session.queue(
+        RecentRow(101, 80, datetime(2026, 10, 1, 9), 'safety', None, "카메라 1", None, 'fire', 'high'),
+        RecentRow(102, 90, datetime(2026, 10, 1, 10), 'safety', None, "카메라 2", "1층", 'smoke', 'critical'),
+    )
+
+    rows = asyncio.run(getattr(DashboardRepository(recording_session), method)(SYNTHETIC_USER_SEQ))
+
+    assert len(recording_session.statements) == 2
+    assert 'FROM tbl_detection_results INNER JOIN tbl_device' in recording_session.statements[1]
+    assert [row['detection_seq'] for row in rows] == [102, 101]
+    assert rows[1]['group_name'] == "미분류"
+
+
+def test_recent_alert_notifications_are_built_from_top_n_detections(recording_session):
+    alert_time = datetime(2026, 10, 1, 10)
+    recording_session.queue((102,))
+    recording_session.queue(AlertRow(102, 7, None, 'safety', 'fire', 'critical', alert_time, 102))
+
+    alerts = asyncio.run(DashboardRepository(recording_session).get_recent_alert_notifications(SYNTHETIC_USER_SEQ))
+
+    assert alerts == [{
+        'alert_seq': 102,
+        'device_label': "디바이스 7",
+        'alert_type': 'critical',
+        'alert_message': "safety 분류에서 fire 탐지됨",
+        'alert_time': alert_time.isoformat(),
+        'is_read': False,
+        'related_detection_seq': 102
+    }]
@@ -0,0 +1,92 @@
+"""대시보드 증분 이벤트 발행기 테스트 (DB 없음)
+
+- 실제 브로커에 구독한 뒤 publish 결과 이벤트 확인, 탐지 권한 인덱스는 고정 값으로 대체
+- 개요 / 시간대 갱신 예약은 지난 날짜 탐지로 건너뜀 (백그라운드 작업 없음)
+"""
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pytest
+
+from app.core.dashboard_events import dashboard_event_broker
+from app.core.entitlement_index import UserEntitlement, entitlement_index
+from app.services import dashboard_stream_service as stream_module
+from app.services.dashboard_stream_service import DashboardDeltaPublisher
+
+SYNTHETIC_USER_SEQ = 2_000_000_005
+DETECTED_AT = datetime(2026, 10, 1, 12, 0, 0)
+
+
+class _FakeSession:
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+def _detection(**overrides) -> Dict[str, Any]:
+    detection = {
+        'detection_seq': 101,
+        'user_seq': SYNTHETIC_USER_SEQ,
+        'device_seq': 7,
+        'model_product_seq': 1,
+        'detection_label': 'fire',
+        'danger_level': 'critical',
+        'detected_at': DETECTED_AT,
+        'detection_count': 1
+    }
+    detection.update(overrides)
+    return detection
+
+
+@pytest.fixture
+def subscription(monkeypatch):
+    async def _get_user_entitlement(db, user_seq):
+        return UserEntitlement(user_seq, frozenset({1}))
+
+    monkeypatch.setattr(entitlement_index, "get_user_entitlement", _get_user_entitlement)
+    monkeypatch.setattr(stream_module, "async_session", _FakeSession)
+    subscription = dashboard_event_broker.subscribe(SYNTHETIC_USER_SEQ)
+    yield subscription
+    dashboard_event_broker.unsubscribe(subscription)
+
+
+def _publish(detections: List[Dict[str, Any]], subscription) -> List[Dict[str, Any]]:
+    asyncio.run(DashboardDeltaPublisher(debounce_seconds=0, max_concurrency=1).publish(detections))
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    return events
+
+
+def test_unentitled_and_unmapped_detections_are_not_published(subscription):
+    events = _publish([
+        _detection(),
+        _detection(detection_seq=None, danger_level=None),          # 매핑 없는 탐지
+        _detection(detection_seq=None, model_product_seq=2),        # 구독하지 않은 상품
+    ], subscription)
+
+    assert [event['event'] for event in events] == ['detections']
+    assert [row['detection_seq'] for row in events[0]['data']] == [101]
+
+
+def test_coalesced_merge_is_published_as_an_update_of_the_opener(subscription):
+    last_detected_at = datetime(2026, 10, 1, 12, 0, 40)
+    events = _publish([
+        _detection(detection_count=3, last_detected_at=last_detected_at, usage_metered=True, coalesced=True)
+    ], subscription)
+
+    assert events == [{
+        'event': 'detections_merged',
+        'data': [{'detection_seq': 101, 'added_count': 3, 'last_detected_at': last_detected_at.isoformat()}]
+    }]
+
+
+def test_coalesced_rows_without_an_opener_are_published_as_new_rows(subscription):
+    events = _publish([
+        _detection(detection_seq=None, detection_count=2, usage_metered=True, coalesced=True)
+    ], subscription)
+
+    assert [event['event'] for event in events] == ['detections']
@@ -0,0 +1,67 @@
+"""대시보드 api 워터마크 동기화 테스트 (DB 없음)
+
+- ETag 비활성 시에도, 조건부 GET 을 쓰지 않는 api 에서도 결과 캐시 / 탐지 권한 인덱스를 DB 워터마크로 동기화
+"""
+from typing import List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.principal_cache import Principal
+from app.dependencies.auth import get_current_user
+from app.repositories.dashboard_repository import DashboardRepository
+from app.routers import dashboard as dashboard_router
+
+SYNTHETIC_USER_SEQ = 2_000_000_004
+
+
+class _FakeSession:
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+async def _get_user_data_watermark(self, user_seq):
+    return {'max_detection_seq': 7, 'subscription_version': 3}
+
+
+async def _empty_list(self, *args, **kwargs):
+    return []
+
+
+@pytest.fixture
+def synced_versions(monkeypatch) -> List[int]:
+    versions: List[int] = []
+    monkeypatch.setattr(DashboardRepository, "get_user_data_watermark", _get_user_data_watermark)
+    monkeypatch.setattr(DashboardRepository, "get_device_model_subscriptions", _empty_list)
+    monkeypatch.setattr(DashboardRepository, "get_user_active_model_subscriptions", _empty_list)
+    monkeypatch.setattr(dashboard_router.entitlement_index, "sync_subscription_version",
+                        lambda user_seq, version: versions.append(version))
+    monkeypatch.setattr(settings, "dashboard_etag_enabled", False)
+    return versions
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(dashboard_router.router)
+    app.dependency_overrides[get_current_user] = lambda: Principal(
+        user_seq=SYNTHETIC_USER_SEQ, username="test@example.com", fullname=None,
+        enabled='Y', status='A', password_wrong_cnt=0
+    )
+    app.dependency_overrides[get_db] = _FakeSession
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("path", ["/dashboard/device-subscriptions", "/dashboard/subscriptions"])
+def test_watermark_is_synced_without_etag(client, synced_versions, path):
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert 'etag' not in response.headers
+    assert synced_versions == [3]
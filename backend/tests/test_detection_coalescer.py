@@ -0,0 +1,184 @@
+"""반복 탐지 병합기 테스트 (DB 없음)
+
+- 반영 경로의 세션 / 레포지토리 / 저장 훅은 기록만 하는 가짜 객체로 대체
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import pytest
+
+from app.services import detection_coalescer as coalescer_module
+from app.services.detection_coalescer import DetectionCoalescer
+
+OPENED_AT = datetime(2026, 10, 1, 12, 0, 0)
+
+
+class _FakeSession:
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    async def commit(self) -> None:
+        return None
+
+    async def rollback(self) -> None:
+        return None
+
+
+class _FakeWriteHooks:
+    async def run_write_hooks(self, db, detections: List[Dict[str, Any]]) -> None:
+        return None
+
+    async def run_commit_hooks(self, detections: List[Dict[str, Any]]) -> None:
+        return None
+
+
+class _RecordingRepository:
+    """merge_coalesced_detection / bulk_insert_detections 호출 기록"""
+
+    merges: List[tuple] = []
+    inserted: List[Dict[str, Any]] = []
+
+    def __init__(self, session):
+        self.session = session
+
+    async def merge_coalesced_detection(self, detection_seq, merged_count, last_detected_at, media) -> int:
+        self.merges.append((detection_seq, merged_count, last_detected_at, media))
+        return 1
+
+    async def bulk_insert_detections(self, detections: List[Dict[str, Any]]) -> int:
+        self.inserted.extend(detections)
+        return len(detections)
+
+
+@pytest.fixture
+def repository(monkeypatch):
+    _RecordingRepository.merges = []
+    _RecordingRepository.inserted = []
+    monkeypatch.setattr(coalescer_module, "async_session", _FakeSession)
+    monkeypatch.setattr(coalescer_module, "DetectionRepository", _RecordingRepository)
+    monkeypatch.setattr(coalescer_module, "detection_write_hooks", _FakeWriteHooks())
+    return _RecordingRepository
+
+
+def _detection(seconds: float = 0, **overrides) -> Dict[str, Any]:
+    detection = {
+        'user_seq': 1,
+        'device_seq': 10,
+        'model_product_seq': 100,
+        'detection_label': 'helmet',
+        'detected_at': OPENED_AT + timedelta(seconds=seconds),
+        'image_url': f"/media/{seconds}.jpg"
+    }
+    detection.update(overrides)
+    return detection
+
+
+def _coalescer() -> DetectionCoalescer:
+    return DetectionCoalescer(window_seconds=60, flush_seconds=5, max_groups=10)
+
+
+def test_flush_merges_into_opener_by_detection_seq(repository):
+    coalescer = _coalescer()
+    opener = _detection()
+    sibling = _detection()  # 같은 초의 다른 프레임 - (디바이스, 시각, 상품, 라벨)이 첫 행과 같음
+    repeat = _detection(seconds=10)
+
+    assert coalescer.admit(opener) is False
+    assert coalescer.is_opener(opener)
+    assert coalescer.admit(sibling) is True
+    assert coalescer.admit(repeat) is True
+
+    opener['detection_seq'] = 101
+    coalescer.confirm([opener], [sibling, repeat])
+
+    assert asyncio.run(coalescer.flush(force=True)) == 1
+    assert repository.merges == [(101, 2, repeat['detected_at'], {'image_url': repeat['image_url']})]
+    assert repository.inserted == []
+
+
+def test_flush_inserts_fallback_row_when_opener_was_rolled_back(repository):
+    coalescer = _coalescer()
+    opener = _detection()
+    repeat = _detection(seconds=5)
+
+    coalescer.admit(opener)
+    coalescer.admit(repeat)
+    coalescer.confirm([], [repeat])      # 다른 요청의 반복 탐지는 커밋됨
+    opener['detection_seq'] = 101        # 롤백된 트랜잭션에서 받은 번호 - 반영에 쓰면 안 됨
+    coalescer.revert([opener], [])
+
+    assert asyncio.run(coalescer.flush(force=True)) == 1
+    assert repository.merges == []
+    assert len(repository.inserted) == 1
+    assert repository.inserted[0]['detection_count'] == 1
+    assert repository.inserted[0]['last_detected_at'] == repeat['detected_at']
+
+
+def test_repeat_inside_window_is_reserved_and_outside_window_opens_new_group():
+    coalescer = _coalescer()
+    opener = _detection()
+
+    repeat = _detection(seconds=59)
+    late_arrival = _detection(seconds=-1)
+    later = _detection(seconds=60)
+
+    assert coalescer.admit(opener) is False
+    assert coalescer.admit(repeat) is True
+    assert coalescer.admit(late_arrival) is False    # 구간 시작 전 (늦게 도착) -> 그대로 저장
+    assert not coalescer.is_opener(late_arrival)
+    assert coalescer.admit(later) is False
+    assert coalescer.is_opener(later)
+    assert coalescer.stats()['closed_groups'] == 1
+
+
+def test_group_with_pending_reservation_is_not_flushed(repository):
+    coalescer = _coalescer()
+    opener = _detection()
+    repeat = _detection(seconds=5)
+    opener['detection_seq'] = 101
+
+    coalescer.admit(opener)
+    coalescer.admit(repeat)
+    coalescer.confirm([opener], [])     # 반복 탐지의 트랜잭션은 아직 커밋 전
+
+    assert asyncio.run(coalescer.flush(force=True)) == 0
+    assert repository.merges == []
+
+    coalescer.confirm([], [repeat])
+    assert asyncio.run(coalescer.flush()) == 1
+    assert repository.merges[0][:2] == (101, 1)
+
+
+def test_reverted_repeat_is_not_merged(repository):
+    coalescer = _coalescer()
+    opener = _detection()
+    kept = _detection(seconds=5)
+    rolled_back = _detection(seconds=6)
+    opener['detection_seq'] = 101
+
+    coalescer.admit(opener)
+    coalescer.admit(kept)
+    coalescer.admit(rolled_back)
+    coalescer.confirm([opener], [kept])
+    coalescer.revert([], [rolled_back])
+
+    assert asyncio.run(coalescer.flush(force=True)) == 1
+    assert repository.merges == [(101, 1, kept['detected_at'], {'image_url': kept['image_url']})]
+    assert coalescer.coalesced == 1
+
+
+def test_reverted_opener_without_repeats_closes_its_group(repository):
+    coalescer = _coalescer()
+    opener = _detection()
+
+    coalescer.admit(opener)
+    coalescer.revert([opener], [])
+
+    assert coalescer.stats()['open_groups'] == 0
+    retry = _detection()
+    assert coalescer.admit(retry) is False
+    assert coalescer.is_opener(retry)
@@ -0,0 +1,170 @@
+"""탐지 일괄 저장 api 테스트 (DB 없음)
+
+- 라우터 + 서비스 경로를 TestClient 로 실행, DB 세션은 RecordingSession (api 키 검증은 통과로 대체)
+- 사용량 계측기 / 위험도 매핑은 고정 값, 병합기 / 저장 훅은 테스트마다 새 인스턴스
+"""
+import json
+from collections import namedtuple
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.database import get_db
+from app.core.detection_events import DetectionWriteHooks
+from app.core.entitlement_index import entitlement_index
+from app.core.usage_meter import SubscriptionQuota
+from app.dependencies.auth import verify_ingest_api_key
+from app.routers import detections as detections_router
+from app.services import detection_ingest_service as ingest_module
+from app.services.detection_coalescer import DetectionCoalescer
+
+SYNTHETIC_USER_SEQ = 2_000_000_009
+DEVICE_SEQ = 7
+DETECTED_AT = datetime(2026, 10, 1, 12, 0, 0)
+
+OwnerRow = namedtuple('OwnerRow', ['device_seq', 'user_seq'])
+InsertedRow = namedtuple('InsertedRow', ['detection_seq', 'device_seq', 'model_product_seq', 'detection_label', 'detected_at'])
+
+
+class _FakeUsageMeter:
+    """상품 1: 한도 없음, 상품 3: 한도 0 (초과), 상품 2: 구독 없음"""
+
+    def __init__(self):
+        self.recorded: List[Dict[str, Any]] = []
+
+    async def get_quotas(self, db, user_seq: int) -> Dict[int, SubscriptionQuota]:
+        return {1: SubscriptionQuota(10, 1, None), 3: SubscriptionQuota(11, 3, 0)}
+
+    async def check_limit(self, db, user_seq: int, model_product_seq: int, amount: int = 1,
+                          usage_date: Optional[date] = None,
+                          reserved: Optional[Dict[Tuple[int, date], Dict[int, int]]] = None) -> bool:
+        return model_product_seq != 3
+
+    def record(self, detections: List[Dict[str, Any]]) -> None:
+        self.recorded.extend(detections)
+
+
+def _item(**overrides) -> Dict[str, Any]:
+    item = {
+        'device_seq': DEVICE_SEQ,
+        'model_product_seq': 1,
+        'detection_class': 'safety',
+        'detection_label': 'fire',
+        'confidence': 91.5,
+        'bbox_x': 10,
+        'bbox_y': 20,
+        'bbox_width': 30,
+        'bbox_height': 40,
+        'detected_at': DETECTED_AT.isoformat()
+    }
+    item.update(overrides)
+    return item
+
+
+@pytest.fixture
+def written(monkeypatch) -> List[Dict[str, Any]]:
+    """트랜잭션 내 훅에 전달된 탐지 목록"""
+    async def _get_danger_levels(db):
+        return {(1, 'fire'): 'critical', (1, 'smoke'): 'high'}
+
+    written: List[Dict[str, Any]] = []
+    hooks = DetectionWriteHooks()
+
+    @hooks.on_write
+    async def _record(db, detections):
+        written.extend(detections)
+
+    monkeypatch.setattr(entitlement_index, "get_danger_levels", _get_danger_levels)
+    monkeypatch.setattr(ingest_module, "usage_meter", _FakeUsageMeter())
+    monkeypatch.setattr(ingest_module, "detection_write_hooks", hooks)
+    monkeypatch.setattr(ingest_module, "detection_coalescer",
+                        DetectionCoalescer(window_seconds=60, flush_seconds=5, max_groups=100))
+    return written
+
+
+@pytest.fixture
+def client(recording_session, written):
+    app = FastAPI()
+    app.include_router(detections_router.router)
+    app.dependency_overrides[verify_ingest_api_key] = lambda: None
+    app.dependency_overrides[get_db] = lambda: recording_session
+    return TestClient(app)
+
+
+def _inserts(recording_session) -> List[str]:
+    return [statement for statement in recording_session.statements if statement.startswith('INSERT')]
+
+
+def test_items_are_validated_and_rejected_per_item(client, recording_session, written):
+    recording_session.queue(OwnerRow(DEVICE_SEQ, SYNTHETIC_USER_SEQ))
+    recording_session.queue_insert(500)
+    recording_session.queue(InsertedRow(500, DEVICE_SEQ, 1, 'fire', DETECTED_AT))
+
+    response = client.post("/detections/bulk", json=[
+        _item(),
+        _item(confidence=150),
+        _item(device_seq=99),
+        _item(model_product_seq=2),
+        _item(model_product_seq=3),
+        "not an object"
+    ])
+
+    body = response.json()
+    assert response.status_code == 200
+    assert [(result['status'], result['error']) for result in body['results']][2:5] == [
+        ('rejected', 'device_not_found'),
+        ('rejected', 'not_subscribed'),
+        ('rejected', 'usage_limit_exceeded')
+    ]
+    assert [result['status'] for result in body['results']] == ['stored', 'invalid', 'rejected', 'rejected', 'rejected', 'invalid']
+    assert body['results'][1]['error'].startswith("confidence:")
+    assert (body['received'], body['stored'], body['invalid'], body['rejected']) == (6, 1, 2, 3)
+    assert [(detection['detection_seq'], detection['danger_level']) for detection in written] == [(500, 'critical')]
+
+
+def test_openers_are_inserted_in_one_statement(client, recording_session, written):
+    recording_session.queue(OwnerRow(DEVICE_SEQ, SYNTHETIC_USER_SEQ))
+    recording_session.queue_insert(500)
+    recording_session.queue(
+        InsertedRow(500, DEVICE_SEQ, 1, 'fire', DETECTED_AT),
+        InsertedRow(501, DEVICE_SEQ, 1, 'smoke', DETECTED_AT),
+        InsertedRow(502, DEVICE_SEQ, 1, 'smoke', DETECTED_AT),     # 다른 요청이 동시에 저장한 같은 자연키 행
+    )
+
+    body = client.post("/detections/bulk", json=[
+        _item(),
+        _item(detection_label='smoke'),
+        _item(detected_at="2026-10-01T12:00:05")                   # 첫 행 구간에 병합
+    ]).json()
+
+    inserts = _inserts(recording_session)
+    assert len(inserts) == 1
+    assert inserts[0].count('CURRENT_TIMESTAMP)') == 2              # 첫 행 2개를 다중 행 1문으로
+    assert 'tbl_detection_results.detection_seq >= %s' in recording_session.statements[-1]
+    assert [result['status'] for result in body['results']] == ['stored', 'stored', 'coalesced']
+    assert [(detection['detection_label'], detection['detection_seq']) for detection in written] == [('fire', 500), ('smoke', 501)]
+
+
+def test_ndjson_lines_are_parsed_per_item(client, recording_session, written):
+    recording_session.queue(OwnerRow(DEVICE_SEQ, SYNTHETIC_USER_SEQ))
+    recording_session.queue_insert(500)
+    recording_session.queue(InsertedRow(500, DEVICE_SEQ, 1, 'fire', DETECTED_AT))
+    body = "\n".join([json.dumps(_item()), "", "{not json", json.dumps(_item(device_seq=99))])
+
+    response = client.post("/detections/bulk", content=body.encode(),
+                           headers={"Content-Type": "application/x-ndjson; charset=utf-8"})
+
+    results = response.json()['results']
+    assert response.status_code == 200
+    assert [(result['index'], result['status']) for result in results] == [(0, 'stored'), (1, 'invalid'), (2, 'rejected')]
+    assert results[1]['error'].startswith("JSON 파싱 오류")
+
+
+@pytest.mark.parametrize("body", [b"{not json", b'{"device_seq": 7}'])
+def test_json_body_must_be_an_array(client, body):
+    response = client.post("/detections/bulk", content=body, headers={"Content-Type": "application/json"})
+
+    assert response.status_code == 400
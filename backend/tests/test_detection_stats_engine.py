@@ -0,0 +1,121 @@
+"""일자별 탐지 통계 엔진 테스트 (한 번의 스캔 결과 검증)
+
+- 위험도 버킷 / 총 건수는 행 수가 아니라 detection_count 합계 (병합된 반복 탐지 포함)
+- 탐지 디바이스 수는 탐지가 있는 디바이스의 중복 없는 수, 등록 디바이스 수는 전체
+- 권한 없는 상품 / 매핑 없는(위험도 NULL) 탐지 / 다른 날짜의 탐지는 제외
+- DB 없는 테스트는 문 하나가 MySQL 방언으로 컴파일되는지와 결과 매핑만 확인
+"""
+import asyncio
+from collections import namedtuple
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict
+
+from sqlalchemy import insert, text
+
+# 합성 사용자 번호 (실제 사용자와 겹치지 않는 값)
+SYNTHETIC_USER_SEQ = 2_000_000_001
+ENTITLED_PRODUCT_SEQ = 0
+UNENTITLED_PRODUCT_SEQ = 1
+TARGET_DATE = date(2026, 10, 1)
+
+
+def _detection(device_seq: int, detected_at: datetime, danger_level, detection_count: int,
+               model_product_seq: int = ENTITLED_PRODUCT_SEQ) -> Dict[str, Any]:
+    return {
+        'device_seq': device_seq,
+        'user_seq': SYNTHETIC_USER_SEQ,
+        'model_product_seq': model_product_seq,
+        'detection_class': 'safety',
+        'detection_label': 'test',
+        'confidence': 90,
+        'bbox_x': 0, 'bbox_y': 0, 'bbox_width': 10, 'bbox_height': 10,
+        'danger_level': danger_level,
+        'severity': None,
+        'detection_count': detection_count,
+        'detected_at': detected_at
+    }
+
+
+async def _daily_stats(monkeypatch) -> Dict[str, Any]:
+    """디바이스 3대(탐지 있는 2대) + 대상일 전후 탐지를 넣고 get_daily_stats 결과 반환 (종료 시 롤백)"""
+    from app.core.database import async_session, engine
+    from app.core.entitlement_index import UserEntitlement, entitlement_index
+    from app.models.detection_result import DetectionResult
+    from app.models.device import Device
+    from app.repositories.detection_stats_engine import DetectionStatsEngine
+
+    async def _get_user_entitlement(db, user_seq):
+        return UserEntitlement(user_seq, frozenset({ENTITLED_PRODUCT_SEQ}))
+
+    monkeypatch.setattr(entitlement_index, "get_user_entitlement", _get_user_entitlement)
+
+    try:
+        async with async_session() as session:
+            try:
+                await session.execute(text("SET SESSION foreign_key_checks = 0"))
+                devices = [
+                    Device(user_seq=SYNTHETIC_USER_SEQ, device_label=f"test device {index}", device_type='A')
+                    for index in range(3)
+                ]
+                session.add_all(devices)
+                await session.flush()
+
+                first, second = devices[0].device_seq, devices[1].device_seq
+                day_start = datetime.combine(TARGET_DATE, time.min)
+                noon = day_start + timedelta(hours=12)
+                await session.execute(insert(DetectionResult), [
+                    _detection(first, day_start, 'high', 3),                    # 병합된 반복 탐지 3건
+                    _detection(first, noon, 'high', 1),
+                    _detection(first, noon, 'critical', 2),
+                    _detection(second, noon, 'low', 4),
+                    _detection(second, noon, 'low', 1, UNENTITLED_PRODUCT_SEQ),  # 구독하지 않은 상품
+                    _detection(first, day_start - timedelta(seconds=1), 'critical', 9),   # 전날
+                    _detection(second, day_start + timedelta(days=1), 'critical', 9),     # 다음날 00시
+                    # 매핑 없는 탐지 - 트리거(migrations/012)가 위험도를 찾지 못해 NULL 로 남음
+                    {**_detection(first, noon, None, 5), 'detection_label': 'unmapped-test-label'},
+                ])
+                await session.flush()
+
+                return await DetectionStatsEngine(session).get_daily_stats(SYNTHETIC_USER_SEQ, TARGET_DATE)
+            finally:
+                await session.rollback()
+    finally:
+        await engine.dispose()
+
+
+def test_daily_stats_sums_detection_count_and_counts_distinct_devices(database, monkeypatch):
+    stats = asyncio.run(_daily_stats(monkeypatch))
+
+    assert stats['total_count'] == 10
+    assert stats['detected_device_count'] == 2
+    assert stats['registered_device_count'] == 3
+    assert stats['level_counts'] == {
+        'critical': 2,
+        'high': 4,
+        'medium': 0,
+        'low': 4,
+        'safe': 0,
+        'normal': 0
+    }
+
+
+def test_daily_stats_is_one_compiled_statement(recording_session, monkeypatch):
+    from app.core.danger_levels import DANGER_LEVELS
+    from app.core.entitlement_index import UserEntitlement, entitlement_index
+    from app.repositories.detection_stats_engine import DetectionStatsEngine
+
+    async def _get_user_entitlement(db, user_seq):
+        return UserEntitlement(user_seq, frozenset({ENTITLED_PRODUCT_SEQ}))
+
+    monkeypatch.setattr(entitlement_index, "get_user_entitlement", _get_user_entitlement)
+    StatsRow = namedtuple('StatsRow', ['total_count', 'detected_device_count', 'registered_device_count',
+                                       *(f'{level}_count' for level in DANGER_LEVELS)])
+    recording_session.queue(StatsRow(10, 2, 3, 2, 4, None, 4, 0, 0))
+
+    stats = asyncio.run(DetectionStatsEngine(recording_session).get_daily_stats(SYNTHETIC_USER_SEQ, TARGET_DATE))
+
+    assert len(recording_session.statements) == 1
+    assert 'FROM tbl_detection_results INNER JOIN tbl_device' in recording_session.statements[0]
+    assert stats['total_count'] == 10
+    assert stats['level_counts']['medium'] == 0
+    assert stats['level_counts']['low'] == 4
@@ -0,0 +1,34 @@
+"""피드 / 정렬 커서 인코딩 테스트"""
+from datetime import datetime
+
+import pytest
+
+from app.core.feed_cursor import decode_feed_cursor, decode_sort_cursor, encode_feed_cursor, encode_sort_cursor
+
+
+def test_feed_cursor_round_trip():
+    detected_at = datetime(2026, 10, 1, 8, 30, 15, 250000)
+    cursor = encode_feed_cursor(detected_at, 42)
+
+    assert '=' not in cursor
+    assert decode_feed_cursor(cursor) == (detected_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-base64!", encode_sort_cursor("detected_at:desc", "x", 1)])
+def test_feed_cursor_rejects_malformed_values(cursor):
+    with pytest.raises(ValueError):
+        decode_feed_cursor(cursor)
+
+
+@pytest.mark.parametrize("sort_value", [datetime(2026, 10, 1, 8, 30), "카메라 1", None])
+def test_sort_cursor_round_trip(sort_value):
+    cursor = encode_sort_cursor("device_label:asc", sort_value, 7)
+
+    assert decode_sort_cursor(cursor, "device_label:asc") == (sort_value, 7)
+
+
+def test_sort_cursor_rejects_a_different_sort_key():
+    cursor = encode_sort_cursor("detected_at:desc", datetime(2026, 10, 1), 7)
+
+    with pytest.raises(ValueError):
+        decode_sort_cursor(cursor, "detected_at:asc")
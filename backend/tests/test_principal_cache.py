@@ -0,0 +1,66 @@
+"""인증 사용자(principal) 캐시 테스트 - 토큰 exp 로 제한되는 TTL / 사용자 단위 무효화"""
+import pytest
+
+from app.core import principal_cache as principal_cache_module
+from app.core.principal_cache import Principal, PrincipalCache
+
+PRINCIPAL = Principal(user_seq=1, username="tester", fullname=None, enabled='Y', status='A', password_wrong_cnt=0)
+
+
+@pytest.fixture
+def clock(clock, monkeypatch):
+    """토큰 exp 계산(time.time)도 같은 시계 사용"""
+    monkeypatch.setattr(principal_cache_module, "time", clock)
+    return clock
+
+
+def _cache() -> PrincipalCache:
+    return PrincipalCache(max_entries=10, ttl_seconds=300)
+
+
+def test_entry_expires_at_token_exp_before_default_ttl(clock):
+    cache = _cache()
+    cache.set("token", {'exp': clock.now + 10}, PRINCIPAL, cache.generation(PRINCIPAL.user_seq))
+
+    clock.advance(9)
+    assert cache.get("token") == PRINCIPAL
+
+    clock.advance(1)
+    assert cache.get("token") is None
+
+
+def test_expired_token_is_not_cached(clock):
+    cache = _cache()
+    cache.set("token", {'exp': clock.now - 1}, PRINCIPAL, cache.generation(PRINCIPAL.user_seq))
+
+    assert cache.get("token") is None
+
+
+def test_default_ttl_applies_without_exp(clock):
+    cache = _cache()
+    cache.set("token", {}, PRINCIPAL, cache.generation(PRINCIPAL.user_seq))
+
+    clock.advance(299)
+    assert cache.get("token") == PRINCIPAL
+    clock.advance(1)
+    assert cache.get("token") is None
+
+
+def test_invalidate_user_drops_cached_tokens(clock):
+    cache = _cache()
+    cache.set("token", {'exp': clock.now + 60}, PRINCIPAL, cache.generation(PRINCIPAL.user_seq))
+
+    cache.invalidate_user(PRINCIPAL.user_seq)
+
+    assert cache.get("token") is None
+    assert cache.stale == 1
+
+
+def test_lookup_started_before_invalidation_is_not_stored(clock):
+    cache = _cache()
+    generation = cache.generation(PRINCIPAL.user_seq)  # DB 조회 시작 전
+
+    cache.invalidate_user(PRINCIPAL.user_seq)          # 조회 도중 계정 잠금
+    cache.set("token", {'exp': clock.now + 60}, PRINCIPAL, generation)
+
+    assert cache.get("token") is None
@@ -0,0 +1,86 @@
+"""최근 위험 탐지 피드 테스트 (DB 없음)
+
+- RecordingSession 으로 2단계 조회(상위 N개 번호 -> 보강) 실행, 탐지 권한 / 카탈로그는 고정 값으로 대체
+"""
+import asyncio
+from collections import namedtuple
+from datetime import datetime
+
+import pytest
+
+from app.core.catalog_cache import CatalogView, LanguageCatalog, catalog_cache
+from app.core.entitlement_index import UserEntitlement, entitlement_index
+from app.core.feed_cursor import decode_feed_cursor
+from app.repositories.dashboard_repository import DashboardRepository
+from app.repositories.detection_repository import DetectionRepository
+from app.services.dashboard_service import DashboardService
+
+SYNTHETIC_USER_SEQ = 2_000_000_006
+DETECTED_AT = datetime(2026, 10, 1, 12, 0, 0)
+
+DetectionRow = namedtuple('DetectionRow', [
+    'detection_seq', 'detection_class', 'detection_label', 'thumbnail_url', 'detected_at', 'confidence',
+    'device_label', 'device_seq', 'group_name', 'danger_level', 'model_product_seq', 'alert_guide'
+])
+
+
+@pytest.fixture(autouse=True)
+def fixed_lookups(monkeypatch):
+    async def _get_user_entitlement(db, user_seq):
+        return UserEntitlement(user_seq, frozenset({1}))
+
+    async def _get_view(db, language):
+        return CatalogView([LanguageCatalog(language, {}, {(1, 'fire'): "대피하세요"}, {})])
+
+    monkeypatch.setattr(entitlement_index, "get_user_entitlement", _get_user_entitlement)
+    monkeypatch.setattr(catalog_cache, "get_view", _get_view)
+
+
+def test_feed_enriches_the_top_n_rows(recording_session):
+    recording_session.queue((101,))
+    recording_session.queue(DetectionRow(101, 'safety', 'fire', '/thumb/101.jpg', DETECTED_AT, 91.5,
+                                         "카메라 1", 7, "1층", 'critical', 1, None))
+    service = DashboardService(DashboardRepository(recording_session), DetectionRepository(recording_session))
+
+    feed = asyncio.run(service.get_recent_detection_feed(SYNTHETIC_USER_SEQ, 'ko-KR', limit=10))
+
+    assert len(recording_session.statements) == 2
+    assert [item.detection_seq for item in feed.items] == [101]
+    assert feed.items[0].location_info == "1층 / 카메라 1"
+    assert feed.items[0].ai_detection_guide == "대피하세요"
+    assert feed.has_more is False
+    assert decode_feed_cursor(feed.newest_cursor) == (DETECTED_AT, 101)
+
+
+def test_enrichment_fills_display_fields_without_catalog_entries(recording_session):
+    recording_session.queue((102,))
+    recording_session.queue(DetectionRow(102, 'safety', 'smoke', None, DETECTED_AT, None,
+                                         "카메라 2", 8, None, 'high', 2, None))
+
+    detections = asyncio.run(
+        DetectionRepository(recording_session).get_recent_detections_with_full_info(SYNTHETIC_USER_SEQ, 'ko-KR')
+    )
+
+    assert detections[0]['location_info'] == "카메라 2"
+    assert detections[0]['product_name'] == "알 수 없는 모델"
+    assert detections[0]['danger_level_display'] == "High"
+    assert detections[0]['ai_detection_guide'] == "개발 중입니다"
+
+
+def test_recent_risk_detections_use_the_requested_language(recording_session, monkeypatch):
+    languages = []
+
+    async def _get_view(db, language):
+        languages.append(language)
+        return CatalogView([LanguageCatalog(language, {}, {}, {})])
+
+    monkeypatch.setattr(catalog_cache, "get_view", _get_view)
+    recording_session.queue((101,))
+    recording_session.queue(DetectionRow(101, 'safety', 'fire', None, DETECTED_AT, 91.5,
+                                         "카메라 1", 7, None, 'critical', 1, None))
+    service = DashboardService(DashboardRepository(recording_session), DetectionRepository(recording_session))
+
+    detections = asyncio.run(service._get_recent_risk_detections(SYNTHETIC_USER_SEQ, 'ja-JP'))
+
+    assert languages == ['ja-JP']
+    assert detections[0].ai_detection_guide == "開発中です"
@@ -0,0 +1,139 @@
+"""구독 사용량 계측기 테스트 (DB 없음)
+
+- 조회 / 반영 쿼리는 RecordingSession 으로 실행 (반영 경로의 async_session 도 대체)
+- 캐시 시계는 clock 픽스처로 진행
+"""
+import asyncio
+from collections import namedtuple
+from datetime import date, datetime
+
+import pytest
+
+from app.core import usage_meter as usage_meter_module
+from app.core.usage_meter import UsageMeter
+
+SYNTHETIC_USER_SEQ = 2_000_000_008
+USAGE_DATE = date(2026, 10, 1)
+
+QuotaRow = namedtuple('QuotaRow', ['subscription_seq', 'model_product_seq', 'usage_limit'])
+UsageRow = namedtuple('UsageRow', ['subscription_seq', 'detection_count'])
+SubscriptionRow = namedtuple('SubscriptionRow', ['subscription_seq', 'user_seq', 'model_product_seq'])
+
+
+def _meter() -> UsageMeter:
+    return UsageMeter(flush_seconds=60, max_pending=100, read_ttl_seconds=30, max_entries=100)
+
+
+def _detection(model_product_seq: int = 1, detection_count: int = 1, **overrides):
+    detection = {
+        'user_seq': SYNTHETIC_USER_SEQ,
+        'model_product_seq': model_product_seq,
+        'detected_at': datetime(2026, 10, 1, 12, 0, 0),
+        'detection_count': detection_count
+    }
+    detection.update(overrides)
+    return detection
+
+
+def test_quotas_are_cached_for_the_read_ttl(recording_session, clock):
+    meter = _meter()
+    recording_session.queue(QuotaRow(10, 1, 5), QuotaRow(11, 2, None))
+
+    quotas = asyncio.run(meter.get_quotas(recording_session, SYNTHETIC_USER_SEQ))
+    asyncio.run(meter.get_quotas(recording_session, SYNTHETIC_USER_SEQ))
+
+    assert {seq: quota.usage_limit for seq, quota in quotas.items()} == {1: 5, 2: None}
+    assert len(recording_session.statements) == 1
+
+    clock.advance(30)
+    asyncio.run(meter.get_quotas(recording_session, SYNTHETIC_USER_SEQ))
+    assert len(recording_session.statements) == 2
+
+
+def test_check_limit_without_subscription_or_limit(recording_session, clock):
+    meter = _meter()
+    recording_session.queue(QuotaRow(11, 2, None))
+
+    assert asyncio.run(meter.check_limit(recording_session, SYNTHETIC_USER_SEQ, 1, usage_date=USAGE_DATE)) is False
+    assert asyncio.run(meter.check_limit(recording_session, SYNTHETIC_USER_SEQ, 2, 1000, usage_date=USAGE_DATE)) is True
+    assert len(recording_session.statements) == 1     # 한도가 없으면 사용량 조회 없음
+
+
+def test_check_limit_counts_db_and_pending_usage(recording_session, clock):
+    meter = _meter()
+    recording_session.queue(QuotaRow(10, 1, 5))
+    recording_session.queue(UsageRow(10, 2))
+    meter.record([_detection(detection_count=2)])
+
+    assert asyncio.run(meter.check_limit(recording_session, SYNTHETIC_USER_SEQ, 1, 1, USAGE_DATE)) is True
+    assert asyncio.run(meter.check_limit(recording_session, SYNTHETIC_USER_SEQ, 1, 2, USAGE_DATE)) is False
+
+
+def test_reserved_snapshot_is_shared_across_items(recording_session, clock):
+    meter = _meter()
+    recording_session.queue(QuotaRow(10, 1, 3))
+    recording_session.queue(UsageRow(10, 1))
+    reserved = {}
+
+    results = [
+        asyncio.run(meter.check_limit(recording_session, SYNTHETIC_USER_SEQ, 1, 1, USAGE_DATE, reserved=reserved))
+        for _ in range(3)
+    ]
+
+    assert results == [True, True, False]
+    assert reserved == {(SYNTHETIC_USER_SEQ, USAGE_DATE): {10: 3}}
+    assert len(recording_session.statements) == 2     # 구독 한도 1회 + 사용량 1회
+
+
+def test_usage_read_during_a_flush_is_not_cached(recording_session, clock):
+    meter = _meter()
+    recording_session.queue(QuotaRow(10, 1, 5))
+
+    async def _read_while_flushing():
+        async with meter._flush_lock:
+            return await meter.get_usage(recording_session, SYNTHETIC_USER_SEQ, USAGE_DATE)
+
+    assert asyncio.run(_read_while_flushing()) == {10: 0}
+    asyncio.run(meter.get_usage(recording_session, SYNTHETIC_USER_SEQ, USAGE_DATE))
+    asyncio.run(meter.get_usage(recording_session, SYNTHETIC_USER_SEQ, USAGE_DATE))
+
+    # 반영 중 조회 1회 + 캐시 미스 1회 (그다음은 캐시 사용)
+    assert len(recording_session.statements) == 3
+
+
+def test_flush_upserts_subscribed_counters_and_drops_cached_values(recording_session, clock, monkeypatch):
+    meter = _meter()
+    monkeypatch.setattr(usage_meter_module, "async_session", lambda: recording_session)
+    recording_session.queue(QuotaRow(10, 1, 5))
+    asyncio.run(meter.get_usage(recording_session, SYNTHETIC_USER_SEQ, USAGE_DATE))
+
+    meter.record([
+        _detection(detection_count=2),
+        _detection(),
+        _detection(model_product_seq=3),                  # 활성 구독 없음
+        _detection(detection_count=4, usage_metered=True)  # 병합 시점에 계측된 누적분
+    ])
+    recording_session.queue(SubscriptionRow(10, SYNTHETIC_USER_SEQ, 1))
+
+    assert asyncio.run(meter.flush()) == 1
+    assert 'ON DUPLICATE KEY UPDATE' in recording_session.statements[-1]
+    assert meter.unmetered == 1
+    assert meter.stats()['pending'] == 0
+
+    recording_session.queue(UsageRow(10, 3))
+    assert asyncio.run(meter.get_usage(recording_session, SYNTHETIC_USER_SEQ, USAGE_DATE)) == {10: 3}
+
+
+def test_failed_flush_keeps_increments_for_the_next_flush(recording_session, clock, monkeypatch):
+    meter = _meter()
+
+    async def _failing_execute(statement, params=None):
+        raise RuntimeError("db unavailable")
+
+    monkeypatch.setattr(recording_session, "execute", _failing_execute)
+    monkeypatch.setattr(usage_meter_module, "async_session", lambda: recording_session)
+    meter.record([_detection(detection_count=2)])
+
+    assert asyncio.run(meter.flush()) == 0
+    assert meter.flush_failures == 1
+    assert meter._pending == {(SYNTHETIC_USER_SEQ, 1, USAGE_DATE): 2}